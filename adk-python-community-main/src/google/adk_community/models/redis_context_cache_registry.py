@@ -0,0 +1,229 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+from typing_extensions import override
+
+from google.adk.models.context_cache_registry import (
+    BaseContextCacheRegistry,
+    CreateSharedContextCache,
+    RefreshSharedContextCache,
+    SharedContextCache,
+)
+
+logger = logging.getLogger("google_adk." + __name__)
+
+DEFAULT_LOCK_TIMEOUT = 30  # seconds
+DEFAULT_POLL_INTERVAL = 0.05  # seconds
+DEFAULT_REFRESH_WINDOW = 300  # seconds
+DEFAULT_FAILURE_BACKOFF = 60  # seconds
+
+
+class RedisCacheKeys:
+    """Helper to generate Redis keys consistently."""
+
+    @staticmethod
+    def cache(key: str) -> str:
+        return f"context_cache:{key}"
+
+    @staticmethod
+    def refcount(key: str, cache_name: str) -> str:
+        return f"context_cache_refs:{key}:{cache_name}"
+
+    @staticmethod
+    def create_lock(key: str) -> str:
+        return f"context_cache_lock:{key}"
+
+    @staticmethod
+    def refresh_lock(key: str) -> str:
+        return f"context_cache_refresh_lock:{key}"
+
+    @staticmethod
+    def failed(key: str) -> str:
+        return f"context_cache_failed:{key}"
+
+
+class RedisContextCacheRegistry(BaseContextCacheRegistry):
+    """A Redis-backed context cache registry shared by many processes.
+
+    Cached-content handles are stored with a Redis TTL that matches the TTL of
+    the cached content. Creation and TTL refreshes are guarded by short-lived
+    Redis locks, so only one process creates or refreshes the cache of a key
+    while the others wait for it or keep using the current cache.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        uri=None,
+        cluster_uri=None,
+        lock_timeout=DEFAULT_LOCK_TIMEOUT,
+        poll_interval=DEFAULT_POLL_INTERVAL,
+        refresh_window=DEFAULT_REFRESH_WINDOW,
+        failure_backoff=DEFAULT_FAILURE_BACKOFF,
+        **kwargs,
+    ):
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.refresh_window = refresh_window
+        self.failure_backoff = failure_backoff
+
+        if cluster_uri:
+            self.cache = redis.RedisCluster.from_url(cluster_uri, **kwargs)
+        elif uri:
+            self.cache = redis.Redis.from_url(uri, **kwargs)
+        else:
+            self.cache = redis.Redis(host=host, port=port, db=db, **kwargs)
+
+    @override
+    async def acquire(
+        self,
+        key: str,
+        *,
+        create: CreateSharedContextCache,
+        refresh: RefreshSharedContextCache,
+    ) -> Optional[SharedContextCache]:
+        try:
+            cache = await self._get_or_create(key, create)
+            if cache is None:
+                return None
+            if cache.expire_time - time.time() < self.refresh_window:
+                cache = await self._refresh(key, cache, refresh)
+
+            refcount_key = RedisCacheKeys.refcount(key, cache.cache_name)
+            async with self.cache.pipeline(transaction=False) as pipe:
+                pipe.incr(refcount_key)
+                pipe.expireat(refcount_key, int(cache.expire_time) + 1)
+                await pipe.execute()
+            return cache
+        except redis.RedisError as e:
+            logger.error(f"Error acquiring shared context cache {key}: {e}")
+            return None
+
+    @override
+    async def release(self, key: str, cache: SharedContextCache) -> None:
+        try:
+            await self.cache.decr(RedisCacheKeys.refcount(key, cache.cache_name))
+        except redis.RedisError as e:
+            logger.error(f"Error releasing shared context cache {key}: {e}")
+
+    async def get_refcount(self, key: str, cache_name: str) -> int:
+        """Returns the number of unreleased acquires of a cache."""
+        refcount = await self.cache.get(RedisCacheKeys.refcount(key, cache_name))
+        return int(refcount) if refcount else 0
+
+    async def _get_or_create(
+        self, key: str, create: CreateSharedContextCache
+    ) -> Optional[SharedContextCache]:
+        lock_key = RedisCacheKeys.create_lock(key)
+        deadline = time.time() + self.lock_timeout
+        while True:
+            cache = await self._load(key)
+            if cache is not None:
+                return cache
+            if await self.cache.get(RedisCacheKeys.failed(key)):
+                return None
+
+            token = uuid.uuid4().hex
+            if await self.cache.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            ):
+                try:
+                    return await self._create(key, create)
+                finally:
+                    await self._unlock(lock_key, token)
+
+            # Another process is creating the cache, wait for it.
+            if time.time() >= deadline:
+                logger.warning(
+                    "Timed out waiting for shared context cache %s", key
+                )
+                return None
+            await asyncio.sleep(self.poll_interval)
+
+    async def _create(
+        self, key: str, create: CreateSharedContextCache
+    ) -> Optional[SharedContextCache]:
+        try:
+            cache = await create()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to create shared context cache {key}: {e}")
+            await self.cache.set(
+                RedisCacheKeys.failed(key), 1, ex=self.failure_backoff
+            )
+            return None
+        await self._store(key, cache)
+        return cache
+
+    async def _refresh(
+        self,
+        key: str,
+        cache: SharedContextCache,
+        refresh: RefreshSharedContextCache,
+    ) -> SharedContextCache:
+        lock_key = RedisCacheKeys.refresh_lock(key)
+        token = uuid.uuid4().hex
+        if not await self.cache.set(
+            lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+        ):
+            # Another process is refreshing the cache, which can be used
+            # until it expires.
+            return cache
+        try:
+            refreshed = await refresh(cache)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to refresh shared context cache {key}: {e}")
+            return cache
+        finally:
+            await self._unlock(lock_key, token)
+        await self._store(key, refreshed)
+        return refreshed
+
+    async def _load(self, key: str) -> Optional[SharedContextCache]:
+        raw_cache = await self.cache.get(RedisCacheKeys.cache(key))
+        if not raw_cache:
+            return None
+        try:
+            cache = SharedContextCache.model_validate_json(raw_cache)
+        except ValueError as e:
+            logger.error(f"Error decoding shared context cache {key}: {e}")
+            return None
+        return cache if cache.is_usable() else None
+
+    async def _store(self, key: str, cache: SharedContextCache) -> None:
+        ttl_ms = int((cache.expire_time - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        await self.cache.set(
+            RedisCacheKeys.cache(key), cache.model_dump_json(), px=ttl_ms
+        )
+
+    async def _unlock(self, lock_key: str, token: str) -> None:
+        # Only delete the lock if it wasn't taken over after a timeout.
+        current_token = await self.cache.get(lock_key)
+        if current_token is not None and (
+            current_token.decode()
+            if isinstance(current_token, bytes)
+            else current_token
+        ) == token:
+            await self.cache.delete(lock_key)
@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from google.adk.models.context_cache_registry import SharedContextCache
+from google.adk_community.models.redis_context_cache_registry import (
+    RedisContextCacheRegistry,
+)
+
+
+class _FakeRedis:
+    """A dict backed stand-in for the Redis commands used by the registry."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.values:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.values[key] = value
+        return True
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def decr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) - 1
+        return self.values[key]
+
+    def pipeline(self, transaction=False):
+        values = self.values
+        pipe = MagicMock()
+        pipe.incr = MagicMock(
+            side_effect=lambda key: values.__setitem__(
+                key, int(values.get(key, 0)) + 1
+            )
+        )
+        pipe.expireat = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        context_manager = MagicMock()
+        context_manager.__aenter__ = AsyncMock(return_value=pipe)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        return context_manager
+
+
+class _FakeCaches:
+    """Creates and refreshes fake shared caches."""
+
+    def __init__(self, ttl_seconds=1800, error=None):
+        self.ttl_seconds = ttl_seconds
+        self.error = error
+        self.created = 0
+        self.refreshed = 0
+
+    async def create(self):
+        self.created += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        now = time.time()
+        return SharedContextCache(
+            cache_name=f"cachedContents/{self.created}",
+            expire_time=now + self.ttl_seconds,
+            created_at=now,
+        )
+
+    async def refresh(self, cache):
+        self.refreshed += 1
+        return cache.model_copy(update={"expire_time": time.time() + 1800})
+
+
+class TestRedisContextCacheRegistry:
+    """Test cases for RedisContextCacheRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        with patch("redis.asyncio.Redis"):
+            registry = RedisContextCacheRegistry(poll_interval=0.001)
+            registry.cache = _FakeRedis()
+            yield registry
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_create_one_cache(self, registry):
+        caches = _FakeCaches()
+
+        acquired = await asyncio.gather(
+            *[
+                registry.acquire(
+                    "key", create=caches.create, refresh=caches.refresh
+                )
+                for _ in range(5)
+            ]
+        )
+
+        assert caches.created == 1
+        assert {cache.cache_name for cache in acquired} == {"cachedContents/1"}
+        assert await registry.get_refcount("key", "cachedContents/1") == 5
+
+        for cache in acquired:
+            await registry.release("key", cache)
+        assert await registry.get_refcount("key", "cachedContents/1") == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_close_to_expiry_is_refreshed(self, registry):
+        registry.refresh_window = 600
+        caches = _FakeCaches(ttl_seconds=400)
+
+        first = await registry.acquire(
+            "key", create=caches.create, refresh=caches.refresh
+        )
+
+        assert caches.created == 1
+        assert caches.refreshed == 1
+        stored = await registry._load("key")
+        assert stored.expire_time == first.expire_time
+        assert stored.expire_time > time.time() + 400
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_backs_off(self, registry):
+        caches = _FakeCaches(error=ValueError("too few tokens"))
+
+        for _ in range(3):
+            assert (
+                await registry.acquire(
+                    "key", create=caches.create, refresh=caches.refresh
+                )
+                is None
+            )
+
+        assert caches.created == 1
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+benchmark_live_sessions.py – measure the CPU cost of live sessions
+
+Runs the live send loop of many sessions against a connection that drops
+everything it's sent, and reports the CPU time per session, for idle sessions
+and for sessions that stream audio.
+
+  python benchmark_live_sessions.py --sessions 1000 --duration 10
+  python benchmark_live_sessions.py --poll-interval 0.25  # Streamlit mode
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator
+from typing import Optional
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.adk.models.base_llm_connection import BaseLlmConnection
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+
+# 20 ms of 16 kHz 16-bit PCM audio.
+_CHUNK = types.Blob(data=bytes(640), mime_type="audio/pcm;rate=16000")
+_CHUNK_INTERVAL = 0.02
+
+
+class _NullConnection(BaseLlmConnection):
+
+  async def send_history(self, history: list[types.Content]):
+    pass
+
+  async def send_content(self, content: types.Content):
+    pass
+
+  async def send_realtime(self, input: types.Blob):
+    pass
+
+  async def receive(self) -> AsyncGenerator[LlmResponse, None]:
+    return
+    yield
+
+  async def close(self):
+    pass
+
+
+async def _create_contexts(
+    count: int, poll_interval: Optional[float]
+) -> list[InvocationContext]:
+  session_service = InMemorySessionService()
+  agent = LlmAgent(name="benchmark_agent", model="gemini-2.0-flash")
+  run_config = RunConfig(
+      live_request_poll_interval=poll_interval, input_audio_transcription=None
+  )
+  contexts = []
+  for i in range(count):
+    contexts.append(
+        InvocationContext(
+            session_service=session_service,
+            invocation_id=f"e-{i}",
+            agent=agent,
+            session=await session_service.create_session(
+                app_name="benchmark", user_id=f"user-{i}"
+            ),
+            live_request_queue=LiveRequestQueue(),
+            run_config=run_config,
+        )
+    )
+  return contexts
+
+
+async def _stream_audio(queue: LiveRequestQueue, duration: float) -> None:
+  deadline = time.monotonic() + duration
+  while time.monotonic() < deadline:
+    queue.send_realtime(_CHUNK)
+    await asyncio.sleep(_CHUNK_INTERVAL)
+
+
+async def _measure(
+    sessions: int,
+    duration: float,
+    poll_interval: Optional[float],
+    active: bool,
+) -> float:
+  """Returns the CPU seconds per session per second of wall time."""
+  flow = SingleFlow()
+  connection = _NullConnection()
+  contexts = await _create_contexts(sessions, poll_interval)
+  senders = [
+      asyncio.create_task(flow._send_to_model(connection, context))
+      for context in contexts
+  ]
+  # Let the sessions settle before measuring.
+  await asyncio.sleep(0.1)
+
+  wall_start = time.monotonic()
+  cpu_start = time.process_time()
+  if active:
+    await asyncio.gather(*(
+        _stream_audio(context.live_request_queue, duration)
+        for context in contexts
+    ))
+  else:
+    await asyncio.sleep(duration)
+  cpu = time.process_time() - cpu_start
+  wall = time.monotonic() - wall_start
+
+  for context in contexts:
+    context.live_request_queue.close()
+  await asyncio.gather(*senders)
+  return cpu / sessions / wall
+
+
+async def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--sessions", type=int, default=1000)
+  parser.add_argument("--duration", type=float, default=5.0)
+  parser.add_argument(
+      "--poll-interval",
+      type=float,
+      default=None,
+      help="RunConfig.live_request_poll_interval, unset by default.",
+  )
+  args = parser.parse_args()
+
+  for label, active in (("idle", False), ("active", True)):
+    cpu = await _measure(
+        args.sessions, args.duration, args.poll_interval, active
+    )
+    print(
+        f"{label:>6}: {cpu * 1e6:10.1f} µs CPU per session per second"
+        f" ({args.sessions} sessions, {args.duration:g} s)"
+    )
+
+
+if __name__ == "__main__":
+  asyncio.run(main())
@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from array import array
+import dataclasses
+from typing import Optional
+
+ARTIFACT_READER = 'artifact'
+"""The reader that flushes the audio to the artifact service."""
+
+TRANSCRIPTION_READER = 'transcription'
+"""The reader that transcribes the audio."""
+
+# Enough for a few chunks of 16 kHz PCM. Streams that buffer more grow the
+# ring as they go.
+_DEFAULT_CAPACITY = 1 << 14
+
+
+@dataclasses.dataclass(frozen=True)
+class AudioSegment:
+  """The audio a reader hasn't consumed yet."""
+
+  data: bytes
+  """The audio data of the chunks, concatenated."""
+
+  timestamp: float
+  """Timestamp when the first chunk was received."""
+
+  chunk_count: int
+  """The number of chunks in the segment."""
+
+  end: int
+  """The position to pass to `AudioBuffer.consume` once the segment is used."""
+
+
+class AudioBuffer:
+  """Buffers the audio chunks of one live stream.
+
+  The audio data is kept in a ring of bytes, with the end offset and the
+  timestamp of each chunk in parallel arrays, so buffering a chunk doesn't
+  create any Python objects. The ring starts small and doubles its capacity
+  whenever the buffered audio outgrows it, so idle streams stay cheap.
+
+  Several readers, e.g. the artifact flush and the transcription, share the
+  buffer. Each reader consumes the chunks at its own pace, and chunks are
+  released once every reader consumed them.
+  """
+
+  def __init__(
+      self,
+      role: str,
+      mime_type: str,
+      capacity: int = _DEFAULT_CAPACITY,
+  ):
+    """Initializes the audio buffer.
+
+    Args:
+      role: The role that creates the audio, typically "user" or "model".
+      mime_type: The MIME type of the audio.
+      capacity: The initial capacity of the ring, in bytes.
+    """
+    self.role = role
+    self.mime_type = mime_type
+    self._ring = bytearray(max(capacity, 1))
+    # Byte offsets are counted from the start of the stream.
+    self._start_offset = 0
+    self._end_offset = 0
+    # The number of chunks released before the first buffered chunk.
+    self._released_chunks = 0
+    self._chunk_ends = array('q')
+    self._timestamps = array('d')
+    self._cursors: dict[str, int] = {ARTIFACT_READER: 0}
+
+  def __len__(self) -> int:
+    """Returns the number of buffered chunks."""
+    return len(self._chunk_ends)
+
+  @property
+  def size(self) -> int:
+    """The number of buffered bytes."""
+    return self._end_offset - self._start_offset
+
+  def get_pending_size(self, reader: str) -> int:
+    """Returns the number of bytes the reader hasn't consumed yet."""
+    index = self._cursors[reader] - self._released_chunks
+    return self._end_offset - self._get_chunk_start(index)
+
+  def add_reader(self, reader: str) -> None:
+    """Adds a reader that starts at the first buffered chunk.
+
+    Adding a reader that already exists has no effect.
+    """
+    self._cursors.setdefault(reader, self._released_chunks)
+
+  def append(self, data: bytes, timestamp: float) -> None:
+    """Buffers an audio chunk.
+
+    Args:
+      data: The audio data of the chunk.
+      timestamp: Timestamp when the chunk was received.
+    """
+    if self.size + len(data) > len(self._ring):
+      self._grow(self.size + len(data))
+    self._write(self._end_offset, data)
+    self._end_offset += len(data)
+    self._chunk_ends.append(self._end_offset)
+    self._timestamps.append(timestamp)
+
+  def read(self, reader: str) -> Optional[AudioSegment]:
+    """Returns the chunks the reader hasn't consumed yet.
+
+    The chunks are copied out of the ring once, into a single bytes object.
+
+    Args:
+      reader: The name of the reader.
+
+    Returns:
+      The audio segment, or None if the reader consumed all chunks.
+    """
+    index = self._cursors[reader] - self._released_chunks
+    if index >= len(self._chunk_ends):
+      return None
+    return AudioSegment(
+        data=self._read(self._get_chunk_start(index), self._end_offset),
+        timestamp=self._timestamps[index],
+        chunk_count=len(self._chunk_ends) - index,
+        end=self._released_chunks + len(self._chunk_ends),
+    )
+
+  def consume(self, reader: str, end: int) -> None:
+    """Marks the chunks before `end` as consumed by the reader.
+
+    Args:
+      reader: The name of the reader.
+      end: The `end` of a segment the reader read.
+    """
+    self._cursors[reader] = max(self._cursors[reader], end)
+    count = min(self._cursors.values()) - self._released_chunks
+    if count <= 0:
+      return
+    self._start_offset = self._chunk_ends[count - 1]
+    del self._chunk_ends[:count]
+    del self._timestamps[:count]
+    self._released_chunks += count
+
+  def _get_chunk_start(self, index: int) -> int:
+    if index >= len(self._chunk_ends):
+      return self._end_offset
+    return self._chunk_ends[index - 1] if index else self._start_offset
+
+  def _grow(self, size: int) -> None:
+    capacity = len(self._ring)
+    while capacity < size:
+      capacity *= 2
+    data = self._read(self._start_offset, self._end_offset)
+    self._ring = bytearray(capacity)
+    self._write(self._start_offset, data)
+
+  def _write(self, offset: int, data: bytes) -> None:
+    position = offset % len(self._ring)
+    head = min(len(data), len(self._ring) - position)
+    view = memoryview(data)
+    self._ring[position : position + head] = view[:head]
+    self._ring[: len(data) - head] = view[head:]
+
+  def _read(self, start: int, end: int) -> bytes:
+    position = start % len(self._ring)
+    length = end - start
+    head = min(length, len(self._ring) - position)
+    view = memoryview(self._ring)
+    if head == length:
+      return bytes(view[position : position + length])
+    return b''.join((view[position:], view[: length - head]))
@@ -34,6 +34,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
@@ -130,6 +131,9 @@ class BaseAgent(BaseModel):
   sub_agents: list[BaseAgent] = Field(default_factory=list)
   """The sub-agents of this agent."""
 
+  _agent_index: Optional[dict[str, BaseAgent]] = PrivateAttr(default=None)
+  """The descendants of this agent by name, used by `find_sub_agent`."""
+
   before_agent_callback: Optional[BeforeAgentCallback] = None
   """Callback or list of callbacks to be invoked before the agent run.
 
@@ -265,6 +269,7 @@ class BaseAgent(BaseModel):
     # Remove the parent agent from the cloned agent to avoid sharing the parent
     # agent with the cloned agent.
     cloned_agent.parent_agent = None
+    cloned_agent._agent_index = cloned_agent._build_agent_index()
     return cloned_agent
 
   @final
@@ -402,17 +407,49 @@ class BaseAgent(BaseModel):
     Returns:
       The agent with the matching name, or None if no such agent is found.
     """
-    for sub_agent in self.sub_agents:
-      if result := sub_agent.find_agent(name):
-        return result
-    return None
+    if self._agent_index is not None:
+      agent = self._agent_index.get(name)
+      if (
+          agent is not None
+          and agent.name == name
+          and self._has_descendant(agent)
+      ):
+        return agent
+    # The index is missing or stale, e.g. sub-agents were attached after it was
+    # built, so rebuild it from the current agent tree.
+    self._agent_index = self._build_agent_index()
+    return self._agent_index.get(name)
+
+  def _build_agent_index(self) -> dict[str, BaseAgent]:
+    """Indexes the descendants of this agent by name.
+
+    Agents are visited in the same depth-first order as a recursive search, so
+    the first agent with a given name wins.
+    """
+    agent_index: dict[str, BaseAgent] = {}
+    stack = list(reversed(self.sub_agents))
+    while stack:
+      agent = stack.pop()
+      agent_index.setdefault(agent.name, agent)
+      stack.extend(reversed(agent.sub_agents))
+    return agent_index
+
+  def _has_descendant(self, agent: BaseAgent) -> bool:
+    """Whether the agent is still attached to the tree below this agent."""
+    while agent is not self:
+      parent_agent = agent.parent_agent
+      if parent_agent is None or not any(
+          sub_agent is agent for sub_agent in parent_agent.sub_agents
+      ):
+        return False
+      agent = parent_agent
+    return True
 
   def _create_invocation_context(
       self, parent_context: InvocationContext
   ) -> InvocationContext:
     """Creates a new invocation context for this agent."""
-    invocation_context = parent_context.model_copy(update={'agent': self})
-    return invocation_context
+    return parent_context._create_view(agent=self)
 
   @property
   def canonical_before_agent_callbacks(self) -> list[_SingleAgentCallback]:
@@ -558,6 +595,7 @@ class BaseAgent(BaseModel):
   @override
   def model_post_init(self, __context: Any) -> None:
     self.__set_parent_agent_for_sub_agents()
+    self._agent_index = self._build_agent_index()
 
   @field_validator('name', mode='after')
   @classmethod
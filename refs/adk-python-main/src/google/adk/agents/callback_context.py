@@ -96,15 +96,7 @@ class CallbackContext(ReadonlyContext):
     Returns:
      The version of the artifact.
     """
-    if self._invocation_context.artifact_service is None:
-      raise ValueError("Artifact service is not initialized.")
-    version = await self._invocation_context.artifact_service.save_artifact(
-        app_name=self._invocation_context.app_name,
-        user_id=self._invocation_context.user_id,
-        session_id=self._invocation_context.session.id,
-        filename=filename,
-        artifact=artifact,
-    )
+    version = await self._invocation_context.save_artifact(filename, artifact)
     self._event_actions.artifact_delta[filename] = version
     return version
 
@@ -14,11 +14,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
 import os
 from typing import Any
 from typing import List
+from typing import NamedTuple
 
 import yaml
 
@@ -29,6 +31,26 @@ from .base_agent_config import BaseAgentConfig
 from .common_configs import AgentRefConfig
 from .common_configs import CodeConfig
 
+# The libyaml loader is much faster, if PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _CompiledConfig(NamedTuple):
+  """A validated config file, and the version of the file it was read from."""
+
+  stat_key: tuple[int, int]
+  """The modification time in nanoseconds and the size of the file."""
+
+  digest: bytes
+  """The hash of the content of the file."""
+
+  config: AgentConfig
+
+
+# The compiled configs by absolute file path. Each referenced sub-agent config
+# is a file of its own, so only the files that changed are parsed again.
+_compiled_configs: dict[str, _CompiledConfig] = {}
+
 
 @experimental
 def from_config(config_path: str) -> BaseAgent:
@@ -93,13 +115,29 @@ def _load_config_from_path(config_path: str) -> AgentConfig:
     FileNotFoundError: If config file doesn't exist.
     ValidationError: If config file's content is invalid YAML.
   """
-  if not os.path.exists(config_path):
-    raise FileNotFoundError(f"Config file not found: {config_path}")
-
-  with open(config_path, "r", encoding="utf-8") as f:
-    config_data = yaml.safe_load(f)
+  try:
+    stat = os.stat(config_path)
+  except FileNotFoundError as e:
+    raise FileNotFoundError(f"Config file not found: {config_path}") from e
+
+  # Configs are compiled once per version of the file. A file that was touched
+  # without changing its content keeps its compiled config as well.
+  stat_key = (stat.st_mtime_ns, stat.st_size)
+  compiled = _compiled_configs.get(config_path)
+  if compiled is None or compiled.stat_key != stat_key:
+    with open(config_path, "rb") as f:
+      content = f.read()
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    if compiled is None or compiled.digest != digest:
+      config_data = yaml.load(content.decode("utf-8"), Loader=_YamlLoader)
+      config = AgentConfig.model_validate(config_data)
+    else:
+      config = compiled.config
+    compiled = _CompiledConfig(stat_key, digest, config)
+    _compiled_configs[config_path] = compiled
 
-  return AgentConfig.model_validate(config_data)
+  # Agents may keep objects of their config, so each agent gets its own copy.
+  return compiled.config.model_copy(deep=True)
 
 
 @experimental
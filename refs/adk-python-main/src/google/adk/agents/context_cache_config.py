@@ -37,6 +37,8 @@ class ContextCacheConfig(BaseModel):
       cache_intervals: Maximum number of invocations to reuse the same cache before refreshing it
       ttl_seconds: Time-to-live for cache in seconds
       min_tokens: Minimum tokens required to enable caching
+      share_static_prefix: Whether to share a cache of the static prefix
+          across sessions
   """
 
   model_config = ConfigDict(
@@ -71,6 +73,16 @@ class ContextCacheConfig(BaseModel):
       ),
   )
 
+  share_static_prefix: bool = Field(
+      default=False,
+      description=(
+          "Whether requests that have no cache of their own use a cache of the"
+          " system instruction, tools and tool config that is shared with"
+          " every other session with the same prefix. Shared caches are"
+          " tracked by the process-wide context cache registry."
+      ),
+  )
+
   @property
   def ttl_string(self) -> str:
     """Get TTL as string format for cache creation."""
@@ -31,8 +31,10 @@ from ..events.event import Event
 from ..memory.base_memory_service import BaseMemoryService
 from ..plugins.plugin_manager import PluginManager
 from ..sessions.base_session_service import BaseSessionService
+from ..sessions.function_call_index import FunctionCallIndex
 from ..sessions.session import Session
 from .active_streaming_tool import ActiveStreamingTool
+from .audio_buffer import AudioBuffer
 from .base_agent import BaseAgent
 from .base_agent import BaseAgentState
 from .context_cache_config import ContextCacheConfig
@@ -45,25 +47,6 @@ class LlmCallsLimitExceededError(Exception):
   """Error thrown when the number of LLM calls exceed the limit."""
 
 
-class RealtimeCacheEntry(BaseModel):
-  """Store audio data chunks for caching before flushing."""
-
-  model_config = ConfigDict(
-      arbitrary_types_allowed=True,
-      extra="forbid",
-  )
-  """The pydantic model config."""
-
-  role: str
-  """The role that created this audio data, typically "user" or "model"."""
-
-  data: types.Blob
-  """The audio data chunk."""
-
-  timestamp: float
-  """Timestamp when the audio chunk was received."""
-
-
 class _InvocationCostManager(BaseModel):
   """A container to keep track of the cost of invocation.
 
@@ -94,6 +77,60 @@ class _InvocationCostManager(BaseModel):
       )
 
 
+class _InvocationArtifactManifest:
+  """An invocation scoped view of the artifacts of the current session.
+
+  It lets tools that need the artifact keys or the artifact contents on every
+  LLM step (for example load_artifacts) fetch them from the artifact service
+  once per invocation. Saves and deletes made through
+  `InvocationContext.save_artifact` and `InvocationContext.delete_artifact`
+  update the manifest, so it stays in sync with the changes made by the
+  invocation itself.
+  """
+
+  def __init__(self):
+    self._artifact_keys: Optional[set[str]] = None
+    # {(filename, version): artifact}. A version of None stands for the latest
+    # version known to this invocation.
+    self._artifacts: dict[tuple[str, Optional[int]], types.Part] = {}
+
+  def get_artifact_keys(self) -> Optional[list[str]]:
+    """Returns the artifact keys, or None if they were not listed yet."""
+    if self._artifact_keys is None:
+      return None
+    return sorted(self._artifact_keys)
+
+  def set_artifact_keys(self, artifact_keys: list[str]) -> None:
+    self._artifact_keys = set(artifact_keys)
+
+  def get_artifact(
+      self, filename: str, version: Optional[int] = None
+  ) -> Optional[types.Part]:
+    return self._artifacts.get((filename, version))
+
+  def put_artifact(
+      self,
+      filename: str,
+      artifact: types.Part,
+      version: Optional[int] = None,
+  ) -> None:
+    self._artifacts[(filename, version)] = artifact
+
+  def record_save(self, filename: str, version: int) -> None:
+    """Records that a new version of an artifact was saved."""
+    if self._artifact_keys is not None:
+      self._artifact_keys.add(filename)
+    # The latest version changed.
+    self._artifacts.pop((filename, None), None)
+
+  def record_delete(self, filename: str) -> None:
+    """Records that an artifact was deleted together with all its versions."""
+    if self._artifact_keys is not None:
+      self._artifact_keys.discard(filename)
+    for key in [key for key in self._artifacts if key[0] == filename]:
+      del self._artifacts[key]
+
+
 class InvocationContext(BaseModel):
   """An invocation context represents the data of a single invocation of an agent.
 
@@ -187,10 +224,12 @@ class InvocationContext(BaseModel):
   live_session_resumption_handle: Optional[str] = None
   """The handle for live session resumption."""
 
-  input_realtime_cache: Optional[list[RealtimeCacheEntry]] = None
-  """Caches input audio chunks before flushing to session and artifact services."""
+  input_realtime_cache: Optional[AudioBuffer] = None
+  """Caches input audio chunks before flushing to session and artifact services.
 
-  output_realtime_cache: Optional[list[RealtimeCacheEntry]] = None
+  The transcription reads the input audio from the same buffer."""
+
+  output_realtime_cache: Optional[AudioBuffer] = None
   """Caches output audio chunks before flushing to session and artifact services."""
 
   run_config: Optional[RunConfig] = None
@@ -209,6 +248,17 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _artifact_manifest: _InvocationArtifactManifest = PrivateAttr(
+      default_factory=_InvocationArtifactManifest
+  )
+  """The artifacts of the current session as seen by this invocation."""
+
+  _function_call_indices: dict[str, FunctionCallIndex] = PrivateAttr(
+      default_factory=dict
+  )
+  """Indexes of the function calls in the session events and in the lists of
+  events derived from them, by a key of the list."""
+
   @property
   def is_resumable(self) -> bool:
     """Returns whether the current invocation is resumable."""
@@ -312,6 +362,55 @@ class InvocationContext(BaseModel):
         self.run_config
     )
 
+  @property
+  def artifact_manifest(self) -> _InvocationArtifactManifest:
+    """The artifacts of the current session as seen by this invocation."""
+    return self._artifact_manifest
+
+  async def save_artifact(self, filename: str, artifact: types.Part) -> int:
+    """Saves an artifact to the current session.
+
+    Args:
+      filename: The filename of the artifact.
+      artifact: The artifact to save.
+
+    Returns:
+      The version of the artifact.
+
+    Raises:
+      ValueError: If the artifact service is not initialized.
+    """
+    if self.artifact_service is None:
+      raise ValueError("Artifact service is not initialized.")
+    version = await self.artifact_service.save_artifact(
+        app_name=self.app_name,
+        user_id=self.user_id,
+        session_id=self.session.id,
+        filename=filename,
+        artifact=artifact,
+    )
+    self._artifact_manifest.record_save(filename, version)
+    return version
+
+  async def delete_artifact(self, filename: str) -> None:
+    """Deletes an artifact of the current session, with all its versions.
+
+    Args:
+      filename: The filename of the artifact.
+
+    Raises:
+      ValueError: If the artifact service is not initialized.
+    """
+    if self.artifact_service is None:
+      raise ValueError("Artifact service is not initialized.")
+    await self.artifact_service.delete_artifact(
+        app_name=self.app_name,
+        user_id=self.user_id,
+        session_id=self.session.id,
+        filename=filename,
+    )
+    self._artifact_manifest.record_delete(filename)
+
   @property
   def app_name(self) -> str:
     return self.session.app_name
@@ -395,14 +494,71 @@ class InvocationContext(BaseModel):
       return None
     function_call_id = function_responses[0].id
 
-    events = self._get_events(current_invocation=True)
-    # The last event is function_response_event, so we search backwards from the
-    # one before it.
-    for event in reversed(events[:-1]):
-      if any(fc.id == function_call_id for fc in event.get_function_calls()):
-        return event
+    events = self.session.events
+    function_call_index = self._get_function_call_index("session")
+    function_call_index.update(events)
+    # The last event of the invocation is function_response_event, so it's not
+    # a candidate.
+    last_invocation_event_index = None
+    index = len(events)
+    while (
+        index := function_call_index.find_function_call_event_index(
+            [function_call_id], before=index
+        )
+    ) is not None:
+      if events[index].invocation_id != self.invocation_id:
+        continue
+      if last_invocation_event_index is None:
+        last_invocation_event_index = next(
+            i
+            for i in range(len(events) - 1, -1, -1)
+            if events[i].invocation_id == self.invocation_id
+        )
+      if index != last_invocation_event_index:
+        return events[index]
     return None
 
+  def _get_function_call_index(self, key: str) -> FunctionCallIndex:
+    """Returns the function call index of a list of events.
+
+    The index is shared by the agents of the invocation, so it only indexes
+    the events appended to the list since it was last used.
+
+    Args:
+      key: The key of the list of events, e.g. 'session' for the session
+        events.
+    """
+    if key not in self._function_call_indices:
+      self._function_call_indices[key] = FunctionCallIndex()
+    return self._function_call_indices[key]
+
+  def _create_view(self, **update: Any) -> InvocationContext:
+    """Returns a shallow copy of this context with some fields replaced.
+
+    This is equivalent to `model_copy(update=update)`: the copy shares the
+    services, session and per-invocation trackers with this context, and only
+    the given fields differ. It skips the generic copy and attribute
+    assignment machinery of pydantic, as a context is created for every agent
+    run, and parallel agents create one per sub-agent.
+
+    Args:
+      **update: The fields to replace, e.g. `agent` or `branch`.
+    """
+    fields = self.__dict__.copy()
+    fields.update(update)
+    view = self.__class__.__new__(self.__class__)
+    object.__setattr__(view, "__dict__", fields)
+    object.__setattr__(
+        view,
+        "__pydantic_fields_set__",
+        self.__pydantic_fields_set__.union(update),
+    )
+    object.__setattr__(view, "__pydantic_extra__", None)
+    object.__setattr__(
+        view, "__pydantic_private__", self.__pydantic_private__.copy()
+    )
+    return view
+
 
 def new_invocation_context_id() -> str:
   return "e-" + str(uuid.uuid4())
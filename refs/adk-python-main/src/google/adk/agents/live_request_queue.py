@@ -78,3 +78,10 @@ class LiveRequestQueue:
 
   async def get(self) -> LiveRequest:
     return await self._queue.get()
+
+  def get_nowait(self) -> Optional[LiveRequest]:
+    """Returns the next request if one is queued, otherwise None."""
+    try:
+      return self._queue.get_nowait()
+    except asyncio.QueueEmpty:
+      return None
@@ -17,19 +17,60 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import logging
 import sys
+import time
 from typing import AsyncGenerator
+from typing import Any
 from typing import ClassVar
+from typing import Dict
+from typing import Optional
+from typing import Union
 
+from pydantic import Field
 from typing_extensions import override
 
 from ..events.event import Event
+from ..telemetry import tracing
+from ..telemetry.tracing import tracer
 from ..utils.context_utils import Aclosing
+from ..utils.feature_decorator import experimental
 from .base_agent import BaseAgent
 from .base_agent import BaseAgentState
 from .base_agent_config import BaseAgentConfig
 from .invocation_context import InvocationContext
 from .parallel_agent_config import ParallelAgentConfig
+from .parallel_completion_config import ParallelCompletionConfig
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class _BranchCompletion:
+  """Marks the end of a sub-agent run among the merged events."""
+
+  succeeded: bool
+  """Whether the sub-agent finished, i.e. didn't fail or pause."""
+
+
+_BranchItem = Union[Event, _BranchCompletion]
+
+
+async def _get_next_before_deadline(
+    agen: AsyncGenerator[_BranchItem, None], deadline: Optional[float]
+) -> _BranchItem:
+  """Returns the next item of the generator.
+
+  Raises:
+    asyncio.TimeoutError: If the deadline passes first. The generator is
+      closed then.
+  """
+  if deadline is None:
+    return await agen.__anext__()
+  return await asyncio.wait_for(
+      agen.__anext__(), timeout=max(deadline - time.monotonic(), 0)
+  )
 
 
 def _create_branch_ctx_for_sub_agent(
@@ -38,32 +79,67 @@ def _create_branch_ctx_for_sub_agent(
     invocation_context: InvocationContext,
 ) -> InvocationContext:
   """Create isolated branch for every sub-agent."""
-  invocation_context = invocation_context.model_copy()
   branch_suffix = f'{agent.name}.{sub_agent.name}'
-  invocation_context.branch = (
-      f'{invocation_context.branch}.{branch_suffix}'
-      if invocation_context.branch
-      else branch_suffix
+  return invocation_context._create_view(
+      branch=(
+          f'{invocation_context.branch}.{branch_suffix}'
+          if invocation_context.branch
+          else branch_suffix
+      )
   )
-  return invocation_context
+
+
+async def _enqueue_agent_events(
+    events_for_one_agent: AsyncGenerator[_BranchItem, None],
+    queue: asyncio.Queue,
+    buffer_size: Optional[int],
+) -> None:
+  """Puts the events of one agent on the merge queue.
+
+  Each event is queued with a callback that the consumer calls once the event
+  is processed by upstream runner.
+
+  Args:
+      events_for_one_agent: The events generated by the agent.
+      queue: The queue shared by the merged agents.
+      buffer_size: If set, the agent may have up to this many queued events
+        that are not processed yet. Otherwise it waits for each event to be
+        processed before generating the next one.
+  """
+  if buffer_size is None:
+    async for event in events_for_one_agent:
+      resume_signal = asyncio.Event()
+      await queue.put((event, resume_signal.set))
+      # Wait for upstream to consume event before generating new events.
+      await resume_signal.wait()
+    return
+
+  free_slots = asyncio.Semaphore(buffer_size)
+  async for event in events_for_one_agent:
+    # Only wait when the agent is too far ahead of upstream.
+    await free_slots.acquire()
+    await queue.put((event, free_slots.release))
 
 
 # TODO - remove once Python <3.11 is no longer supported.
 async def _merge_agent_run_pre_3_11(
-    agent_runs: list[AsyncGenerator[Event, None]],
-) -> AsyncGenerator[Event, None]:
+    agent_runs: list[AsyncGenerator[_BranchItem, None]],
+    buffer_size: Optional[int] = None,
+) -> AsyncGenerator[_BranchItem, None]:
   """Merges the agent run event generator.
   This version works in Python 3.9 and 3.10 and uses custom replacement for
   asyncio.TaskGroup for tasks cancellation and exception handling.
 
-  This implementation guarantees for each agent, it won't move on until the
-  generated event is processed by upstream runner.
+  Without a buffer size, this implementation guarantees for each agent, it
+  won't move on until the generated event is processed by upstream runner.
 
   Args:
       agent_runs: A list of async generators that yield events from each agent.
+      buffer_size: If set, each agent may generate up to this many events
+        ahead of the upstream runner.
 
   Yields:
-      Event: The next event from the merged generator.
+      The next event or sub-agent completion from the merged generator.
   """
   sentinel = object()
   queue = asyncio.Queue()
@@ -80,11 +156,7 @@ async def _merge_agent_run_pre_3_11(
   # Events for each agent are put on queue sequentially.
   async def process_an_agent(events_for_one_agent):
     try:
-      async for event in events_for_one_agent:
-        resume_signal = asyncio.Event()
-        await queue.put((event, resume_signal))
-        # Wait for upstream to consume event before generating new events.
-        await resume_signal.wait()
+      await _enqueue_agent_events(events_for_one_agent, queue, buffer_size)
     finally:
       # Mark agent as finished.
       await queue.put((sentinel, None))
@@ -98,7 +170,7 @@ async def _merge_agent_run_pre_3_11(
     # Run until all agents finished processing.
     while sentinel_count < len(agent_runs):
       propagate_exceptions(tasks)
-      event, resume_signal = await queue.get()
+      event, resume = await queue.get()
       # Agent finished processing.
       if event is sentinel:
         sentinel_count += 1
@@ -106,25 +178,31 @@ async def _merge_agent_run_pre_3_11(
         yield event
         # Signal to agent that event has been processed by runner and it can
         # continue now.
-        resume_signal.set()
+        resume()
   finally:
     for task in tasks:
       task.cancel()
+    # Wait for the cancelled tasks to stop iterating the agent runs, so that
+    # the runs can be closed afterwards.
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 async def _merge_agent_run(
-    agent_runs: list[AsyncGenerator[Event, None]],
-) -> AsyncGenerator[Event, None]:
+    agent_runs: list[AsyncGenerator[_BranchItem, None]],
+    buffer_size: Optional[int] = None,
+) -> AsyncGenerator[_BranchItem, None]:
   """Merges the agent run event generator.
 
-  This implementation guarantees for each agent, it won't move on until the
-  generated event is processed by upstream runner.
+  Without a buffer size, this implementation guarantees for each agent, it
+  won't move on until the generated event is processed by upstream runner.
 
   Args:
       agent_runs: A list of async generators that yield events from each agent.
+      buffer_size: If set, each agent may generate up to this many events
+        ahead of the upstream runner.
 
   Yields:
-      Event: The next event from the merged generator.
+      The next event or sub-agent completion from the merged generator.
   """
   sentinel = object()
   queue = asyncio.Queue()
@@ -133,30 +211,34 @@ async def _merge_agent_run(
   # Events for each agent are put on queue sequentially.
   async def process_an_agent(events_for_one_agent):
     try:
-      async for event in events_for_one_agent:
-        resume_signal = asyncio.Event()
-        await queue.put((event, resume_signal))
-        # Wait for upstream to consume event before generating new events.
-        await resume_signal.wait()
+      await _enqueue_agent_events(events_for_one_agent, queue, buffer_size)
     finally:
       # Mark agent as finished.
       await queue.put((sentinel, None))
 
+  tasks = []
   async with asyncio.TaskGroup() as tg:
     for events_for_one_agent in agent_runs:
-      tg.create_task(process_an_agent(events_for_one_agent))
+      tasks.append(tg.create_task(process_an_agent(events_for_one_agent)))
 
     sentinel_count = 0
     # Run until all agents finished processing.
     while sentinel_count < len(agent_runs):
-      event, resume_signal = await queue.get()
+      event, resume = await queue.get()
       # Agent finished processing.
       if event is sentinel:
         sentinel_count += 1
       else:
-        yield event
+        try:
+          yield event
+        except GeneratorExit:
+          # Upstream stopped early. Cancel the agents that are still running
+          # instead of letting the task group report the exit as an error.
+          for task in tasks:
+            task.cancel()
+          break
         # Signal to agent that it should generate next event.
-        resume_signal.set()
+        resume()
 
 
 class ParallelAgent(BaseAgent):
@@ -172,6 +254,23 @@ class ParallelAgent(BaseAgent):
   config_type: ClassVar[type[BaseAgentConfig]] = ParallelAgentConfig
   """The config type for this agent."""
 
+  completion_config: Optional[ParallelCompletionConfig] = None
+  """When to stop waiting for the sub-agents.
+
+  If not set, the ParallelAgent waits for every sub-agent to finish, and an
+  error in any sub-agent stops all of them.
+  """
+
+  event_buffer_size: Optional[int] = Field(default=None, ge=1)
+  """The number of events each sub-agent may generate ahead of the runner.
+
+  If not set, each sub-agent waits for every event it generates to be
+  processed by the runner, e.g. appended to the session, before it continues.
+  Setting it lets sub-agents that stream many events run without waiting on
+  the runner, at the cost of a sub-agent possibly not seeing the effects of
+  its previous few events yet.
+  """
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -184,15 +283,28 @@ class ParallelAgent(BaseAgent):
       ctx.set_agent_state(self.name, agent_state=BaseAgentState())
       yield self._create_agent_state_event(ctx)
 
+    completion_config = self.completion_config
+    required_completions = len(self.sub_agents)
+    if completion_config:
+      required_completions = completion_config.get_required_completions(
+          len(self.sub_agents)
+      )
+    completed_count = 0
+
     agent_runs = []
     # Prepare and collect async generators for each sub-agent.
     for sub_agent in self.sub_agents:
       sub_agent_ctx = _create_branch_ctx_for_sub_agent(self, sub_agent, ctx)
 
       # Only include sub-agents that haven't finished in a previous run.
-      if not sub_agent_ctx.end_of_agents.get(sub_agent.name):
-        agent_runs.append(sub_agent.run_async(sub_agent_ctx))
+      if sub_agent_ctx.end_of_agents.get(sub_agent.name):
+        completed_count += 1
+      else:
+        agent_runs.append(self._run_branch(sub_agent, sub_agent_ctx))
 
+    deadline = None
+    if completion_config and completion_config.timeout_seconds:
+      deadline = time.monotonic() + completion_config.timeout_seconds
     pause_invocation = False
     try:
       # TODO remove if once Python <3.11 is no longer supported.
@@ -202,29 +314,99 @@ class ParallelAgent(BaseAgent):
           else _merge_agent_run_pre_3_11
       )
 
-      async with Aclosing(merge_func(agent_runs)) as agen:
-        async for event in agen:
-          yield event
-          if ctx.should_pause_invocation(event):
+      async with Aclosing(
+          merge_func(agent_runs, self.event_buffer_size)
+      ) as agen:
+        while completed_count < required_completions:
+          try:
+            item = await _get_next_before_deadline(agen, deadline)
+          except StopAsyncIteration:
+            break
+          except asyncio.TimeoutError:
+            logger.info(
+                'Timed out waiting for the sub-agents of %s, %d of %d'
+                ' completed.',
+                self.name,
+                completed_count,
+                len(self.sub_agents),
+            )
+            completed_count = required_completions
+            break
+          if isinstance(item, _BranchCompletion):
+            if item.succeeded:
+              completed_count += 1
+            continue
+          yield item
+          if ctx.should_pause_invocation(item):
             pause_invocation = True
 
       if pause_invocation:
         return
 
-      # Once all sub-agents are done, mark the ParallelAgent as final.
-      if ctx.is_resumable and all(
-          ctx.end_of_agents.get(sub_agent.name) for sub_agent in self.sub_agents
-      ):
+      # Once all sub-agents are done, or the completion policy is met, mark
+      # the ParallelAgent as final.
+      if ctx.is_resumable and completed_count >= required_completions:
         ctx.set_agent_state(self.name, end_of_agent=True)
         yield self._create_agent_state_event(ctx)
 
     finally:
+      # Closing the runs also cancels the sub-agents that are still running.
       for sub_agent_run in agent_runs:
         await sub_agent_run.aclose()
 
+  async def _run_branch(
+      self, sub_agent: BaseAgent, ctx: InvocationContext
+  ) -> AsyncGenerator[_BranchItem, None]:
+    """Runs a sub-agent and yields its events, then its completion."""
+    cancel_on_error = (
+        self.completion_config.cancel_on_error
+        if self.completion_config
+        else True
+    )
+    span = tracer.start_span(f'parallel_branch {sub_agent.name}')
+    start_time = time.perf_counter()
+    outcome = 'cancelled'
+    try:
+      async with Aclosing(sub_agent.run_async(ctx)) as agen:
+        async for event in agen:
+          yield event
+      outcome = 'completed'
+    except Exception:
+      outcome = 'failed'
+      if cancel_on_error:
+        raise
+      logger.warning(
+          'Sub-agent %s of %s failed.', sub_agent.name, self.name, exc_info=True
+      )
+    finally:
+      tracing.trace_parallel_branch(
+          span, sub_agent, ctx, outcome, time.perf_counter() - start_time
+      )
+      span.end()
+    # A paused sub-agent returns without having finished.
+    yield _BranchCompletion(
+        succeeded=outcome == 'completed'
+        and (not ctx.is_resumable or ctx.end_of_agents.get(sub_agent.name))
+    )
+
   @override
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
     raise NotImplementedError('This is not supported yet for ParallelAgent.')
     yield  # AsyncGenerator requires having at least one yield statement
+
+  @override
+  @classmethod
+  @experimental
+  def _parse_config(
+      cls: type[ParallelAgent],
+      config: ParallelAgentConfig,
+      config_abs_path: str,
+      kwargs: Dict[str, Any],
+  ) -> Dict[str, Any]:
+    if config.completion_config:
+      kwargs['completion_config'] = config.completion_config
+    if config.event_buffer_size:
+      kwargs['event_buffer_size'] = config.event_buffer_size
+    return kwargs
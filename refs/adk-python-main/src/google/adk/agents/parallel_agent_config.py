@@ -16,11 +16,14 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from pydantic import ConfigDict
 from pydantic import Field
 
 from ..utils.feature_decorator import experimental
 from .base_agent_config import BaseAgentConfig
+from .parallel_completion_config import ParallelCompletionConfig
 
 
 @experimental
@@ -37,3 +40,11 @@ class ParallelAgentConfig(BaseAgentConfig):
           "The value is used to uniquely identify the ParallelAgent class."
       ),
   )
+
+  completion_config: Optional[ParallelCompletionConfig] = Field(
+      default=None, description="Optional. ParallelAgent.completion_config."
+  )
+
+  event_buffer_size: Optional[int] = Field(
+      default=None, description="Optional. ParallelAgent.event_buffer_size."
+  )
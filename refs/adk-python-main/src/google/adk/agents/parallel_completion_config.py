@@ -0,0 +1,104 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import model_validator
+
+from ..utils.feature_decorator import experimental
+
+
+@experimental
+class ParallelCompletionConfig(BaseModel):
+  """Configuration for when a ParallelAgent stops waiting for its sub-agents.
+
+  By default a ParallelAgent runs until every sub-agent finished, and an error
+  in any sub-agent stops all of them. This configuration lets it finish early,
+  for example to take the first 2 answers of 5 specialists, and cancel the
+  sub-agents that are still running. Events already generated by cancelled
+  sub-agents are kept.
+
+  Attributes:
+      min_completed_sub_agents: Finish once this many sub-agents completed
+      quorum: Finish once this fraction of the sub-agents completed
+      timeout_seconds: Finish with the results so far after this long
+      cancel_on_error: Whether an error in a sub-agent stops all of them
+  """
+
+  model_config = ConfigDict(
+      extra="forbid",
+  )
+
+  min_completed_sub_agents: Optional[int] = Field(
+      default=None,
+      ge=1,
+      description=(
+          "Finish once this many sub-agents completed without an error, and"
+          " cancel the others."
+      ),
+  )
+
+  quorum: Optional[float] = Field(
+      default=None,
+      gt=0,
+      le=1,
+      description=(
+          "Finish once this fraction of the sub-agents, rounded up, completed"
+          " without an error, and cancel the others."
+      ),
+  )
+
+  timeout_seconds: Optional[float] = Field(
+      default=None,
+      gt=0,
+      description=(
+          "Finish after this many seconds with the events generated so far,"
+          " and cancel the sub-agents that are still running."
+      ),
+  )
+
+  cancel_on_error: bool = Field(
+      default=True,
+      description=(
+          "Whether an error in a sub-agent cancels the other sub-agents and"
+          " is raised. Otherwise the error is logged, the failed sub-agent"
+          " doesn't count as completed and the others keep running."
+      ),
+  )
+
+  @model_validator(mode="after")
+  def _validate_completion_count(self) -> ParallelCompletionConfig:
+    if self.min_completed_sub_agents is not None and self.quorum is not None:
+      raise ValueError(
+          "Only one of min_completed_sub_agents and quorum can be set."
+      )
+    return self
+
+  def get_required_completions(self, sub_agent_count: int) -> int:
+    """Returns how many sub-agents must complete for the run to finish.
+
+    Args:
+        sub_agent_count: The number of sub-agents of the ParallelAgent.
+    """
+    if self.min_completed_sub_agents is not None:
+      return min(self.min_completed_sub_agents, sub_agent_count)
+    if self.quorum is not None:
+      return math.ceil(self.quorum * sub_agent_count)
+    return sub_agent_count
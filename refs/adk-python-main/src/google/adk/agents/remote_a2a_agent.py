@@ -329,7 +329,9 @@ class RemoteA2aAgent(BaseAgent):
     """
     if not ctx.session.events or ctx.session.events[-1].author != "user":
       return None
-    function_call_event = find_matching_function_call(ctx.session.events)
+    function_call_event = find_matching_function_call(
+        ctx.session.events, ctx.session.get_function_call_index()
+    )
     if not function_call_event:
       return None
 
@@ -25,6 +25,8 @@ from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
 
+from ..transcription.base_transcription_backend import BaseTranscriptionBackend
+
 logger = logging.getLogger('google_adk.' + __name__)
 
 
@@ -82,6 +84,10 @@ class RunConfig(BaseModel):
   )
   """Input transcription for live agents with audio input from user."""
 
+  input_transcription_backend: Optional[BaseTranscriptionBackend] = None
+  """Transcribes the audio input from user when `input_audio_transcription` is
+  disabled, e.g. for live models without input transcription."""
+
   realtime_input_config: Optional[types.RealtimeInputConfig] = None
   """Realtime input config for live agents with audio input from user."""
 
@@ -99,6 +105,14 @@ class RunConfig(BaseModel):
   )
   """Configuration for context window compression. If set, this will enable context window compression for LLM input."""
 
+  live_request_poll_interval: Optional[float] = Field(default=None, gt=0)
+  """If set, the interval in seconds at which live agents wake up while waiting
+  for live requests.
+
+  By default, live agents sleep until a live request arrives. Polling is only
+  needed on event loops that don't preemptively yield, e.g. Streamlit's.
+  """
+
   save_live_audio: bool = False
   """Saves live video and audio data to session and artifact service.
 
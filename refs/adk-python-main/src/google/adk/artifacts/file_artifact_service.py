@@ -0,0 +1,668 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation that stores artifacts on a local disk.
+
+Artifact contents are content addressed, so identical contents are stored only
+once no matter how many artifacts, versions or users refer to them:
+  {root_dir}/blobs/{sha256[:2]}/{sha256}
+
+Versions and their metadata are kept in a SQLite index:
+  {root_dir}/index.db
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Iterator
+from typing import Optional
+import uuid
+
+from google.genai import types
+from typing_extensions import override
+
+from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_USER_SCOPE = ""
+
+_KIND_INLINE_DATA = "inline_data"
+_KIND_TEXT = "text"
+_KIND_FILE_DATA = "file_data"
+
+_DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifact_versions (
+  app_name TEXT NOT NULL,
+  user_id TEXT NOT NULL,
+  session_id TEXT NOT NULL,
+  filename TEXT NOT NULL,
+  version INTEGER NOT NULL,
+  kind TEXT NOT NULL,
+  content_hash TEXT,
+  size INTEGER,
+  file_uri TEXT,
+  mime_type TEXT,
+  custom_metadata TEXT NOT NULL,
+  create_time REAL NOT NULL,
+  PRIMARY KEY (app_name, user_id, session_id, filename, version)
+);
+CREATE INDEX IF NOT EXISTS idx_artifact_versions_content_hash
+  ON artifact_versions (content_hash);
+"""
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation that stores artifacts on a local disk.
+
+  Saving the same contents again, for example a new version that didn't change
+  or the same file uploaded by many users, doesn't use any extra disk space.
+  Contents are read through mmap, and large artifacts can be saved and loaded
+  as streams of chunks with save_artifact_stream and load_artifact_stream.
+
+  The service can be shared by several processes on the same machine. SQLite
+  locking is unreliable on some network file systems, so a root_dir on NFS
+  should only be written to by a single host.
+  """
+
+  def __init__(self, root_dir: str):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory where the artifacts and the index are stored.
+          It is created if it doesn't exist.
+    """
+    self.root_dir = os.path.abspath(root_dir)
+    self._blobs_dir = os.path.join(self.root_dir, "blobs")
+    self._tmp_dir = os.path.join(self.root_dir, "tmp")
+    os.makedirs(self._blobs_dir, exist_ok=True)
+    os.makedirs(self._tmp_dir, exist_ok=True)
+
+    self._lock = threading.Lock()
+    self._connection = sqlite3.connect(
+        os.path.join(self.root_dir, "index.db"),
+        check_same_thread=False,
+        # Transactions are managed explicitly, see _transaction.
+        isolation_level=None,
+        timeout=30,
+    )
+    self._connection.row_factory = sqlite3.Row
+    self._connection.execute("PRAGMA journal_mode=WAL")
+    self._connection.executescript(_SCHEMA)
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      artifact: types.Part,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    return await asyncio.to_thread(
+        self._save_artifact,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        artifact,
+        custom_metadata,
+    )
+
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: AsyncIterable[bytes],
+      mime_type: Optional[str] = None,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Saves an artifact whose contents are given as a stream of chunks.
+
+    The contents are written to disk as they arrive, so they are never held in
+    memory as a whole.
+
+    Args:
+        app_name: The app name.
+        user_id: The user ID.
+        filename: The filename of the artifact.
+        chunks: The contents of the artifact.
+        mime_type: The MIME type of the artifact.
+        session_id: The session ID. If `None`, the artifact is user-scoped.
+        custom_metadata: custom metadata to associate with the artifact.
+
+    Returns:
+        The revision ID of the saved artifact.
+    """
+    session_scope = self._get_session_scope(filename, session_id)
+    tmp_path = self._new_tmp_path()
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+      with open(tmp_path, "wb") as f:
+        async for chunk in chunks:
+          hasher.update(chunk)
+          size += len(chunk)
+          await asyncio.to_thread(f.write, chunk)
+      return await asyncio.to_thread(
+          self._add_version,
+          app_name,
+          user_id,
+          session_scope,
+          filename,
+          kind=_KIND_INLINE_DATA,
+          content_hash=hasher.hexdigest(),
+          size=size,
+          tmp_path=tmp_path,
+          mime_type=mime_type,
+          custom_metadata=custom_metadata,
+      )
+    finally:
+      with contextlib.suppress(FileNotFoundError):
+        os.remove(tmp_path)
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    return await asyncio.to_thread(
+        self._load_artifact,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+
+  async def load_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+      chunk_size: int = _DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    """Yields the contents of an artifact in chunks of at most chunk_size.
+
+    Nothing is yielded if the artifact is not found, or if it refers to a file
+    that is stored elsewhere (file_data).
+    """
+    row = await asyncio.to_thread(
+        self._get_version_row,
+        app_name,
+        user_id,
+        self._get_session_scope(filename, session_id),
+        filename,
+        version,
+    )
+    if row is None or row["kind"] == _KIND_FILE_DATA:
+      return
+
+    with open(self._get_blob_path(row["content_hash"]), "rb") as f:
+      while chunk := await asyncio.to_thread(f.read, chunk_size):
+        yield chunk
+
+  async def load_artifact_buffer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[memoryview]:
+    """Returns a read-only view of the contents of an artifact.
+
+    The view is backed by a memory map of the stored contents, so nothing is
+    copied until the caller reads from it. Contents are never modified in
+    place, so the view stays valid even if the artifact is deleted.
+
+    Returns:
+        The view, or None if the artifact is not found or refers to a file that
+        is stored elsewhere (file_data).
+    """
+    row = await asyncio.to_thread(
+        self._get_version_row,
+        app_name,
+        user_id,
+        self._get_session_scope(filename, session_id),
+        filename,
+        version,
+    )
+    if row is None or row["kind"] == _KIND_FILE_DATA:
+      return None
+    if not row["size"]:
+      return memoryview(b"")
+    return memoryview(self._map_blob(row["content_hash"]))
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: Optional[str] = None
+  ) -> list[str]:
+    return await asyncio.to_thread(
+        self._list_artifact_keys,
+        app_name,
+        user_id,
+        session_id,
+    )
+
+  @override
+  async def delete_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> None:
+    return await asyncio.to_thread(
+        self._delete_artifact,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+    )
+
+  @override
+  async def list_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[int]:
+    artifact_versions = await self.list_artifact_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+    return [artifact_version.version for artifact_version in artifact_versions]
+
+  @override
+  async def list_artifact_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[ArtifactVersion]:
+    return await asyncio.to_thread(
+        self._list_artifact_versions,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+    )
+
+  @override
+  async def get_artifact_version(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactVersion]:
+    row = await asyncio.to_thread(
+        self._get_version_row,
+        app_name,
+        user_id,
+        self._get_session_scope(filename, session_id),
+        filename,
+        version,
+    )
+    return self._to_artifact_version(row) if row is not None else None
+
+  def _file_has_user_namespace(self, filename: str) -> bool:
+    """Checks if the filename has a user namespace.
+
+    Args:
+        filename: The filename to check.
+
+    Returns:
+        True if the filename has a user namespace (starts with "user:"),
+        False otherwise.
+    """
+    return filename.startswith("user:")
+
+  def _get_session_scope(
+      self, filename: str, session_id: Optional[str]
+  ) -> str:
+    """Returns the session_id column value for the artifact."""
+    if self._file_has_user_namespace(filename):
+      return _USER_SCOPE
+
+    if session_id is None:
+      raise ValueError(
+          "Session ID must be provided for session-scoped artifacts."
+      )
+    return session_id
+
+  def _get_blob_path(self, content_hash: str) -> str:
+    return os.path.join(self._blobs_dir, content_hash[:2], content_hash)
+
+  def _new_tmp_path(self) -> str:
+    return os.path.join(self._tmp_dir, uuid.uuid4().hex)
+
+  @contextlib.contextmanager
+  def _transaction(self) -> Iterator[sqlite3.Connection]:
+    """Runs a write transaction that excludes writers in other processes."""
+    with self._lock:
+      self._connection.execute("BEGIN IMMEDIATE")
+      try:
+        yield self._connection
+      except BaseException:
+        self._connection.execute("ROLLBACK")
+        raise
+      self._connection.execute("COMMIT")
+
+  def _query(self, sql: str, parameters: tuple[Any, ...]) -> list[sqlite3.Row]:
+    with self._lock:
+      return self._connection.execute(sql, parameters).fetchall()
+
+  def _save_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      artifact: types.Part,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    session_scope = self._get_session_scope(filename, session_id)
+
+    if artifact.inline_data:
+      kind = _KIND_INLINE_DATA
+      data = artifact.inline_data.data or b""
+      mime_type = artifact.inline_data.mime_type
+    elif artifact.text is not None:
+      kind = _KIND_TEXT
+      data = artifact.text.encode("utf-8")
+      mime_type = "text/plain"
+    elif artifact.file_data:
+      # The contents were uploaded elsewhere, we only keep the reference.
+      return self._add_version(
+          app_name,
+          user_id,
+          session_scope,
+          filename,
+          kind=_KIND_FILE_DATA,
+          file_uri=artifact.file_data.file_uri,
+          mime_type=artifact.file_data.mime_type,
+          custom_metadata=custom_metadata,
+      )
+    else:
+      raise ValueError("Artifact must have either inline_data or text.")
+
+    content_hash = hashlib.sha256(data).hexdigest()
+    tmp_path = None
+    if not os.path.exists(self._get_blob_path(content_hash)):
+      tmp_path = self._new_tmp_path()
+      with open(tmp_path, "wb") as f:
+        f.write(data)
+    try:
+      return self._add_version(
+          app_name,
+          user_id,
+          session_scope,
+          filename,
+          kind=kind,
+          content_hash=content_hash,
+          size=len(data),
+          tmp_path=tmp_path,
+          data=data,
+          mime_type=mime_type,
+          custom_metadata=custom_metadata,
+      )
+    finally:
+      if tmp_path:
+        with contextlib.suppress(FileNotFoundError):
+          os.remove(tmp_path)
+
+  def _add_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_scope: str,
+      filename: str,
+      *,
+      kind: str,
+      content_hash: Optional[str] = None,
+      size: Optional[int] = None,
+      tmp_path: Optional[str] = None,
+      data: Optional[bytes] = None,
+      file_uri: Optional[str] = None,
+      mime_type: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Records a new version of an artifact and returns its version number.
+
+    If the contents are not stored yet, they are moved into place from
+    tmp_path, or written from data. This happens inside the write transaction,
+    so that a concurrent delete can't remove the contents before the new
+    version refers to them.
+    """
+    with self._transaction() as connection:
+      if content_hash is not None:
+        blob_path = self._get_blob_path(content_hash)
+        if not os.path.exists(blob_path):
+          if tmp_path is None:
+            # The contents were deleted since the caller last checked.
+            tmp_path = self._new_tmp_path()
+            with open(tmp_path, "wb") as f:
+              f.write(data or b"")
+          os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+          os.replace(tmp_path, blob_path)
+
+      (version,) = connection.execute(
+          "SELECT COALESCE(MAX(version) + 1, 0) FROM artifact_versions"
+          " WHERE app_name = ? AND user_id = ? AND session_id = ?"
+          " AND filename = ?",
+          (app_name, user_id, session_scope, filename),
+      ).fetchone()
+      connection.execute(
+          "INSERT INTO artifact_versions VALUES"
+          " (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+          (
+              app_name,
+              user_id,
+              session_scope,
+              filename,
+              version,
+              kind,
+              content_hash,
+              size,
+              file_uri,
+              mime_type,
+              json.dumps(custom_metadata or {}),
+              time.time(),
+          ),
+      )
+    return version
+
+  def _get_version_row(
+      self,
+      app_name: str,
+      user_id: str,
+      session_scope: str,
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[sqlite3.Row]:
+    sql = (
+        "SELECT * FROM artifact_versions WHERE app_name = ? AND user_id = ?"
+        " AND session_id = ? AND filename = ?"
+    )
+    parameters = (app_name, user_id, session_scope, filename)
+    if version is None:
+      sql += " ORDER BY version DESC LIMIT 1"
+    else:
+      sql += " AND version = ?"
+      parameters += (version,)
+    rows = self._query(sql, parameters)
+    return rows[0] if rows else None
+
+  def _load_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    row = self._get_version_row(
+        app_name,
+        user_id,
+        self._get_session_scope(filename, session_id),
+        filename,
+        version,
+    )
+    if row is None:
+      return None
+
+    if row["kind"] == _KIND_FILE_DATA:
+      return types.Part(
+          file_data=types.FileData(
+              file_uri=row["file_uri"], mime_type=row["mime_type"]
+          )
+      )
+
+    data = self._read_blob(row["content_hash"], row["size"])
+    if row["kind"] == _KIND_TEXT:
+      return types.Part(text=data.decode("utf-8"))
+    return types.Part.from_bytes(data=data, mime_type=row["mime_type"])
+
+  def _map_blob(self, content_hash: str) -> mmap.mmap:
+    with open(self._get_blob_path(content_hash), "rb") as f:
+      # The mapping stays valid after the file is closed.
+      return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+  def _read_blob(self, content_hash: str, size: int) -> bytes:
+    if not size:
+      return b""
+    # types.Part holds bytes, so the contents are copied once, straight from
+    # the mapped pages.
+    with self._map_blob(content_hash) as mapped:
+      return mapped[:]
+
+  def _list_artifact_keys(
+      self, app_name: str, user_id: str, session_id: Optional[str]
+  ) -> list[str]:
+    session_scopes = [_USER_SCOPE]
+    if session_id:
+      session_scopes.append(session_id)
+    rows = self._query(
+        "SELECT DISTINCT filename FROM artifact_versions"
+        " WHERE app_name = ? AND user_id = ?"
+        f" AND session_id IN ({', '.join('?' * len(session_scopes))})"
+        " ORDER BY filename",
+        (app_name, user_id, *session_scopes),
+    )
+    return [row["filename"] for row in rows]
+
+  def _delete_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> None:
+    session_scope = self._get_session_scope(filename, session_id)
+    with self._transaction() as connection:
+      content_hashes = {
+          row["content_hash"]
+          for row in connection.execute(
+              "SELECT DISTINCT content_hash FROM artifact_versions"
+              " WHERE app_name = ? AND user_id = ? AND session_id = ?"
+              " AND filename = ? AND content_hash IS NOT NULL",
+              (app_name, user_id, session_scope, filename),
+          )
+      }
+      connection.execute(
+          "DELETE FROM artifact_versions WHERE app_name = ? AND user_id = ?"
+          " AND session_id = ? AND filename = ?",
+          (app_name, user_id, session_scope, filename),
+      )
+      # Contents are shared, so they are only removed once no other version
+      # refers to them.
+      for content_hash in content_hashes:
+        if connection.execute(
+            "SELECT 1 FROM artifact_versions WHERE content_hash = ? LIMIT 1",
+            (content_hash,),
+        ).fetchone():
+          continue
+        with contextlib.suppress(FileNotFoundError):
+          os.remove(self._get_blob_path(content_hash))
+
+  def _list_artifact_versions(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> list[ArtifactVersion]:
+    rows = self._query(
+        "SELECT * FROM artifact_versions WHERE app_name = ? AND user_id = ?"
+        " AND session_id = ? AND filename = ? ORDER BY version",
+        (
+            app_name,
+            user_id,
+            self._get_session_scope(filename, session_id),
+            filename,
+        ),
+    )
+    return [self._to_artifact_version(row) for row in rows]
+
+  def _to_artifact_version(self, row: sqlite3.Row) -> ArtifactVersion:
+    if row["kind"] == _KIND_FILE_DATA:
+      canonical_uri = row["file_uri"]
+    else:
+      canonical_uri = "file://" + self._get_blob_path(row["content_hash"])
+    return ArtifactVersion(
+        version=row["version"],
+        canonical_uri=canonical_uri,
+        custom_metadata=json.loads(row["custom_metadata"]),
+        create_time=row["create_time"],
+        mime_type=row["mime_type"],
+    )
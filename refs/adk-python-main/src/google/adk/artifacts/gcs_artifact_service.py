@@ -19,14 +19,21 @@ The blob name format used depends on whether the filename has a user namespace:
     {app_name}/{user_id}/user/{filename}/{version}
   - For regular session-scoped files:
     {app_name}/{user_id}/{session_id}/{filename}/{version}
+
+The latest version of every artifact is tracked in a small pointer blob, so
+that saving and loading the latest version don't need to list all versions:
+    .adk_version_index/{artifact blob prefix}
 """
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
+import time
 from typing import Any
 from typing import Optional
 
+from google.api_core import exceptions as gcs_exceptions
 from google.cloud import storage
 from google.genai import types
 from typing_extensions import override
@@ -36,20 +43,48 @@ from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_VERSION_INDEX_PREFIX = ".adk_version_index/"
+
+# Blobs larger than this are uploaded as resumable uploads in chunks of this
+# size (a multiple of 256 KiB, as required by GCS), so that a failed request
+# only retries a single chunk.
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# How many times advancing a version pointer is retried when other writers
+# keep updating it at the same time.
+_MAX_VERSION_POINTER_UPDATE_ATTEMPTS = 10
+
 
 class GcsArtifactService(BaseArtifactService):
   """An artifact service implementation using Google Cloud Storage (GCS)."""
 
-  def __init__(self, bucket_name: str, **kwargs):
+  def __init__(
+      self,
+      bucket_name: str,
+      list_artifact_keys_cache_ttl_seconds: float = 5.0,
+      **kwargs,
+  ):
     """Initializes the GcsArtifactService.
 
     Args:
         bucket_name: The name of the bucket to use.
+        list_artifact_keys_cache_ttl_seconds: How long the results of
+          list_artifact_keys are reused. Saves and deletes made through this
+          service invalidate them right away, changes made by other processes
+          are visible after at most this long. Set to 0 to disable caching.
         **kwargs: Keyword arguments to pass to the Google Cloud Storage client.
     """
     self.bucket_name = bucket_name
     self.storage_client = storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
+    self._list_artifact_keys_cache_ttl_seconds = (
+        list_artifact_keys_cache_ttl_seconds
+    )
+    # {(app_name, user_id, session_id): (expire_time, artifact keys)}
+    self._artifact_keys_cache: dict[
+        tuple[str, str, Optional[str]], tuple[float, list[str]]
+    ] = {}
+    self._artifact_keys_cache_lock = threading.Lock()
 
   @override
   async def save_artifact(
@@ -190,51 +225,153 @@ class GcsArtifactService(BaseArtifactService):
       # TODO: b/447451270 - support saving artifact with custom metadata.
       raise NotImplementedError("custom_metadata is not supported yet.")
 
-    versions = self._list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    version = 0 if not versions else max(versions) + 1
-
-    blob_name = self._get_blob_name(
-        app_name, user_id, filename, version, session_id
+    latest_version, pointer_generation = self._get_latest_version(
+        app_name, user_id, session_id, filename
     )
-    blob = self.bucket.blob(blob_name)
+    version = 0 if latest_version is None else latest_version + 1
 
     if artifact.inline_data:
-      blob.upload_from_string(
-          data=artifact.inline_data.data,
-          content_type=artifact.inline_data.mime_type,
-      )
+      data = artifact.inline_data.data
+      content_type = artifact.inline_data.mime_type
     elif artifact.text:
-      blob.upload_from_string(
-          data=artifact.text,
-      )
+      data = artifact.text
+      content_type = None
     else:
       raise ValueError("Artifact must have either inline_data or text.")
 
+    while True:
+      blob_name = self._get_blob_name(
+          app_name, user_id, filename, version, session_id
+      )
+      blob = self.bucket.blob(blob_name)
+      if len(data) > _UPLOAD_CHUNK_SIZE:
+        blob.chunk_size = _UPLOAD_CHUNK_SIZE
+      upload_kwargs = {"content_type": content_type} if content_type else {}
+      try:
+        # Only create the blob if the version doesn't exist yet, which makes
+        # allocating the version atomic across concurrent writers.
+        blob.upload_from_string(
+            data=data, if_generation_match=0, **upload_kwargs
+        )
+        break
+      except gcs_exceptions.PreconditionFailed:
+        version += 1
+
+    self._advance_version_pointer(
+        app_name, user_id, session_id, filename, version, pointer_generation
+    )
+    self._invalidate_artifact_keys_cache(app_name, user_id)
     return version
 
-  def _load_artifact(
+  def _get_version_pointer_name(
       self,
       app_name: str,
       user_id: str,
       session_id: Optional[str],
       filename: str,
-      version: Optional[int] = None,
-  ) -> Optional[types.Part]:
-    if version is None:
+  ) -> str:
+    return _VERSION_INDEX_PREFIX + self._get_blob_name(
+        app_name, user_id, filename, "", session_id
+    )
+
+  def _read_version_pointer(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> tuple[Optional[int], int]:
+    """Returns the latest version in the pointer and the pointer generation.
+
+    The generation is 0 if there is no pointer.
+    """
+    pointer = self.bucket.blob(
+        self._get_version_pointer_name(
+            app_name, user_id, session_id, filename
+        )
+    )
+    try:
+      # The download sets the generation of the content it returned, so both
+      # come from the same request and can't be torn by a concurrent writer.
+      data = pointer.download_as_bytes()
+    except gcs_exceptions.NotFound:
+      return None, 0
+    return int(data), pointer.generation
+
+  def _get_latest_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> tuple[Optional[int], int]:
+    """Returns the latest version of an artifact and the pointer generation."""
+    latest_version, pointer_generation = self._read_version_pointer(
+        app_name, user_id, session_id, filename
+    )
+    if latest_version is None:
+      # Artifacts saved before the version pointer existed don't have one.
       versions = self._list_versions(
           app_name=app_name,
           user_id=user_id,
           session_id=session_id,
           filename=filename,
       )
-      if not versions:
+      if versions:
+        latest_version = max(versions)
+    return latest_version, pointer_generation
+
+  def _advance_version_pointer(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: int,
+      pointer_generation: int,
+  ):
+    """Points the version pointer at version, unless it is already newer."""
+    pointer = self.bucket.blob(
+        self._get_version_pointer_name(
+            app_name, user_id, session_id, filename
+        )
+    )
+    for _ in range(_MAX_VERSION_POINTER_UPDATE_ATTEMPTS):
+      try:
+        pointer.upload_from_string(
+            data=str(version), if_generation_match=pointer_generation
+        )
+        return
+      except gcs_exceptions.PreconditionFailed:
+        latest_version, pointer_generation = self._read_version_pointer(
+            app_name, user_id, session_id, filename
+        )
+        if latest_version is not None and latest_version >= version:
+          return
+    # The version itself is saved. A lagging pointer only makes the next save
+    # try a few taken versions before it finds a free one.
+    logger.warning(
+        "Gave up advancing the version pointer of %s to version %d after %d"
+        " concurrent updates.",
+        filename,
+        version,
+        _MAX_VERSION_POINTER_UPDATE_ATTEMPTS,
+    )
+
+  def _load_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    if version is None:
+      version, _ = self._get_latest_version(
+          app_name, user_id, session_id, filename
+      )
+      if version is None:
         return None
-      version = max(versions)
 
     blob_name = self._get_blob_name(
         app_name, user_id, filename, version, session_id
@@ -251,6 +388,32 @@ class GcsArtifactService(BaseArtifactService):
 
   def _list_artifact_keys(
       self, app_name: str, user_id: str, session_id: Optional[str]
+  ) -> list[str]:
+    cache_key = (app_name, user_id, session_id)
+    with self._artifact_keys_cache_lock:
+      cached = self._artifact_keys_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+      return list(cached[1])
+
+    artifact_keys = self._list_artifact_keys_uncached(
+        app_name, user_id, session_id
+    )
+    if self._list_artifact_keys_cache_ttl_seconds > 0:
+      with self._artifact_keys_cache_lock:
+        self._artifact_keys_cache[cache_key] = (
+            time.monotonic() + self._list_artifact_keys_cache_ttl_seconds,
+            artifact_keys,
+        )
+    return list(artifact_keys)
+
+  def _invalidate_artifact_keys_cache(self, app_name: str, user_id: str):
+    with self._artifact_keys_cache_lock:
+      for cache_key in list(self._artifact_keys_cache):
+        if cache_key[:2] == (app_name, user_id):
+          del self._artifact_keys_cache[cache_key]
+
+  def _list_artifact_keys_uncached(
+      self, app_name: str, user_id: str, session_id: Optional[str]
   ) -> list[str]:
     filenames = set()
 
@@ -292,7 +455,17 @@ class GcsArtifactService(BaseArtifactService):
       )
       blob = self.bucket.blob(blob_name)
       blob.delete()
-    return
+
+    pointer = self.bucket.blob(
+        self._get_version_pointer_name(
+            app_name, user_id, session_id, filename
+        )
+    )
+    try:
+      pointer.delete()
+    except gcs_exceptions.NotFound:
+      pass
+    self._invalidate_artifact_keys_cache(app_name, user_id)
 
   def _list_versions(
       self,
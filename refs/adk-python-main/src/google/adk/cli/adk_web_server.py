@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
+import hashlib
 import importlib
 import json
 import logging
@@ -32,6 +33,7 @@ from typing import Optional
 from fastapi import FastAPI
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Request
 from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
@@ -47,6 +49,7 @@ from opentelemetry.sdk.trace import export as export_lib
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
+from pydantic import BaseModel
 from pydantic import Field
 from pydantic import ValidationError
 from starlette.types import Lifespan
@@ -58,6 +61,7 @@ from . import agent_graph
 from ..agents.base_agent import BaseAgent
 from ..agents.live_request_queue import LiveRequest
 from ..agents.live_request_queue import LiveRequestQueue
+from ..agents.llm_agent import LlmAgent
 from ..agents.run_config import RunConfig
 from ..agents.run_config import StreamingMode
 from ..apps.app import App
@@ -67,6 +71,8 @@ from ..errors.not_found_error import NotFoundError
 from ..evaluation.base_eval_service import InferenceConfig
 from ..evaluation.base_eval_service import InferenceRequest
 from ..evaluation.constants import MISSING_EVAL_DEPENDENCIES_MESSAGE
+from ..evaluation.database_eval_set_results_manager import DatabaseEvalSetResultsManager
+from ..evaluation.database_eval_set_results_manager import EvalMetricSummary
 from ..evaluation.eval_case import EvalCase
 from ..evaluation.eval_case import SessionInput
 from ..evaluation.eval_metrics import EvalMetric
@@ -80,16 +86,24 @@ from ..evaluation.eval_set_results_manager import EvalSetResultsManager
 from ..evaluation.eval_sets_manager import EvalSetsManager
 from ..events.event import Event
 from ..memory.base_memory_service import BaseMemoryService
+from ..models.base_llm import BaseLlm
+from ..models.registry import LLMRegistry
 from ..plugins.base_plugin import BasePlugin
 from ..runners import Runner
 from ..sessions.base_session_service import BaseSessionService
+from ..sessions.base_session_service import GetSessionConfig
+from ..sessions.base_session_service import ListSessionsConfig
+from ..sessions.base_session_service import SessionProjection
 from ..sessions.session import Session
 from ..utils.context_utils import Aclosing
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .utils import cleanup
 from .utils import common
+from .utils import compression
 from .utils import envs
 from .utils import evals
+from .utils import live_frames
+from .utils import sse_frames
 from .utils.base_agent_loader import BaseAgentLoader
 from .utils.shared_value import SharedValue
 from .utils.state import create_empty_state
@@ -171,6 +185,8 @@ class RunAgentRequest(common.BaseModel):
   session_id: str
   new_message: types.Content
   streaming: bool = False
+  # Whether /run_sse sends streamed text as text deltas, see sse_frames.
+  sse_text_deltas: bool = False
   state_delta: Optional[dict[str, Any]] = None
   # for resume long running functions
   invocation_id: Optional[str] = None
@@ -263,6 +279,12 @@ class ListEvalSetsResponse(common.BaseModel):
   eval_set_ids: list[str]
 
 
+class ReadinessResponse(common.BaseModel):
+  ready: bool
+  failed_apps: dict[str, str] = Field(default_factory=dict)
+  """The error of each app that failed to load while warming up."""
+
+
 class EvalResult(EvalSetResult):
   """This class has no field intentionally.
 
@@ -279,6 +301,10 @@ class ListMetricsInfoResponse(common.BaseModel):
   metrics_info: list[MetricInfo]
 
 
+class ListEvalMetricSummariesResponse(common.BaseModel):
+  eval_metric_summaries: list[EvalMetricSummary]
+
+
 def _setup_telemetry(
     otel_to_cloud: bool = False,
     internal_exporters: Optional[list[SpanProcessor]] = None,
@@ -386,6 +412,69 @@ def _setup_instrumentation_lib_if_installed():
     )
 
 
+def _matches_etag(if_none_match: Optional[str], etag: str) -> bool:
+  if not if_none_match:
+    return False
+  if if_none_match.strip() == "*":
+    return True
+  # Compressed responses carry weak ETags, so the comparison is weak.
+  return any(
+      tag.strip().removeprefix("W/") == etag
+      for tag in if_none_match.split(",")
+  )
+
+
+def _create_cacheable_json_response(
+    request: Request, model_type: type[BaseModel], content: Any
+) -> Response:
+  """Returns the content as JSON, or a 304 if the client has it already.
+
+  The content is validated as the model type, like FastAPI does for response
+  models. The ETag is a hash of the JSON, so clients polling e.g. a session only
+  download it again once it changed.
+  """
+  data = model_type.model_validate(content).model_dump_json(
+      exclude_none=True, by_alias=True
+  )
+  etag = f'"{hashlib.blake2b(data.encode(), digest_size=16).hexdigest()}"'
+  headers = {"ETag": etag, "Cache-Control": "no-cache"}
+  if _matches_etag(request.headers.get("if-none-match"), etag):
+    return Response(status_code=304, headers=headers)
+  return Response(data, media_type="application/json", headers=headers)
+
+
+_SESSION_AFFINITY_HEADER = "X-Session-Affinity"
+
+_TRACES_DISABLED_DETAIL = (
+    "In-memory traces are disabled when the server runs multiple workers."
+    " Export the traces with --trace_to_cloud or --otel_to_cloud instead."
+)
+
+
+def _get_session_affinity(app_name: str, user_id: str) -> str:
+  """Returns the routing key of the sessions of a user.
+
+  Balancers in front of several servers can route the requests carrying the
+  key to the same server, whose runner for the app is warm. The key is the same
+  for all the sessions of a user, so it's known before a session is created.
+  """
+  key = "\0".join((app_name, user_id))
+  return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+async def _warm_up_llms(agent: BaseAgent) -> None:
+  """Warms up the LLMs of the agent and its sub-agents."""
+  if isinstance(agent, LlmAgent):
+    if isinstance(agent.model, BaseLlm):
+      await agent.model.warm_up()
+    elif agent.model:
+      # The LLM of a model name is created per request, so only its class can
+      # be loaded ahead of time.
+      LLMRegistry.resolve(agent.model)
+  for sub_agent in agent.sub_agents:
+    await _warm_up_llms(sub_agent)
+
+
 class AdkWebServer:
   """Helper class for setting up and running the ADK web server on FastAPI.
 
@@ -486,6 +575,32 @@ class AdkWebServer:
     self.runner_dict[app_name] = runner
     return runner
 
+  async def warm_up(self) -> dict[str, str]:
+    """Loads all the apps, builds their runners and warms up their LLMs.
+
+    The agents are loaded in parallel threads. Apps that fail to load are
+    skipped, they fail again on their first request.
+
+    Returns:
+      The error of each app that failed to load.
+    """
+    load_errors = await asyncio.to_thread(self.agent_loader.preload_agents)
+    failed_apps = {
+        app_name: str(error)
+        for app_name, error in load_errors.items()
+        if error is not None
+    }
+    for app_name, error in load_errors.items():
+      if error is not None:
+        continue
+      try:
+        runner = await self.get_runner_async(app_name)
+        await _warm_up_llms(runner.agent)
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to warm up app %s: %s", app_name, e)
+        failed_apps[app_name] = str(e)
+    return failed_apps
+
   def _create_runner(self, agentic_app: App) -> Runner:
     """Create a runner with common services."""
     return Runner(
@@ -590,6 +705,9 @@ class AdkWebServer:
       ] = lambda o, s: None,
       register_processors: Callable[[TracerProvider], None] = lambda o: None,
       otel_to_cloud: bool = False,
+      in_memory_traces: bool = True,
+      warm_up: bool = False,
+      wait_for_warm_up: bool = True,
   ):
     """Creates a FastAPI app for the ADK web server.
 
@@ -608,6 +726,14 @@ class AdkWebServer:
         to the TracerProvider.
       otel_to_cloud: EXPERIMENTAL. Whether to enable Cloud Trace
       and Cloud Logging integrations.
+      in_memory_traces: Whether to keep the traces in memory for the debug
+        trace endpoints. Servers with multiple workers disable them, since
+        each worker would only see its own traces.
+      warm_up: Whether to load all the apps, build their runners and warm up
+        their LLMs when the app starts. The /ready endpoint reports when it's
+        done.
+      wait_for_warm_up: Whether the app only accepts requests once it's warmed
+        up, rather than warming up in the background.
 
     Returns:
       A FastAPI app instance.
@@ -618,16 +744,24 @@ class AdkWebServer:
     # Set up a file system watcher to detect changes in the agents directory.
     observer = Observer()
     setup_observer(observer, self)
+    warm_up_task: Optional[asyncio.Task[dict[str, str]]] = None
 
     @asynccontextmanager
     async def internal_lifespan(app: FastAPI):
+      nonlocal warm_up_task
       try:
+        if warm_up:
+          warm_up_task = asyncio.create_task(self.warm_up())
+          if wait_for_warm_up:
+            await warm_up_task
         if lifespan:
           async with lifespan(app) as lifespan_context:
             yield lifespan_context
         else:
           yield
       finally:
+        if warm_up_task:
+          warm_up_task.cancel()
         tear_down_observer(observer, self)
         # Create tasks for all runner closures to run concurrently
         await cleanup.close_runners(list(self.runner_dict.values()))
@@ -639,7 +773,9 @@ class AdkWebServer:
         internal_exporters=[
             export_lib.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict)),
             export_lib.SimpleSpanProcessor(memory_exporter),
-        ],
+        ]
+        if in_memory_traces
+        else None,
     )
     if web_assets_dir:
       self._setup_runtime_config(web_assets_dir)
@@ -651,6 +787,7 @@ class AdkWebServer:
 
     # Run the FastAPI server.
     app = FastAPI(lifespan=internal_lifespan)
+    app.add_middleware(compression.CompressionMiddleware)
 
     if allow_origins:
       app.add_middleware(
@@ -665,8 +802,24 @@ class AdkWebServer:
     async def list_apps() -> list[str]:
       return self.agent_loader.list_agents()
 
+    @app.get("/ready")
+    async def get_readiness(response: Response) -> ReadinessResponse:
+      """Reports whether the apps are warmed up, if warming up is enabled."""
+      if warm_up_task is None:
+        return ReadinessResponse(ready=True)
+      if (
+          not warm_up_task.done()
+          or warm_up_task.cancelled()
+          or warm_up_task.exception()
+      ):
+        response.status_code = 503
+        return ReadinessResponse(ready=False)
+      return ReadinessResponse(ready=True, failed_apps=warm_up_task.result())
+
     @app.get("/debug/trace/{event_id}", tags=[TAG_DEBUG])
     async def get_trace_dict(event_id: str) -> Any:
+      if not in_memory_traces:
+        raise HTTPException(status_code=404, detail=_TRACES_DISABLED_DETAIL)
       event_dict = trace_dict.get(event_id, None)
       if event_dict is None:
         raise HTTPException(status_code=404, detail="Trace not found")
@@ -674,6 +827,8 @@ class AdkWebServer:
 
     @app.get("/debug/trace/session/{session_id}", tags=[TAG_DEBUG])
     async def get_session_trace(session_id: str) -> Any:
+      if not in_memory_traces:
+        raise HTTPException(status_code=404, detail=_TRACES_DISABLED_DETAIL)
       spans = memory_exporter.get_finished_spans(session_id)
       if not spans:
         return []
@@ -695,24 +850,61 @@ class AdkWebServer:
         response_model_exclude_none=True,
     )
     async def get_session(
-        app_name: str, user_id: str, session_id: str
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        request: Request,
+        projection: SessionProjection = Query(SessionProjection.FULL),
     ) -> Session:
+      kwargs = {}
+      if projection != SessionProjection.FULL:
+        kwargs["config"] = GetSessionConfig(projection=projection)
       session = await self.session_service.get_session(
-          app_name=app_name, user_id=user_id, session_id=session_id
+          app_name=app_name, user_id=user_id, session_id=session_id, **kwargs
       )
       if not session:
         raise HTTPException(status_code=404, detail="Session not found")
       self.current_app_name_ref.value = app_name
-      return session
+      response = _create_cacheable_json_response(request, Session, session)
+      response.headers[_SESSION_AFFINITY_HEADER] = _get_session_affinity(
+          app_name, user_id
+      )
+      return response
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions",
         response_model_exclude_none=True,
     )
-    async def list_sessions(app_name: str, user_id: str) -> list[Session]:
-      list_sessions_response = await self.session_service.list_sessions(
-          app_name=app_name, user_id=user_id
+    async def list_sessions(
+        app_name: str,
+        user_id: str,
+        response: Response,
+        page_size: Optional[int] = Query(None, gt=0),
+        page_token: Optional[str] = Query(None),
+    ) -> list[Session]:
+      """Lists the sessions of a user.
+
+      The sessions are paginated if a page size is set, and the token of the
+      next page is returned in the X-Next-Page-Token header.
+      """
+      kwargs = {}
+      if page_size or page_token:
+        kwargs["config"] = ListSessionsConfig(
+            page_size=page_size, page_token=page_token
+        )
+      try:
+        list_sessions_response = await self.session_service.list_sessions(
+            app_name=app_name, user_id=user_id, **kwargs
+        )
+      except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+      response.headers[_SESSION_AFFINITY_HEADER] = _get_session_affinity(
+          app_name, user_id
       )
+      if list_sessions_response.next_page_token:
+        response.headers["X-Next-Page-Token"] = (
+            list_sessions_response.next_page_token
+        )
       return [
           session
           for session in list_sessions_response.sessions
@@ -732,6 +924,7 @@ class AdkWebServer:
         app_name: str,
         user_id: str,
         session_id: str,
+        response: Response,
         state: Optional[dict[str, Any]] = None,
     ) -> Session:
       if (
@@ -747,6 +940,9 @@ class AdkWebServer:
           app_name=app_name, user_id=user_id, state=state, session_id=session_id
       )
       logger.info("New session created: %s", session_id)
+      response.headers[_SESSION_AFFINITY_HEADER] = _get_session_affinity(
+          app_name, user_id
+      )
       return session
 
     @app.post(
@@ -756,24 +952,30 @@ class AdkWebServer:
     async def create_session(
         app_name: str,
         user_id: str,
+        response: Response,
         req: Optional[CreateSessionRequest] = None,
     ) -> Session:
       if not req:
-        return await self.session_service.create_session(
+        session = await self.session_service.create_session(
             app_name=app_name, user_id=user_id
         )
+      else:
+        session = await self.session_service.create_session(
+            app_name=app_name,
+            user_id=user_id,
+            state=req.state,
+            session_id=req.session_id,
+        )
 
-      session = await self.session_service.create_session(
-          app_name=app_name,
-          user_id=user_id,
-          state=req.state,
-          session_id=req.session_id,
-      )
-
-      if req.events:
-        for event in req.events:
-          await self.session_service.append_event(session=session, event=event)
+        if req.events:
+          for event in req.events:
+            await self.session_service.append_event(
+                session=session, event=event
+            )
 
+      response.headers[_SESSION_AFFINITY_HEADER] = _get_session_affinity(
+          app_name, user_id
+      )
       return session
 
     @app.delete("/apps/{app_name}/users/{user_id}/sessions/{session_id}")
@@ -1205,6 +1407,41 @@ class AdkWebServer:
       list_eval_results_response = await list_eval_results(app_name)
       return list_eval_results_response.eval_result_ids
 
+    @app.get(
+        "/apps/{app_name}/eval-metric-summaries",
+        response_model_exclude_none=True,
+        tags=[TAG_EVALUATION],
+    )
+    async def list_eval_metric_summaries(
+        app_name: str,
+        eval_set_id: Optional[str] = Query(None),
+        metric_name: Optional[str] = Query(None),
+        start_timestamp: Optional[float] = Query(None),
+        end_timestamp: Optional[float] = Query(None),
+        limit: Optional[int] = Query(None, ge=1),
+    ) -> ListEvalMetricSummariesResponse:
+      """Lists the metric aggregates of the eval runs of the given app."""
+      if not isinstance(
+          self.eval_set_results_manager, DatabaseEvalSetResultsManager
+      ):
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Eval metric summaries require a database eval results store."
+                " Start the server with --eval_results_db_url."
+            ),
+        )
+      return ListEvalMetricSummariesResponse(
+          eval_metric_summaries=self.eval_set_results_manager.list_eval_metric_summaries(
+              app_name,
+              eval_set_id=eval_set_id,
+              metric_name=metric_name,
+              start_timestamp=start_timestamp,
+              end_timestamp=end_timestamp,
+              limit=limit,
+          )
+      )
+
     @app.get(
         "/apps/{app_name}/metrics-info",
         response_model_exclude_none=True,
@@ -1236,6 +1473,7 @@ class AdkWebServer:
         user_id: str,
         session_id: str,
         artifact_name: str,
+        request: Request,
         version: Optional[int] = Query(None),
     ) -> Optional[types.Part]:
       artifact = await self.artifact_service.load_artifact(
@@ -1247,7 +1485,7 @@ class AdkWebServer:
       )
       if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
-      return artifact
+      return _create_cacheable_json_response(request, types.Part, artifact)
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}/versions/{version_id}",
@@ -1259,6 +1497,7 @@ class AdkWebServer:
         session_id: str,
         artifact_name: str,
         version_id: int,
+        request: Request,
     ) -> Optional[types.Part]:
       artifact = await self.artifact_service.load_artifact(
           app_name=app_name,
@@ -1269,7 +1508,7 @@ class AdkWebServer:
       )
       if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
-      return artifact
+      return _create_cacheable_json_response(request, types.Part, artifact)
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts",
@@ -1345,7 +1584,9 @@ class AdkWebServer:
       await self.memory_service.add_session_to_memory(session)
 
     @app.post("/run", response_model_exclude_none=True)
-    async def run_agent(req: RunAgentRequest) -> list[Event]:
+    async def run_agent(
+        req: RunAgentRequest, response: Response
+    ) -> list[Event]:
       session = await self.session_service.get_session(
           app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
       )
@@ -1363,6 +1604,9 @@ class AdkWebServer:
         events = [event async for event in agen]
       logger.info("Generated %s events in agent run", len(events))
       logger.debug("Events generated: %s", events)
+      response.headers[_SESSION_AFFINITY_HEADER] = _get_session_affinity(
+          req.app_name, req.user_id
+      )
       return events
 
     @app.post("/run_sse")
@@ -1381,6 +1625,9 @@ class AdkWebServer:
               StreamingMode.SSE if req.streaming else StreamingMode.NONE
           )
           runner = await self.get_runner_async(req.app_name)
+          encoder = sse_frames.SseEventEncoder(
+              text_deltas=req.sse_text_deltas
+          )
           async with Aclosing(
               runner.run_async(
                   user_id=req.user_id,
@@ -1393,13 +1640,11 @@ class AdkWebServer:
           ) as agen:
             async for event in agen:
               # Format as SSE data
-              sse_event = event.model_dump_json(
-                  exclude_none=True, by_alias=True
-              )
+              sse_event = encoder.encode(event)
               logger.debug(
-                  "Generated event in agent run streaming: %s", sse_event
+                  "Generated event in agent run streaming: %s", event.id
               )
-              yield f"data: {sse_event}\n\n"
+              yield sse_event
         except Exception as e:
           logger.exception("Error in event_generator: %s", e)
           # You might want to yield an error event here
@@ -1409,6 +1654,11 @@ class AdkWebServer:
       return StreamingResponse(
           event_generator(),
           media_type="text/event-stream",
+          headers={
+              _SESSION_AFFINITY_HEADER: _get_session_affinity(
+                  req.app_name, req.user_id
+              )
+          },
       )
 
     @app.get(
@@ -1477,7 +1727,17 @@ class AdkWebServer:
             default=["TEXT", "AUDIO"]
         ),  # Only allows "TEXT" or "AUDIO"
     ) -> None:
-      await websocket.accept()
+      # Clients that request the binary sub-protocol exchange audio as binary
+      # frames instead of base64 encoded JSON.
+      use_binary_frames = (
+          live_frames.BINARY_SUBPROTOCOL
+          in websocket.scope.get("subprotocols", ())
+      )
+      await websocket.accept(
+          subprotocol=live_frames.BINARY_SUBPROTOCOL
+          if use_binary_frames
+          else None
+      )
 
       session = await self.session_service.get_session(
           app_name=app_name, user_id=user_id, session_id=session_id
@@ -1498,6 +1758,12 @@ class AdkWebServer:
             )
         ) as agen:
           async for event in agen:
+            if use_binary_frames and (
+                blobs := live_frames.get_audio_blobs(event)
+            ):
+              for blob in blobs:
+                await websocket.send_bytes(live_frames.encode_audio_frame(blob))
+              continue
             await websocket.send_text(
                 event.model_dump_json(exclude_none=True, by_alias=True)
             )
@@ -1505,10 +1771,22 @@ class AdkWebServer:
       async def process_messages():
         try:
           while True:
-            data = await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+              raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes") is not None and use_binary_frames:
+              live_request_queue.send_realtime(
+                  live_frames.decode_audio_frame(message["bytes"])
+              )
+              continue
             # Validate and send the received message to the live queue.
-            live_request_queue.send(LiveRequest.model_validate_json(data))
-        except ValidationError as ve:
+            live_request_queue.send(
+                LiveRequest.model_validate_json(
+                    message.get("text") or message.get("bytes") or ""
+                )
+            )
+        except ValueError as ve:
+          # Also covers pydantic's ValidationError.
           logger.error("Validation error in process_messages: %s", ve)
 
       # Run both tasks concurrently and cancel all if one fails.
@@ -258,9 +258,18 @@ def pretty_print_eval_result(eval_result: EvalCaseResult):
 
 
 def get_eval_sets_manager(
-    eval_storage_uri: Optional[str], agents_dir: str
+    eval_storage_uri: Optional[str],
+    agents_dir: str,
+    eval_set_format: str = "json",
 ) -> EvalSetsManager:
-  """Returns an instance of EvalSetsManager."""
+  """Returns an instance of EvalSetsManager.
+
+  Args:
+    eval_storage_uri: The evals storage URI, if eval sets are not stored
+      locally.
+    agents_dir: The directory of the agents, where local eval sets are stored.
+    eval_set_format: The format of new local eval sets, "json" or "jsonl".
+  """
   try:
     from ..evaluation.local_eval_sets_manager import LocalEvalSetsManager
     from .utils import evals
@@ -273,4 +282,6 @@ def get_eval_sets_manager(
     )
     return gcs_eval_managers.eval_sets_manager
   else:
-    return LocalEvalSetsManager(agents_dir=agents_dir)
+    return LocalEvalSetsManager(
+        agents_dir=agents_dir, use_jsonl_format=eval_set_format == "jsonl"
+    )
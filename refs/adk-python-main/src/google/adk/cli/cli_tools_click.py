@@ -40,6 +40,7 @@ from .fast_api import get_fast_api_app
 from .utils import envs
 from .utils import evals
 from .utils import logs
+from .utils.workers import serve_with_workers
 
 LOG_LEVELS = click.Choice(
     ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -473,12 +474,35 @@ def eval_options():
     default=False,
     help="Optional. Whether to print detailed results on console or not.",
 )
+@click.option(
+    "--inference_cache_dir",
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
+    default=None,
+    help=(
+        "Optional. A directory to cache agent inferences in. Eval cases whose"
+        " agent definition and inputs didn't change since a previous run are"
+        " scored against the cached inferences instead of running the agent"
+        " again."
+    ),
+)
+@click.option(
+    "--eval_results_db_url",
+    type=str,
+    default=None,
+    help=(
+        "Optional. The database URL to store eval results in, e.g."
+        " sqlite:///eval_results.db. Takes precedence over the results store"
+        " of --eval_storage_uri."
+    ),
+)
 @eval_options()
 def cli_eval(
     agent_module_file_path: str,
     eval_set_file_path_or_id: list[str],
     config_file_path: str,
     print_detailed_results: bool,
+    inference_cache_dir: Optional[str] = None,
+    eval_results_db_url: Optional[str] = None,
     eval_storage_uri: Optional[str] = None,
 ):
   """Evaluates an agent given the eval sets.
@@ -534,6 +558,8 @@ def cli_eval(
   CONFIG_FILE_PATH: The path to config file.
 
   PRINT_DETAILED_RESULTS: Prints detailed results on the console.
+
+  INFERENCE_CACHE_DIR: Caches inferences across eval runs.
   """
   envs.load_dotenv_for_agent(agent_module_file_path, ".")
 
@@ -545,6 +571,7 @@ def cli_eval(
     from ..evaluation.eval_result import EvalCaseResult
     from ..evaluation.evaluator import EvalStatus
     from ..evaluation.in_memory_eval_sets_manager import InMemoryEvalSetsManager
+    from ..evaluation.inference_result_cache import InferenceResultCache
     from ..evaluation.local_eval_service import LocalEvalService
     from ..evaluation.local_eval_set_results_manager import LocalEvalSetResultsManager
     from ..evaluation.local_eval_sets_manager import load_eval_set_from_file
@@ -575,6 +602,10 @@ def cli_eval(
     eval_set_results_manager = gcs_eval_managers.eval_set_results_manager
   else:
     eval_set_results_manager = LocalEvalSetResultsManager(agents_dir=agents_dir)
+  if eval_results_db_url:
+    eval_set_results_manager = evals.create_database_eval_set_results_manager(
+        eval_results_db_url
+    )
 
   inference_requests = []
   eval_set_file_or_id_to_evals = parse_and_get_evals_to_run(
@@ -638,11 +669,18 @@ def cli_eval(
           )
       )
 
+  inference_result_cache = (
+      InferenceResultCache(cache_dir=inference_cache_dir)
+      if inference_cache_dir
+      else None
+  )
+
   try:
     eval_service = LocalEvalService(
         root_agent=root_agent,
         eval_sets_manager=eval_sets_manager,
         eval_set_results_manager=eval_set_results_manager,
+        inference_result_cache=inference_result_cache,
     )
 
     inference_results = asyncio.run(
@@ -675,6 +713,12 @@ def cli_eval(
       eval_run_summary[eval_result.eval_set_id][0] += 1
     else:
       eval_run_summary[eval_result.eval_set_id][1] += 1
+  if inference_result_cache:
+    cache_stats = inference_result_cache.stats
+    click.echo(
+        f"Inference cache: {cache_stats.hits} hits, {cache_stats.misses}"
+        " misses"
+    )
   click.echo("Eval Run Summary")
   for eval_set_id, pass_fail_count in eval_run_summary.items():
     click.echo(
@@ -705,10 +749,22 @@ def eval_set():
     ),
 )
 @click.argument("eval_set_id", type=str, required=True)
+@click.option(
+    "--eval_set_format",
+    type=click.Choice(["json", "jsonl"]),
+    default="json",
+    show_default=True,
+    help=(
+        "Optional. The file format of the eval set, if it is stored locally."
+        " The jsonl format appends eval cases to the file instead of"
+        " rewriting it."
+    ),
+)
 @eval_options()
 def cli_create_eval_set(
     agent_module_file_path: str,
     eval_set_id: str,
+    eval_set_format: str = "json",
     eval_storage_uri: Optional[str] = None,
 ):
   """Creates an empty EvalSet given the agent_module_file_path and eval_set_id."""
@@ -716,7 +772,9 @@ def cli_create_eval_set(
 
   app_name = os.path.basename(agent_module_file_path)
   agents_dir = os.path.dirname(agent_module_file_path)
-  eval_sets_manager = get_eval_sets_manager(eval_storage_uri, agents_dir)
+  eval_sets_manager = get_eval_sets_manager(
+      eval_storage_uri, agents_dir, eval_set_format
+  )
 
   try:
     eval_sets_manager.create_eval_set(
@@ -727,6 +785,48 @@ def cli_create_eval_set(
     raise click.ClickException(str(e))
 
 
+@eval_set.command("convert", cls=HelpfulCommand)
+@click.argument(
+    "agent_module_file_path",
+    type=click.Path(
+        exists=True, dir_okay=True, file_okay=False, resolve_path=True
+    ),
+)
+@click.argument("eval_set_id", type=str, required=True)
+@click.option(
+    "--to",
+    "target_format",
+    type=click.Choice(["json", "jsonl"]),
+    required=True,
+    help="The file format to convert the local eval set to.",
+)
+def cli_convert_eval_set(
+    agent_module_file_path: str,
+    eval_set_id: str,
+    target_format: str,
+):
+  """Converts a local EvalSet between the json and the jsonl file formats."""
+  try:
+    from ..errors.not_found_error import NotFoundError
+    from ..evaluation.local_eval_sets_manager import LocalEvalSetsManager
+  except ModuleNotFoundError as mnf:
+    raise click.ClickException(MISSING_EVAL_DEPENDENCIES_MESSAGE) from mnf
+
+  app_name = os.path.basename(agent_module_file_path)
+  agents_dir = os.path.dirname(agent_module_file_path)
+  eval_sets_manager = LocalEvalSetsManager(agents_dir=agents_dir)
+  try:
+    eval_sets_manager.convert_eval_set(
+        app_name, eval_set_id, use_jsonl_format=target_format == "jsonl"
+    )
+  except NotFoundError as e:
+    raise click.ClickException(str(e))
+  click.echo(
+      f"Eval set '{eval_set_id}' of app '{app_name}' converted to"
+      f" {target_format}."
+  )
+
+
 @eval_set.command("add_eval_case", cls=HelpfulCommand)
 @click.argument(
     "agent_module_file_path",
@@ -872,7 +972,8 @@ def adk_services_options():
         type=str,
         help=(
             "Optional. The URI of the artifact service,"
-            " supported URIs: gs://<bucket name> for GCS artifact service."
+            " supported URIs: gs://<bucket name> for GCS artifact service,"
+            " file://<path> for local filesystem artifact service."
         ),
         default=None,
     )
@@ -1008,6 +1109,17 @@ def fast_api_common_options():
         show_default=True,
         help="Optional. Whether to enable live reload for agents changes.",
     )
+    @click.option(
+        "--preload_agents",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help=(
+            "Optional. Whether to load all agents and build their runners in"
+            " the background when the server starts. GET /ready reports when"
+            " they are loaded."
+        ),
+    )
     @click.option(
         "--eval_storage_uri",
         type=str,
@@ -1017,6 +1129,26 @@ def fast_api_common_options():
         ),
         default=None,
     )
+    @click.option(
+        "--eval_results_db_url",
+        type=str,
+        help=(
+            "Optional. The database URL to store eval results in, e.g."
+            " sqlite:///eval_results.db. Stored results are aggregated per"
+            " metric so they can be tracked across runs."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--eval_set_format",
+        type=click.Choice(["json", "jsonl"]),
+        default="json",
+        show_default=True,
+        help=(
+            "Optional. The file format of new local eval sets. The jsonl"
+            " format appends eval cases to the file instead of rewriting it."
+        ),
+    )
     @click.option(
         "--extra_plugins",
         help=(
@@ -1059,6 +1191,8 @@ def fast_api_common_options():
 def cli_web(
     agents_dir: str,
     eval_storage_uri: Optional[str] = None,
+    eval_set_format: str = "json",
+    eval_results_db_url: Optional[str] = None,
     log_level: str = "INFO",
     allow_origins: Optional[list[str]] = None,
     host: str = "127.0.0.1",
@@ -1073,6 +1207,7 @@ def cli_web(
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
     reload_agents: bool = False,
+    preload_agents: bool = False,
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
     logo_image_url: Optional[str] = None,
@@ -1118,6 +1253,8 @@ def cli_web(
       artifact_service_uri=artifact_service_uri,
       memory_service_uri=memory_service_uri,
       eval_storage_uri=eval_storage_uri,
+      eval_set_format=eval_set_format,
+      eval_results_db_url=eval_results_db_url,
       allow_origins=allow_origins,
       web=True,
       trace_to_cloud=trace_to_cloud,
@@ -1127,6 +1264,7 @@ def cli_web(
       host=host,
       port=port,
       reload_agents=reload_agents,
+      preload_agents=preload_agents,
       extra_plugins=extra_plugins,
       logo_text=logo_text,
       logo_image_url=logo_image_url,
@@ -1155,9 +1293,23 @@ def cli_web(
 @fast_api_common_options()
 @adk_services_options()
 @deprecated_adk_services_options()
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "Optional. The number of worker processes. Workers are forked after"
+        " the agents are loaded and require a shared session service, e.g."
+        " --session_service_uri. Traces are not kept in memory, so the debug"
+        " trace endpoints are disabled. Not supported on Windows."
+    ),
+)
 def cli_api_server(
     agents_dir: str,
     eval_storage_uri: Optional[str] = None,
+    eval_set_format: str = "json",
+    eval_results_db_url: Optional[str] = None,
     log_level: str = "INFO",
     allow_origins: Optional[list[str]] = None,
     host: str = "127.0.0.1",
@@ -1172,7 +1324,9 @@ def cli_api_server(
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
     reload_agents: bool = False,
+    preload_agents: bool = False,
     extra_plugins: Optional[list[str]] = None,
+    workers: int = 1,
 ):
   """Starts a FastAPI server for agents.
 
@@ -1182,6 +1336,12 @@ def cli_api_server(
   Example:
 
     adk api_server --session_service_uri=[uri] --port=[port] path/to/agents_dir
+
+  With --workers, the agents are loaded once and the worker processes are
+  forked from the server, so they share the loaded agents. Each worker builds
+  the runners of all the agents before it accepts requests. Responses about a
+  session carry an X-Session-Affinity header, which balancers in front of
+  several servers can route on.
   """
   logs.setup_adk_logger(getattr(logging, log_level.upper()))
 
@@ -1194,6 +1354,8 @@ def cli_api_server(
           artifact_service_uri=artifact_service_uri,
           memory_service_uri=memory_service_uri,
           eval_storage_uri=eval_storage_uri,
+          eval_set_format=eval_set_format,
+          eval_results_db_url=eval_results_db_url,
           allow_origins=allow_origins,
           web=False,
           trace_to_cloud=trace_to_cloud,
@@ -1202,12 +1364,20 @@ def cli_api_server(
           host=host,
           port=port,
           reload_agents=reload_agents,
+          preload_agents=preload_agents,
           extra_plugins=extra_plugins,
+          workers=workers,
       ),
       host=host,
       port=port,
-      reload=reload,
+      reload=reload and workers == 1,
   )
+  if workers > 1:
+    try:
+      serve_with_workers(config, workers)
+    except RuntimeError as e:
+      raise click.ClickException(str(e)) from e
+    return
   server = uvicorn.Server(config)
   server.run()
 
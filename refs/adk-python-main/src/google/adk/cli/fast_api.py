@@ -33,6 +33,7 @@ from opentelemetry.sdk.trace import TracerProvider
 from starlette.types import Lifespan
 from watchdog.observers import Observer
 
+from ..artifacts.file_artifact_service import FileArtifactService
 from ..artifacts.gcs_artifact_service import GcsArtifactService
 from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..auth.credential_service.in_memory_credential_service import InMemoryCredentialService
@@ -61,6 +62,8 @@ def get_fast_api_app(
     artifact_service_uri: Optional[str] = None,
     memory_service_uri: Optional[str] = None,
     eval_storage_uri: Optional[str] = None,
+    eval_set_format: str = "json",
+    eval_results_db_url: Optional[str] = None,
     allow_origins: Optional[list[str]] = None,
     web: bool,
     a2a: bool = False,
@@ -73,7 +76,39 @@ def get_fast_api_app(
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
     logo_image_url: Optional[str] = None,
+    workers: int = 1,
+    preload_agents: bool = False,
 ) -> FastAPI:
+  # With multiple workers, every worker has its own memory, so the state of
+  # the server must be shared through external services. The in-memory traces
+  # are disabled, while eval sets and results are stored in files, GCS or a
+  # database already.
+  if workers > 1:
+    if not session_service_uri:
+      raise click.ClickException(
+          "Multiple workers require a shared session service, set"
+          " --session_service_uri."
+      )
+    if reload_agents:
+      raise click.ClickException(
+          "Live reload of agents is not supported with multiple workers."
+      )
+    if a2a:
+      raise click.ClickException(
+          "A2A is not supported with multiple workers, as its task store is"
+          " in memory."
+      )
+    if not artifact_service_uri:
+      logger.warning(
+          "Artifacts are kept in the memory of each worker, set"
+          " --artifact_service_uri to share them."
+      )
+    if not memory_service_uri:
+      logger.warning(
+          "Memories are kept in the memory of each worker, set"
+          " --memory_service_uri to share them."
+      )
+
   # Set up eval managers.
   if eval_storage_uri:
     gcs_eval_managers = evals.create_gcs_eval_managers_from_uri(
@@ -82,8 +117,14 @@ def get_fast_api_app(
     eval_sets_manager = gcs_eval_managers.eval_sets_manager
     eval_set_results_manager = gcs_eval_managers.eval_set_results_manager
   else:
-    eval_sets_manager = LocalEvalSetsManager(agents_dir=agents_dir)
+    eval_sets_manager = LocalEvalSetsManager(
+        agents_dir=agents_dir, use_jsonl_format=eval_set_format == "jsonl"
+    )
     eval_set_results_manager = LocalEvalSetResultsManager(agents_dir=agents_dir)
+  if eval_results_db_url:
+    eval_set_results_manager = evals.create_database_eval_set_results_manager(
+        eval_results_db_url
+    )
 
   def _parse_agent_engine_resource_name(agent_engine_id_or_resource_name):
     if not agent_engine_id_or_resource_name:
@@ -168,6 +209,9 @@ def get_fast_api_app(
     if artifact_service_uri.startswith("gs://"):
       gcs_bucket = artifact_service_uri.split("://")[1]
       artifact_service = GcsArtifactService(bucket_name=gcs_bucket)
+    elif artifact_service_uri.startswith("file://"):
+      root_dir = artifact_service_uri.split("://", 1)[1]
+      artifact_service = FileArtifactService(root_dir=root_dir)
     else:
       raise click.ClickException(
           "Unsupported artifact service URI: %s" % artifact_service_uri
@@ -247,6 +291,20 @@ def get_fast_api_app(
         web_assets_dir=ANGULAR_DIST_PATH,
     )
 
+  if workers > 1:
+    # The workers are forked after the app is created, so they share the
+    # loaded agents and the modules they imported.
+    agent_loader.preload_agents()
+    # Pooled database connections must not be shared by the workers.
+    for service in (session_service, eval_set_results_manager):
+      if db_engine := getattr(service, "db_engine", None):
+        db_engine.dispose()
+    extra_fast_api_args.update(in_memory_traces=False, warm_up=True)
+  elif preload_agents:
+    # The server accepts requests right away, /ready reports when the agents
+    # are loaded.
+    extra_fast_api_args.update(warm_up=True, wait_for_warm_up=False)
+
   app = adk_web_server.get_fast_api_app(
       lifespan=lifespan,
       allow_origins=allow_origins,
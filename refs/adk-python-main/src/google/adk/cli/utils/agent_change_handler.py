@@ -41,5 +41,18 @@ class AgentChangeEventHandler(FileSystemEventHandler):
     if not (event.src_path.endswith(".py") or event.src_path.endswith(".yaml")):
       return
     logger.info("Change detected in agents directory: %s", event.src_path)
-    self.agent_loader.remove_agent_from_cache(self.current_app_name_ref.value)
-    self.runners_to_clean.add(self.current_app_name_ref.value)
+    app_name = self.current_app_name_ref.value
+    if not app_name:
+      return
+    # The agent is reloaded on the observer thread, while requests keep using
+    # the previous agent until the new one is swapped in.
+    try:
+      self.agent_loader.reload_agent(app_name)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.error(
+          "Failed to reload agent %s, keeping the previous version: %s",
+          app_name,
+          e,
+      )
+      return
+    self.runners_to_clean.add(app_name)
@@ -14,11 +14,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import logging
 import os
 from pathlib import Path
 import sys
+import threading
+from types import ModuleType
 from typing import Optional
 from typing import Union
 
@@ -40,6 +43,43 @@ SPECIAL_AGENTS_DIR = os.path.join(
 )
 
 
+class _DotenvScope:
+  """Lets only agents that use the same .env file load at the same time.
+
+  Loading an agent applies its .env file to the process-wide environment, and
+  the modules of the agent may read the environment while they are imported.
+  An agent therefore must not be imported while the .env file of another agent
+  is applied, but the agents that share a .env file, or have none, can load in
+  parallel.
+  """
+
+  def __init__(self):
+    self._condition = threading.Condition()
+    self._dotenv_path: Optional[str] = None
+    self._loading = 0
+
+  @contextlib.contextmanager
+  def enter(self, dotenv_path: str):
+    """Waits until agents with the .env file can load, for the context."""
+    with self._condition:
+      self._condition.wait_for(
+          lambda: not self._loading or self._dotenv_path == dotenv_path
+      )
+      self._dotenv_path = dotenv_path
+      self._loading += 1
+    try:
+      yield
+    finally:
+      with self._condition:
+        self._loading -= 1
+        if not self._loading:
+          self._condition.notify_all()
+
+
+# The environment is shared by all the agent loaders of the process.
+_dotenv_scope = _DotenvScope()
+
+
 class AgentLoader(BaseAgentLoader):
   """Centralized agent loading with proper isolation, caching, and .env loading.
   Support loading agents from below folder/file structures:
@@ -52,12 +92,20 @@ class AgentLoader(BaseAgentLoader):
   d)  {agent_name} as a YAML config folder:
       agents_dir/{agent_name}/root_agent.yaml defines the root agent
 
+  Agents can be loaded from several threads at once, each agent is loaded only
+  once. Agents with different .env files are loaded one at a time, so that an
+  agent never sees the environment of another agent while it is imported.
   """
 
   def __init__(self, agents_dir: str):
     self.agents_dir = agents_dir.rstrip("/")
     self._original_sys_path = None
     self._agent_cache: dict[str, Union[BaseAgent, App]] = {}
+    # Serialize the loading of each agent, while different agents load in
+    # parallel.
+    self._agent_locks: dict[str, threading.Lock] = {}
+    # Guards the agent locks and sys.path.
+    self._lock = threading.Lock()
 
   def _load_from_module_or_package(
       self, agent_name: str
@@ -198,12 +246,22 @@ class AgentLoader(BaseAgentLoader):
       actual_agent_name = agent_name
 
     # Add agents_dir to sys.path
-    if agents_dir not in sys.path:
-      sys.path.insert(0, agents_dir)
-
-    logger.debug("Loading .env for agent %s from %s", agent_name, agents_dir)
-    envs.load_dotenv_for_agent(actual_agent_name, str(agents_dir))
+    with self._lock:
+      if agents_dir not in sys.path:
+        sys.path.insert(0, agents_dir)
 
+    dotenv_path = envs.get_dotenv_path_for_agent(
+        actual_agent_name, str(agents_dir)
+    )
+    with _dotenv_scope.enter(dotenv_path):
+      logger.debug("Loading .env for agent %s from %s", agent_name, agents_dir)
+      envs.load_dotenv_for_agent(actual_agent_name, str(agents_dir))
+      return self._load_root_agent(agent_name, actual_agent_name, agents_dir)
+
+  def _load_root_agent(
+      self, agent_name: str, actual_agent_name: str, agents_dir: str
+  ) -> Union[BaseAgent, App]:
+    """Loads the root agent of an agent whose .env file is applied."""
     if root_agent := self._load_from_module_or_package(actual_agent_name):
       self._ensure_app_name_matches(
           maybe_app=root_agent,
@@ -260,17 +318,50 @@ class AgentLoader(BaseAgentLoader):
         "match, then reload."
     )
 
+  def _get_agent_lock(self, agent_name: str) -> threading.Lock:
+    with self._lock:
+      return self._agent_locks.setdefault(agent_name, threading.Lock())
+
   @override
   def load_agent(self, agent_name: str) -> Union[BaseAgent, App]:
     """Load an agent module (with caching & .env) and return its root_agent."""
-    if agent_name in self._agent_cache:
+    if (agent_or_app := self._agent_cache.get(agent_name)) is not None:
       logger.debug("Returning cached agent for %s (async)", agent_name)
-      return self._agent_cache[agent_name]
-
-    logger.debug("Loading agent %s - not in cache.", agent_name)
-    agent_or_app = self._perform_load(agent_name)
-    self._agent_cache[agent_name] = agent_or_app
-    return agent_or_app
+      return agent_or_app
+
+    with self._get_agent_lock(agent_name):
+      # Another thread may have loaded the agent while this one waited.
+      if (agent_or_app := self._agent_cache.get(agent_name)) is not None:
+        return agent_or_app
+      logger.debug("Loading agent %s - not in cache.", agent_name)
+      agent_or_app = self._perform_load(agent_name)
+      self._agent_cache[agent_name] = agent_or_app
+      return agent_or_app
+
+  def reload_agent(self, agent_name: str) -> Union[BaseAgent, App]:
+    """Loads an agent again from its files, and swaps it in once loaded.
+
+    The previously loaded agent keeps being returned by `load_agent` while the
+    agent is reloaded. If reloading fails, the previous agent and its modules
+    are kept.
+
+    Args:
+      agent_name: The name of the agent to reload.
+
+    Returns:
+      The reloaded agent.
+    """
+    with self._get_agent_lock(agent_name):
+      previous_modules = self._pop_agent_modules(agent_name)
+      try:
+        agent_or_app = self._perform_load(agent_name)
+      except Exception:
+        self._pop_agent_modules(agent_name)
+        sys.modules.update(previous_modules)
+        raise
+      self._agent_cache[agent_name] = agent_or_app
+      logger.info("Reloaded agent %s", agent_name)
+      return agent_or_app
 
   @override
   def list_agents(self) -> list[str]:
@@ -286,14 +377,22 @@ class AgentLoader(BaseAgentLoader):
     agent_names.sort()
     return agent_names
 
-  def remove_agent_from_cache(self, agent_name: str):
-    # Clear module cache for the agent and its submodules
-    keys_to_delete = [
+  def _pop_agent_modules(self, agent_name: str) -> dict[str, ModuleType]:
+    """Removes the modules of the agent and its submodules from sys.modules."""
+    module_names = [
         module_name
         for module_name in sys.modules
         if module_name == agent_name or module_name.startswith(f"{agent_name}.")
     ]
-    for key in keys_to_delete:
-      logger.debug("Deleting module %s", key)
-      del sys.modules[key]
-    self._agent_cache.pop(agent_name, None)
+    modules = {}
+    for module_name in module_names:
+      logger.debug("Deleting module %s", module_name)
+      if (module := sys.modules.pop(module_name, None)) is not None:
+        modules[module_name] = module
+    return modules
+
+  def remove_agent_from_cache(self, agent_name: str):
+    # Clear module cache for the agent and its submodules
+    with self._get_agent_lock(agent_name):
+      self._pop_agent_modules(agent_name)
+      self._agent_cache.pop(agent_name, None)
@@ -18,11 +18,16 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+import concurrent.futures
+import logging
+from typing import Optional
 from typing import Union
 
 from ...agents.base_agent import BaseAgent
 from ...apps.app import App
 
+logger = logging.getLogger("google_adk." + __name__)
+
 
 class BaseAgentLoader(ABC):
   """Abstract base class for agent loaders."""
@@ -34,3 +39,40 @@ class BaseAgentLoader(ABC):
   @abstractmethod
   def list_agents(self) -> list[str]:
     """Lists all agents available in the agent loader in alphabetical order."""
+
+  def preload_agents(
+      self, max_workers: Optional[int] = None
+  ) -> dict[str, Optional[Exception]]:
+    """Loads all the agents in parallel threads.
+
+    Loading the agents ahead of time spares the first request of each agent
+    the imports and config parsing, and surfaces broken agents early.
+
+    Imports and config parsing hold the GIL, so only the file and network I/O
+    of the loads overlaps. Loaders serialize the loads that can't run at the
+    same time, e.g. `AgentLoader` loads agents with different .env files one
+    at a time.
+
+    Args:
+      max_workers: The number of threads loading agents. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns:
+      The error of each agent that failed to load, or None for the agents that
+      loaded.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="adk_agent_loader"
+    ) as executor:
+      futures = {
+          agent_name: executor.submit(self.load_agent, agent_name)
+          for agent_name in self.list_agents()
+      }
+    errors = {}
+    for agent_name, future in futures.items():
+      errors[agent_name] = future.exception()
+      if errors[agent_name] is not None:
+        logger.warning(
+            "Failed to load agent %s: %s", agent_name, errors[agent_name]
+        )
+    return errors
@@ -0,0 +1,273 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compression of the responses of the API server.
+
+The content coding is negotiated from the `Accept-Encoding` header of the
+request. gzip is always available, while brotli and zstd are offered if the
+`brotli` and `zstandard` packages are installed.
+
+Streamed server-sent events are compressed too: the compressor is flushed after
+each chunk, so every event reaches the client as soon as it's sent.
+"""
+
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from typing import Callable
+from typing import Optional
+import zlib
+
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+try:
+  import brotli
+except ImportError:
+  brotli = None
+
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+)
+_COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+
+class _Compressor(ABC):
+  """Compresses one response body."""
+
+  @abstractmethod
+  def compress(self, data: bytes) -> bytes:
+    """Returns the compressed data that is ready to be sent."""
+
+  @abstractmethod
+  def flush(self) -> bytes:
+    """Returns all the data compressed so far, keeping the stream open."""
+
+  @abstractmethod
+  def finish(self) -> bytes:
+    """Returns the rest of the compressed data and closes the stream."""
+
+
+class _GzipCompressor(_Compressor):
+
+  def __init__(self):
+    self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+  def compress(self, data: bytes) -> bytes:
+    return self._compressor.compress(data)
+
+  def flush(self) -> bytes:
+    return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+  def finish(self) -> bytes:
+    return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor(_Compressor):
+
+  def __init__(self):
+    # Qualities above 5 are much slower for little gain on dynamic content.
+    self._compressor = brotli.Compressor(quality=4)
+
+  def compress(self, data: bytes) -> bytes:
+    return self._compressor.process(data)
+
+  def flush(self) -> bytes:
+    return self._compressor.flush()
+
+  def finish(self) -> bytes:
+    return self._compressor.finish()
+
+
+class _ZstdCompressor(_Compressor):
+
+  def __init__(self):
+    self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+  def compress(self, data: bytes) -> bytes:
+    return self._compressor.compress(data)
+
+  def flush(self) -> bytes:
+    return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+  def finish(self) -> bytes:
+    return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _get_compressors() -> dict[str, Callable[[], _Compressor]]:
+  # In the order the server prefers them.
+  compressors: dict[str, Callable[[], _Compressor]] = {}
+  if zstandard is not None:
+    compressors["zstd"] = _ZstdCompressor
+  if brotli is not None:
+    compressors["br"] = _BrotliCompressor
+  compressors["gzip"] = _GzipCompressor
+  return compressors
+
+
+_COMPRESSORS = _get_compressors()
+
+SUPPORTED_ENCODINGS = tuple(_COMPRESSORS)
+"""The content codings the server can compress with, in preference order."""
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+  """Returns the content coding to compress a response with.
+
+  Args:
+    accept_encoding: The `Accept-Encoding` header of the request.
+
+  Returns:
+    The supported content coding the client prefers, ties going to the coding
+    the server prefers, or None if the response shouldn't be compressed.
+  """
+  qualities: dict[str, float] = {}
+  for item in accept_encoding.split(","):
+    coding, *params = item.split(";")
+    coding = coding.strip().lower()
+    if not coding:
+      continue
+    quality = 1.0
+    for param in params:
+      name, _, value = param.partition("=")
+      if name.strip().lower() == "q":
+        try:
+          quality = float(value)
+        except ValueError:
+          quality = 0.0
+    qualities[coding] = quality
+  default_quality = qualities.get("*", 0.0)
+  best_encoding = None
+  best_quality = 0.0
+  for encoding in SUPPORTED_ENCODINGS:
+    quality = qualities.get(encoding, default_quality)
+    if quality > best_quality:
+      best_encoding = encoding
+      best_quality = quality
+  return best_encoding
+
+
+def _is_compressible(status: int, headers: Headers) -> bool:
+  if status in (204, 304) or "content-encoding" in headers:
+    return False
+  media_type = headers.get("content-type", "").partition(";")[0].strip()
+  return media_type.startswith(_COMPRESSIBLE_TYPES) or media_type.endswith(
+      _COMPRESSIBLE_SUFFIXES
+  )
+
+
+class CompressionMiddleware:
+  """Compresses the responses with the content coding the client accepts."""
+
+  def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+    """Initializes the middleware.
+
+    Args:
+      app: The ASGI app to compress the responses of.
+      minimum_size: The size below which complete responses are sent
+        uncompressed. Streamed responses are always compressed.
+    """
+    self.app = app
+    self.minimum_size = minimum_size
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] != "http":
+      await self.app(scope, receive, send)
+      return
+    encoding = negotiate_encoding(
+        Headers(scope=scope).get("accept-encoding", "")
+    )
+    if encoding is None:
+      await self.app(scope, receive, send)
+      return
+    responder = _CompressionResponder(send, encoding, self.minimum_size)
+    await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+  """Compresses the messages of one response."""
+
+  def __init__(self, send: Send, encoding: str, minimum_size: int):
+    self._send = send
+    self._encoding = encoding
+    self._minimum_size = minimum_size
+    # The start message is held until the first body message tells whether
+    # the response is compressed.
+    self._start_message: Optional[Message] = None
+    self._compressor: Optional[_Compressor] = None
+    self._flush_chunks = False
+
+  async def send(self, message: Message) -> None:
+    if message["type"] == "http.response.start":
+      self._start_message = message
+      return
+    if message["type"] == "http.response.body":
+      more_body = message.get("more_body", False)
+      if self._start_message is not None:
+        self._start_compression(message)
+      if self._compressor is not None:
+        message["body"] = self._compress(message.get("body", b""), more_body)
+        if self._start_message is None:
+          # Chunks the compressor buffered entirely are sent with later ones.
+          if not message["body"] and more_body:
+            return
+        elif not more_body:
+          headers = MutableHeaders(raw=self._start_message["headers"])
+          headers["Content-Length"] = str(len(message["body"]))
+    if self._start_message is not None:
+      start_message, self._start_message = self._start_message, None
+      await self._send(start_message)
+    await self._send(message)
+
+  def _start_compression(self, body_message: Message) -> None:
+    headers = MutableHeaders(raw=self._start_message["headers"])
+    if not _is_compressible(self._start_message["status"], headers):
+      return
+    headers.add_vary_header("Accept-Encoding")
+    more_body = body_message.get("more_body", False)
+    if not more_body and len(body_message.get("body", b"")) < self._minimum_size:
+      return
+    self._compressor = _COMPRESSORS[self._encoding]()
+    self._flush_chunks = headers.get("content-type", "").startswith(
+        "text/event-stream"
+    )
+    headers["Content-Encoding"] = self._encoding
+    del headers["Content-Length"]
+    # The compressed bytes differ from the identity ones, so a strong ETag of
+    # the content can only be kept as a weak one.
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+      headers["ETag"] = "W/" + etag
+
+  def _compress(self, body: bytes, more_body: bool) -> bytes:
+    data = self._compressor.compress(body)
+    if not more_body:
+      return data + self._compressor.finish()
+    if self._flush_chunks:
+      return data + self._compressor.flush()
+    return data
@@ -32,16 +32,28 @@ def _walk_to_root_until_found(folder, filename) -> str:
   return _walk_to_root_until_found(parent_folder, filename)
 
 
-def load_dotenv_for_agent(
+def get_dotenv_path_for_agent(
     agent_name: str, agent_parent_folder: str, filename: str = '.env'
-):
-  """Loads the .env file for the agent module."""
+) -> str:
+  """Returns the path of the .env file for the agent, or '' if there is none.
 
+  The closest file in the folder of the agent module or in one of its parents
+  is used.
+  """
   # Gets the folder of agent_module as starting_folder
   starting_folder = os.path.abspath(
       os.path.join(agent_parent_folder, agent_name)
   )
-  dotenv_file_path = _walk_to_root_until_found(starting_folder, filename)
+  return _walk_to_root_until_found(starting_folder, filename)
+
+
+def load_dotenv_for_agent(
+    agent_name: str, agent_parent_folder: str, filename: str = '.env'
+):
+  """Loads the .env file for the agent module."""
+  dotenv_file_path = get_dotenv_path_for_agent(
+      agent_name, agent_parent_folder, filename
+  )
   if dotenv_file_path:
     load_dotenv(dotenv_file_path, override=True, verbose=True)
     logger.info(
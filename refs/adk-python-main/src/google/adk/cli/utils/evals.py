@@ -20,6 +20,7 @@ from pydantic import alias_generators
 from pydantic import BaseModel
 from pydantic import ConfigDict
 
+from ...evaluation.database_eval_set_results_manager import DatabaseEvalSetResultsManager
 from ...evaluation.eval_case import Invocation
 from ...evaluation.evaluation_generator import EvaluationGenerator
 from ...evaluation.gcs_eval_set_results_manager import GcsEvalSetResultsManager
@@ -84,3 +85,21 @@ def create_gcs_eval_managers_from_uri(
         f'Unsupported evals storage URI: {eval_storage_uri}. Supported URIs:'
         ' gs://<bucket name>'
     )
+
+
+def create_database_eval_set_results_manager(
+    eval_results_db_url: str,
+) -> DatabaseEvalSetResultsManager:
+  """Creates an eval set results manager that stores results in a database.
+
+  Args:
+      eval_results_db_url: The SQLAlchemy URL of the database, e.g.
+        sqlite:///eval_results.db.
+
+  Returns:
+      DatabaseEvalSetResultsManager: The eval set results manager.
+
+  Raises:
+      ValueError: If the eval_results_db_url can't be parsed.
+  """
+  return DatabaseEvalSetResultsManager(db_url=eval_results_db_url)
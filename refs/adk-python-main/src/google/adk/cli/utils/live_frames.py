@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Binary WebSocket frames for the audio of live sessions.
+
+Clients that request the `adk.live.binary.v1` WebSocket sub-protocol on
+`/run_live` exchange audio as binary messages instead of base64 encoded JSON:
+
+  * byte 0: the length N of the MIME type, between 1 and 255.
+  * bytes 1 to N: the MIME type in ASCII, e.g. `audio/pcm;rate=16000`.
+  * the remaining bytes: the audio data, e.g. raw PCM or Opus.
+
+Text messages keep carrying JSON, i.e. `LiveRequest` from the client and
+`Event` from the server, for everything that isn't audio.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Optional
+
+from google.genai import types
+
+from ...events.event import Event
+
+BINARY_SUBPROTOCOL = "adk.live.binary.v1"
+"""The WebSocket sub-protocol of the binary audio frames."""
+
+_MAX_MIME_TYPE_LENGTH = 255
+
+# The fields of an event that may be dropped when its audio is sent as binary
+# frames.
+_AUDIO_EVENT_FIELDS = frozenset({
+    "id",
+    "invocation_id",
+    "author",
+    "branch",
+    "timestamp",
+    "content",
+    "partial",
+    "actions",
+    "model_version",
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_mime_type(header: bytes) -> str:
+  return header.decode("ascii")
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_header(mime_type: str) -> bytes:
+  encoded = mime_type.encode("ascii")
+  if not encoded or len(encoded) > _MAX_MIME_TYPE_LENGTH:
+    raise ValueError(f"Unsupported MIME type for a binary frame: {mime_type}")
+  return bytes([len(encoded)]) + encoded
+
+
+def decode_audio_frame(frame: bytes) -> types.Blob:
+  """Returns the audio blob of a binary frame.
+
+  The audio data is handed to the blob as is, without base64 decoding or
+  pydantic validation.
+
+  Raises:
+    ValueError: If the frame is malformed.
+  """
+  if not frame or not frame[0] or len(frame) <= frame[0]:
+    raise ValueError("Malformed binary audio frame.")
+  mime_type_end = frame[0] + 1
+  return types.Blob.model_construct(
+      mime_type=_decode_mime_type(frame[1:mime_type_end]),
+      data=frame[mime_type_end:],
+  )
+
+
+def encode_audio_frame(blob: types.Blob) -> bytes:
+  """Returns the binary frame of an audio blob.
+
+  Raises:
+    ValueError: If the MIME type of the blob can't be encoded in a frame.
+  """
+  return _encode_header(blob.mime_type or "") + blob.data
+
+
+def get_audio_blobs(event: Event) -> Optional[list[types.Blob]]:
+  """Returns the audio of an event that only carries audio.
+
+  Such events are sent as binary frames, one per blob, without the event
+  metadata. Events that carry anything else, e.g. text, transcriptions, turn
+  signals or actions, are sent as JSON.
+  """
+  if (
+      not event.content
+      or not event.content.parts
+      or not event.model_fields_set <= _AUDIO_EVENT_FIELDS
+      or event.actions.model_dump(exclude_defaults=True)
+  ):
+    return None
+  blobs = []
+  for part in event.content.parts:
+    inline_data = part.inline_data
+    if (
+        inline_data is None
+        or not inline_data.data
+        or not (inline_data.mime_type or "").startswith("audio/")
+        or part.model_fields_set != {"inline_data"}
+    ):
+      return None
+    blobs.append(inline_data)
+  return blobs
@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Server-sent events of agent runs.
+
+Events are sent as `data:` frames carrying the JSON of the event. Clients of
+`/run_sse` that set `sseTextDeltas` receive streamed text compactly: the
+first partial event of a response is sent in full, and the following partial
+events that only differ in their text are sent as `text_delta` frames:
+
+  event: text_delta
+  data: {"id": "...", "timestamp": 1.0, "text": "..."}
+
+A text delta stands for the previous event with its `id`, `timestamp` and the
+text of its only part replaced, and with its `usageMetadata` replaced if the
+delta carries one. Events that aren't partial are always sent in full.
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import Any
+from typing import Optional
+
+from google.genai import types
+import pydantic_core
+
+from ...events.event import Event
+
+# The fields of a partial event that a text delta may change.
+_DELTA_FIELDS = frozenset({"id", "timestamp", "content", "usage_metadata"})
+
+
+def _get_text_part(event: Event) -> Optional[types.Part]:
+  """Returns the only part of the event if it's a text part."""
+  if not event.content or not event.content.parts:
+    return None
+  if len(event.content.parts) != 1 or event.content.parts[0].text is None:
+    return None
+  return event.content.parts[0]
+
+
+class _Envelope:
+  """The fields of a partial text event that text deltas must match."""
+
+  def __init__(self, event: Event, part: types.Part):
+    self.fields_set = event.model_fields_set
+    self.role = event.content.role
+    self.part_fields_set = part.model_fields_set
+    # The getters start with a field that must match anyway, so they have a
+    # name even if no other field is set.
+    self._get_fields = operator.attrgetter(
+        "partial", *(self.fields_set - _DELTA_FIELDS)
+    )
+    self._get_part_fields = operator.attrgetter(
+        "thought", *(self.part_fields_set - {"text"})
+    )
+    self._fields = self._get_fields(event)
+    self._part_fields = self._get_part_fields(part)
+
+  def matches(self, event: Event, part: types.Part) -> bool:
+    return (
+        event.model_fields_set == self.fields_set
+        and event.content.role == self.role
+        and part.model_fields_set == self.part_fields_set
+        and self._get_fields(event) == self._fields
+        and self._get_part_fields(part) == self._part_fields
+    )
+
+
+class SseEventEncoder:
+  """Encodes the events of one agent run as server-sent events."""
+
+  def __init__(self, text_deltas: bool = False):
+    """Initializes the encoder.
+
+    Args:
+      text_deltas: Whether to send partial text events as text deltas.
+    """
+    self._text_deltas = text_deltas
+    # The envelope of the last event sent in full, if text deltas can follow.
+    self._envelope: Optional[_Envelope] = None
+    # The usage metadata of the last event sent.
+    self._usage_metadata: Optional[
+        types.GenerateContentResponseUsageMetadata
+    ] = None
+
+  def encode(self, event: Event) -> str:
+    """Returns the server-sent event of an agent event."""
+    if self._text_deltas:
+      part = _get_text_part(event) if event.partial else None
+      if part is not None and self._envelope:
+        if self._envelope.matches(event, part):
+          return self._encode_text_delta(event, part)
+      self._envelope = _Envelope(event, part) if part is not None else None
+      self._usage_metadata = event.usage_metadata
+    data = Event.__pydantic_serializer__.to_json(
+        event, exclude_none=True, by_alias=True
+    )
+    return f"data: {data.decode()}\n\n"
+
+  def _encode_text_delta(self, event: Event, part: types.Part) -> str:
+    delta: dict[str, Any] = {
+        "id": event.id,
+        "timestamp": event.timestamp,
+        "text": part.text,
+    }
+    if event.usage_metadata != self._usage_metadata:
+      self._usage_metadata = event.usage_metadata
+      delta["usageMetadata"] = (
+          event.usage_metadata.model_dump(
+              mode="json", exclude_none=True, by_alias=True
+          )
+          if event.usage_metadata
+          else None
+      )
+    data = pydantic_core.to_json(delta)
+    return f"event: text_delta\ndata: {data.decode()}\n\n"
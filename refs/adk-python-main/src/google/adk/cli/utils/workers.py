@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serving the API server from several pre-forked worker processes.
+
+The app is created, and its agents are loaded, once in the main process. The
+workers are then forked from it, so they share the imported modules and the
+loaded agents copy-on-write instead of each importing them again. Every worker
+runs its own event loop on the shared listening socket, and builds its runners
+and LLM clients in the startup of the app, before it accepts connections.
+
+uvicorn's own `--workers` spawns fresh interpreters that import the app from
+scratch, so none of this is shared.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+
+import uvicorn
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# The exit code of a worker whose app failed to start, like uvicorn's.
+_STARTUP_FAILURE = 3
+
+
+def _run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+  """Serves the app in a forked worker, and exits the worker."""
+  exit_code = 0
+  try:
+    # uvicorn installs its own handlers in place of the supervisor's.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    if not server.started:
+      exit_code = _STARTUP_FAILURE
+  except SystemExit as e:
+    # uvicorn exits with _STARTUP_FAILURE if the app fails to start.
+    exit_code = e.code if isinstance(e.code, int) else 1
+  except BaseException:  # pylint: disable=broad-exception-caught
+    logger.exception("Worker %d failed.", os.getpid())
+    exit_code = 1
+  finally:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # The worker must not run the cleanup of the supervisor it was forked from.
+    os._exit(exit_code)
+
+
+def _fork_worker(config: uvicorn.Config, sock: socket.socket) -> int:
+  pid = os.fork()
+  if pid == 0:
+    _run_worker(config, sock)
+  logger.info("Started worker %d.", pid)
+  return pid
+
+
+def serve_with_workers(config: uvicorn.Config, workers: int) -> None:
+  """Serves the app of the config from pre-forked worker processes.
+
+  Workers that exit unexpectedly are replaced, unless their app failed to
+  start. SIGINT and SIGTERM shut all the workers down gracefully.
+
+  Args:
+    config: The uvicorn config of the server. Its app must already be created,
+      so that the workers share it.
+    workers: The number of worker processes.
+
+  Raises:
+    RuntimeError: If the platform can't fork processes, or the app of a worker
+      failed to start.
+  """
+  if not hasattr(os, "fork"):
+    raise RuntimeError(
+        "Multiple workers are only supported on platforms that can fork"
+        " processes."
+    )
+  sock = config.bind_socket()
+  # Objects that survive until the fork are never collected by the workers, so
+  # the garbage collector doesn't copy the pages they're on.
+  gc.collect()
+  gc.freeze()
+
+  pids: set[int] = set()
+  stopping = False
+
+  def handle_exit(signum, frame):
+    nonlocal stopping
+    stopping = True
+    for pid in pids:
+      # Workers in the foreground process group also get the SIGINT of a
+      # Ctrl+C, and a second SIGINT would stop them without draining.
+      os.kill(pid, signal.SIGTERM)
+
+  previous_handlers = {
+      sig: signal.signal(sig, handle_exit)
+      for sig in (signal.SIGINT, signal.SIGTERM)
+  }
+  startup_failed = False
+  try:
+    for _ in range(workers):
+      pids.add(_fork_worker(config, sock))
+    while pids:
+      pid, status = os.wait()
+      pids.discard(pid)
+      exit_code = os.waitstatus_to_exitcode(status)
+      if stopping:
+        continue
+      if exit_code == _STARTUP_FAILURE:
+        logger.error("Worker %d failed to start, shutting down.", pid)
+        startup_failed = True
+        handle_exit(signal.SIGTERM, None)
+        continue
+      logger.warning(
+          "Worker %d exited with code %d, restarting it.", pid, exit_code
+      )
+      pids.add(_fork_worker(config, sock))
+  finally:
+    for sig, handler in previous_handlers.items():
+      signal.signal(sig, handler)
+    sock.close()
+    gc.unfreeze()
+  if startup_failed:
+    raise RuntimeError("The app failed to start in a worker.")
@@ -0,0 +1,356 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An append-only, indexed file format for eval sets.
+
+The first line of the file holds the EvalSet metadata (everything except the
+eval cases). Every following line is a record for a single eval case:
+
+  {"eval_id": "<id>", "eval_case": {...}}   # Adds or replaces an eval case.
+  {"eval_id": "<id>", "deleted": true}      # Deletes an eval case.
+
+Mutations only append a line to the file, and an in-memory index maps each
+eval_id to the byte range of its latest record. Superseded records are dropped
+when the file is compacted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Iterator
+from typing import Optional
+
+from ..errors.not_found_error import NotFoundError
+from .eval_case import EvalCase
+from .eval_set import EvalSet
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_EVAL_ID_PREFIX = b'{"eval_id": '
+
+# The file is compacted once it holds more superseded records than this value
+# and more superseded records than live ones.
+_MIN_DEAD_RECORDS_FOR_COMPACTION = 128
+
+_json_decoder = json.JSONDecoder()
+
+
+def _dump_record(record: dict) -> bytes:
+  return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _eval_case_record(eval_case: EvalCase) -> bytes:
+  eval_case_json = eval_case.model_dump_json(
+      exclude_unset=True,
+      exclude_defaults=True,
+      exclude_none=True,
+  )
+  eval_id = json.dumps(eval_case.eval_id, ensure_ascii=False)
+  return f'{{"eval_id": {eval_id}, "eval_case": {eval_case_json}}}\n'.encode(
+      "utf-8"
+  )
+
+
+def _parse_record_eval_id(line: bytes) -> tuple[str, bool]:
+  """Returns the eval_id of a record and whether it marks a deletion.
+
+  Records written by this module start with the eval_id, so only that prefix is
+  decoded. The body of the eval case is left untouched until it is read.
+  """
+  if line.startswith(_EVAL_ID_PREFIX):
+    text = line.decode("utf-8")
+    eval_id, end = _json_decoder.raw_decode(text, len(_EVAL_ID_PREFIX))
+    return eval_id, text.startswith(', "deleted"', end)
+
+  record = json.loads(line)
+  return record["eval_id"], bool(record.get("deleted", False))
+
+
+class JsonlEvalSetFile:
+  """An eval set stored as an append-only JSONL file with an eval_id index.
+
+  Adding, updating and deleting an eval case costs a single append, and reading
+  a single eval case costs a single seek, regardless of the size of the eval
+  set. The index is built once by scanning the record prefixes and is then
+  extended incrementally as the file grows.
+  """
+
+  def __init__(self, path: str):
+    self._path = path
+    self._lock = threading.RLock()
+    self._header: Optional[bytes] = None
+    # {eval_id: (offset, length)} of the latest record, in eval set order.
+    self._index: dict[str, tuple[int, int]] = {}
+    self._dead_records = 0
+    self._indexed_size = 0
+    self._file_id: Optional[tuple[int, int]] = None
+
+  @property
+  def path(self) -> str:
+    return self._path
+
+  @classmethod
+  def create(cls, path: str, eval_set: EvalSet) -> JsonlEvalSetFile:
+    """Writes the given EvalSet to a new JSONL file at path."""
+    jsonl_file = cls(path)
+    jsonl_file._rewrite(
+        _dump_record(cls._header_from_eval_set(eval_set)),
+        [_eval_case_record(eval_case) for eval_case in eval_set.eval_cases],
+    )
+    return jsonl_file
+
+  def get_eval_set(self) -> EvalSet:
+    """Returns the full EvalSet stored in the file.
+
+    Raises:
+      FileNotFoundError: If the file doesn't exist.
+      ValueError: If the file has no header.
+    """
+    eval_set = self.get_eval_set_metadata()
+    eval_set.eval_cases = list(self.iter_eval_cases())
+    return eval_set
+
+  def get_eval_set_metadata(self) -> EvalSet:
+    """Returns the EvalSet stored in the file, without any eval cases.
+
+    Raises:
+      FileNotFoundError: If the file doesn't exist.
+      ValueError: If the file has no header.
+    """
+    with self._lock:
+      self._refresh_index()
+      header = self._load_header()
+    header["eval_cases"] = []
+    return EvalSet.model_validate(header)
+
+  def list_eval_case_ids(self) -> list[str]:
+    """Returns the ids of the eval cases in the file, in eval set order."""
+    with self._lock:
+      self._refresh_index()
+      return list(self._index.keys())
+
+  def iter_eval_cases(self) -> Iterator[EvalCase]:
+    """Yields the eval cases in the file one at a time.
+
+    Each eval case is only parsed when it is reached, so callers can start
+    working on the first eval case before the rest of the file is parsed.
+
+    Raises:
+      FileNotFoundError: If the file doesn't exist.
+    """
+    with self._lock:
+      self._refresh_index()
+      positions = list(self._index.values())
+      # Keep a handle on the current file, so that a concurrent compaction
+      # doesn't change the data that we are iterating over.
+      f = open(self._path, "rb")
+
+    with f:
+      for offset, length in positions:
+        f.seek(offset)
+        yield self._parse_eval_case(f.read(length))
+
+  def get_eval_case(self, eval_case_id: str) -> Optional[EvalCase]:
+    """Returns the EvalCase with the given id if found, otherwise None."""
+    with self._lock:
+      self._refresh_index()
+      position = self._index.get(eval_case_id)
+      if position is None:
+        return None
+      with open(self._path, "rb") as f:
+        f.seek(position[0])
+        record = f.read(position[1])
+    return self._parse_eval_case(record)
+
+  def add_eval_case(self, eval_case: EvalCase):
+    """Appends the given EvalCase to the file.
+
+    Raises:
+      ValueError: If an eval case with the same id already exists, or the
+        file has no header.
+    """
+    with self._lock:
+      self._refresh_index()
+      # The first record of a file without a header would be read as one.
+      self._load_header()
+      if eval_case.eval_id in self._index:
+        raise ValueError(
+            f"Eval id `{eval_case.eval_id}` already exists in"
+            f" `{self._get_eval_set_id()}` eval set.",
+        )
+      self._append(eval_case.eval_id, _eval_case_record(eval_case))
+
+  def update_eval_case(self, updated_eval_case: EvalCase):
+    """Appends a record that replaces an existing EvalCase.
+
+    Raises:
+      NotFoundError: If the eval case is not found.
+    """
+    with self._lock:
+      self._refresh_index()
+      eval_case_id = updated_eval_case.eval_id
+      if eval_case_id not in self._index:
+        raise NotFoundError(
+            f"Eval case `{eval_case_id}` not found in eval set"
+            f" `{self._get_eval_set_id()}`."
+        )
+      self._append(eval_case_id, _eval_case_record(updated_eval_case))
+      self._maybe_compact()
+
+  def delete_eval_case(self, eval_case_id: str):
+    """Appends a record that deletes an existing EvalCase.
+
+    Raises:
+      NotFoundError: If the eval case is not found.
+    """
+    with self._lock:
+      self._refresh_index()
+      if eval_case_id not in self._index:
+        raise NotFoundError(
+            f"Eval case `{eval_case_id}` not found in eval set"
+            f" `{self._get_eval_set_id()}`."
+        )
+      logger.info(
+          "EvalCase`%s` was found in the eval set. It will be removed"
+          " permanently.",
+          eval_case_id,
+      )
+      self._append(
+          eval_case_id,
+          _dump_record({"eval_id": eval_case_id, "deleted": True}),
+          deleted=True,
+      )
+      self._maybe_compact()
+
+  def compact(self):
+    """Rewrites the file so that it only holds the live records."""
+    with self._lock:
+      self._refresh_index()
+      with open(self._path, "rb") as f:
+        records = []
+        for offset, length in self._index.values():
+          f.seek(offset)
+          records.append(f.read(length))
+      self._rewrite(self._header, records)
+
+  @staticmethod
+  def _header_from_eval_set(eval_set: EvalSet) -> dict:
+    return json.loads(
+        eval_set.model_dump_json(
+            exclude={"eval_cases"},
+            exclude_unset=True,
+            exclude_defaults=True,
+            exclude_none=True,
+        )
+    )
+
+  @staticmethod
+  def _parse_eval_case(record: bytes) -> EvalCase:
+    return EvalCase.model_validate(json.loads(record)["eval_case"])
+
+  def _load_header(self) -> dict:
+    if self._header is None:
+      raise ValueError(
+          f"Eval set file `{self._path}` is empty, it has no eval set header."
+      )
+    return json.loads(self._header)
+
+  def _get_eval_set_id(self) -> str:
+    return self._load_header()["eval_set_id"]
+
+  def _append(self, eval_case_id: str, record: bytes, deleted: bool = False):
+    with open(self._path, "ab") as f:
+      offset = f.tell()
+      f.write(record)
+
+    if self._indexed_size != offset:
+      # Somebody else appended to the file since we last read it, so we pick
+      # up their records together with ours.
+      self._refresh_index()
+      return
+    self._apply_record(eval_case_id, deleted, offset, len(record))
+    self._indexed_size = offset + len(record)
+
+  def _apply_record(
+      self, eval_case_id: str, deleted: bool, offset: int, length: int
+  ):
+    if eval_case_id in self._index:
+      # The old record is superseded. We also move the eval case to the end,
+      # which matches how the JSON format orders updated eval cases.
+      del self._index[eval_case_id]
+      self._dead_records += 1
+    if deleted:
+      self._dead_records += 1
+    else:
+      self._index[eval_case_id] = (offset, length)
+
+  def _refresh_index(self):
+    """Brings the index up to date with the contents of the file."""
+    stat = os.stat(self._path)
+    file_id = (stat.st_dev, stat.st_ino)
+    if file_id != self._file_id or stat.st_size < self._indexed_size:
+      # The file was replaced, for example after a compaction.
+      self._header = None
+      self._index = {}
+      self._dead_records = 0
+      self._indexed_size = 0
+      self._file_id = file_id
+
+    if stat.st_size == self._indexed_size:
+      return
+
+    with open(self._path, "rb") as f:
+      f.seek(self._indexed_size)
+      offset = self._indexed_size
+      for line in f:
+        if not line.endswith(b"\n"):
+          # A partially written record, we will pick it up once it completes.
+          break
+        if self._header is None:
+          self._header = line
+        elif line.strip():
+          eval_case_id, deleted = _parse_record_eval_id(line)
+          self._apply_record(eval_case_id, deleted, offset, len(line))
+        offset += len(line)
+      self._indexed_size = offset
+
+  def _maybe_compact(self):
+    if (
+        self._dead_records > _MIN_DEAD_RECORDS_FOR_COMPACTION
+        and self._dead_records > len(self._index)
+    ):
+      self.compact()
+
+  def _rewrite(self, header: bytes, records: list[bytes]):
+    tmp_path = f"{self._path}.tmp"
+    with open(tmp_path, "wb") as f:
+      f.write(header)
+      offset = len(header)
+      index = {}
+      for record in records:
+        eval_case_id, _ = _parse_record_eval_id(record)
+        index[eval_case_id] = (offset, len(record))
+        f.write(record)
+        offset += len(record)
+    os.replace(tmp_path, self._path)
+
+    stat = os.stat(self._path)
+    self._header = header
+    self._index = index
+    self._dead_records = 0
+    self._indexed_size = offset
+    self._file_id = (stat.st_dev, stat.st_ino)
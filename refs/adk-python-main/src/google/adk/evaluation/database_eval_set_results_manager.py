@@ -0,0 +1,569 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any
+from typing import Optional
+
+from pydantic import alias_generators
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from sqlalchemy import Float
+from sqlalchemy import ForeignKeyConstraint
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import Text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import Session as DatabaseSessionFactory
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.types import String
+from typing_extensions import override
+
+from ..errors.not_found_error import NotFoundError
+from ._eval_set_results_manager_utils import create_eval_set_result
+from .eval_result import EvalCaseResult
+from .eval_result import EvalSetResult
+from .eval_set_results_manager import EvalSetResultsManager
+from .evaluator import EvalStatus
+
+logger = logging.getLogger("google_adk." + __name__)
+
+DEFAULT_MAX_KEY_LENGTH = 128
+DEFAULT_MAX_VARCHAR_LENGTH = 256
+
+_LongText = Text().with_variant(mysql.LONGTEXT, "mysql")
+
+
+class EvalMetricSummary(BaseModel):
+  """Aggregated results of a single metric for a single eval set result."""
+
+  model_config = ConfigDict(
+      alias_generator=alias_generators.to_camel,
+      populate_by_name=True,
+  )
+
+  eval_set_result_id: str
+  eval_set_id: str
+  creation_timestamp: float
+  metric_name: str
+
+  num_passed: int = 0
+  """Number of eval cases for which the metric passed."""
+
+  num_failed: int = 0
+  """Number of eval cases for which the metric failed."""
+
+  num_not_evaluated: int = 0
+  """Number of eval cases for which the metric was not evaluated."""
+
+  pass_rate: Optional[float] = None
+  """Ratio of passed eval cases over evaluated eval cases."""
+
+  mean_score: Optional[float] = None
+  min_score: Optional[float] = None
+  max_score: Optional[float] = None
+  p50_score: Optional[float] = None
+  p90_score: Optional[float] = None
+  p99_score: Optional[float] = None
+
+
+class Base(DeclarativeBase):
+  """Base class for eval result tables."""
+
+  pass
+
+
+class StorageEvalSetResult(Base):
+  """Represents an eval set result, i.e. a single eval run."""
+
+  __tablename__ = "eval_set_results"
+
+  app_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+  eval_set_result_id: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_VARCHAR_LENGTH), primary_key=True
+  )
+  eval_set_result_name: Mapped[Optional[str]] = mapped_column(
+      String(DEFAULT_MAX_VARCHAR_LENGTH), nullable=True
+  )
+  eval_set_id: Mapped[str] = mapped_column(String(DEFAULT_MAX_KEY_LENGTH))
+  creation_timestamp: Mapped[float] = mapped_column(Float)
+
+  num_passed: Mapped[int] = mapped_column(Integer, default=0)
+  num_failed: Mapped[int] = mapped_column(Integer, default=0)
+  num_not_evaluated: Mapped[int] = mapped_column(Integer, default=0)
+
+  __table_args__ = (
+      Index(
+          "ix_eval_set_results_app_eval_set_time",
+          "app_name",
+          "eval_set_id",
+          "creation_timestamp",
+      ),
+      Index(
+          "ix_eval_set_results_app_name_result_name",
+          "app_name",
+          "eval_set_result_name",
+      ),
+  )
+
+
+class StorageEvalCaseResult(Base):
+  """Represents the result of a single eval case in an eval run."""
+
+  __tablename__ = "eval_case_results"
+
+  app_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+  eval_set_result_id: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_VARCHAR_LENGTH), primary_key=True
+  )
+  position: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+  eval_id: Mapped[str] = mapped_column(String(DEFAULT_MAX_KEY_LENGTH))
+  final_eval_status: Mapped[int] = mapped_column(Integer)
+  session_id: Mapped[Optional[str]] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), nullable=True
+  )
+  # The complete EvalCaseResult, so that the eval set result can be restored.
+  payload: Mapped[str] = mapped_column(_LongText)
+
+  __table_args__ = (
+      ForeignKeyConstraint(
+          ["app_name", "eval_set_result_id"],
+          [
+              "eval_set_results.app_name",
+              "eval_set_results.eval_set_result_id",
+          ],
+          ondelete="CASCADE",
+      ),
+      Index("ix_eval_case_results_app_eval_id", "app_name", "eval_id"),
+  )
+
+
+class StorageEvalMetricResult(Base):
+  """Represents the overall result of a metric for a single eval case."""
+
+  __tablename__ = "eval_metric_results"
+
+  app_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+  eval_set_result_id: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_VARCHAR_LENGTH), primary_key=True
+  )
+  position: Mapped[int] = mapped_column(Integer, primary_key=True)
+  metric_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+
+  eval_id: Mapped[str] = mapped_column(String(DEFAULT_MAX_KEY_LENGTH))
+  threshold: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  eval_status: Mapped[int] = mapped_column(Integer)
+
+  __table_args__ = (
+      ForeignKeyConstraint(
+          ["app_name", "eval_set_result_id"],
+          [
+              "eval_set_results.app_name",
+              "eval_set_results.eval_set_result_id",
+          ],
+          ondelete="CASCADE",
+      ),
+      Index(
+          "ix_eval_metric_results_app_metric_eval_id",
+          "app_name",
+          "metric_name",
+          "eval_id",
+      ),
+  )
+
+
+class StorageEvalMetricSummary(Base):
+  """Represents the precomputed aggregates of a metric for an eval run."""
+
+  __tablename__ = "eval_metric_summaries"
+
+  app_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+  eval_set_result_id: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_VARCHAR_LENGTH), primary_key=True
+  )
+  metric_name: Mapped[str] = mapped_column(
+      String(DEFAULT_MAX_KEY_LENGTH), primary_key=True
+  )
+
+  eval_set_id: Mapped[str] = mapped_column(String(DEFAULT_MAX_KEY_LENGTH))
+  creation_timestamp: Mapped[float] = mapped_column(Float)
+
+  num_passed: Mapped[int] = mapped_column(Integer, default=0)
+  num_failed: Mapped[int] = mapped_column(Integer, default=0)
+  num_not_evaluated: Mapped[int] = mapped_column(Integer, default=0)
+  pass_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  mean_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  min_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  max_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  p50_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  p90_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+  p99_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+  __table_args__ = (
+      ForeignKeyConstraint(
+          ["app_name", "eval_set_result_id"],
+          [
+              "eval_set_results.app_name",
+              "eval_set_results.eval_set_result_id",
+          ],
+          ondelete="CASCADE",
+      ),
+      Index(
+          "ix_eval_metric_summaries_app_metric_time",
+          "app_name",
+          "metric_name",
+          "creation_timestamp",
+      ),
+  )
+
+  def to_eval_metric_summary(self) -> EvalMetricSummary:
+    return EvalMetricSummary(
+        eval_set_result_id=self.eval_set_result_id,
+        eval_set_id=self.eval_set_id,
+        creation_timestamp=self.creation_timestamp,
+        metric_name=self.metric_name,
+        num_passed=self.num_passed,
+        num_failed=self.num_failed,
+        num_not_evaluated=self.num_not_evaluated,
+        pass_rate=self.pass_rate,
+        mean_score=self.mean_score,
+        min_score=self.min_score,
+        max_score=self.max_score,
+        p50_score=self.p50_score,
+        p90_score=self.p90_score,
+        p99_score=self.p99_score,
+    )
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+  """Returns the percentile of sorted values, using linear interpolation."""
+  rank = (len(sorted_values) - 1) * percentile / 100
+  lower = math.floor(rank)
+  upper = math.ceil(rank)
+  return sorted_values[lower] + (
+      sorted_values[upper] - sorted_values[lower]
+  ) * (rank - lower)
+
+
+def _create_metric_summaries(
+    app_name: str,
+    eval_set_result: EvalSetResult,
+    storage_metric_results: list[StorageEvalMetricResult],
+) -> list[StorageEvalMetricSummary]:
+  """Aggregates the metric results of an eval run, one summary per metric."""
+  metric_results_by_name: dict[str, list[StorageEvalMetricResult]] = {}
+  for storage_metric_result in storage_metric_results:
+    metric_results_by_name.setdefault(
+        storage_metric_result.metric_name, []
+    ).append(storage_metric_result)
+
+  summaries = []
+  for metric_name, metric_results in metric_results_by_name.items():
+    statuses = [metric_result.eval_status for metric_result in metric_results]
+    num_passed = statuses.count(EvalStatus.PASSED.value)
+    num_failed = statuses.count(EvalStatus.FAILED.value)
+    scores = sorted(
+        metric_result.score
+        for metric_result in metric_results
+        if metric_result.score is not None
+    )
+    summary = StorageEvalMetricSummary(
+        app_name=app_name,
+        eval_set_result_id=eval_set_result.eval_set_result_id,
+        metric_name=metric_name,
+        eval_set_id=eval_set_result.eval_set_id,
+        creation_timestamp=eval_set_result.creation_timestamp,
+        num_passed=num_passed,
+        num_failed=num_failed,
+        num_not_evaluated=len(statuses) - num_passed - num_failed,
+        pass_rate=(
+            num_passed / (num_passed + num_failed)
+            if num_passed + num_failed
+            else None
+        ),
+    )
+    if scores:
+      summary.mean_score = sum(scores) / len(scores)
+      summary.min_score = scores[0]
+      summary.max_score = scores[-1]
+      summary.p50_score = _percentile(scores, 50)
+      summary.p90_score = _percentile(scores, 90)
+      summary.p99_score = _percentile(scores, 99)
+    summaries.append(summary)
+  return summaries
+
+
+class DatabaseEvalSetResultsManager(EvalSetResultsManager):
+  """An EvalSetResults manager that stores eval set results in a database.
+
+  Each eval run is stored as indexed rows per run, per eval case and per
+  metric, together with per-metric aggregates (pass rate and score
+  percentiles) that are computed once when the run is saved. This allows
+  comparing many eval runs without loading the individual results.
+  """
+
+  def __init__(self, db_url: str, **kwargs: Any):
+    """Initializes the manager with a database URL."""
+    try:
+      db_engine = create_engine(db_url, **kwargs)
+    except Exception as e:
+      if isinstance(e, ArgumentError):
+        raise ValueError(
+            f"Invalid database URL format or argument '{db_url}'."
+        ) from e
+      if isinstance(e, ImportError):
+        raise ValueError(
+            f"Database related module not found for URL '{db_url}'."
+        ) from e
+      raise ValueError(
+          f"Failed to create database engine for URL '{db_url}'"
+      ) from e
+
+    self.db_engine: Engine = db_engine
+    self.database_session_factory: sessionmaker[DatabaseSessionFactory] = (
+        sessionmaker(bind=self.db_engine)
+    )
+    Base.metadata.create_all(self.db_engine)
+
+  @override
+  def save_eval_set_result(
+      self,
+      app_name: str,
+      eval_set_id: str,
+      eval_case_results: list[EvalCaseResult],
+  ) -> None:
+    """Creates and saves a new EvalSetResult given eval_case_results."""
+    eval_set_result = create_eval_set_result(
+        app_name, eval_set_id, eval_case_results
+    )
+
+    storage_case_results = []
+    storage_metric_results = []
+    for position, eval_case_result in enumerate(eval_case_results):
+      storage_case_results.append(
+          StorageEvalCaseResult(
+              app_name=app_name,
+              eval_set_result_id=eval_set_result.eval_set_result_id,
+              position=position,
+              eval_id=eval_case_result.eval_id,
+              final_eval_status=eval_case_result.final_eval_status.value,
+              session_id=eval_case_result.session_id,
+              payload=eval_case_result.model_dump_json(),
+          )
+      )
+      for metric_result in eval_case_result.overall_eval_metric_results:
+        storage_metric_results.append(
+            StorageEvalMetricResult(
+                app_name=app_name,
+                eval_set_result_id=eval_set_result.eval_set_result_id,
+                position=position,
+                metric_name=metric_result.metric_name,
+                eval_id=eval_case_result.eval_id,
+                threshold=metric_result.threshold,
+                score=metric_result.score,
+                eval_status=metric_result.eval_status.value,
+            )
+        )
+
+    final_statuses = [
+        eval_case_result.final_eval_status
+        for eval_case_result in eval_case_results
+    ]
+    storage_eval_set_result = StorageEvalSetResult(
+        app_name=app_name,
+        eval_set_result_id=eval_set_result.eval_set_result_id,
+        eval_set_result_name=eval_set_result.eval_set_result_name,
+        eval_set_id=eval_set_id,
+        creation_timestamp=eval_set_result.creation_timestamp,
+        num_passed=final_statuses.count(EvalStatus.PASSED),
+        num_failed=final_statuses.count(EvalStatus.FAILED),
+        num_not_evaluated=final_statuses.count(EvalStatus.NOT_EVALUATED),
+    )
+
+    logger.info(
+        "Writing eval result `%s` to the database.",
+        eval_set_result.eval_set_result_id,
+    )
+    with self.database_session_factory() as sql_session:
+      sql_session.add(storage_eval_set_result)
+      # Flush the parent row first, so that the foreign keys of the child rows
+      # are satisfied regardless of the insert order.
+      sql_session.flush()
+      sql_session.add_all(storage_case_results)
+      sql_session.add_all(storage_metric_results)
+      sql_session.add_all(
+          _create_metric_summaries(
+              app_name, eval_set_result, storage_metric_results
+          )
+      )
+      sql_session.commit()
+
+  @override
+  def get_eval_set_result(
+      self, app_name: str, eval_set_result_id: str
+  ) -> EvalSetResult:
+    """Returns an EvalSetResult identified by app_name and eval_set_result_id.
+
+    The eval set result can be identified by either its id or its name.
+
+    Raises:
+      NotFoundError: If the EvalSetResult is not found.
+    """
+    with self.database_session_factory() as sql_session:
+      storage_eval_set_result = self._get_storage_eval_set_result(
+          sql_session, app_name, eval_set_result_id
+      )
+      if storage_eval_set_result is None:
+        raise NotFoundError(
+            f"Eval set result `{eval_set_result_id}` not found."
+        )
+
+      payloads = sql_session.scalars(
+          select(StorageEvalCaseResult.payload)
+          .filter(StorageEvalCaseResult.app_name == app_name)
+          .filter(
+              StorageEvalCaseResult.eval_set_result_id
+              == storage_eval_set_result.eval_set_result_id
+          )
+          .order_by(StorageEvalCaseResult.position)
+      ).all()
+
+      return EvalSetResult(
+          eval_set_result_id=storage_eval_set_result.eval_set_result_id,
+          eval_set_result_name=storage_eval_set_result.eval_set_result_name,
+          eval_set_id=storage_eval_set_result.eval_set_id,
+          eval_case_results=[
+              EvalCaseResult.model_validate_json(payload)
+              for payload in payloads
+          ],
+          creation_timestamp=storage_eval_set_result.creation_timestamp,
+      )
+
+  @override
+  def list_eval_set_results(self, app_name: str) -> list[str]:
+    """Returns the eval result ids that belong to the given app_name.
+
+    The ids are ordered by creation time, oldest first.
+    """
+    with self.database_session_factory() as sql_session:
+      rows = sql_session.execute(
+          select(
+              StorageEvalSetResult.eval_set_result_id,
+              StorageEvalSetResult.eval_set_result_name,
+          )
+          .filter(StorageEvalSetResult.app_name == app_name)
+          .order_by(StorageEvalSetResult.creation_timestamp)
+      ).all()
+    # Local and GCS managers identify results by their (sanitized) name.
+    return [
+        eval_set_result_name or eval_set_result_id
+        for eval_set_result_id, eval_set_result_name in rows
+    ]
+
+  def list_eval_metric_summaries(
+      self,
+      app_name: str,
+      *,
+      eval_set_id: Optional[str] = None,
+      metric_name: Optional[str] = None,
+      start_timestamp: Optional[float] = None,
+      end_timestamp: Optional[float] = None,
+      limit: Optional[int] = None,
+  ) -> list[EvalMetricSummary]:
+    """Returns the precomputed metric aggregates of eval runs over time.
+
+    Args:
+      app_name: The app name to return the summaries for.
+      eval_set_id: If set, only runs of this eval set are returned.
+      metric_name: If set, only summaries of this metric are returned.
+      start_timestamp: If set, only runs created at or after this time are
+        returned.
+      end_timestamp: If set, only runs created before this time are returned.
+      limit: If set, only the most recent `limit` summaries are returned.
+
+    Returns:
+      The summaries, ordered by creation time, oldest first.
+    """
+    query = select(StorageEvalMetricSummary).filter(
+        StorageEvalMetricSummary.app_name == app_name
+    )
+    if eval_set_id is not None:
+      query = query.filter(StorageEvalMetricSummary.eval_set_id == eval_set_id)
+    if metric_name is not None:
+      query = query.filter(StorageEvalMetricSummary.metric_name == metric_name)
+    if start_timestamp is not None:
+      query = query.filter(
+          StorageEvalMetricSummary.creation_timestamp >= start_timestamp
+      )
+    if end_timestamp is not None:
+      query = query.filter(
+          StorageEvalMetricSummary.creation_timestamp < end_timestamp
+      )
+    query = query.order_by(
+        StorageEvalMetricSummary.creation_timestamp.desc(),
+        # Reversed below along with the timestamps, so metrics end up in
+        # ascending order within each run.
+        StorageEvalMetricSummary.metric_name.desc(),
+    )
+    if limit is not None:
+      query = query.limit(limit)
+
+    with self.database_session_factory() as sql_session:
+      summaries = [
+          storage_summary.to_eval_metric_summary()
+          for storage_summary in sql_session.scalars(query)
+      ]
+    summaries.reverse()
+    return summaries
+
+  def _get_storage_eval_set_result(
+      self,
+      sql_session: DatabaseSessionFactory,
+      app_name: str,
+      eval_set_result_id: str,
+  ) -> Optional[StorageEvalSetResult]:
+    storage_eval_set_result = sql_session.get(
+        StorageEvalSetResult, (app_name, eval_set_result_id)
+    )
+    if storage_eval_set_result is not None:
+      return storage_eval_set_result
+    return sql_session.scalars(
+        select(StorageEvalSetResult)
+        .filter(StorageEvalSetResult.app_name == app_name)
+        .filter(
+            StorageEvalSetResult.eval_set_result_name == eval_set_result_id
+        )
+    ).first()
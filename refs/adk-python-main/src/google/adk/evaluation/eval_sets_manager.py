@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterator
 from typing import Optional
 
 from .eval_case import EvalCase
@@ -29,6 +30,20 @@ class EvalSetsManager(ABC):
   def get_eval_set(self, app_name: str, eval_set_id: str) -> Optional[EvalSet]:
     """Returns an EvalSet identified by an app_name and eval_set_id."""
 
+  def iter_eval_cases(
+      self, app_name: str, eval_set_id: str
+  ) -> Optional[Iterator[EvalCase]]:
+    """Returns an iterator over the EvalCases of an EvalSet if found, otherwise None.
+
+    Implementations that can read eval cases incrementally should override this
+    method, so that callers can start processing the first eval case before the
+    whole eval set is loaded.
+    """
+    eval_set = self.get_eval_set(app_name, eval_set_id)
+    if not eval_set:
+      return None
+    return iter(eval_set.eval_cases)
+
   @abstractmethod
   def create_eval_set(self, app_name: str, eval_set_id: str) -> EvalSet:
     """Creates and returns an empty EvalSet given the app_name and eval_set_id.
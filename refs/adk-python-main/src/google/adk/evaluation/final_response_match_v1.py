@@ -14,10 +14,14 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Optional
 
 from google.genai import types as genai_types
+from nltk.stem import porter
+import numpy as np
 from rouge_score import rouge_scorer
+from rouge_score import tokenize
 from typing_extensions import override
 
 from .eval_case import Invocation
@@ -40,6 +44,20 @@ class RougeEvaluator(Evaluator):
 
   def __init__(self, eval_metric: EvalMetric):
     self._eval_metric = eval_metric
+    self._batch_scorer = Rouge1BatchScorer()
+
+  @property
+  def batch_scorer(self) -> Rouge1BatchScorer:
+    return self._batch_scorer
+
+  @batch_scorer.setter
+  def batch_scorer(self, batch_scorer: Rouge1BatchScorer):
+    """Sets the scorer used to compute the ROUGE-1 scores.
+
+    Evaluators that share a scorer reuse each other's tokenized texts, e.g. the
+    references of an eval case that is evaluated for several runs.
+    """
+    self._batch_scorer = batch_scorer
 
   @staticmethod
   def get_metric_info() -> MetricInfo:
@@ -61,14 +79,23 @@ class RougeEvaluator(Evaluator):
       actual_invocations: list[Invocation],
       expected_invocations: list[Invocation],
   ) -> EvaluationResult:
-    total_score = 0.0
-    num_invocations = 0
+    references = [
+        _get_text_from_content(expected.final_response)
+        for expected in expected_invocations
+    ]
+    candidates = [
+        _get_text_from_content(actual.final_response)
+        for actual in actual_invocations
+    ]
+    # All invocations are scored in a single pass.
+    _, _, fmeasures = self._batch_scorer.score(
+        candidates[: len(references)], references[: len(candidates)]
+    )
+
     per_invocation_results = []
-    for actual, expected in zip(actual_invocations, expected_invocations):
-      reference = _get_text_from_content(expected.final_response)
-      response = _get_text_from_content(actual.final_response)
-      rouge_1_scores = _calculate_rouge_1_scores(response, reference)
-      score = rouge_1_scores.fmeasure
+    for actual, expected, score in zip(
+        actual_invocations, expected_invocations, fmeasures.tolist()
+    ):
       per_invocation_results.append(
           PerInvocationResult(
               actual_invocation=actual,
@@ -77,11 +104,9 @@ class RougeEvaluator(Evaluator):
               eval_status=_get_eval_status(score, self._eval_metric.threshold),
           )
       )
-      total_score += score
-      num_invocations += 1
 
     if per_invocation_results:
-      overall_score = total_score / num_invocations
+      overall_score = float(fmeasures.mean())
       return EvaluationResult(
           overall_score=overall_score,
           overall_eval_status=_get_eval_status(
@@ -122,10 +147,126 @@ def _calculate_rouge_1_scores(candidate: str, reference: str):
   Returns:
       A dictionary containing the ROUGE-1 precision, recall, and f-measure.
   """
-  scorer = rouge_scorer.RougeScorer(["rouge1"], use_stemmer=True)
+  scorer = _get_rouge_1_scorer()
 
   # The score method returns a dictionary where keys are the ROUGE types
   # and values are Score objects (tuples) with precision, recall, and fmeasure.
   scores = scorer.score(reference, candidate)
 
   return scores["rouge1"]
+
+
+@functools.cache
+def _get_rouge_1_scorer() -> rouge_scorer.RougeScorer:
+  # Building a scorer sets up a stemmer, so we only do it once.
+  return rouge_scorer.RougeScorer(["rouge1"], use_stemmer=True)
+
+
+class _CachingStemmer:
+  """A Porter stemmer that remembers the stem of every word it has seen."""
+
+  def __init__(self):
+    self._stemmer = porter.PorterStemmer()
+    self._stems: dict[str, str] = {}
+
+  def stem(self, word: str) -> str:
+    stem = self._stems.get(word)
+    if stem is None:
+      stem = self._stems[word] = self._stemmer.stem(word)
+    return stem
+
+
+class Rouge1BatchScorer:
+  """Computes the ROUGE-1 scores of many candidate and reference pairs at once.
+
+  The scores are the same as the ones computed by rouge_scorer.RougeScorer with
+  use_stemmer=True. Texts are tokenized into arrays of token ids, which are
+  cached, and the unigram overlaps of all pairs are computed in a single
+  vectorized pass.
+
+  The caches grow with every distinct text and word scored, so a scorer is
+  meant to be shared by the evaluations of one eval run and then dropped.
+  """
+
+  def __init__(self):
+    self._stemmer = _CachingStemmer()
+    self._vocabulary: dict[str, int] = {}
+    self._token_ids: dict[str, np.ndarray] = {}
+
+  def score(
+      self, candidates: list[str], references: list[str]
+  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the ROUGE-1 precision, recall and f-measure of each pair."""
+    if len(candidates) != len(references):
+      raise ValueError("Expected as many candidates as references.")
+
+    candidate_token_ids = [self._get_token_ids(text) for text in candidates]
+    reference_token_ids = [self._get_token_ids(text) for text in references]
+    # Every (pair, token) combination maps to a distinct key.
+    key_stride = max(len(self._vocabulary), 1)
+    candidate_keys, candidate_key_counts, candidate_lengths = _count_tokens(
+        candidate_token_ids, key_stride
+    )
+    reference_keys, reference_key_counts, reference_lengths = _count_tokens(
+        reference_token_ids, key_stride
+    )
+
+    common_keys, candidate_indices, reference_indices = np.intersect1d(
+        candidate_keys,
+        reference_keys,
+        assume_unique=True,
+        return_indices=True,
+    )
+    overlaps = np.bincount(
+        common_keys // key_stride,
+        weights=np.minimum(
+            candidate_key_counts[candidate_indices],
+            reference_key_counts[reference_indices],
+        ),
+        minlength=len(candidates),
+    )
+
+    precisions = overlaps / np.maximum(candidate_lengths, 1)
+    recalls = overlaps / np.maximum(reference_lengths, 1)
+    denominators = precisions + recalls
+    fmeasures = np.divide(
+        2 * precisions * recalls,
+        denominators,
+        out=np.zeros_like(denominators),
+        where=denominators > 0,
+    )
+    return precisions, recalls, fmeasures
+
+  def _get_token_ids(self, text: str) -> np.ndarray:
+    token_ids = self._token_ids.get(text)
+    if token_ids is not None:
+      return token_ids
+
+    token_ids = np.array(
+        [
+            self._vocabulary.setdefault(token, len(self._vocabulary))
+            for token in tokenize.tokenize(text, self._stemmer)
+        ],
+        dtype=np.int64,
+    )
+    self._token_ids[text] = token_ids
+    return token_ids
+
+
+def _count_tokens(
+    token_ids: list[np.ndarray], key_stride: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """Returns the unigram counts and the length of each token id array.
+
+  Unigram counts are returned as sorted, unique keys that encode the index of
+  the array and the token id, together with the count of each key.
+  """
+  lengths = np.array([len(ids) for ids in token_ids], dtype=np.int64)
+  if not lengths.sum():
+    empty = np.zeros(0, dtype=np.int64)
+    return empty, empty, lengths
+
+  array_indices = np.repeat(np.arange(len(token_ids), dtype=np.int64), lengths)
+  keys = array_indices * key_stride + np.concatenate(token_ids)
+  unique_keys, counts = np.unique(keys, return_counts=True)
+  return unique_keys, counts, lengths
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import json
 import logging
@@ -30,7 +31,6 @@ from ..models.base_llm import BaseLlm
 from ..models.llm_request import LlmRequest
 from ..models.llm_response import LlmResponse
 from ..models.registry import LLMRegistry
-from ..utils.context_utils import Aclosing
 from ..utils.feature_decorator import experimental
 from .app_details import AppDetails
 from .eval_case import Invocation
@@ -46,6 +46,7 @@ from .evaluator import EvalStatus
 from .evaluator import EvaluationResult
 from .evaluator import Evaluator
 from .evaluator import PerInvocationResult
+from .judge_scheduler import JudgeScheduler
 from .llm_as_judge_utils import get_eval_status
 from .llm_as_judge_utils import get_text_from_content
 from .llm_as_judge_utils import get_tool_declarations_as_json_str
@@ -298,6 +299,16 @@ class HallucinationsV1Evaluator(Evaluator):
     self.sentence_validator_prompt = _HALLUCINATIONS_V1_VALIDATOR_PROMPT
     self._model = self._judge_model_options.judge_model
     self._model_config = self._judge_model_options.judge_model_config
+    self._judge_scheduler = JudgeScheduler()
+
+  @property
+  def judge_scheduler(self) -> JudgeScheduler:
+    return self._judge_scheduler
+
+  @judge_scheduler.setter
+  def judge_scheduler(self, judge_scheduler: JudgeScheduler):
+    """Sets the scheduler used for segmenter and validator calls."""
+    self._judge_scheduler = judge_scheduler
 
   def _setup_auto_rater(self) -> BaseLlm:
     model_id = self._judge_model_options.judge_model
@@ -525,13 +536,13 @@ class HallucinationsV1Evaluator(Evaluator):
         config=self._model_config,
     )
     try:
-      async with Aclosing(
-          self._judge_model.generate_content_async(segmenter_llm_request)
-      ) as agen:
-        segmenter_response = await agen.__anext__()
-        sentences = _parse_sentences(
-            get_text_from_content(segmenter_response.content)
-        )
+      segmenter_responses = await self._judge_scheduler.generate_content(
+          self._judge_model, segmenter_llm_request
+      )
+      segmenter_response = segmenter_responses[0]
+      sentences = _parse_sentences(
+          get_text_from_content(segmenter_response.content)
+      )
     except Exception as e:
       return None, f"Error during sentence segmentation: {e}"
 
@@ -558,13 +569,13 @@ class HallucinationsV1Evaluator(Evaluator):
         config=self._model_config,
     )
     try:
-      async with Aclosing(
-          self._judge_model.generate_content_async(validator_llm_request)
-      ) as agen:
-        validator_response = await agen.__anext__()
-        validation_results = _parse_validation_results(
-            get_text_from_content(validator_response.content)
-        )
+      validator_responses = await self._judge_scheduler.generate_content(
+          self._judge_model, validator_llm_request
+      )
+      validator_response = validator_responses[0]
+      validation_results = _parse_validation_results(
+          get_text_from_content(validator_response.content)
+      )
     except Exception as e:
       return None, f"Error during sentence validation: {e}"
 
@@ -707,51 +718,54 @@ class HallucinationsV1Evaluator(Evaluator):
         per_invocation_results=per_invocation_results,
     )
 
+  async def _evaluate_invocation(
+      self, actual: Invocation, expected: Invocation
+  ) -> PerInvocationResult:
+    step_evaluations = self._get_steps_to_evaluate(actual)
+
+    if not step_evaluations:
+      return PerInvocationResult(
+          actual_invocation=actual,
+          expected_invocation=expected,
+          score=None,
+          eval_status=EvalStatus.NOT_EVALUATED,
+          rubric_scores=[],
+      )
+
+    step_results = await asyncio.gather(*[
+        self._evaluate_nl_response(step.nl_response, step.context)
+        for step in step_evaluations
+    ])
+    scores_per_step = [
+        fs_score for fs_score, _ in step_results if fs_score is not None
+    ]
+
+    invocation_score = (
+        statistics.mean(scores_per_step) if scores_per_step else None
+    )
+
+    return PerInvocationResult(
+        actual_invocation=actual,
+        expected_invocation=expected,
+        score=invocation_score,
+        eval_status=get_eval_status(
+            invocation_score, self._eval_metric.threshold
+        ),
+        rubric_scores=[],
+    )
+
   @override
   async def evaluate_invocations(
       self,
       actual_invocations: list[Invocation],
       expected_invocations: list[Invocation],
   ) -> EvaluationResult:
-    per_invocation_results = []
-    for actual, expected in zip(actual_invocations, expected_invocations):
-      step_evaluations = self._get_steps_to_evaluate(actual)
-
-      if not step_evaluations:
-        per_invocation_results.append(
-            PerInvocationResult(
-                actual_invocation=actual,
-                expected_invocation=expected,
-                score=None,
-                eval_status=EvalStatus.NOT_EVALUATED,
-                rubric_scores=[],
-            )
-        )
-        continue
-
-      scores_per_step = []
-      for step in step_evaluations:
-        fs_score, _ = await self._evaluate_nl_response(
-            step.nl_response, step.context
-        )
-        if fs_score is not None:
-          scores_per_step.append(fs_score)
-
-      invocation_score = (
-          statistics.mean(scores_per_step) if scores_per_step else None
-      )
-
-      per_invocation_results.append(
-          PerInvocationResult(
-              actual_invocation=actual,
-              expected_invocation=expected,
-              score=invocation_score,
-              eval_status=get_eval_status(
-                  invocation_score, self._eval_metric.threshold
-              ),
-              rubric_scores=[],
-          )
-      )
+    # All invocations and all of their steps are evaluated concurrently, the
+    # judge scheduler limits the calls that are in flight to the judge model.
+    per_invocation_results = await asyncio.gather(*[
+        self._evaluate_invocation(actual, expected)
+        for actual, expected in zip(actual_invocations, expected_invocations)
+    ])
 
     if per_invocation_results:
       return self._aggregate_invocation_results(per_invocation_results)
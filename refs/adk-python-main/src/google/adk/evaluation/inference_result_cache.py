@@ -0,0 +1,270 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import inspect
+import json
+import logging
+import os
+from typing import Any
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from ..agents.base_agent import BaseAgent
+from ..sessions.session import Session
+from ..tools.base_tool import BaseTool
+from ..utils.feature_decorator import experimental
+from .common import EvalBaseModel
+from .eval_case import EvalCase
+from .eval_case import Invocation
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Bump this value whenever the cache key or the entry format changes, so that
+# stale entries are not reused.
+_CACHE_FORMAT_VERSION = 1
+
+# Fields of an agent that don't affect the inferences that it generates.
+_EXCLUDED_AGENT_FIELDS = frozenset({"parent_agent"})
+
+
+class InferenceCacheStats(BaseModel):
+  """Hit and miss counts of an InferenceResultCache."""
+
+  hits: int = 0
+  """Number of eval cases whose inferences were served from the cache."""
+
+  misses: int = 0
+  """Number of eval cases whose inferences had to be generated."""
+
+  writes: int = 0
+  """Number of inferences that were written to the cache."""
+
+
+class CachedInference(EvalBaseModel):
+  """The inferences generated for an eval case, as stored in the cache."""
+
+  inferences: list[Invocation]
+  """Inferences obtained from the Agent for the eval case."""
+
+  session: Optional[Session] = Field(default=None)
+  """The session that was generated while inferencing."""
+
+
+def _hash_source(obj: Any) -> str:
+  try:
+    source = inspect.getsource(obj)
+  except (OSError, TypeError):
+    code = getattr(obj, "__code__", None)
+    if code is None:
+      return ""
+    source = repr((code.co_code, code.co_consts))
+  return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _fingerprint(value: Any) -> Any:
+  """Returns a JSON serializable value that identifies the given value.
+
+  Pydantic models are walked field by field, functions are identified by their
+  qualified name and source code, and objects that we don't know how to
+  describe are identified by their type.
+  """
+  if value is None or isinstance(value, (str, int, float, bool)):
+    return value
+  if isinstance(value, enum.Enum):
+    return value.value
+  if isinstance(value, bytes):
+    return hashlib.sha256(value).hexdigest()
+  if isinstance(value, (list, tuple, set, frozenset)):
+    items = [_fingerprint(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+      items.sort(key=lambda item: json.dumps(item, sort_keys=True))
+    return items
+  if isinstance(value, dict):
+    return {str(key): _fingerprint(item) for key, item in value.items()}
+  if isinstance(value, BaseAgent):
+    return _agent_fingerprint(value)
+  if isinstance(value, BaseModel):
+    return {
+        "type": type(value).__qualname__,
+        "fields": {
+            name: _fingerprint(getattr(value, name, None))
+            for name in type(value).model_fields
+        },
+    }
+  if isinstance(value, type):
+    fingerprint = {"type": f"{value.__module__}.{value.__qualname__}"}
+    if issubclass(value, BaseModel):
+      fingerprint["schema"] = value.model_json_schema()
+    return fingerprint
+  if isinstance(value, BaseTool):
+    try:
+      declaration = value._get_declaration()
+    except Exception:  # pylint: disable=broad-exception-caught
+      # Some tools can only build their declaration at runtime.
+      declaration = None
+    return {
+        "type": type(value).__qualname__,
+        "name": value.name,
+        "description": value.description,
+        "declaration": (
+            declaration.model_dump(mode="json", exclude_none=True)
+            if declaration
+            else None
+        ),
+        # Function tools and agent tools are defined by what they wrap.
+        "func": _fingerprint(getattr(value, "func", None)),
+        "agent": _fingerprint(getattr(value, "agent", None)),
+    }
+  if callable(value) and hasattr(value, "__qualname__"):
+    return {
+        "callable": f"{value.__module__}.{value.__qualname__}",
+        "source": _hash_source(value),
+    }
+  return {"type": f"{type(value).__module__}.{type(value).__qualname__}"}
+
+
+def _agent_fingerprint(agent: BaseAgent) -> dict[str, Any]:
+  return {
+      "type": type(agent).__qualname__,
+      "fields": {
+          name: _fingerprint(getattr(agent, name, None))
+          for name in type(agent).model_fields
+          if name not in _EXCLUDED_AGENT_FIELDS
+      },
+  }
+
+
+def _hash_json(value: Any) -> str:
+  return hashlib.sha256(
+      json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+  ).hexdigest()
+
+
+def get_agent_definition_hash(root_agent: BaseAgent) -> str:
+  """Returns a hash of the definition of the given agent tree.
+
+  The hash covers the configuration of every agent in the tree, including the
+  model and its generation config, instructions, tools and callbacks.
+  """
+  return _hash_json(_agent_fingerprint(root_agent))
+
+
+def get_eval_case_hash(eval_case: EvalCase) -> str:
+  """Returns a hash of the parts of an eval case that affect inferencing.
+
+  Only the inputs to the agent are considered, so editing the expected
+  responses of an eval case doesn't invalidate its cached inferences.
+  """
+  return _hash_json({
+      "user_contents": [
+          invocation.user_content.model_dump(mode="json", exclude_none=True)
+          for invocation in eval_case.conversation or []
+      ],
+      "conversation_scenario": (
+          eval_case.conversation_scenario.model_dump(
+              mode="json", exclude_none=True
+          )
+          if eval_case.conversation_scenario
+          else None
+      ),
+      "session_input": (
+          eval_case.session_input.model_dump(mode="json", exclude_none=True)
+          if eval_case.session_input
+          else None
+      ),
+  })
+
+
+@experimental
+class InferenceResultCache:
+  """A content addressed, on-disk cache of the inferences of eval cases.
+
+  Entries are keyed by a hash of the agent definition, a hash of the inputs of
+  the eval case and an optional user provided salt. Changing the agent, its
+  model config or the inputs of an eval case yields a new key, while changing
+  only the metrics or the expected responses reuses the cached inferences.
+  """
+
+  def __init__(self, cache_dir: str, cache_salt: str = ""):
+    """Initializes the InferenceResultCache.
+
+    Args:
+      cache_dir: The directory where the cache entries are stored.
+      cache_salt: An optional value that is mixed into every cache key. Use it
+        to invalidate the cache when something that is not part of the agent
+        definition changes, for example the data behind a tool.
+    """
+    self._cache_dir = cache_dir
+    self._cache_salt = cache_salt
+    self._stats = InferenceCacheStats()
+    # Agent definitions don't change while the cache is in use, so we only
+    # hash each agent tree once. {id(agent): (agent, hash)}
+    self._agent_hashes: dict[int, tuple[BaseAgent, str]] = {}
+
+  @property
+  def stats(self) -> InferenceCacheStats:
+    return self._stats
+
+  def get_cache_key(self, root_agent: BaseAgent, eval_case: EvalCase) -> str:
+    """Returns the cache key for the inferences of an eval case."""
+    agent_hash = self._agent_hashes.get(id(root_agent))
+    if agent_hash is None or agent_hash[0] is not root_agent:
+      agent_hash = (root_agent, get_agent_definition_hash(root_agent))
+      self._agent_hashes[id(root_agent)] = agent_hash
+
+    return _hash_json({
+        "version": _CACHE_FORMAT_VERSION,
+        "agent": agent_hash[1],
+        "eval_case": get_eval_case_hash(eval_case),
+        "salt": self._cache_salt,
+    })
+
+  def get(self, cache_key: str) -> Optional[CachedInference]:
+    """Returns the cached inferences for the key, if present."""
+    try:
+      with open(self._get_entry_path(cache_key), "r", encoding="utf-8") as f:
+        cached_inference = CachedInference.model_validate_json(f.read())
+    except FileNotFoundError:
+      self._stats.misses += 1
+      return None
+    except ValueError as e:
+      logger.warning(
+          "Ignoring corrupt inference cache entry %s: %s", cache_key, e
+      )
+      self._stats.misses += 1
+      return None
+
+    self._stats.hits += 1
+    return cached_inference
+
+  def put(self, cache_key: str, cached_inference: CachedInference):
+    """Stores the inferences under the given key."""
+    entry_path = self._get_entry_path(cache_key)
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    # Write to a temporary file first, so that readers never see a partially
+    # written entry.
+    tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+      f.write(cached_inference.model_dump_json(exclude_none=True))
+    os.replace(tmp_path, entry_path)
+    self._stats.writes += 1
+
+  def _get_entry_path(self, cache_key: str) -> str:
+    return os.path.join(self._cache_dir, cache_key[:2], cache_key + ".json")
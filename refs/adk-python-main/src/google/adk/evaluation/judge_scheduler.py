@@ -0,0 +1,260 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import hashlib
+import json
+import logging
+import time
+from typing import Optional
+
+from google.genai import types as genai_types
+from pydantic import BaseModel
+
+from ..models.base_llm import BaseLlm
+from ..models.llm_request import LlmRequest
+from ..models.llm_response import LlmResponse
+from ..utils.context_utils import Aclosing
+from ..utils.feature_decorator import experimental
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_DEFAULT_MAX_CONCURRENT_REQUESTS_PER_MODEL = 8
+
+_DEFAULT_MAX_CACHED_RESPONSES = 4096
+
+# The interval that max_requests_per_minute_per_model is counted over.
+_RATE_LIMIT_INTERVAL_SECONDS = 60.0
+
+
+class JudgeSchedulerStats(BaseModel):
+  """Request counts of a JudgeScheduler."""
+
+  requests: int = 0
+  """Number of judge requests that were submitted to the scheduler."""
+
+  model_calls: int = 0
+  """Number of judge requests that were actually sent to a model."""
+
+  deduplicated: int = 0
+  """Number of judge requests that were served by an identical request."""
+
+
+class _RateLimiter:
+  """A token bucket that lets up to max_requests requests start per interval.
+
+  A full bucket lets a burst of max_requests requests start at once, after
+  that the requests are spread evenly over the interval. Waiting requests
+  start in the order they arrived.
+  """
+
+  def __init__(self, max_requests: int, interval: float):
+    self._max_tokens = float(max_requests)
+    self._tokens = float(max_requests)
+    self._tokens_per_second = max_requests / interval
+    self._refilled_at = time.monotonic()
+    self._lock = asyncio.Lock()
+
+  async def acquire(self):
+    """Waits until a request may start."""
+    async with self._lock:
+      while True:
+        now = time.monotonic()
+        self._tokens = min(
+            self._max_tokens,
+            self._tokens + (now - self._refilled_at) * self._tokens_per_second,
+        )
+        self._refilled_at = now
+        if self._tokens >= 1:
+          self._tokens -= 1
+          return
+        await asyncio.sleep((1 - self._tokens) / self._tokens_per_second)
+
+
+def _is_deterministic(llm_request: LlmRequest) -> bool:
+  config = llm_request.config
+  return (
+      isinstance(config, genai_types.GenerateContentConfig)
+      and config.temperature == 0
+  )
+
+
+def _get_request_key(llm_request: LlmRequest, sample_index: int) -> str:
+  config = llm_request.config
+  return hashlib.sha256(
+      json.dumps(
+          {
+              "model": llm_request.model,
+              "contents": [
+                  content.model_dump(mode="json", exclude_none=True)
+                  for content in llm_request.contents
+              ],
+              "config": (
+                  config.model_dump(mode="json", exclude_none=True)
+                  if isinstance(config, BaseModel)
+                  else None
+              ),
+              # Samples of a deterministic request are all the same, so they
+              # share a single model call.
+              "sample_index": (
+                  None if _is_deterministic(llm_request) else sample_index
+              ),
+          },
+          sort_keys=True,
+          default=str,
+      ).encode("utf-8")
+  ).hexdigest()
+
+
+@experimental
+class JudgeScheduler:
+  """Schedules the model calls made by LLM based evaluators.
+
+  The scheduler lets evaluators issue all of their judge requests at once:
+    - Requests run concurrently, with at most max_concurrent_requests_per_model
+      requests in flight for any single judge model.
+    - If max_requests_per_minute_per_model is set, the requests to a judge
+      model are rate limited to stay within the quota of the model.
+    - Identical requests are only sent once. A request is identified by the
+      judge model, the prompt, the model config and the sample index, so the
+      n-th sample of a prompt is reused across eval cases and across eval runs
+      that share the scheduler. When the judge model config is deterministic
+      (temperature 0) all samples of a prompt share a single model call.
+
+  A scheduler is bound to the event loop that it is first used on.
+  """
+
+  def __init__(
+      self,
+      max_concurrent_requests_per_model: int = (
+          _DEFAULT_MAX_CONCURRENT_REQUESTS_PER_MODEL
+      ),
+      max_cached_responses: int = _DEFAULT_MAX_CACHED_RESPONSES,
+      max_requests_per_minute_per_model: Optional[int] = None,
+  ):
+    """Initializes the JudgeScheduler.
+
+    Args:
+      max_concurrent_requests_per_model: The maximum number of requests that
+        are in flight at any time for a single judge model.
+      max_cached_responses: The maximum number of judge responses that are
+        kept around for deduplication. Set this to 0 to only deduplicate
+        requests that are in flight at the same time.
+      max_requests_per_minute_per_model: The maximum number of requests that
+        are sent to a single judge model per minute. Requests are not rate
+        limited if this is None. Deduplicated requests don't count.
+    """
+    if max_concurrent_requests_per_model < 1:
+      raise ValueError("max_concurrent_requests_per_model must be at least 1.")
+    if (
+        max_requests_per_minute_per_model is not None
+        and max_requests_per_minute_per_model < 1
+    ):
+      raise ValueError("max_requests_per_minute_per_model must be at least 1.")
+
+    self._max_concurrent_requests_per_model = max_concurrent_requests_per_model
+    self._max_cached_responses = max_cached_responses
+    self._max_requests_per_minute_per_model = max_requests_per_minute_per_model
+    self._semaphores: dict[str, asyncio.Semaphore] = {}
+    self._rate_limiters: dict[str, _RateLimiter] = {}
+    self._in_flight: dict[str, asyncio.Future[list[LlmResponse]]] = {}
+    self._responses: collections.OrderedDict[str, list[LlmResponse]] = (
+        collections.OrderedDict()
+    )
+    self._stats = JudgeSchedulerStats()
+
+  @property
+  def stats(self) -> JudgeSchedulerStats:
+    return self._stats
+
+  async def generate_content(
+      self,
+      judge_model: BaseLlm,
+      llm_request: LlmRequest,
+      sample_index: int = 0,
+  ) -> list[LlmResponse]:
+    """Returns the responses of the judge model for the given request.
+
+    Args:
+      judge_model: The model that the request is sent to.
+      llm_request: The judge request.
+      sample_index: The index of the sample when the same request is sampled
+        more than once. Different samples of a non-deterministic request are
+        never deduplicated against each other.
+    """
+    self._stats.requests += 1
+    request_key = _get_request_key(llm_request, sample_index)
+
+    responses = self._responses.get(request_key)
+    if responses is not None:
+      self._responses.move_to_end(request_key)
+      self._stats.deduplicated += 1
+      return responses
+
+    call = self._in_flight.get(request_key)
+    if call is None:
+      call = asyncio.ensure_future(self._call_model(judge_model, llm_request))
+      call.add_done_callback(functools.partial(self._on_call_done, request_key))
+      self._in_flight[request_key] = call
+    else:
+      self._stats.deduplicated += 1
+
+    # The call is shared by every identical request, so a cancelled caller
+    # must not cancel it for everybody else.
+    return await asyncio.shield(call)
+
+  async def _call_model(
+      self, judge_model: BaseLlm, llm_request: LlmRequest
+  ) -> list[LlmResponse]:
+    model = llm_request.model or ""
+    semaphore = self._semaphores.get(model)
+    if semaphore is None:
+      semaphore = asyncio.Semaphore(self._max_concurrent_requests_per_model)
+      self._semaphores[model] = semaphore
+    rate_limiter = self._rate_limiters.get(model)
+    if rate_limiter is None and self._max_requests_per_minute_per_model:
+      rate_limiter = _RateLimiter(
+          self._max_requests_per_minute_per_model,
+          _RATE_LIMIT_INTERVAL_SECONDS,
+      )
+      self._rate_limiters[model] = rate_limiter
+
+    async with semaphore:
+      if rate_limiter:
+        await rate_limiter.acquire()
+      self._stats.model_calls += 1
+      responses = []
+      async with Aclosing(
+          judge_model.generate_content_async(llm_request)
+      ) as agen:
+        async for llm_response in agen:
+          responses.append(llm_response)
+      return responses
+
+  def _on_call_done(
+      self, request_key: str, call: asyncio.Future[list[LlmResponse]]
+  ):
+    del self._in_flight[request_key]
+    if call.cancelled() or call.exception() is not None:
+      # Failed calls are not cached, the next identical request is sent again.
+      return
+    if self._max_cached_responses <= 0:
+      return
+    self._responses[request_key] = call.result()
+    while len(self._responses) > self._max_cached_responses:
+      self._responses.popitem(last=False)
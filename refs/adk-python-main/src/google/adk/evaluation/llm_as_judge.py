@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+import asyncio
 from typing import Optional
 
 from google.genai import types as genai_types
@@ -25,7 +26,6 @@ from ..models.base_llm import BaseLlm
 from ..models.llm_request import LlmRequest
 from ..models.llm_response import LlmResponse
 from ..models.registry import LLMRegistry
-from ..utils.context_utils import Aclosing
 from ..utils.feature_decorator import experimental
 from .common import EvalBaseModel
 from .eval_case import Invocation
@@ -35,6 +35,7 @@ from .eval_metrics import RubricScore
 from .evaluator import EvaluationResult
 from .evaluator import Evaluator
 from .evaluator import PerInvocationResult
+from .judge_scheduler import JudgeScheduler
 from .llm_as_judge_utils import get_eval_status
 
 
@@ -57,6 +58,10 @@ class LlmAsJudge(Evaluator):
       results to get the overall score.
     - (Optional) Override aggregate_per_invocation_result_samples to aggregate
       multiple auto-rater samples of the same invocation.
+
+  All auto-rater samples of all invocations are requested at once through a
+  JudgeScheduler, which runs them concurrently and deduplicates identical
+  requests.
   """
 
   def __init__(
@@ -81,6 +86,20 @@ class LlmAsJudge(Evaluator):
 
     self._judge_model_options = self._criterion.judge_model_options
     self._judge_model = self._setup_auto_rater()
+    self._judge_scheduler = JudgeScheduler()
+
+  @property
+  def judge_scheduler(self) -> JudgeScheduler:
+    return self._judge_scheduler
+
+  @judge_scheduler.setter
+  def judge_scheduler(self, judge_scheduler: JudgeScheduler):
+    """Sets the scheduler used for auto-rater calls.
+
+    Evaluators that share a scheduler share its limits and reuse each
+    other's auto-rater responses for identical requests.
+    """
+    self._judge_scheduler = judge_scheduler
 
   @abstractmethod
   def format_auto_rater_prompt(
@@ -114,41 +133,59 @@ class LlmAsJudge(Evaluator):
       actual_invocations: list[Invocation],
       expected_invocations: list[Invocation],
   ) -> EvaluationResult:
-    per_invocation_results = []
-    for actual, expected in zip(actual_invocations, expected_invocations):
-      auto_rater_prompt = self.format_auto_rater_prompt(actual, expected)
-      llm_request = LlmRequest(
-          model=self._judge_model_options.judge_model,
-          contents=[
-              genai_types.Content(
-                  parts=[genai_types.Part(text=auto_rater_prompt)],
-                  role="user",
-              )
-          ],
-          config=self._judge_model_options.judge_model_config,
-      )
-      num_samples = self._judge_model_options.num_samples
-      invocation_result_samples = []
-      for _ in range(num_samples):
-        async with Aclosing(
-            self._judge_model.generate_content_async(llm_request)
-        ) as agen:
-          async for llm_response in agen:
-            # Non-streaming call, so there is only one response content.
-            auto_rater_score = self.convert_auto_rater_response_to_score(
-                llm_response
-            )
-            invocation_result_samples.append(
-                PerInvocationResult(
-                    actual_invocation=actual,
-                    expected_invocation=expected,
-                    score=auto_rater_score.score,
-                    eval_status=get_eval_status(
-                        auto_rater_score.score, self._eval_metric.threshold
-                    ),
-                    rubric_scores=auto_rater_score.rubric_scores,
+    num_samples = self._judge_model_options.num_samples
+    invocation_pairs = list(zip(actual_invocations, expected_invocations))
+    llm_requests = [
+        LlmRequest(
+            model=self._judge_model_options.judge_model,
+            contents=[
+                genai_types.Content(
+                    parts=[
+                        genai_types.Part(
+                            text=self.format_auto_rater_prompt(actual, expected)
+                        )
+                    ],
+                    role="user",
                 )
+            ],
+            config=self._judge_model_options.judge_model_config,
+        )
+        for actual, expected in invocation_pairs
+    ]
+    # Request every sample of every invocation up front, the scheduler takes
+    # care of limiting the calls and of deduplicating identical requests.
+    samples_per_invocation = await asyncio.gather(*[
+        asyncio.gather(*[
+            self._judge_scheduler.generate_content(
+                self._judge_model, llm_request, sample_index=sample_index
             )
+            for sample_index in range(num_samples)
+        ])
+        for llm_request in llm_requests
+    ])
+
+    per_invocation_results = []
+    for (actual, expected), samples in zip(
+        invocation_pairs, samples_per_invocation
+    ):
+      invocation_result_samples = []
+      for llm_responses in samples:
+        # Non-streaming call, so there is only one response content.
+        for llm_response in llm_responses:
+          auto_rater_score = self.convert_auto_rater_response_to_score(
+              llm_response
+          )
+          invocation_result_samples.append(
+              PerInvocationResult(
+                  actual_invocation=actual,
+                  expected_invocation=expected,
+                  score=auto_rater_score.score,
+                  eval_status=get_eval_status(
+                      auto_rater_score.score, self._eval_metric.threshold
+                  ),
+                  rubric_scores=auto_rater_score.rubric_scores,
+              )
+          )
       if not invocation_result_samples:
         continue
       per_invocation_results.append(
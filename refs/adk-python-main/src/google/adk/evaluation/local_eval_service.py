@@ -38,6 +38,7 @@ from .base_eval_service import InferenceRequest
 from .base_eval_service import InferenceResult
 from .base_eval_service import InferenceStatus
 from .eval_case import Invocation
+from .eval_case import SessionInput
 from .eval_metrics import EvalMetric
 from .eval_metrics import EvalMetricResult
 from .eval_metrics import EvalMetricResultDetails
@@ -49,8 +50,16 @@ from .eval_sets_manager import EvalSetsManager
 from .evaluation_generator import EvaluationGenerator
 from .evaluator import EvalStatus
 from .evaluator import EvaluationResult
+from .final_response_match_v1 import Rouge1BatchScorer
+from .final_response_match_v1 import RougeEvaluator
+from .hallucinations_v1 import HallucinationsV1Evaluator
+from .inference_result_cache import CachedInference
+from .inference_result_cache import InferenceResultCache
+from .judge_scheduler import JudgeScheduler
+from .llm_as_judge import LlmAsJudge
 from .metric_evaluator_registry import DEFAULT_METRIC_EVALUATOR_REGISTRY
 from .metric_evaluator_registry import MetricEvaluatorRegistry
+from .response_evaluator import ResponseEvaluator
 
 logger = logging.getLogger('google_adk.' + __name__)
 
@@ -74,7 +83,27 @@ class LocalEvalService(BaseEvalService):
       artifact_service: Optional[BaseArtifactService] = None,
       eval_set_results_manager: Optional[EvalSetResultsManager] = None,
       session_id_supplier: Callable[[], str] = _get_session_id,
+      inference_result_cache: Optional[InferenceResultCache] = None,
+      judge_scheduler: Optional[JudgeScheduler] = None,
   ):
+    """Initializes the LocalEvalService.
+
+    Args:
+      root_agent: The agent that is evaluated.
+      eval_sets_manager: The manager to read the eval sets from.
+      metric_evaluator_registry: The registry of metric evaluators.
+      session_service: The session service used while inferencing.
+      artifact_service: The artifact service used while inferencing.
+      eval_set_results_manager: If set, eval results are saved with it.
+      session_id_supplier: Supplies the session ids for inferencing.
+      inference_result_cache: If set, successful inferences are stored in this
+        cache and eval cases whose agent and inputs are unchanged are served
+        from it instead of being inferenced again.
+      judge_scheduler: The scheduler shared by all the LLM based evaluators of
+        this service. It limits the calls to the judge models and reuses
+        judge responses for identical requests across eval cases and runs.
+        Defaults to a new JudgeScheduler.
+    """
     self._root_agent = root_agent
     self._eval_sets_manager = eval_sets_manager
     metric_evaluator_registry = (
@@ -87,6 +116,8 @@ class LocalEvalService(BaseEvalService):
     self._artifact_service = artifact_service
     self._eval_set_results_manager = eval_set_results_manager
     self._session_id_supplier = session_id_supplier
+    self._inference_result_cache = inference_result_cache
+    self._judge_scheduler = judge_scheduler or JudgeScheduler()
 
   @override
   async def perform_inference(
@@ -98,13 +129,14 @@ class LocalEvalService(BaseEvalService):
     Args:
       inference_request: The request for generating inferences.
     """
-    # Get the eval set from the storage.
-    eval_set = self._eval_sets_manager.get_eval_set(
+    # Get the eval cases from the storage. Eval cases are read as we go, so
+    # that inferencing can start before the whole eval set is loaded.
+    eval_cases = self._eval_sets_manager.iter_eval_cases(
         app_name=inference_request.app_name,
         eval_set_id=inference_request.eval_set_id,
     )
 
-    if not eval_set:
+    if eval_cases is None:
       raise NotFoundError(
           f'Eval set with id {inference_request.eval_set_id} not found for app'
           f' {inference_request.app_name}'
@@ -112,30 +144,55 @@ class LocalEvalService(BaseEvalService):
 
     # Select eval cases for which we need to run inferencing. If the inference
     # request specified eval cases, then we use only those.
-    eval_cases = eval_set.eval_cases
     if inference_request.eval_case_ids:
-      eval_cases = [
+      eval_case_ids = set(inference_request.eval_case_ids)
+      eval_cases = (
           eval_case
           for eval_case in eval_cases
-          if eval_case.eval_id in inference_request.eval_case_ids
-      ]
-
-    semaphore = asyncio.Semaphore(
-        value=inference_request.inference_config.parallelism
-    )
+          if eval_case.eval_id in eval_case_ids
+      )
 
-    async def run_inference(eval_case):
-      async with semaphore:
-        return await self._perform_inference_sigle_eval_item(
-            app_name=inference_request.app_name,
-            eval_set_id=inference_request.eval_set_id,
-            eval_case=eval_case,
-            root_agent=self._root_agent,
+    parallelism = inference_request.inference_config.parallelism
+    pending = set()
+    try:
+      for eval_case in eval_cases:
+        # We only pull the next eval case once there is room for it, which
+        # bounds the number of eval cases that are held in memory.
+        while len(pending) >= parallelism:
+          done, pending = await asyncio.wait(
+              pending, return_when=asyncio.FIRST_COMPLETED
+          )
+          for inference_task in done:
+            yield inference_task.result()
+
+        pending.add(
+            asyncio.ensure_future(
+                self._perform_inference_sigle_eval_item(
+                    app_name=inference_request.app_name,
+                    eval_set_id=inference_request.eval_set_id,
+                    eval_case=eval_case,
+                    root_agent=self._root_agent,
+                )
+            )
         )
 
-    inference_results = [run_inference(eval_case) for eval_case in eval_cases]
-    for inference_result in asyncio.as_completed(inference_results):
-      yield await inference_result
+      while pending:
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.FIRST_COMPLETED
+        )
+        for inference_task in done:
+          yield inference_task.result()
+    finally:
+      for inference_task in pending:
+        inference_task.cancel()
+
+      if self._inference_result_cache:
+        stats = self._inference_result_cache.stats
+        logger.info(
+            'Inference cache stats: %d hits, %d misses.',
+            stats.hits,
+            stats.misses,
+        )
 
   @override
   async def evaluate(
@@ -151,12 +208,18 @@ class LocalEvalService(BaseEvalService):
     semaphore = asyncio.Semaphore(
         value=evaluate_request.evaluate_config.parallelism
     )
+    # The ROUGE-1 evaluations of all the inference results share one scorer,
+    # so that the references of eval cases inferenced for several runs, and
+    # the words that are shared across texts, are only tokenized and stemmed
+    # once. The scorer is dropped with the request.
+    rouge_batch_scorer = Rouge1BatchScorer()
 
     async def run_evaluation(inference_result):
       async with semaphore:
         return await self._evaluate_single_inference_result(
             inference_result=inference_result,
             evaluate_config=evaluate_request.evaluate_config,
+            rouge_batch_scorer=rouge_batch_scorer,
         )
 
     evaluation_tasks = [
@@ -177,7 +240,10 @@ class LocalEvalService(BaseEvalService):
       yield eval_case_result
 
   async def _evaluate_single_inference_result(
-      self, inference_result: InferenceResult, evaluate_config: EvaluateConfig
+      self,
+      inference_result: InferenceResult,
+      evaluate_config: EvaluateConfig,
+      rouge_batch_scorer: Optional[Rouge1BatchScorer] = None,
   ) -> tuple[InferenceResult, EvalCaseResult]:
     """Returns EvalCaseResult for the given inference result.
 
@@ -237,6 +303,7 @@ class LocalEvalService(BaseEvalService):
           eval_metric=eval_metric,
           actual_invocations=inference_result.inferences,
           expected_invocations=eval_case.conversation,
+          rouge_batch_scorer=rouge_batch_scorer,
       )
 
       # Track overall scrore across all invocations.
@@ -310,6 +377,7 @@ class LocalEvalService(BaseEvalService):
       eval_metric: EvalMetric,
       actual_invocations: list[Invocation],
       expected_invocations: list[Invocation],
+      rouge_batch_scorer: Optional[Rouge1BatchScorer] = None,
   ) -> EvaluationResult:
     """Returns EvaluationResult obtained from evaluating a metric using an Evaluator."""
 
@@ -317,6 +385,13 @@ class LocalEvalService(BaseEvalService):
     metric_evaluator = self._metric_evaluator_registry.get_evaluator(
         eval_metric=eval_metric
     )
+    if isinstance(metric_evaluator, (LlmAsJudge, HallucinationsV1Evaluator)):
+      metric_evaluator.judge_scheduler = self._judge_scheduler
+    if rouge_batch_scorer:
+      if isinstance(metric_evaluator, RougeEvaluator):
+        metric_evaluator.batch_scorer = rouge_batch_scorer
+      elif isinstance(metric_evaluator, ResponseEvaluator):
+        metric_evaluator.rouge_batch_scorer = rouge_batch_scorer
 
     if inspect.iscoroutinefunction(metric_evaluator.evaluate_invocations):
       # Some evaluators could be async, for example those that use llm as a
@@ -370,6 +445,22 @@ class LocalEvalService(BaseEvalService):
         session_id=session_id,
     )
 
+    cache_key = None
+    if self._inference_result_cache:
+      cache_key = self._inference_result_cache.get_cache_key(
+          root_agent=root_agent, eval_case=eval_case
+      )
+      cached_inference = self._inference_result_cache.get(cache_key)
+      if cached_inference:
+        await self._restore_cached_session(
+            cached_inference=cached_inference,
+            initial_session=initial_session,
+            session_id=session_id,
+        )
+        inference_result.inferences = cached_inference.inferences
+        inference_result.status = InferenceStatus.SUCCESS
+        return inference_result
+
     try:
       inferences = (
           await EvaluationGenerator._generate_inferences_from_root_agent(
@@ -385,6 +476,14 @@ class LocalEvalService(BaseEvalService):
       inference_result.inferences = inferences
       inference_result.status = InferenceStatus.SUCCESS
 
+      if cache_key:
+        await self._cache_inferences(
+            cache_key=cache_key,
+            initial_session=initial_session,
+            session_id=session_id,
+            inferences=inferences,
+        )
+
       return inference_result
     except Exception as e:
       # We intentionally catch the Exception as we don't failures to affect
@@ -397,3 +496,55 @@ class LocalEvalService(BaseEvalService):
       inference_result.status = InferenceStatus.FAILURE
       inference_result.error_message = str(e)
       return inference_result
+
+  async def _cache_inferences(
+      self,
+      cache_key: str,
+      initial_session: Optional[SessionInput],
+      session_id: str,
+      inferences: list[Invocation],
+  ):
+    """Stores the inferences and the session that produced them in the cache."""
+    # These defaults match the ones used by the EvaluationGenerator.
+    session = await self._session_service.get_session(
+        app_name=(
+            initial_session.app_name
+            if initial_session
+            else 'EvaluationGenerator'
+        ),
+        user_id=initial_session.user_id if initial_session else 'test_user_id',
+        session_id=session_id,
+    )
+    try:
+      self._inference_result_cache.put(
+          cache_key,
+          CachedInference(inferences=inferences, session=session),
+      )
+    except OSError as e:
+      # A cache that can't be written to shouldn't fail the inference.
+      logger.warning('Failed to cache inferences: %s', e)
+
+  async def _restore_cached_session(
+      self,
+      cached_inference: CachedInference,
+      initial_session: Optional[SessionInput],
+      session_id: str,
+  ):
+    """Recreates the session of a cached inference under a new session id.
+
+    The session is needed later on, when the eval case results are put
+    together. It starts from the initial state of the eval case, like the
+    session of the inference did, and its events replay the state deltas.
+    """
+    cached_session = cached_inference.session
+    if not cached_session:
+      return
+
+    session = await self._session_service.create_session(
+        app_name=cached_session.app_name,
+        user_id=cached_session.user_id,
+        state=initial_session.state if initial_session else {},
+        session_id=session_id,
+    )
+    for event in cached_session.events:
+      await self._session_service.append_event(session=session, event=event)
@@ -20,6 +20,7 @@ import os
 import re
 import time
 from typing import Any
+from typing import Iterator
 from typing import Optional
 import uuid
 
@@ -33,6 +34,7 @@ from ._eval_sets_manager_utils import delete_eval_case_from_eval_set
 from ._eval_sets_manager_utils import get_eval_case_from_eval_set
 from ._eval_sets_manager_utils import get_eval_set_from_app_and_id
 from ._eval_sets_manager_utils import update_eval_case_in_eval_set
+from ._jsonl_eval_set_file import JsonlEvalSetFile
 from .eval_case import EvalCase
 from .eval_case import IntermediateData
 from .eval_case import Invocation
@@ -43,6 +45,7 @@ from .eval_sets_manager import EvalSetsManager
 logger = logging.getLogger("google_adk." + __name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
+_EVAL_SET_JSONL_FILE_EXTENSION = ".evalset.jsonl"
 
 
 def _convert_invocation_to_pydantic_schema(
@@ -176,6 +179,9 @@ def load_eval_set_from_file(
     eval_set_file_path: str, eval_set_id: str
 ) -> EvalSet:
   """Returns an EvalSet that is read from the given file."""
+  if eval_set_file_path.endswith(_EVAL_SET_JSONL_FILE_EXTENSION):
+    return JsonlEvalSetFile(eval_set_file_path).get_eval_set()
+
   with open(eval_set_file_path, "r", encoding="utf-8") as f:
     content = f.read()
     try:
@@ -188,15 +194,81 @@ def load_eval_set_from_file(
       )
 
 
+def convert_eval_set_file(source_path: str, target_path: str) -> EvalSet:
+  """Converts an eval set file between the JSON and the JSONL formats.
+
+  The format of each file is picked by its extension, `.evalset.jsonl` for the
+  JSONL format and anything else for the JSON format.
+
+  Args:
+    source_path: The path of the eval set file to convert.
+    target_path: The path of the file to write the eval set to. An existing
+      file is overwritten.
+
+  Returns:
+    The converted EvalSet.
+  """
+  source_name = os.path.basename(source_path)
+  for extension in (_EVAL_SET_JSONL_FILE_EXTENSION, _EVAL_SET_FILE_EXTENSION):
+    if source_name.endswith(extension):
+      source_name = source_name[: -len(extension)]
+      break
+  eval_set = load_eval_set_from_file(source_path, source_name)
+
+  if target_path.endswith(_EVAL_SET_JSONL_FILE_EXTENSION):
+    JsonlEvalSetFile.create(target_path, eval_set)
+  else:
+    _write_eval_set_to_path(target_path, eval_set)
+  return eval_set
+
+
+def _write_eval_set_to_path(eval_set_path: str, eval_set: EvalSet):
+  with open(eval_set_path, "w", encoding="utf-8") as f:
+    f.write(
+        eval_set.model_dump_json(
+            indent=2,
+            exclude_unset=True,
+            exclude_defaults=True,
+            exclude_none=True,
+        )
+    )
+
+
 class LocalEvalSetsManager(EvalSetsManager):
-  """An EvalSets manager that stores eval sets locally on disk."""
+  """An EvalSets manager that stores eval sets locally on disk.
 
-  def __init__(self, agents_dir: str):
+  Eval sets are stored either as `.evalset.json` files, that hold the whole
+  EvalSet as a single JSON document, or as append-only `.evalset.jsonl` files.
+  Both formats can be read, and eval sets are always modified in the format
+  they were created in.
+
+  With the JSONL format, adding, updating or deleting an eval case appends a
+  single record to the file instead of rewriting the whole eval set, and eval
+  cases can be looked up by id and iterated without parsing the whole file.
+  """
+
+  def __init__(self, agents_dir: str, use_jsonl_format: bool = False):
+    """Initializes the LocalEvalSetsManager.
+
+    Args:
+      agents_dir: The directory that contains the agents.
+      use_jsonl_format: Whether new eval sets are created in the append-only
+        `.evalset.jsonl` format. Existing eval sets keep their format.
+    """
     self._agents_dir = agents_dir
+    self._use_jsonl_format = use_jsonl_format
+    self._jsonl_eval_set_files: dict[str, JsonlEvalSetFile] = {}
 
   @override
   def get_eval_set(self, app_name: str, eval_set_id: str) -> Optional[EvalSet]:
     """Returns an EvalSet identified by an app_name and eval_set_id."""
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      try:
+        return jsonl_eval_set_file.get_eval_set()
+      except FileNotFoundError:
+        return None
+
     # Load the eval set file data
     try:
       eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
@@ -215,10 +287,20 @@ class LocalEvalSetsManager(EvalSetsManager):
 
     # Define the file path
     new_eval_set_path = self._get_eval_set_file_path(app_name, eval_set_id)
+    new_jsonl_eval_set_path = self._get_jsonl_eval_set_file_path(
+        app_name, eval_set_id
+    )
 
-    logger.info("Creating eval set file `%s`", new_eval_set_path)
+    logger.info(
+        "Creating eval set file `%s`",
+        new_jsonl_eval_set_path
+        if self._use_jsonl_format
+        else new_eval_set_path,
+    )
 
-    if not os.path.exists(new_eval_set_path):
+    if not os.path.exists(new_eval_set_path) and not os.path.exists(
+        new_jsonl_eval_set_path
+    ):
       # Write the JSON string to the file
       logger.info("Eval set file doesn't exist, we will create a new one.")
       new_eval_set = EvalSet(
@@ -227,7 +309,12 @@ class LocalEvalSetsManager(EvalSetsManager):
           eval_cases=[],
           creation_timestamp=time.time(),
       )
-      self._write_eval_set_to_path(new_eval_set_path, new_eval_set)
+      if self._use_jsonl_format:
+        self._jsonl_eval_set_files[new_jsonl_eval_set_path] = (
+            JsonlEvalSetFile.create(new_jsonl_eval_set_path, new_eval_set)
+        )
+      else:
+        self._write_eval_set_to_path(new_eval_set_path, new_eval_set)
       return new_eval_set
 
     raise ValueError(
@@ -248,13 +335,20 @@ class LocalEvalSetsManager(EvalSetsManager):
       NotFoundError: If the eval directory for the app is not found.
     """
     eval_set_file_path = os.path.join(self._agents_dir, app_name)
-    eval_sets = []
+    # An eval set is listed once, even if it has a file in both formats.
+    eval_sets = set()
     try:
       for file in os.listdir(eval_set_file_path):
         if file.endswith(_EVAL_SET_FILE_EXTENSION):
-          eval_sets.append(
+          eval_sets.add(
               os.path.basename(file).removesuffix(_EVAL_SET_FILE_EXTENSION)
           )
+        elif file.endswith(_EVAL_SET_JSONL_FILE_EXTENSION):
+          eval_sets.add(
+              os.path.basename(file).removesuffix(
+                  _EVAL_SET_JSONL_FILE_EXTENSION
+              )
+          )
       return sorted(eval_sets)
     except FileNotFoundError as e:
       raise NotFoundError(
@@ -266,11 +360,33 @@ class LocalEvalSetsManager(EvalSetsManager):
       self, app_name: str, eval_set_id: str, eval_case_id: str
   ) -> Optional[EvalCase]:
     """Returns an EvalCase if found, otherwise None."""
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      try:
+        return jsonl_eval_set_file.get_eval_case(eval_case_id)
+      except FileNotFoundError:
+        return None
+
     eval_set = self.get_eval_set(app_name, eval_set_id)
     if not eval_set:
       return None
     return get_eval_case_from_eval_set(eval_set, eval_case_id)
 
+  @override
+  def iter_eval_cases(
+      self, app_name: str, eval_set_id: str
+  ) -> Optional[Iterator[EvalCase]]:
+    """Returns an iterator over the EvalCases of an EvalSet if found, otherwise None.
+
+    For eval sets in the JSONL format, each eval case is only parsed when the
+    iterator reaches it.
+    """
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      return jsonl_eval_set_file.iter_eval_cases()
+
+    return super().iter_eval_cases(app_name, eval_set_id)
+
   @override
   def add_eval_case(self, app_name: str, eval_set_id: str, eval_case: EvalCase):
     """Adds the given EvalCase to an existing EvalSet identified by app_name and eval_set_id.
@@ -278,6 +394,11 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set is not found.
     """
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      jsonl_eval_set_file.add_eval_case(eval_case)
+      return
+
     eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
     updated_eval_set = add_eval_case_to_eval_set(eval_set, eval_case)
 
@@ -292,6 +413,11 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set or the eval case is not found.
     """
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      jsonl_eval_set_file.update_eval_case(updated_eval_case)
+      return
+
     eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
     updated_eval_set = update_eval_case_in_eval_set(eval_set, updated_eval_case)
     self._save_eval_set(app_name, eval_set_id, updated_eval_set)
@@ -305,10 +431,54 @@ class LocalEvalSetsManager(EvalSetsManager):
     Raises:
       NotFoundError: If the eval set or the eval case to delete is not found.
     """
+    jsonl_eval_set_file = self._get_jsonl_eval_set_file(app_name, eval_set_id)
+    if jsonl_eval_set_file:
+      jsonl_eval_set_file.delete_eval_case(eval_case_id)
+      return
+
     eval_set = get_eval_set_from_app_and_id(self, app_name, eval_set_id)
     updated_eval_set = delete_eval_case_from_eval_set(eval_set, eval_case_id)
     self._save_eval_set(app_name, eval_set_id, updated_eval_set)
 
+  def convert_eval_set(
+      self, app_name: str, eval_set_id: str, *, use_jsonl_format: bool
+  ) -> EvalSet:
+    """Converts an existing eval set to the JSON or the JSONL format.
+
+    The file in the previous format is removed. Converting an eval set to the
+    format it already has only compacts a JSONL file.
+
+    Args:
+      app_name: The app name of the eval set.
+      eval_set_id: The id of the eval set.
+      use_jsonl_format: Whether to convert the eval set to the JSONL format,
+        rather than the JSON format.
+
+    Returns:
+      The converted EvalSet.
+
+    Raises:
+      NotFoundError: If the eval set is not found.
+    """
+    json_path = self._get_eval_set_file_path(app_name, eval_set_id)
+    jsonl_path = self._get_jsonl_eval_set_file_path(app_name, eval_set_id)
+    source_path, target_path = (
+        (json_path, jsonl_path) if use_jsonl_format else (jsonl_path, json_path)
+    )
+    if not os.path.isfile(source_path):
+      if os.path.isfile(target_path):
+        if use_jsonl_format:
+          self._get_jsonl_eval_set_file(app_name, eval_set_id).compact()
+        return self.get_eval_set(app_name, eval_set_id)
+      raise NotFoundError(
+          f"Eval set `{eval_set_id}` not found for app `{app_name}`."
+      )
+
+    eval_set = convert_eval_set_file(source_path, target_path)
+    os.remove(source_path)
+    self._jsonl_eval_set_files.pop(jsonl_path, None)
+    return eval_set
+
   def _get_eval_set_file_path(self, app_name: str, eval_set_id: str) -> str:
     return os.path.join(
         self._agents_dir,
@@ -316,6 +486,27 @@ class LocalEvalSetsManager(EvalSetsManager):
         eval_set_id + _EVAL_SET_FILE_EXTENSION,
     )
 
+  def _get_jsonl_eval_set_file_path(
+      self, app_name: str, eval_set_id: str
+  ) -> str:
+    return os.path.join(
+        self._agents_dir,
+        app_name,
+        eval_set_id + _EVAL_SET_JSONL_FILE_EXTENSION,
+    )
+
+  def _get_jsonl_eval_set_file(
+      self, app_name: str, eval_set_id: str
+  ) -> Optional[JsonlEvalSetFile]:
+    """Returns the JSONL file of the eval set, if the eval set uses that format."""
+    path = self._get_jsonl_eval_set_file_path(app_name, eval_set_id)
+    if not os.path.isfile(path):
+      return None
+    if path not in self._jsonl_eval_set_files:
+      # The file keeps an index of the eval cases, so we hold on to it.
+      self._jsonl_eval_set_files[path] = JsonlEvalSetFile(path)
+    return self._jsonl_eval_set_files[path]
+
   def _validate_id(self, id_name: str, id_value: str):
     pattern = r"^[a-zA-Z0-9_]+$"
     if not bool(re.fullmatch(pattern, id_value)):
@@ -324,15 +515,7 @@ class LocalEvalSetsManager(EvalSetsManager):
       )
 
   def _write_eval_set_to_path(self, eval_set_path: str, eval_set: EvalSet):
-    with open(eval_set_path, "w", encoding="utf-8") as f:
-      f.write(
-          eval_set.model_dump_json(
-              indent=2,
-              exclude_unset=True,
-              exclude_defaults=True,
-              exclude_none=True,
-          )
-      )
+    _write_eval_set_to_path(eval_set_path, eval_set)
 
   def _save_eval_set(self, app_name: str, eval_set_id: str, eval_set: EvalSet):
     eval_set_file_path = self._get_eval_set_file_path(app_name, eval_set_id)
@@ -27,6 +27,7 @@ from .eval_metrics import MetricValueInfo
 from .eval_metrics import PrebuiltMetrics
 from .evaluator import EvaluationResult
 from .evaluator import Evaluator
+from .final_response_match_v1 import Rouge1BatchScorer
 from .final_response_match_v1 import RougeEvaluator
 from .vertex_ai_eval_facade import _VertexAiEvalFacade
 
@@ -73,6 +74,16 @@ class ResponseEvaluator(Evaluator):
       raise ValueError(f"`{metric_name}` is not supported.")
 
     self._threshold = threshold
+    self._rouge_batch_scorer = Rouge1BatchScorer()
+
+  @property
+  def rouge_batch_scorer(self) -> Rouge1BatchScorer:
+    return self._rouge_batch_scorer
+
+  @rouge_batch_scorer.setter
+  def rouge_batch_scorer(self, rouge_batch_scorer: Rouge1BatchScorer):
+    """Sets the scorer used for the response_match_score metric."""
+    self._rouge_batch_scorer = rouge_batch_scorer
 
   @staticmethod
   def get_metric_info(metric_name: str) -> MetricInfo:
@@ -105,6 +116,7 @@ class ResponseEvaluator(Evaluator):
       rouge_evaluator = RougeEvaluator(
           EvalMetric(metric_name=self._metric_name, threshold=self._threshold)
       )
+      rouge_evaluator.batch_scorer = self._rouge_batch_scorer
       return rouge_evaluator.evaluate_invocations(
           actual_invocations, expected_invocations
       )
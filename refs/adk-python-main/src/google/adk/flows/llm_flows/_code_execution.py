@@ -421,12 +421,9 @@ async def _post_process_code_execution_result(
 
   # Handle output files.
   for output_file in code_execution_result.output_files:
-    version = await invocation_context.artifact_service.save_artifact(
-        app_name=invocation_context.app_name,
-        user_id=invocation_context.user_id,
-        session_id=invocation_context.session.id,
-        filename=output_file.name,
-        artifact=types.Part.from_bytes(
+    version = await invocation_context.save_artifact(
+        output_file.name,
+        types.Part.from_bytes(
             data=base64.b64decode(output_file.content),
             mime_type=output_file.mime_type,
         ),
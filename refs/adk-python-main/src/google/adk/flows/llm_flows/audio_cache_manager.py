@@ -14,13 +14,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING
 
 from google.genai import types
 
-from ...agents.invocation_context import RealtimeCacheEntry
+from ...agents.audio_buffer import ARTIFACT_READER
+from ...agents.audio_buffer import AudioBuffer
 from ...events.event import Event
 
 if TYPE_CHECKING:
@@ -39,6 +41,8 @@ class AudioCacheManager:
       config: Configuration for audio caching behavior.
     """
     self.config = config or AudioCacheConfig()
+    # The flushes of full caches that are still saving, by cache.
+    self._pending_flushes: dict[AudioBuffer, asyncio.Task] = {}
 
   def cache_audio(
       self,
@@ -57,22 +61,21 @@ class AudioCacheManager:
       ValueError: If cache_type is not 'input' or 'output'.
     """
     if cache_type == 'input':
-      if not invocation_context.input_realtime_cache:
-        invocation_context.input_realtime_cache = []
+      if invocation_context.input_realtime_cache is None:
+        invocation_context.input_realtime_cache = AudioBuffer(
+            role='user', mime_type=audio_blob.mime_type or 'audio/pcm'
+        )
       cache = invocation_context.input_realtime_cache
-      role = 'user'
     elif cache_type == 'output':
-      if not invocation_context.output_realtime_cache:
-        invocation_context.output_realtime_cache = []
+      if invocation_context.output_realtime_cache is None:
+        invocation_context.output_realtime_cache = AudioBuffer(
+            role='model', mime_type=audio_blob.mime_type or 'audio/pcm'
+        )
       cache = invocation_context.output_realtime_cache
-      role = 'model'
     else:
       raise ValueError("cache_type must be either 'input' or 'output'")
 
-    audio_entry = RealtimeCacheEntry(
-        role=role, data=audio_blob, timestamp=time.time()
-    )
-    cache.append(audio_entry)
+    cache.append(audio_blob.data, time.time())
 
     logger.debug(
         'Cached %s audio chunk: %d bytes, cache size: %d',
@@ -81,6 +84,52 @@ class AudioCacheManager:
         len(cache),
     )
 
+  def flush_full_caches(self, invocation_context: InvocationContext) -> None:
+    """Start flushing the audio caches that reached the maximum cache size.
+
+    Long turns are saved in several artifacts, so the caches don't hold the
+    audio of a whole turn. The artifacts are saved in background tasks, so
+    the stream isn't held up by the artifact service. The flushed audio is
+    consumed from a cache once its artifact is saved, and a cache isn't
+    flushed again while its previous flush is still saving.
+
+    Args:
+      invocation_context: The invocation context containing audio caches.
+    """
+    for audio_cache, cache_type in (
+        (invocation_context.input_realtime_cache, 'input_audio'),
+        (invocation_context.output_realtime_cache, 'output_audio'),
+    ):
+      if (
+          not self._is_cache_full(audio_cache)
+          or audio_cache in self._pending_flushes
+      ):
+        continue
+      task = asyncio.create_task(
+          self._flush_cache_to_services(
+              invocation_context, audio_cache, cache_type
+          )
+      )
+      self._pending_flushes[audio_cache] = task
+      task.add_done_callback(
+          lambda _, audio_cache=audio_cache: self._pending_flushes.pop(
+              audio_cache, None
+          )
+      )
+
+  async def _wait_for_pending_flush(self, audio_cache: AudioBuffer) -> None:
+    """Waits until the background flush of the cache, if any, is saved."""
+    task = self._pending_flushes.get(audio_cache)
+    if task:
+      await asyncio.shield(task)
+
+  def _is_cache_full(self, audio_cache: AudioBuffer | None) -> bool:
+    return (
+        audio_cache is not None
+        and audio_cache.get_pending_size(ARTIFACT_READER)
+        >= self.config.max_cache_size_bytes
+    )
+
   async def flush_caches(
       self,
       invocation_context: InvocationContext,
@@ -95,6 +144,9 @@ class AudioCacheManager:
     f"artifact://{invocation_context.app_name}/{invocation_context.user_id}/
     {invocation_context.session.id}/_adk_live/{filename}#{revision_id}"
 
+    Background flushes of the caches are awaited first, so their audio isn't
+    saved twice.
+
     Note: video data is not supported yet.
 
     Args:
@@ -103,34 +155,37 @@ class AudioCacheManager:
       flush_model_audio: Whether to flush the output (model) audio cache.
     """
     if flush_user_audio and invocation_context.input_realtime_cache:
-      flush_success = await self._flush_cache_to_services(
+      await self._wait_for_pending_flush(
+          invocation_context.input_realtime_cache
+      )
+      await self._flush_cache_to_services(
           invocation_context,
           invocation_context.input_realtime_cache,
           'input_audio',
       )
-      if flush_success:
-        invocation_context.input_realtime_cache = []
 
     if flush_model_audio and invocation_context.output_realtime_cache:
       logger.debug('Flushed output audio cache')
-      flush_success = await self._flush_cache_to_services(
+      await self._wait_for_pending_flush(
+          invocation_context.output_realtime_cache
+      )
+      await self._flush_cache_to_services(
           invocation_context,
           invocation_context.output_realtime_cache,
           'output_audio',
       )
-      if flush_success:
-        invocation_context.output_realtime_cache = []
 
   async def _flush_cache_to_services(
       self,
       invocation_context: InvocationContext,
-      audio_cache: list[RealtimeCacheEntry],
+      audio_cache: AudioBuffer,
       cache_type: str,
   ) -> bool:
-    """Flush a list of audio cache entries to artifact services.
+    """Flush the unflushed chunks of an audio cache to artifact services.
 
     The artifact service stores the actual blob. The session stores the
-    reference to the stored blob.
+    reference to the stored blob. The flushed chunks are consumed from the
+    cache only if the blob was stored.
 
     Args:
       invocation_context: The invocation context.
@@ -140,34 +195,27 @@ class AudioCacheManager:
     Returns:
       True if the cache was successfully flushed, False otherwise.
     """
-    if not invocation_context.artifact_service or not audio_cache:
+    segment = audio_cache.read(ARTIFACT_READER)
+    if not invocation_context.artifact_service or not segment:
       logger.debug('Skipping cache flush: no artifact service or empty cache')
       return False
 
     try:
-      # Combine audio chunks into a single file
-      combined_audio_data = b''
-      mime_type = audio_cache[0].data.mime_type if audio_cache else 'audio/pcm'
-
-      for entry in audio_cache:
-        combined_audio_data += entry.data.data
+      mime_type = audio_cache.mime_type
 
       # Generate filename with timestamp from first audio chunk (when recording started)
-      timestamp = int(audio_cache[0].timestamp * 1000)  # milliseconds
+      timestamp = int(segment.timestamp * 1000)  # milliseconds
       filename = f"adk_live_audio_storage_{cache_type}_{timestamp}.{mime_type.split('/')[-1]}"
 
       # Save to artifact service
       combined_audio_part = types.Part(
-          inline_data=types.Blob(data=combined_audio_data, mime_type=mime_type)
+          inline_data=types.Blob(data=segment.data, mime_type=mime_type)
       )
 
-      revision_id = await invocation_context.artifact_service.save_artifact(
-          app_name=invocation_context.app_name,
-          user_id=invocation_context.user_id,
-          session_id=invocation_context.session.id,
-          filename=filename,
-          artifact=combined_audio_part,
+      revision_id = await invocation_context.save_artifact(
+          filename, combined_audio_part
       )
+      audio_cache.consume(ARTIFACT_READER, segment.end)
 
       # Create artifact reference for session service
       artifact_ref = f'artifact://{invocation_context.app_name}/{invocation_context.user_id}/{invocation_context.session.id}/_adk_live/{filename}#{revision_id}'
@@ -176,9 +224,9 @@ class AudioCacheManager:
       audio_event = Event(
           id=Event.new_id(),
           invocation_id=invocation_context.invocation_id,
-          author=audio_cache[0].role,
+          author=audio_cache.role,
           content=types.Content(
-              role=audio_cache[0].role,
+              role=audio_cache.role,
               parts=[
                   types.Part(
                       file_data=types.FileData(
@@ -187,14 +235,14 @@ class AudioCacheManager:
                   )
               ],
           ),
-          timestamp=audio_cache[0].timestamp,
+          timestamp=segment.timestamp,
       )
 
       logger.debug(
           'Successfully flushed %s cache: %d chunks, %d bytes, saved as %s',
           cache_type,
-          len(audio_cache),
-          len(combined_audio_data),
+          segment.chunk_count,
+          len(segment.data),
           filename,
       )
       return audio_event
@@ -214,17 +262,12 @@ class AudioCacheManager:
     Returns:
       Dictionary containing cache statistics.
     """
-    input_count = len(invocation_context.input_realtime_cache or [])
-    output_count = len(invocation_context.output_realtime_cache or [])
-
-    input_bytes = sum(
-        len(entry.data.data)
-        for entry in (invocation_context.input_realtime_cache or [])
-    )
-    output_bytes = sum(
-        len(entry.data.data)
-        for entry in (invocation_context.output_realtime_cache or [])
-    )
+    input_cache = invocation_context.input_realtime_cache
+    output_cache = invocation_context.output_realtime_cache
+    input_count = len(input_cache) if input_cache else 0
+    output_count = len(output_cache) if output_cache else 0
+    input_bytes = input_cache.size if input_cache else 0
+    output_bytes = output_cache.size if output_cache else 0
 
     return {
         'input_chunks': input_count,
@@ -13,98 +13,76 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
+from typing import AsyncGenerator
 from typing import TYPE_CHECKING
 
-from google.cloud import speech
-from google.genai import types as genai_types
+from google.genai import types
+
+from ...agents.audio_buffer import TRANSCRIPTION_READER
+from ...utils.context_utils import Aclosing
 
 if TYPE_CHECKING:
   from ...agents.invocation_context import InvocationContext
+  from ...transcription.base_transcription_backend import BaseTranscriptionBackend
 
 
 class AudioTranscriber:
-  """Transcribes audio using Google Cloud Speech-to-Text."""
-
-  def __init__(self, init_client=False):
-    if init_client:
-      self.client = speech.SpeechClient()
-
-  def transcribe_file(
-      self, invocation_context: InvocationContext
-  ) -> list[genai_types.Content]:
-    """Transcribe audio, bundling consecutive segments from the same speaker.
-
-    The ordering of speakers will be preserved. Audio blobs will be merged for
-    the same speaker as much as we can do reduce the transcription latency.
-
-    Args:
-        invocation_context: The invocation context to access the transcription
-          cache.
-
-    Returns:
-        A list of Content objects containing the transcribed text.
+  """Transcribes the user audio of a live invocation while it arrives.
+
+  The audio is read from the input audio cache, which the transcriber shares
+  with the artifact flush, and streamed to a transcription backend. Backends
+  don't block the event loop, so the live flow never waits on a recognize
+  call.
+  """
+
+  def __init__(
+      self,
+      invocation_context: InvocationContext,
+      backend: BaseTranscriptionBackend,
+  ):
+    self._invocation_context = invocation_context
+    self._backend = backend
+    self._audio_cached = asyncio.Event()
+    self._closed = False
+
+  def on_audio_cached(self) -> None:
+    """Signals that user audio was added to the input audio cache."""
+    self._invocation_context.input_realtime_cache.add_reader(
+        TRANSCRIPTION_READER
+    )
+    self._audio_cached.set()
+
+  def close(self) -> None:
+    """Ends the audio stream once the cached audio is transcribed."""
+    self._closed = True
+    self._audio_cached.set()
+
+  async def transcribe(self) -> AsyncGenerator[types.Transcription, None]:
+    """Transcribes the user audio until the transcriber is closed.
+
+    Yields:
+      The transcriptions of the backend, as the audio arrives.
     """
-
-    bundled_audio = []
-    current_speaker = None
-    current_audio_data = b''
-    contents = []
-
-    # Step1: merge audio blobs
-    for transcription_entry in invocation_context.transcription_cache or []:
-      speaker, audio_data = (
-          transcription_entry.role,
-          transcription_entry.data,
-      )
-
-      if isinstance(audio_data, genai_types.Content):
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-          current_speaker = None
-          current_audio_data = b''
-        bundled_audio.append((speaker, audio_data))
-        continue
-
-      if not audio_data.data:
-        continue
-
-      if speaker == current_speaker:
-        current_audio_data += audio_data.data
-      else:
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-        current_speaker = speaker
-        current_audio_data = audio_data.data
-
-    # Append the last audio segment if any
-    if current_speaker is not None:
-      bundled_audio.append((current_speaker, current_audio_data))
-
-    # reset cache
-    invocation_context.transcription_cache = []
-
-    # Step2: transcription
-    for speaker, data in bundled_audio:
-      if isinstance(data, genai_types.Blob):
-        audio = speech.RecognitionAudio(content=data)
-
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            language_code='en-US',
-        )
-
-        response = self.client.recognize(config=config, audio=audio)
-
-        for result in response.results:
-          transcript = result.alternatives[0].transcript
-
-          parts = [genai_types.Part(text=transcript)]
-          role = speaker.lower()
-          content = genai_types.Content(role=role, parts=parts)
-          contents.append(content)
-      else:
-        # don't need to transcribe model which are already text
-        contents.append(data)
-
-    return contents
+    await self._audio_cached.wait()
+    input_cache = self._invocation_context.input_realtime_cache
+    if input_cache is None:
+      return
+    input_cache.add_reader(TRANSCRIPTION_READER)
+    async with Aclosing(
+        self._backend.transcribe(self._read_audio(), input_cache.mime_type)
+    ) as agen:
+      async for transcription in agen:
+        yield transcription
+
+  async def _read_audio(self) -> AsyncGenerator[bytes, None]:
+    input_cache = self._invocation_context.input_realtime_cache
+    while True:
+      await self._audio_cached.wait()
+      self._audio_cached.clear()
+      segment = input_cache.read(TRANSCRIPTION_READER)
+      if segment:
+        input_cache.consume(TRANSCRIPTION_READER, segment.end)
+        yield segment.data
+      if self._closed:
+        return
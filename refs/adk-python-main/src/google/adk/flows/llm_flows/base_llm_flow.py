@@ -19,6 +19,7 @@ import asyncio
 import datetime
 import inspect
 import logging
+from typing import Any
 from typing import AsyncGenerator
 from typing import cast
 from typing import Optional
@@ -33,10 +34,10 @@ from . import functions
 from ...agents.base_agent import BaseAgent
 from ...agents.callback_context import CallbackContext
 from ...agents.invocation_context import InvocationContext
+from ...agents.live_request_queue import LiveRequest
 from ...agents.live_request_queue import LiveRequestQueue
 from ...agents.readonly_context import ReadonlyContext
 from ...agents.run_config import StreamingMode
-from ...agents.transcription_entry import TranscriptionEntry
 from ...events.event import Event
 from ...models.base_llm_connection import BaseLlmConnection
 from ...models.llm_request import LlmRequest
@@ -49,6 +50,7 @@ from ...tools.google_search_tool import google_search
 from ...tools.tool_context import ToolContext
 from ...utils.context_utils import Aclosing
 from .audio_cache_manager import AudioCacheManager
+from .audio_transcriber import AudioTranscriber
 from .transcription_manager import TranscriptionManager
 
 if TYPE_CHECKING:
@@ -62,9 +64,14 @@ logger = logging.getLogger('google_adk.' + __name__)
 _ADK_AGENT_NAME_LABEL_KEY = 'adk_agent_name'
 
 # Timing configuration
-DEFAULT_REQUEST_QUEUE_TIMEOUT = 0.25
 DEFAULT_TRANSFER_AGENT_DELAY = 1.0
 DEFAULT_TASK_COMPLETION_DELAY = 1.0
+# How long the transcription of the last user audio may take once the live
+# connection ends.
+DEFAULT_TRANSCRIPTION_TAIL_TIMEOUT = 5.0
+
+# Queued audio blobs are merged into realtime sends of up to this many bytes.
+DEFAULT_MAX_REALTIME_BATCH_BYTES = 64 * 1024
 
 # Statistics configuration
 DEFAULT_ENABLE_CACHE_STATISTICS = False
@@ -137,56 +144,89 @@ class BaseLlmFlow(ABC):
                   invocation_context, event_id, llm_request.contents
               )
 
+          audio_transcriber = self._create_audio_transcriber(invocation_context)
           send_task = asyncio.create_task(
-              self._send_to_model(llm_connection, invocation_context)
+              self._send_to_model(
+                  llm_connection, invocation_context, audio_transcriber
+              )
+          )
+          # The model events and the user transcriptions are yielded in the
+          # order they're produced. Each model event is queued with a callback
+          # that lets the model receive continue once the event is processed.
+          live_events: asyncio.Queue[tuple[Optional[Event], Any]] = (
+              asyncio.Queue()
+          )
+          receive_task = asyncio.create_task(
+              self._receive_into_queue(
+                  llm_connection,
+                  event_id,
+                  invocation_context,
+                  llm_request,
+                  live_events,
+              )
+          )
+          transcription_task = (
+              asyncio.create_task(
+                  self._transcribe_input(
+                      invocation_context, audio_transcriber, live_events
+                  )
+              )
+              if audio_transcriber
+              else None
           )
 
           try:
-            async with Aclosing(
-                self._receive_from_model(
-                    llm_connection,
-                    event_id,
-                    invocation_context,
-                    llm_request,
+            while True:
+              event, resume = await live_events.get()
+              # No event means the model stream ended.
+              if event is None:
+                # Raises the error of the model stream, if any.
+                await receive_task
+                break
+              logger.debug('Receive new event: %s', event)
+              yield event
+              # send back the function response
+              if event.get_function_responses():
+                logger.debug(
+                    'Sending back last function response event: %s', event
                 )
-            ) as agen:
-              async for event in agen:
-                # Empty event means the queue is closed.
-                if not event:
-                  break
-                logger.debug('Receive new event: %s', event)
-                yield event
-                # send back the function response
-                if event.get_function_responses():
-                  logger.debug(
-                      'Sending back last function response event: %s', event
-                  )
-                  invocation_context.live_request_queue.send_content(
-                      event.content
-                  )
-                if (
-                    event.content
-                    and event.content.parts
-                    and event.content.parts[0].function_response
-                    and event.content.parts[0].function_response.name
-                    == 'transfer_to_agent'
-                ):
-                  await asyncio.sleep(DEFAULT_TRANSFER_AGENT_DELAY)
-                  # cancel the tasks that belongs to the closed connection.
-                  send_task.cancel()
-                  await llm_connection.close()
-                if (
+                invocation_context.live_request_queue.send_content(
                     event.content
-                    and event.content.parts
-                    and event.content.parts[0].function_response
-                    and event.content.parts[0].function_response.name
-                    == 'task_completed'
-                ):
-                  # this is used for sequential agent to signal the end of the agent.
-                  await asyncio.sleep(DEFAULT_TASK_COMPLETION_DELAY)
-                  # cancel the tasks that belongs to the closed connection.
-                  send_task.cancel()
-                  return
+                )
+              if (
+                  event.content
+                  and event.content.parts
+                  and event.content.parts[0].function_response
+                  and event.content.parts[0].function_response.name
+                  == 'transfer_to_agent'
+              ):
+                await asyncio.sleep(DEFAULT_TRANSFER_AGENT_DELAY)
+                # cancel the tasks that belongs to the closed connection.
+                send_task.cancel()
+                await llm_connection.close()
+              if (
+                  event.content
+                  and event.content.parts
+                  and event.content.parts[0].function_response
+                  and event.content.parts[0].function_response.name
+                  == 'task_completed'
+              ):
+                # this is used for sequential agent to signal the end of the agent.
+                await asyncio.sleep(DEFAULT_TASK_COMPLETION_DELAY)
+                # cancel the tasks that belongs to the closed connection.
+                send_task.cancel()
+                return
+              if resume:
+                resume()
+
+            if transcription_task:
+              # Transcribe the audio the user sent last before the stream ends.
+              await self._finish_transcription(
+                  audio_transcriber, transcription_task
+              )
+              while not live_events.empty():
+                event, _ = live_events.get_nowait()
+                yield event
           finally:
             # Clean up
             if not send_task.done():
@@ -195,6 +235,15 @@ class BaseLlmFlow(ABC):
               await send_task
             except asyncio.CancelledError:
               pass
+            receive_task.cancel()
+            try:
+              await receive_task
+            except asyncio.CancelledError:
+              pass
+            if transcription_task:
+              await self._finish_transcription(
+                  audio_transcriber, transcription_task
+              )
       except (ConnectionClosed, ConnectionClosedOK) as e:
         # when the session timeout, it will just close and not throw exception.
         # so this is for bad cases
@@ -206,37 +255,115 @@ class BaseLlmFlow(ABC):
         )
         raise
 
+  def _create_audio_transcriber(
+      self, invocation_context: InvocationContext
+  ) -> Optional[AudioTranscriber]:
+    """Creates a transcriber if the user audio isn't transcribed by the model."""
+    run_config = invocation_context.run_config
+    if (
+        run_config.input_audio_transcription
+        or not run_config.input_transcription_backend
+    ):
+      return None
+    return AudioTranscriber(
+        invocation_context, run_config.input_transcription_backend
+    )
+
+  async def _receive_into_queue(
+      self,
+      llm_connection: BaseLlmConnection,
+      event_id: str,
+      invocation_context: InvocationContext,
+      llm_request: LlmRequest,
+      live_events: asyncio.Queue[tuple[Optional[Event], Any]],
+  ) -> None:
+    """Puts the model events on the live event queue until the stream ends.
+
+    Each event waits to be processed before the next one is received.
+    """
+    try:
+      async with Aclosing(
+          self._receive_from_model(
+              llm_connection, event_id, invocation_context, llm_request
+          )
+      ) as agen:
+        async for event in agen:
+          # Empty event means the queue is closed.
+          if not event:
+            break
+          resume_signal = asyncio.Event()
+          await live_events.put((event, resume_signal.set))
+          await resume_signal.wait()
+    finally:
+      live_events.put_nowait((None, None))
+
+  async def _transcribe_input(
+      self,
+      invocation_context: InvocationContext,
+      audio_transcriber: AudioTranscriber,
+      live_events: asyncio.Queue[tuple[Optional[Event], Any]],
+  ) -> None:
+    """Transcribes the user audio into events for the live event stream."""
+    try:
+      async with Aclosing(audio_transcriber.transcribe()) as agen:
+        async for transcription in agen:
+          event = await self.transcription_manager.handle_input_transcription(
+              invocation_context, transcription
+          )
+          live_events.put_nowait((event, None))
+    except Exception as e:
+      # Transcription is best effort and must not end the live session.
+      logger.error('Failed to transcribe user audio: %s', e, exc_info=True)
+
+  async def _finish_transcription(
+      self,
+      audio_transcriber: AudioTranscriber,
+      transcription_task: asyncio.Task[None],
+  ) -> None:
+    """Ends the user audio stream and waits for its last transcriptions.
+
+    The transcription is cancelled if it takes longer than
+    DEFAULT_TRANSCRIPTION_TAIL_TIMEOUT.
+    """
+    audio_transcriber.close()
+    await asyncio.wait(
+        [transcription_task], timeout=DEFAULT_TRANSCRIPTION_TAIL_TIMEOUT
+    )
+    if not transcription_task.done():
+      logger.warning('Timed out transcribing the last user audio.')
+      transcription_task.cancel()
+    try:
+      await transcription_task
+    except asyncio.CancelledError:
+      pass
+
   async def _send_to_model(
       self,
       llm_connection: BaseLlmConnection,
       invocation_context: InvocationContext,
+      audio_transcriber: Optional[AudioTranscriber] = None,
   ):
     """Sends data to model."""
+    poll_interval = invocation_context.run_config.live_request_poll_interval
+    pending_request: Optional[LiveRequest] = None
     while True:
       live_request_queue = invocation_context.live_request_queue
-      try:
+      if pending_request is not None:
+        live_request, pending_request = pending_request, None
+      elif poll_interval is None:
+        live_request = await live_request_queue.get()
+      else:
         # Streamlit's execution model doesn't preemptively yield to the event
         # loop. Therefore, we must explicitly introduce timeouts to allow the
         # event loop to process events.
-        # TODO: revert back(remove timeout) once we move off streamlit.
-        live_request = await asyncio.wait_for(
-            live_request_queue.get(), timeout=DEFAULT_REQUEST_QUEUE_TIMEOUT
-        )
-        # duplicate the live_request to all the active streams
-        logger.debug(
-            'Sending live request %s to active streams: %s',
-            live_request,
-            invocation_context.active_streaming_tools,
-        )
-        if invocation_context.active_streaming_tools:
-          for active_streaming_tool in (
-              invocation_context.active_streaming_tools
-          ).values():
-            if active_streaming_tool.stream:
-              active_streaming_tool.stream.send(live_request)
+        try:
+          live_request = await asyncio.wait_for(
+              live_request_queue.get(), timeout=poll_interval
+          )
+        except asyncio.TimeoutError:
+          continue
         await asyncio.sleep(0)
-      except asyncio.TimeoutError:
-        continue
+      self._send_to_active_streams(invocation_context, live_request)
       if live_request.close:
         await llm_connection.close()
         return
@@ -246,26 +373,86 @@ class BaseLlmFlow(ABC):
       elif live_request.activity_end:
         await llm_connection.send_realtime(types.ActivityEnd())
       elif live_request.blob:
-        # Cache audio data here for transcription
-        if not invocation_context.transcription_cache:
-          invocation_context.transcription_cache = []
-        if not invocation_context.run_config.input_audio_transcription:
-          # if the live model's input transcription is not enabled, then
-          # we use our onwn audio transcriber to achieve that.
-          invocation_context.transcription_cache.append(
-              TranscriptionEntry(role='user', data=live_request.blob)
-          )
-
+        blob, pending_request = self._batch_realtime_blobs(
+            invocation_context, live_request.blob
+        )
         # Cache input audio chunks before flushing
         self.audio_cache_manager.cache_audio(
-            invocation_context, live_request.blob, cache_type='input'
+            invocation_context, blob, cache_type='input'
         )
-
-        await llm_connection.send_realtime(live_request.blob)
+        if audio_transcriber:
+          # if the live model's input transcription is not enabled, then
+          # we use our onwn audio transcriber to achieve that. It reads the
+          # audio from the same cache.
+          audio_transcriber.on_audio_cached()
+        await llm_connection.send_realtime(blob)
+        self.audio_cache_manager.flush_full_caches(invocation_context)
 
       if live_request.content:
         await llm_connection.send_content(live_request.content)
 
+  def _send_to_active_streams(
+      self, invocation_context: InvocationContext, live_request: LiveRequest
+  ) -> None:
+    """Duplicates the live request to all the active streams."""
+    if not invocation_context.active_streaming_tools:
+      return
+    logger.debug(
+        'Sending live request %s to active streams: %s',
+        live_request,
+        invocation_context.active_streaming_tools,
+    )
+    for active_streaming_tool in (
+        invocation_context.active_streaming_tools
+    ).values():
+      if active_streaming_tool.stream:
+        active_streaming_tool.stream.send(live_request)
+
+  def _batch_realtime_blobs(
+      self, invocation_context: InvocationContext, blob: types.Blob
+  ) -> tuple[types.Blob, Optional[LiveRequest]]:
+    """Merges the audio blobs already queued behind a blob into one blob.
+
+    Only raw PCM audio of the same MIME type is merged, so the model receives
+    the same audio in fewer sends.
+
+    Args:
+      invocation_context: The invocation context with the live request queue.
+      blob: The blob that was taken from the queue.
+
+    Returns:
+      The merged blob, and the first queued request that couldn't be merged,
+      if any.
+    """
+    if not (blob.mime_type or '').startswith('audio/pcm'):
+      return blob, None
+    chunks = [blob.data]
+    size = len(blob.data)
+    next_request = None
+    while size < DEFAULT_MAX_REALTIME_BATCH_BYTES:
+      next_request = invocation_context.live_request_queue.get_nowait()
+      if next_request is None:
+        break
+      if (
+          next_request.blob is None
+          or next_request.blob.mime_type != blob.mime_type
+          or next_request.content
+          or next_request.activity_start
+          or next_request.activity_end
+          or next_request.close
+      ):
+        break
+      self._send_to_active_streams(invocation_context, next_request)
+      chunks.append(next_request.blob.data)
+      size += len(next_request.blob.data)
+      next_request = None
+    if len(chunks) == 1:
+      return blob, next_request
+    return (
+        types.Blob(data=b''.join(chunks), mime_type=blob.mime_type),
+        next_request,
+    )
+
   async def _receive_from_model(
       self,
       llm_connection: BaseLlmConnection,
@@ -339,6 +526,7 @@ class BaseLlmFlow(ABC):
                   self.audio_cache_manager.cache_audio(
                       invocation_context, audio_blob, cache_type='output'
                   )
+                  self.audio_cache_manager.flush_full_caches(invocation_context)
 
                 yield event
         # Give opportunity for other tasks to run.
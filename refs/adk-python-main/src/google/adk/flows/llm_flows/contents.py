@@ -24,6 +24,7 @@ from typing_extensions import override
 from ...agents.invocation_context import InvocationContext
 from ...events.event import Event
 from ...models.llm_request import LlmRequest
+from ...sessions.function_call_index import FunctionCallIndex
 from ._base_llm_processor import BaseLlmRequestProcessor
 from .functions import remove_client_function_call_id
 from .functions import REQUEST_CONFIRMATION_FUNCTION_CALL_NAME
@@ -51,6 +52,10 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
           invocation_context.branch,
           invocation_context.session.events,
           agent.name,
+          llm_request=llm_request,
+          function_call_index=invocation_context._get_function_call_index(
+              f'contents:{agent.name}:{invocation_context.branch}'
+          ),
       )
     else:
       # Include current turn context only (no conversation history)
@@ -58,6 +63,7 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
           invocation_context.branch,
           invocation_context.session.events,
           agent.name,
+          llm_request=llm_request,
       )
 
     # Add instruction-related contents to proper position in conversation
@@ -75,16 +81,21 @@ request_processor = _ContentLlmRequestProcessor()
 
 def _rearrange_events_for_async_function_responses_in_history(
     events: list[Event],
+    function_call_index: Optional[FunctionCallIndex] = None,
 ) -> list[Event]:
-  """Rearrange the async function_response events in the history."""
+  """Rearrange the async function_response events in the history.
 
-  function_call_id_to_response_events_index: dict[str, int] = {}
-  for i, event in enumerate(events):
-    function_responses = event.get_function_responses()
-    if function_responses:
-      for function_response in function_responses:
-        function_call_id = function_response.id
-        function_call_id_to_response_events_index[function_call_id] = i
+  Args:
+    events: A list of events.
+    function_call_index: An index of the events, built if not provided.
+
+  Returns:
+    A list of events with each function_response moved next to its
+    function_call.
+  """
+  if function_call_index is None:
+    function_call_index = FunctionCallIndex()
+  function_call_index.update(events)
 
   result_events: list[Event] = []
   for event in events:
@@ -95,11 +106,13 @@ def _rearrange_events_for_async_function_responses_in_history(
 
       function_response_events_indices = set()
       for function_call in event.get_function_calls():
-        function_call_id = function_call.id
-        if function_call_id in function_call_id_to_response_events_index:
-          function_response_events_indices.add(
-              function_call_id_to_response_events_index[function_call_id]
-          )
+        response_event_index = (
+            function_call_index.get_function_response_event_index(
+                function_call.id
+            )
+        )
+        if response_event_index is not None:
+          function_response_events_indices.add(response_event_index)
       result_events.append(event)
       if not function_response_events_indices:
         continue
@@ -122,6 +135,7 @@ def _rearrange_events_for_async_function_responses_in_history(
 
 def _rearrange_events_for_latest_function_response(
     events: list[Event],
+    function_call_index: Optional[FunctionCallIndex] = None,
 ) -> list[Event]:
   """Rearrange the events for the latest function_response.
 
@@ -131,6 +145,8 @@ def _rearrange_events_for_latest_function_response(
 
   Args:
     events: A list of events.
+    function_call_index: An index of the events. If set, the function_call
+      event is looked up in the index instead of scanning the events.
 
   Returns:
     A list of events with the latest function_response rearranged.
@@ -156,31 +172,32 @@ def _rearrange_events_for_latest_function_response(
       if function_call.id in function_responses_ids:
         return events
 
+  if function_call_index is not None:
+    function_call_index.update(events)
+
   function_call_event_idx = -1
   # look for corresponding function call event reversely
-  for idx in range(len(events) - 2, -1, -1):
-    event = events[idx]
-    function_calls = event.get_function_calls()
-    if function_calls:
-      for function_call in function_calls:
-        if function_call.id in function_responses_ids:
-          function_call_event_idx = idx
-          function_call_ids = {
-              function_call.id for function_call in function_calls
-          }
-          # last response event should only contain the responses for the
-          # function calls in the same function call event
-          if not function_responses_ids.issubset(function_call_ids):
-            raise ValueError(
-                'Last response event should only contain the responses for the'
-                ' function calls in the same function call event. Function'
-                f' call ids found : {function_call_ids}, function response'
-                f' ids provided: {function_responses_ids}'
-            )
-          # collect all function responses from the function call event to
-          # the last response event
-          function_responses_ids = function_call_ids
-          break
+  idx = len(events) - 1
+  while (
+      idx := _find_function_call_event_index(
+          events, function_responses_ids, idx, function_call_index
+      )
+  ) is not None:
+    function_calls = events[idx].get_function_calls()
+    function_call_event_idx = idx
+    function_call_ids = {function_call.id for function_call in function_calls}
+    # last response event should only contain the responses for the
+    # function calls in the same function call event
+    if not function_responses_ids.issubset(function_call_ids):
+      raise ValueError(
+          'Last response event should only contain the responses for the'
+          ' function calls in the same function call event. Function'
+          f' call ids found : {function_call_ids}, function response'
+          f' ids provided: {function_responses_ids}'
+      )
+    # collect all function responses from the function call event to
+    # the last response event
+    function_responses_ids = function_call_ids
 
   if function_call_event_idx == -1:
     raise ValueError(
@@ -210,6 +227,26 @@ def _rearrange_events_for_latest_function_response(
   return result_events
 
 
+def _find_function_call_event_index(
+    events: list[Event],
+    function_call_ids: set[Optional[str]],
+    before: int,
+    function_call_index: Optional[FunctionCallIndex],
+) -> Optional[int]:
+  """Finds the latest event before a position with any of the function calls."""
+  if function_call_index is not None:
+    return function_call_index.find_function_call_event_index(
+        function_call_ids, before
+    )
+  for idx in range(before - 1, -1, -1):
+    if any(
+        function_call.id in function_call_ids
+        for function_call in events[idx].get_function_calls()
+    ):
+      return idx
+  return None
+
+
 def _contains_empty_content(event: Event) -> bool:
   """Check if an event should be skipped due to missing or empty content.
 
@@ -293,7 +330,11 @@ def _process_compaction_events(events: list[Event]) -> list[Event]:
 
 
 def _get_contents(
-    current_branch: Optional[str], events: list[Event], agent_name: str = ''
+    current_branch: Optional[str],
+    events: list[Event],
+    agent_name: str = '',
+    llm_request: Optional[LlmRequest] = None,
+    function_call_index: Optional[FunctionCallIndex] = None,
 ) -> list[types.Content]:
   """Get the contents for the LLM request.
 
@@ -303,6 +344,11 @@ def _get_contents(
     current_branch: The current branch of the agent.
     events: Events to process.
     agent_name: The name of the agent.
+    llm_request: If set, the request where the contents that are copied
+      unchanged from an event are recorded with the ID of their event.
+    function_call_index: If set, the index of the function calls in the events
+      that are filtered for the agent, kept from the previous step so only the
+      newly appended events are indexed.
 
   Returns:
     A list of processed contents.
@@ -379,26 +425,44 @@ def _get_contents(
     else:
       filtered_events.append(event)
 
-  # Rearrange events for proper function call/response pairing
+  # Rearrange events for proper function call/response pairing. Both steps
+  # share one index of the function calls, unless the first step rearranged
+  # the events.
+  if function_call_index is None or has_compaction_events:
+    # Compaction rewrites earlier events, so the previous index doesn't apply.
+    function_call_index = FunctionCallIndex()
   result_events = _rearrange_events_for_latest_function_response(
-      filtered_events
+      filtered_events, function_call_index
   )
   result_events = _rearrange_events_for_async_function_responses_in_history(
-      result_events
+      result_events,
+      function_call_index if result_events is filtered_events else None,
   )
 
   # Convert events to contents
+  # Events that were merged or rewritten above are new objects, their
+  # contents don't match the contents of the session events with their IDs.
+  session_events = {id(event) for event in events}
   contents = []
   for event in result_events:
     content = copy.deepcopy(event.content)
     if content:
       remove_client_function_call_id(content)
       contents.append(content)
+      if (
+          llm_request is not None
+          and event.id
+          and id(event) in session_events
+      ):
+        llm_request.set_content_event_id(content, event.id)
   return contents
 
 
 def _get_current_turn_contents(
-    current_branch: Optional[str], events: list[Event], agent_name: str = ''
+    current_branch: Optional[str],
+    events: list[Event],
+    agent_name: str = '',
+    llm_request: Optional[LlmRequest] = None,
 ) -> list[types.Content]:
   """Get contents for the current turn only (no conversation history).
 
@@ -425,7 +489,9 @@ def _get_current_turn_contents(
     if not event.content:
       continue
     if event.author == 'user' or _is_other_agent_reply(agent_name, event):
-      return _get_contents(current_branch, events[i:], agent_name)
+      return _get_contents(
+          current_branch, events[i:], agent_name, llm_request=llm_request
+      )
 
   return []
 
@@ -35,6 +35,7 @@ from ...agents.invocation_context import InvocationContext
 from ...auth.auth_tool import AuthToolArguments
 from ...events.event import Event
 from ...events.event_actions import EventActions
+from ...sessions.function_call_index import FunctionCallIndex
 from ...telemetry.tracing import trace_merged_tool_calls
 from ...telemetry.tracing import trace_tool_call
 from ...telemetry.tracing import tracer
@@ -774,8 +775,19 @@ def merge_parallel_function_response_events(
 
 def find_matching_function_call(
     events: list[Event],
+    function_call_index: Optional[FunctionCallIndex] = None,
 ) -> Optional[Event]:
-  """Finds the function call event that matches the function response id of the last event."""
+  """Finds the function call event that matches the function response id of the last event.
+
+  Args:
+    events: The events to search.
+    function_call_index: An index of the events, e.g. the one of the session
+      the events belong to. If set, the function call event is looked up in
+      the index instead of scanning the events.
+
+  Returns:
+    The function call event, or None if there is none.
+  """
   if not events:
     return None
 
@@ -791,6 +803,12 @@ def find_matching_function_call(
         for part in last_event.content.parts
         if part.function_response
     )
+    if function_call_index is not None:
+      function_call_index.update(events)
+      index = function_call_index.find_function_call_event_index(
+          [function_call_id], before=len(events) - 1
+      )
+      return events[index] if index is not None else None
     for i in range(len(events) - 2, -1, -1):
       event = events[i]
       # looking for the system long running request euc function call
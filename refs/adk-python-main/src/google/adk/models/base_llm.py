@@ -112,6 +112,13 @@ class BaseLlm(BaseModel):
           )
       )
 
+  async def warm_up(self) -> None:
+    """Prepares the LLM to serve requests, e.g. by creating its clients.
+
+    Servers call this before accepting traffic, so that the first request
+    doesn't pay for it. The default implementation does nothing.
+    """
+
   def connect(self, llm_request: LlmRequest) -> BaseLlmConnection:
     """Creates a live connection to the LLM.
 
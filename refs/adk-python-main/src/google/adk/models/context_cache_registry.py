@@ -0,0 +1,273 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of context caches that are shared across sessions."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import collections
+import functools
+import logging
+import time
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+from ..utils.feature_decorator import experimental
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# A shared cache that expires within this buffer is not handed out anymore,
+# the same buffer that CacheMetadata.expire_soon uses.
+EXPIRY_BUFFER_SECONDS = 120
+
+_DEFAULT_REFRESH_WINDOW_SECONDS = 300
+
+_DEFAULT_FAILURE_BACKOFF_SECONDS = 60
+
+_DEFAULT_MAX_ENTRIES = 1024
+
+
+@experimental
+class SharedContextCache(BaseModel):
+  """A cached content that is shared by all sessions with the same prefix."""
+
+  model_config = ConfigDict(
+      extra="forbid",
+      frozen=True,
+  )
+
+  cache_name: str
+  """The full resource name of the cached content."""
+
+  expire_time: float
+  """Unix timestamp when the cached content expires."""
+
+  created_at: float
+  """Unix timestamp when the cached content was created."""
+
+  def is_usable(self, now: Optional[float] = None) -> bool:
+    """Returns whether the cache lives long enough to be used by a request."""
+    now = time.time() if now is None else now
+    return now < self.expire_time - EXPIRY_BUFFER_SECONDS
+
+
+CreateSharedContextCache = Callable[[], Awaitable[SharedContextCache]]
+"""Creates the cached content of a registry key."""
+
+RefreshSharedContextCache = Callable[
+    [SharedContextCache], Awaitable[SharedContextCache]
+]
+"""Extends the TTL of a cached content and returns the updated handle."""
+
+
+@experimental
+class BaseContextCacheRegistry(abc.ABC):
+  """Registry of cached-content handles keyed by a static-prefix fingerprint.
+
+  Sessions of the same agent share the system instruction, the tools and the
+  tool config. The registry lets them share a single cached content for that
+  prefix instead of every session creating its own.
+
+  Implementations guarantee that:
+    - Concurrent acquires of a missing key create the cached content once.
+    - Caches that are close to expiry get their TTL refreshed, again once.
+    - Every acquire is counted until it is released, so caches that are in
+      use are never evicted from the registry.
+  """
+
+  @abc.abstractmethod
+  async def acquire(
+      self,
+      key: str,
+      *,
+      create: CreateSharedContextCache,
+      refresh: RefreshSharedContextCache,
+  ) -> Optional[SharedContextCache]:
+    """Returns the shared cache of the key, creating it if needed.
+
+    Every cache that is returned must be released with `release` once the
+    request that uses it was sent.
+
+    Args:
+      key: The static-prefix fingerprint.
+      create: Creates the cached content when the key has none.
+      refresh: Extends the TTL of the cached content when it expires soon.
+
+    Returns:
+      The shared cache, or None if it could not be created.
+    """
+
+  @abc.abstractmethod
+  async def release(self, key: str, cache: SharedContextCache) -> None:
+    """Releases a cache that was returned by `acquire`."""
+
+
+class _RegistryEntry:
+
+  def __init__(self, cache: SharedContextCache):
+    self.cache = cache
+    self.refcount = 0
+
+
+@experimental
+class InMemoryContextCacheRegistry(BaseContextCacheRegistry):
+  """A process-wide, in-memory context cache registry.
+
+  The registry is bound to the event loop that it is first used on.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_entries: int = _DEFAULT_MAX_ENTRIES,
+      refresh_window_seconds: float = _DEFAULT_REFRESH_WINDOW_SECONDS,
+      failure_backoff_seconds: float = _DEFAULT_FAILURE_BACKOFF_SECONDS,
+  ):
+    """Initializes the InMemoryContextCacheRegistry.
+
+    Args:
+      max_entries: The maximum number of keys that are tracked. Beyond that,
+        the least recently used keys whose caches are not in use are dropped
+        and their cached contents are left to expire.
+      refresh_window_seconds: The TTL of a cache is refreshed when it expires
+        within this window.
+      failure_backoff_seconds: How long to wait before trying again to create
+        the cache of a key whose creation failed.
+    """
+    self._max_entries = max_entries
+    self._refresh_window_seconds = refresh_window_seconds
+    self._failure_backoff_seconds = failure_backoff_seconds
+    self._entries: collections.OrderedDict[str, _RegistryEntry] = (
+        collections.OrderedDict()
+    )
+    self._pending: dict[str, asyncio.Future[Optional[SharedContextCache]]] = {}
+    self._failed_until: dict[str, float] = {}
+
+  async def acquire(
+      self,
+      key: str,
+      *,
+      create: CreateSharedContextCache,
+      refresh: RefreshSharedContextCache,
+  ) -> Optional[SharedContextCache]:
+    now = time.time()
+    entry = self._entries.get(key)
+    if entry is not None and not entry.cache.is_usable(now):
+      # Requests that still hold the old cache release it by name.
+      del self._entries[key]
+      entry = None
+
+    if entry is None:
+      if self._failed_until.get(key, 0) > now:
+        return None
+      cache = await self._single_flight(key, create)
+      if cache is None:
+        self._failed_until[key] = time.time() + self._failure_backoff_seconds
+        return None
+      self._failed_until.pop(key, None)
+    elif entry.cache.expire_time - now < self._refresh_window_seconds:
+      cache = await self._single_flight(
+          key, functools.partial(refresh, entry.cache)
+      )
+      if cache is None or not cache.is_usable():
+        # The old cache can still be used until it expires.
+        cache = entry.cache
+    else:
+      cache = entry.cache
+
+    entry = self._entries.get(key)
+    if entry is not None and entry.cache.cache_name == cache.cache_name:
+      entry.refcount += 1
+      self._entries.move_to_end(key)
+    return cache
+
+  async def release(self, key: str, cache: SharedContextCache) -> None:
+    entry = self._entries.get(key)
+    if (
+        entry is not None
+        and entry.cache.cache_name == cache.cache_name
+        and entry.refcount > 0
+    ):
+      entry.refcount -= 1
+
+  def get_refcount(self, key: str) -> int:
+    """Returns the number of unreleased acquires of the key's cache."""
+    entry = self._entries.get(key)
+    return entry.refcount if entry else 0
+
+  async def _single_flight(
+      self, key: str, update: CreateSharedContextCache
+  ) -> Optional[SharedContextCache]:
+    future = self._pending.get(key)
+    if future is None:
+      future = asyncio.ensure_future(self._update_entry(key, update))
+      self._pending[key] = future
+      future.add_done_callback(
+          lambda done: self._pending.pop(key, None)
+          if self._pending.get(key) is done
+          else None
+      )
+    # The update is shared by every waiter, a cancelled waiter must not
+    # cancel it for everybody else.
+    return await asyncio.shield(future)
+
+  async def _update_entry(
+      self, key: str, update: CreateSharedContextCache
+  ) -> Optional[SharedContextCache]:
+    try:
+      cache = await update()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning("Failed to update shared context cache %s: %s", key, e)
+      return None
+
+    entry = self._entries.get(key)
+    if entry is not None and entry.cache.cache_name == cache.cache_name:
+      entry.cache = cache
+    else:
+      self._entries[key] = _RegistryEntry(cache)
+    self._entries.move_to_end(key)
+    self._evict(keep_key=key)
+    return cache
+
+  def _evict(self, keep_key: str):
+    idle_keys = [
+        key
+        for key, entry in self._entries.items()
+        if entry.refcount == 0 and key != keep_key
+    ]
+    for key in idle_keys[: max(0, len(self._entries) - self._max_entries)]:
+      del self._entries[key]
+
+
+_context_cache_registry: Optional[BaseContextCacheRegistry] = None
+
+
+def get_context_cache_registry() -> BaseContextCacheRegistry:
+  """Returns the process-wide context cache registry."""
+  global _context_cache_registry
+  if _context_cache_registry is None:
+    _context_cache_registry = InMemoryContextCacheRegistry()
+  return _context_cache_registry
+
+
+def set_context_cache_registry(registry: BaseContextCacheRegistry) -> None:
+  """Sets the process-wide context cache registry, e.g. a Redis backed one."""
+  global _context_cache_registry
+  _context_cache_registry = registry
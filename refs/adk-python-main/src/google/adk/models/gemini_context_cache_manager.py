@@ -16,23 +16,174 @@
 
 from __future__ import annotations
 
+import collections
 import hashlib
 import json
 import logging
+import threading
 import time
 from typing import Optional
+import weakref
 
 from google.genai import Client
 from google.genai import types
 
+from ..telemetry.context_cache_metrics import context_cache_metrics
+from ..tools.base_tool import BaseTool
 from ..utils.feature_decorator import experimental
 from .cache_metadata import CacheMetadata
+from .context_cache_registry import BaseContextCacheRegistry
+from .context_cache_registry import get_context_cache_registry
+from .context_cache_registry import SharedContextCache
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
 
 logger = logging.getLogger("google_adk." + __name__)
 
 
+# The number of fingerprint chains kept for the next steps of conversations.
+_MAX_STORED_FINGERPRINT_CHAINS = 256
+
+# {tool: (declaration name, digest)} of the function declarations of tools.
+_declaration_digests: weakref.WeakKeyDictionary[BaseTool, tuple[str, bytes]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_content_key(llm_request: LlmRequest, content: types.Content) -> str:
+  """Returns the key that identifies a content in a cache fingerprint."""
+  event_id = llm_request.get_content_event_id(content)
+  if event_id is not None:
+    return f"event:{event_id}"
+  return (
+      "content:"
+      + hashlib.sha256(
+          content.model_dump_json(exclude_none=True).encode()
+      ).hexdigest()
+  )
+
+
+def _extend_chain(state: bytes, key: str) -> bytes:
+  """Returns the state of a fingerprint chain that is extended by a content."""
+  return hashlib.sha256(state + key.encode()).digest()
+
+
+def _get_declaration_digest(
+    llm_request: LlmRequest, declaration: types.FunctionDeclaration
+) -> bytes:
+  """Returns the digest of a function declaration.
+
+  Declarations are rebuilt for every LLM call, but a tool always declares
+  itself the same way, so the digest is memoized per tool.
+  """
+  tool = llm_request.tools_dict.get(declaration.name)
+  try:
+    memoized = _declaration_digests.get(tool) if tool else None
+  except TypeError:
+    # The tool isn't hashable, so its digest isn't memoized.
+    tool = memoized = None
+  if memoized and memoized[0] == declaration.name:
+    return memoized[1]
+
+  digest = hashlib.sha256(
+      declaration.model_dump_json(exclude_none=True).encode()
+  ).digest()
+  if tool:
+    _declaration_digests[tool] = (declaration.name, digest)
+  return digest
+
+
+class _FingerprintChain:
+  """The cache fingerprints of every prefix of the contents of a request.
+
+  The fingerprint of the first i + 1 contents is the hash of the fingerprint
+  of the first i contents and the key of content i, so any prefix of the
+  chain can be extended. A chain is built from the chain of the previous step
+  of the conversation: the prefix whose content keys are unchanged is taken
+  over as is, and only the contents after it are hashed.
+  """
+
+  def __init__(
+      self,
+      llm_request: LlmRequest,
+      config_digest: bytes,
+      previous: Optional[_FingerprintChain] = None,
+  ):
+    self._llm_request = llm_request
+    self._contents = llm_request.contents
+    self.config_digest = config_digest
+    # The key of each content and the chain state after it, for every
+    # content that was fingerprinted so far.
+    self.keys: list[str] = []
+    self.states: list[bytes] = [hashlib.sha256(config_digest).digest()]
+    self._previous = (
+        previous
+        if previous and previous.config_digest == config_digest
+        else None
+    )
+
+  def is_for(self, llm_request: LlmRequest) -> bool:
+    """Whether the chain was built for the request and its current contents."""
+    return (
+        self._llm_request is llm_request
+        and self._contents is llm_request.contents
+        and len(self.keys) <= len(self._contents)
+    )
+
+  def get_fingerprint(self, contents_count: int) -> str:
+    """Returns the fingerprint of the first contents_count contents."""
+    contents_count = min(contents_count, len(self._contents))
+    previous = self._previous
+    for content in self._contents[len(self.keys) : contents_count]:
+      i = len(self.keys)
+      key = _get_content_key(self._llm_request, content)
+      self.keys.append(key)
+      if previous and i < len(previous.keys) and previous.keys[i] == key:
+        self.states.append(previous.states[i + 1])
+      else:
+        previous = self._previous = None
+        self.states.append(_extend_chain(self.states[i], key))
+    return self.states[contents_count].hex()[:16]
+
+  def detach(self) -> None:
+    """Drops the request and the previous chain, so the chain can be stored."""
+    self._llm_request = None
+    self._contents = []
+    self._previous = None
+
+
+class _FingerprintChainStore:
+  """The fingerprint chains of recent requests, by the fingerprint returned.
+
+  Cache metadata of a response is passed to the next request of the same
+  conversation, so its fingerprint finds the chain to build the next one from.
+  """
+
+  def __init__(self, max_entries: int):
+    self._max_entries = max_entries
+    self._chains: collections.OrderedDict[str, _FingerprintChain] = (
+        collections.OrderedDict()
+    )
+    self._lock = threading.Lock()
+
+  def get(self, fingerprint: str) -> Optional[_FingerprintChain]:
+    with self._lock:
+      chain = self._chains.get(fingerprint)
+      if chain:
+        self._chains.move_to_end(fingerprint)
+      return chain
+
+  def put(self, fingerprint: str, chain: _FingerprintChain) -> None:
+    with self._lock:
+      self._chains[fingerprint] = chain
+      self._chains.move_to_end(fingerprint)
+      while len(self._chains) > self._max_entries:
+        self._chains.popitem(last=False)
+
+
+_fingerprint_chains = _FingerprintChainStore(_MAX_STORED_FINGERPRINT_CHAINS)
+
+
 @experimental
 class GeminiContextCacheManager:
   """Manages context cache lifecycle for Gemini models.
@@ -42,13 +193,28 @@ class GeminiContextCacheManager:
   cache compatibility and implements efficient caching strategies.
   """
 
-  def __init__(self, genai_client: Client):
+  def __init__(
+      self,
+      genai_client: Client,
+      cache_registry: Optional[BaseContextCacheRegistry] = None,
+  ):
     """Initialize cache manager with shared client.
 
     Args:
         genai_client: The GenAI client to use for cache operations.
+        cache_registry: The registry of caches shared across sessions. Uses
+            the process-wide registry if not set.
     """
     self.genai_client = genai_client
+    self.cache_registry = cache_registry
+    # (key, cache) of the shared cache used by the last request.
+    self._shared_cache_lease: Optional[tuple[str, SharedContextCache]] = None
+    # The model of the last request, used to label metrics.
+    self._model: Optional[str] = None
+    # Fingerprint chain of the last request that was fingerprinted.
+    self._fingerprint_chain: Optional[_FingerprintChain] = None
+    # Fingerprint chain of the previous step of the conversation.
+    self._previous_fingerprint_chain: Optional[_FingerprintChain] = None
 
   async def handle_context_caching(
       self, llm_request: LlmRequest
@@ -66,6 +232,25 @@ class GeminiContextCacheManager:
     Returns:
         Cache metadata to be included in response, or None if caching failed
     """
+    self._model = llm_request.model
+    if llm_request.cache_metadata:
+      self._previous_fingerprint_chain = _fingerprint_chains.get(
+          llm_request.cache_metadata.fingerprint
+      )
+    cache_metadata = await self._handle_context_caching(llm_request)
+    self._previous_fingerprint_chain = None
+    if cache_metadata and self._fingerprint_chain:
+      # The next step of the conversation extends the chain of this one.
+      self._fingerprint_chain.detach()
+      _fingerprint_chains.put(
+          cache_metadata.fingerprint, self._fingerprint_chain
+      )
+      self._fingerprint_chain = None
+    return cache_metadata
+
+  async def _handle_context_caching(
+      self, llm_request: LlmRequest
+  ) -> Optional[CacheMetadata]:
     # Check if we have existing cache metadata and if it's valid
     if llm_request.cache_metadata:
       logger.debug(
@@ -83,6 +268,7 @@ class GeminiContextCacheManager:
         self._apply_cache_to_request(
             llm_request, cache_name, cache_contents_count
         )
+        context_cache_metrics.record_hit(llm_request.model)
         return llm_request.cache_metadata.model_copy()
       else:
         # Invalid cache - clean it up and check if we should create new one
@@ -114,6 +300,8 @@ class GeminiContextCacheManager:
             self._apply_cache_to_request(
                 llm_request, cache_metadata.cache_name, cache_contents_count
             )
+            context_cache_metrics.record_creation(llm_request.model)
+            context_cache_metrics.record_hit(llm_request.model)
             return cache_metadata
 
         # Fingerprints don't match - recalculate with total contents
@@ -124,10 +312,12 @@ class GeminiContextCacheManager:
         fingerprint_for_all = self._generate_cache_fingerprint(
             llm_request, total_contents_count
         )
-        return CacheMetadata(
+        cache_metadata = CacheMetadata(
             fingerprint=fingerprint_for_all,
             contents_count=total_contents_count,
         )
+        await self._apply_shared_prefix_cache_or_record_miss(llm_request)
+        return cache_metadata
 
     # No existing cache metadata - return fingerprint-only metadata
     # We don't create cache without previous fingerprint to match
@@ -138,10 +328,93 @@ class GeminiContextCacheManager:
     fingerprint = self._generate_cache_fingerprint(
         llm_request, total_contents_count
     )
-    return CacheMetadata(
+    cache_metadata = CacheMetadata(
         fingerprint=fingerprint,
         contents_count=total_contents_count,
     )
+    await self._apply_shared_prefix_cache_or_record_miss(llm_request)
+    return cache_metadata
+
+  async def _apply_shared_prefix_cache_or_record_miss(
+      self, llm_request: LlmRequest
+  ) -> None:
+    if await self._apply_shared_prefix_cache(llm_request):
+      context_cache_metrics.record_hit(llm_request.model, shared=True)
+    else:
+      context_cache_metrics.record_miss(llm_request.model)
+
+  async def _apply_shared_prefix_cache(self, llm_request: LlmRequest) -> bool:
+    """Applies the cache of the static prefix that is shared across sessions.
+
+    Only requests that have no cache of their own use the shared cache. It
+    holds the system instruction, tools and tool config, so the request keeps
+    all of its contents.
+
+    Args:
+        llm_request: Request to apply the shared cache to
+
+    Returns:
+        Whether a shared cache was applied
+    """
+    if not llm_request.cache_config.share_static_prefix:
+      return False
+    if not llm_request.config or not (
+        llm_request.config.system_instruction or llm_request.config.tools
+    ):
+      return False
+    if (
+        self._estimate_request_tokens(llm_request, include_contents=False)
+        < llm_request.cache_config.min_tokens
+    ):
+      return False
+
+    # Caches belong to a model, so the model is part of the key.
+    prefix_fingerprint = self._generate_cache_fingerprint(llm_request, 0)
+    key = f"{llm_request.model}:{prefix_fingerprint}"
+    cache_registry = self._get_cache_registry()
+    ttl_seconds = llm_request.cache_config.ttl_seconds
+
+    async def create() -> SharedContextCache:
+      cache_metadata = await self._create_gemini_cache(llm_request, 0)
+      context_cache_metrics.record_creation(llm_request.model, shared=True)
+      return SharedContextCache(
+          cache_name=cache_metadata.cache_name,
+          expire_time=cache_metadata.expire_time,
+          created_at=cache_metadata.created_at,
+      )
+
+    async def refresh(cache: SharedContextCache) -> SharedContextCache:
+      await self.genai_client.aio.caches.update(
+          name=cache.cache_name,
+          config=types.UpdateCachedContentConfig(
+              ttl=llm_request.cache_config.ttl_string
+          ),
+      )
+      logger.debug("Shared cache TTL refreshed: %s", cache.cache_name)
+      return cache.model_copy(update={"expire_time": time.time() + ttl_seconds})
+
+    cache = await cache_registry.acquire(key, create=create, refresh=refresh)
+    if cache is None:
+      return False
+    logger.debug("Using shared prefix cache: %s", cache.cache_name)
+    self._apply_cache_to_request(llm_request, cache.cache_name, 0)
+    self._shared_cache_lease = (key, cache)
+    return True
+
+  async def release_shared_cache(self) -> None:
+    """Releases the shared cache used by the last request, if any.
+
+    Call this once the request that was prepared by handle_context_caching
+    has been sent.
+    """
+    if self._shared_cache_lease is None:
+      return
+    key, cache = self._shared_cache_lease
+    self._shared_cache_lease = None
+    await self._get_cache_registry().release(key, cache)
+
+  def _get_cache_registry(self) -> BaseContextCacheRegistry:
+    return self.cache_registry or get_context_cache_registry()
 
   def _find_count_of_contents_to_cache(
       self, contents: list[types.Content]
@@ -198,6 +471,7 @@ class GeminiContextCacheManager:
     # Check if cache has expired
     if time.time() >= cache_metadata.expire_time:
       logger.info("Cache expired: %s", cache_metadata.cache_name)
+      context_cache_metrics.record_invalidation(llm_request.model, "expired")
       return False
 
     # Check if cache has been used for too many invocations
@@ -211,6 +485,9 @@ class GeminiContextCacheManager:
           cache_metadata.invocations_used,
           llm_request.cache_config.cache_intervals,
       )
+      context_cache_metrics.record_invalidation(
+          llm_request.model, "cache_intervals_exceeded"
+      )
       return False
 
     # Check if fingerprint matches using cached contents count
@@ -219,6 +496,9 @@ class GeminiContextCacheManager:
     )
     if current_fingerprint != cache_metadata.fingerprint:
       logger.debug("Cache content fingerprint mismatch")
+      context_cache_metrics.record_invalidation(
+          llm_request.model, "fingerprint_mismatch"
+      )
       return False
 
     return True
@@ -230,6 +510,13 @@ class GeminiContextCacheManager:
 
     Includes system instruction, tools, tool_config, and first N contents.
 
+    The fingerprint is a hash chain over the config and the contents, so it
+    never serializes the conversation history: contents that were built from
+    session events are identified by the event ID, and only the remaining
+    contents (e.g. instructions) are hashed by value. The chain is built from
+    the chain of the previous step of the conversation, so only the contents
+    that were added since are hashed.
+
     Args:
         llm_request: Request to generate fingerprint for
         cache_contents_count: Number of contents to include in fingerprint
@@ -237,38 +524,60 @@ class GeminiContextCacheManager:
     Returns:
         16-character hexadecimal fingerprint representing the cached state
     """
-    # Create fingerprint from system instruction, tools, tool_config, and first N contents
-    fingerprint_data = {}
-
-    if llm_request.config and llm_request.config.system_instruction:
-      fingerprint_data["system_instruction"] = (
-          llm_request.config.system_instruction
+    start_time = time.perf_counter()
+    chain = self._fingerprint_chain
+    if chain is None or not chain.is_for(llm_request):
+      chain = self._fingerprint_chain = _FingerprintChain(
+          llm_request,
+          self._get_config_digest(llm_request),
+          previous=self._previous_fingerprint_chain,
+      )
+    fingerprint = chain.get_fingerprint(cache_contents_count)
+    context_cache_metrics.record_fingerprint_duration(
+        time.perf_counter() - start_time
+    )
+    return fingerprint
+
+  def _get_config_digest(self, llm_request: LlmRequest) -> bytes:
+    """Returns the digest of the system instruction, tools and tool config."""
+    digest = hashlib.sha256()
+    config = llm_request.config
+    if config and config.system_instruction:
+      system_instruction = config.system_instruction
+      digest.update(
+          b"system_instruction:"
+          + (
+              system_instruction.model_dump_json(exclude_none=True)
+              if isinstance(system_instruction, types.Content)
+              else str(system_instruction)
+          ).encode()
       )
 
-    if llm_request.config and llm_request.config.tools:
-      # Simplified: just dump types.Tool instances to JSON
-      tools_data = []
-      for tool in llm_request.config.tools:
-        if isinstance(tool, types.Tool):
-          tools_data.append(tool.model_dump())
-      fingerprint_data["tools"] = tools_data
+    if config and config.tools:
+      for tool in config.tools:
+        if not isinstance(tool, types.Tool):
+          continue
+        # Built-in tools are small, function declarations are digested once
+        # per tool.
+        digest.update(
+            b"tool:"
+            + tool.model_dump_json(
+                exclude_none=True, exclude={"function_declarations"}
+            ).encode()
+        )
+        for declaration in tool.function_declarations or []:
+          digest.update(
+              b"declaration:"
+              + _get_declaration_digest(llm_request, declaration)
+          )
 
-    if llm_request.config and llm_request.config.tool_config:
-      fingerprint_data["tool_config"] = (
-          llm_request.config.tool_config.model_dump()
+    if config and config.tool_config:
+      digest.update(
+          b"tool_config:"
+          + config.tool_config.model_dump_json(exclude_none=True).encode()
       )
 
-    # Include first N contents in fingerprint
-    if cache_contents_count > 0 and llm_request.contents:
-      contents_data = []
-      for i in range(min(cache_contents_count, len(llm_request.contents))):
-        content = llm_request.contents[i]
-        contents_data.append(content.model_dump())
-      fingerprint_data["cached_contents"] = contents_data
-
-    # Generate hash using str() instead of json.dumps() to handle bytes
-    fingerprint_str = str(fingerprint_data)
-    return hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
+    return digest.digest()
 
   async def _create_new_cache_with_contents(
       self, llm_request: LlmRequest, cache_contents_count: int
@@ -308,13 +617,17 @@ class GeminiContextCacheManager:
       logger.warning("Failed to create cache: %s", e)
       return None
 
-  def _estimate_request_tokens(self, llm_request: LlmRequest) -> int:
+  def _estimate_request_tokens(
+      self, llm_request: LlmRequest, include_contents: bool = True
+  ) -> int:
     """Estimate token count for the request.
 
     This is a rough estimation based on content text length.
 
     Args:
         llm_request: Request to estimate tokens for
+        include_contents: Whether to count the contents, or only the system
+            instruction and tools
 
     Returns:
         Estimated token count
@@ -333,10 +646,11 @@ class GeminiContextCacheManager:
           total_chars += len(tool_str)
 
     # Contents
-    for content in llm_request.contents:
-      for part in content.parts:
-        if part.text:
-          total_chars += len(part.text)
+    if include_contents:
+      for content in llm_request.contents:
+        for part in content.parts:
+          if part.text:
+            total_chars += len(part.text)
 
     # Rough estimate: 4 characters per token
     return total_chars // 4
@@ -454,3 +768,4 @@ class GeminiContextCacheManager:
     """
     # Create a copy of cache metadata for the response
     llm_response.cache_metadata = cache_metadata.model_copy()
+    context_cache_metrics.record_usage(self._model, llm_response.usage_metadata)
@@ -139,26 +139,33 @@ class Gemini(BaseLlm):
       )
 
     if stream:
-      responses = await self.api_client.aio.models.generate_content_stream(
-          model=llm_request.model,
-          contents=llm_request.contents,
-          config=llm_request.config,
-      )
-
       # for sse, similar as bidi (see receive method in gemini_llm_connection.py),
       # we need to mark those text content as partial and after all partial
       # contents are sent, we send an accumulated event which contains all the
       # previous partial content. The only difference is bidi rely on
       # complete_turn flag to detect end while sse depends on finish_reason.
       aggregator = StreamingResponseAggregator()
-      async with Aclosing(responses) as agen:
-        async for response in agen:
-          logger.debug(_build_response_log(response))
-          async with Aclosing(
-              aggregator.process_response(response)
-          ) as aggregator_gen:
-            async for llm_response in aggregator_gen:
-              yield llm_response
+      try:
+        # The stream only sends the request when it's iterated, so the cache
+        # is in use until the first chunk arrives.
+        responses = await self.api_client.aio.models.generate_content_stream(
+            model=llm_request.model,
+            contents=llm_request.contents,
+            config=llm_request.config,
+        )
+        async with Aclosing(responses) as agen:
+          async for response in agen:
+            if cache_manager:
+              await cache_manager.release_shared_cache()
+            logger.debug(_build_response_log(response))
+            async with Aclosing(
+                aggregator.process_response(response)
+            ) as aggregator_gen:
+              async for llm_response in aggregator_gen:
+                yield llm_response
+      finally:
+        if cache_manager:
+          await cache_manager.release_shared_cache()
       if (close_result := aggregator.close()) is not None:
         # Populate cache metadata in the final aggregated response for streaming
         if cache_metadata:
@@ -168,11 +175,15 @@ class Gemini(BaseLlm):
         yield close_result
 
     else:
-      response = await self.api_client.aio.models.generate_content(
-          model=llm_request.model,
-          contents=llm_request.contents,
-          config=llm_request.config,
-      )
+      try:
+        response = await self.api_client.aio.models.generate_content(
+            model=llm_request.model,
+            contents=llm_request.contents,
+            config=llm_request.config,
+        )
+      finally:
+        if cache_manager:
+          await cache_manager.release_shared_cache()
       logger.info('Response received from the model.')
       logger.debug(_build_response_log(response))
 
@@ -183,6 +194,12 @@ class Gemini(BaseLlm):
         )
       yield llm_response
 
+  @override
+  async def warm_up(self) -> None:
+    # Creating the client reads the backend and credentials from the env, and
+    # the backend is needed by every request.
+    _ = self._api_backend
+
   @cached_property
   def api_client(self) -> Client:
     """Provides the api client.
@@ -22,6 +22,7 @@ from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from ..agents.context_cache_config import ContextCacheConfig
 from ..tools.base_tool import BaseTool
@@ -91,6 +92,31 @@ class LlmRequest(BaseModel):
   cacheable_contents_token_count: Optional[int] = None
   """Token count from previous request's prompt, used for cache size validation."""
 
+  _content_event_ids: dict[int, tuple[types.Content, str]] = PrivateAttr(
+      default_factory=dict
+  )
+  """{id(content): (content, event_id)} of the contents built from events."""
+
+  def set_content_event_id(self, content: types.Content, event_id: str):
+    """Records that the content was built from the session event.
+
+    Session events don't change once they are appended, so the event ID
+    identifies the content, and consumers like context caching can
+    fingerprint the content without serializing it.
+
+    Args:
+      content: A content of this request.
+      event_id: The ID of the event that the content was built from.
+    """
+    self._content_event_ids[id(content)] = (content, event_id)
+
+  def get_content_event_id(self, content: types.Content) -> Optional[str]:
+    """Returns the ID of the event that the content was built from, if any."""
+    entry = self._content_event_ids.get(id(content))
+    if entry is None or entry[0] is not content:
+      return None
+    return entry[1]
+
   def append_instructions(
       self, instructions: Union[list[str], types.Content]
   ) -> list[types.Content]:
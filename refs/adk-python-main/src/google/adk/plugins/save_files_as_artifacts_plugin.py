@@ -87,13 +87,7 @@ class SaveFilesAsArtifactsPlugin(BasePlugin):
         display_name = file_name
 
         # Create a copy to stop mutation of the saved artifact if the original part is modified
-        await invocation_context.artifact_service.save_artifact(
-            app_name=invocation_context.app_name,
-            user_id=invocation_context.user_id,
-            session_id=invocation_context.session.id,
-            filename=file_name,
-            artifact=copy.copy(part),
-        )
+        await invocation_context.save_artifact(file_name, copy.copy(part))
 
         # Replace the inline data with a placeholder text (using the clean name)
         new_parts.append(
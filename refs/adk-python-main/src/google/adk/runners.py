@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import inspect
 import logging
 from pathlib import Path
@@ -63,6 +64,9 @@ from .utils.context_utils import Aclosing
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# The maximum number of sessions whose last active agent is remembered.
+_MAX_LAST_ACTIVE_AGENTS = 10_000
+
 
 class Runner:
   """The Runner class is used to run agents.
@@ -155,6 +159,10 @@ class Runner:
         self._agent_origin_dir,
     ) = self._infer_agent_origin(self.agent)
     self._enforce_app_name_alignment()
+    self._transferable_agents: dict[str, tuple[BaseAgent, bool]] = {}
+    self._last_active_agents: collections.OrderedDict[
+        tuple[str, str, str, str], tuple[str, str]
+    ] = collections.OrderedDict()
 
   def _validate_runner_params(
       self,
@@ -551,13 +559,7 @@ class Runner:
         if part.inline_data is None:
           continue
         file_name = f'artifact_{invocation_context.invocation_id}_{i}'
-        await self.artifact_service.save_artifact(
-            app_name=self.app_name,
-            user_id=session.user_id,
-            session_id=session.id,
-            filename=file_name,
-            artifact=part,
-        )
+        await invocation_context.save_artifact(file_name, part)
         new_message.parts[i] = types.Part(
             text=f'Uploaded file: {file_name}. It is saved into artifacts'
         )
@@ -725,10 +727,50 @@ class Runner:
     # the agent that returned the corressponding function call regardless the
     # type of the agent. e.g. a remote a2a agent may surface a credential
     # request as a special long running function tool call.
-    event = find_matching_function_call(session.events)
+    event = find_matching_function_call(
+        session.events, session.get_function_call_index()
+    )
     if event and event.author:
       return root_agent.find_agent(event.author)
 
+    marker_key = (
+        session.app_name,
+        session.user_id,
+        session.id,
+        root_agent.name,
+    )
+    agent = self._find_last_active_agent(
+        session, root_agent, self._last_active_agents.get(marker_key)
+    )
+    if session.events:
+      self._last_active_agents[marker_key] = (
+          session.events[-1].id,
+          agent.name,
+      )
+      self._last_active_agents.move_to_end(marker_key)
+      if len(self._last_active_agents) > _MAX_LAST_ACTIVE_AGENTS:
+        self._last_active_agents.popitem(last=False)
+    return agent
+
+  def _find_last_active_agent(
+      self,
+      session: Session,
+      root_agent: BaseAgent,
+      marker: Optional[tuple[str, str]],
+  ) -> BaseAgent:
+    """Finds the agent that replied last and can transfer across the tree.
+
+    Args:
+        session: The session to find the agent for.
+        root_agent: The root agent of the runner.
+        marker: The id of the last event seen by the previous lookup in this
+          session and the agent it found. Events up to the marked one are not
+          scanned again.
+
+    Returns:
+      The last active agent, or the root agent if there is none.
+    """
+
     def _event_filter(event: Event) -> bool:
       """Filters out user-authored events and agent state change events."""
       if event.author == 'user':
@@ -737,7 +779,14 @@ class Runner:
         return False
       return True
 
-    for event in filter(_event_filter, reversed(session.events)):
+    for event in reversed(session.events):
+      if marker and event.id == marker[0]:
+        if agent := root_agent.find_agent(marker[1]):
+          return agent
+        # The agent is no longer in the tree, scan the older events instead.
+        marker = None
+      if not _event_filter(event):
+        continue
       if event.author == root_agent.name:
         # Found root agent.
         return root_agent
@@ -766,15 +815,24 @@ class Runner:
     Returns:
         True if the agent can transfer, False otherwise.
     """
+    # The flag only depends on the agent tree, so it is computed once per agent.
+    cached = self._transferable_agents.get(agent_to_run.name)
+    if cached is not None and cached[0] is agent_to_run:
+      return cached[1]
+
+    transferable = True
     agent = agent_to_run
     while agent:
       if not isinstance(agent, LlmAgent):
         # Only LLM-based Agent can provide agent transfer capability.
-        return False
+        transferable = False
+        break
       if agent.disallow_transfer_to_parent:
-        return False
+        transferable = False
+        break
       agent = agent.parent_agent
-    return True
+    self._transferable_agents[agent_to_run.name] = (agent_to_run, transferable)
+    return transferable
 
   async def _setup_context_for_new_invocation(
       self,
@@ -14,11 +14,15 @@
 """Utility functions for session service."""
 from __future__ import annotations
 
+import base64
+import json
 from typing import Any
 from typing import Optional
 
 from google.genai import types
 
+from ..events.event import Event
+
 
 def decode_content(
     content: Optional[dict[str, Any]],
@@ -36,3 +40,40 @@ def decode_grounding_metadata(
   if not grounding_metadata:
     return None
   return types.GroundingMetadata.model_validate(grounding_metadata)
+
+
+def encode_page_token(position: list[Any]) -> str:
+  """Encodes the position of the last listed item as an opaque page token."""
+  return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_page_token(page_token: str, length: int) -> list[Any]:
+  """Decodes the position of the last listed item from a page token.
+
+  Args:
+    page_token: The page token.
+    length: The number of values of the position.
+
+  Returns:
+    The position of the last listed item.
+
+  Raises:
+    ValueError: If the page token is invalid.
+  """
+  try:
+    position = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+  except ValueError as e:
+    raise ValueError(f'Invalid page token: {page_token}') from e
+  if not isinstance(position, list) or len(position) != length:
+    raise ValueError(f'Invalid page token: {page_token}')
+  return position
+
+
+def project_event_ids(event: Event) -> Event:
+  """Returns the event with only its IDs, author and timestamp."""
+  return Event(
+      id=event.id,
+      invocation_id=event.invocation_id,
+      author=event.author,
+      timestamp=event.timestamp,
+  )
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import abc
+import enum
 from typing import Any
 from typing import Optional
 
@@ -26,11 +27,37 @@ from .session import Session
 from .state import State
 
 
+class SessionProjection(enum.Enum):
+  """The parts of a session to get."""
+
+  FULL = 'full'
+  """The session with its state and events."""
+
+  METADATA = 'metadata'
+  """The session with its state, without events."""
+
+  EVENT_IDS = 'event_ids'
+  """The session with its state, with events that only carry their `id`,
+  `invocation_id`, `author` and `timestamp`."""
+
+
 class GetSessionConfig(BaseModel):
   """The configuration of getting a session."""
 
   num_recent_events: Optional[int] = None
   after_timestamp: Optional[float] = None
+  projection: SessionProjection = SessionProjection.FULL
+
+
+class ListSessionsConfig(BaseModel):
+  """The configuration of listing sessions."""
+
+  page_size: Optional[int] = Field(default=None, gt=0)
+  """The maximum number of sessions to return. All sessions are returned if
+  not set."""
+
+  page_token: Optional[str] = None
+  """The `next_page_token` of the previous page, to list the next one."""
 
 
 class ListSessionsResponse(BaseModel):
@@ -41,6 +68,9 @@ class ListSessionsResponse(BaseModel):
 
   sessions: list[Session] = Field(default_factory=list)
 
+  next_page_token: Optional[str] = None
+  """The token to list the next page, or None if this is the last page."""
+
 
 class BaseSessionService(abc.ABC):
   """Base class for session services.
@@ -83,17 +113,29 @@ class BaseSessionService(abc.ABC):
 
   @abc.abstractmethod
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     """Lists all the sessions for a user.
 
+    Sessions are listed from the most recently updated one, unless the storage
+    backend defines its own order.
+
     Args:
       app_name: The name of the app.
       user_id: The ID of the user. If not provided, lists all sessions for all
         users.
+      config: The page of sessions to list. If not provided, lists all
+        sessions.
 
     Returns:
       A ListSessionsResponse containing the sessions.
+
+    Raises:
+      ValueError: If the page token is invalid.
     """
 
   @abc.abstractmethod
@@ -109,6 +151,7 @@ class BaseSessionService(abc.ABC):
     event = self._trim_temp_delta_state(event)
     self._update_session_state(session, event)
     session.events.append(event)
+    session.get_function_call_index().update(session.events)
     return event
 
   def _trim_temp_delta_state(self, event: Event) -> Event:
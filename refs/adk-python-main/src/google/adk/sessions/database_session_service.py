@@ -23,12 +23,16 @@ from typing import Any
 from typing import Optional
 import uuid
 
+from sqlalchemy import and_
 from sqlalchemy import Boolean
 from sqlalchemy import delete
 from sqlalchemy import Dialect
 from sqlalchemy import event
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import func
+from sqlalchemy import Index
+from sqlalchemy import literal_column
+from sqlalchemy import or_
 from sqlalchemy import Text
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
@@ -55,7 +59,9 @@ from . import _session_util
 from ..events.event import Event
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
+from .base_session_service import SessionProjection
 from .session import Session
 from .state import State
 
@@ -174,6 +180,25 @@ class StorageSession(Base):
       back_populates="storage_session",
   )
 
+  __table_args__ = (
+      # Lists the sessions of a user from the most recently updated one.
+      Index(
+          "ix_sessions_app_name_user_id_update_time",
+          "app_name",
+          "user_id",
+          "update_time",
+      ),
+      # SQLite orders the sessions by the Julian day of their update time, see
+      # _get_comparable_timestamp, which only an index on the expression can
+      # serve.
+      Index(
+          "ix_sessions_app_name_user_id_julianday_update_time",
+          "app_name",
+          "user_id",
+          func.julianday(literal_column("update_time")),
+      ).ddl_if(dialect="sqlite"),
+  )
+
   def __repr__(self):
     return f"<StorageSession(id={self.id}, update_time={self.update_time})>"
 
@@ -521,20 +546,33 @@ class DatabaseSessionService(BaseSessionService):
       else:
         timestamp_filter = True
 
-      storage_events = (
-          sql_session.query(StorageEvent)
-          .filter(StorageEvent.app_name == app_name)
-          .filter(StorageEvent.session_id == storage_session.id)
-          .filter(StorageEvent.user_id == user_id)
-          .filter(timestamp_filter)
-          .order_by(StorageEvent.timestamp.desc())
-          .limit(
-              config.num_recent_events
-              if config and config.num_recent_events
-              else None
-          )
-          .all()
-      )
+      projection = config.projection if config else SessionProjection.FULL
+      if projection == SessionProjection.FULL:
+        columns = (StorageEvent,)
+      else:
+        columns = (
+            StorageEvent.id,
+            StorageEvent.invocation_id,
+            StorageEvent.author,
+            StorageEvent.timestamp,
+        )
+      if projection == SessionProjection.METADATA:
+        storage_events = []
+      else:
+        storage_events = (
+            sql_session.query(*columns)
+            .filter(StorageEvent.app_name == app_name)
+            .filter(StorageEvent.session_id == storage_session.id)
+            .filter(StorageEvent.user_id == user_id)
+            .filter(timestamp_filter)
+            .order_by(StorageEvent.timestamp.desc())
+            .limit(
+                config.num_recent_events
+                if config and config.num_recent_events
+                else None
+            )
+            .all()
+        )
 
       # Fetch states from storage
       storage_app_state = sql_session.get(StorageAppState, (app_name))
@@ -550,13 +588,28 @@ class DatabaseSessionService(BaseSessionService):
       merged_state = _merge_state(app_state, user_state, session_state)
 
       # Convert storage session to session
-      events = [e.to_event() for e in reversed(storage_events)]
+      if projection == SessionProjection.FULL:
+        events = [e.to_event() for e in reversed(storage_events)]
+      else:
+        events = [
+            Event(
+                id=row.id,
+                invocation_id=row.invocation_id,
+                author=row.author,
+                timestamp=row.timestamp.timestamp(),
+            )
+            for row in reversed(storage_events)
+        ]
       session = storage_session.to_session(state=merged_state, events=events)
     return session
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     with self.database_session_factory() as sql_session:
       query = sql_session.query(StorageSession).filter(
@@ -564,8 +617,52 @@ class DatabaseSessionService(BaseSessionService):
       )
       if user_id is not None:
         query = query.filter(StorageSession.user_id == user_id)
+      update_time = _get_comparable_timestamp(
+          self.db_engine.dialect.name, StorageSession.update_time
+      )
+      if config and config.page_token:
+        last_update_time, last_user_id, last_session_id = _decode_list_position(
+            config.page_token
+        )
+        last_update_time = _get_comparable_timestamp(
+            self.db_engine.dialect.name, last_update_time
+        )
+        # Row value comparisons aren't supported by all databases.
+        query = query.filter(
+            or_(
+                update_time < last_update_time,
+                and_(
+                    update_time == last_update_time,
+                    or_(
+                        StorageSession.user_id < last_user_id,
+                        and_(
+                            StorageSession.user_id == last_user_id,
+                            StorageSession.id < last_session_id,
+                        ),
+                    ),
+                ),
+            )
+        )
+      query = query.order_by(
+          update_time.desc(),
+          StorageSession.user_id.desc(),
+          StorageSession.id.desc(),
+      )
+      page_size = config.page_size if config else None
+      if page_size:
+        # One more session tells whether there is a next page.
+        query = query.limit(page_size + 1)
       results = query.all()
 
+      next_page_token = None
+      if page_size and len(results) > page_size:
+        results = results[:page_size]
+        next_page_token = _session_util.encode_page_token([
+            results[-1].update_time.isoformat(),
+            results[-1].user_id,
+            results[-1].id,
+        ])
+
       # Fetch app state from storage
       storage_app_state = sql_session.get(StorageAppState, (app_name))
       app_state = storage_app_state.state if storage_app_state else {}
@@ -578,13 +675,16 @@ class DatabaseSessionService(BaseSessionService):
         )
         if storage_user_state:
           user_states_map[user_id] = storage_user_state.state
-      else:
-        all_user_states_for_app = (
+      elif results:
+        user_states_for_page = (
             sql_session.query(StorageUserState)
             .filter(StorageUserState.app_name == app_name)
+            .filter(
+                StorageUserState.user_id.in_(list({s.user_id for s in results}))
+            )
             .all()
         )
-        for storage_user_state in all_user_states_for_app:
+        for storage_user_state in user_states_for_page:
           user_states_map[storage_user_state.user_id] = storage_user_state.state
 
       sessions = []
@@ -593,7 +693,9 @@ class DatabaseSessionService(BaseSessionService):
         user_state = user_states_map.get(storage_session.user_id, {})
         merged_state = _merge_state(app_state, user_state, session_state)
         sessions.append(storage_session.to_session(state=merged_state))
-      return ListSessionsResponse(sessions=sessions)
+      return ListSessionsResponse(
+          sessions=sessions, next_page_token=next_page_token
+      )
 
   @override
   async def delete_session(
@@ -627,8 +729,8 @@ class DatabaseSessionService(BaseSessionService):
       if storage_session.update_timestamp_tz > session.last_update_time:
         raise ValueError(
             "The last_update_time provided in the session object"
-            f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'} is"
-            " earlier than the update_time in the storage_session"
+            f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'}"
+            " is earlier than the update_time in the storage_session"
             f" {datetime.fromtimestamp(storage_session.update_timestamp_tz):'%Y-%m-%d %H:%M:%S'}."
             " Please check if it is a stale session."
         )
@@ -692,6 +794,25 @@ def _extract_state_delta(state: dict[str, Any]):
   return app_state_delta, user_state_delta, session_state_delta
 
 
+def _get_comparable_timestamp(dialect_name: str, timestamp: Any) -> Any:
+  if dialect_name == "sqlite":
+    # SQLite stores timestamps as text, with or without microseconds depending
+    # on whether the database or SQLAlchemy set them, so they're compared as
+    # Julian days.
+    return func.julianday(timestamp)
+  return timestamp
+
+
+def _decode_list_position(page_token: str) -> tuple[datetime, str, str]:
+  update_time, user_id, session_id = _session_util.decode_page_token(
+      page_token, 3
+  )
+  try:
+    return datetime.fromisoformat(update_time), str(user_id), str(session_id)
+  except (TypeError, ValueError) as e:
+    raise ValueError(f"Invalid page token: {page_token}") from e
+
+
 def _merge_state(app_state, user_state, session_state):
   # Merge states for response
   merged_state = copy.deepcopy(session_state)
@@ -0,0 +1,173 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+from typing import Iterable
+from typing import Optional
+
+from ..events.event import Event
+
+
+class FunctionCallIndex:
+  """Pairs function calls with their responses in a list of events.
+
+  The index maps each function call ID to the positions of the events that
+  carry the call and of the events that carry its responses. It is kept up to
+  date incrementally with `update`, so pairing calls and responses doesn't
+  require scanning the events again.
+
+  Calls and responses without an ID are indexed under `None`, so lookups match
+  the same events as comparing the IDs of the events one by one.
+
+  Positions refer to the list of events the index was last updated with.
+  """
+
+  def __init__(self, events: Optional[list[Event]] = None):
+    self._events: list[Event] = []
+    self._indexed_count = 0
+    self._last_event: Optional[Event] = None
+    self._call_event_indices: dict[Optional[str], list[int]] = {}
+    self._response_event_indices: dict[Optional[str], list[int]] = {}
+    # Insertion ordered, so pending calls are returned in call order.
+    self._pending_call_ids: dict[str, None] = {}
+    if events is not None:
+      self.update(events)
+
+  def __eq__(self, other: object) -> bool:
+    # The index is derived from the events, so it never makes the models that
+    # hold it unequal.
+    return isinstance(other, FunctionCallIndex)
+
+  def update(self, events: list[Event]) -> None:
+    """Indexes the events that were appended since the last update.
+
+    The events may be a new list, as long as it starts with the events the
+    index was last updated with. Otherwise, e.g. after the session was
+    rewound, the index is rebuilt.
+
+    Args:
+      events: The events to index.
+    """
+    if self._indexed_count > len(events) or (
+        self._indexed_count
+        and events[self._indexed_count - 1] is not self._last_event
+    ):
+      self._reset()
+    for i in range(self._indexed_count, len(events)):
+      self._index_event(i, events[i])
+    self._events = events
+    self._indexed_count = len(events)
+    self._last_event = events[-1] if events else None
+
+  def get_function_call_event_index(
+      self, function_call_id: Optional[str]
+  ) -> Optional[int]:
+    """Returns the position of the latest event with the function call."""
+    indices = self._call_event_indices.get(function_call_id)
+    return indices[-1] if indices else None
+
+  def get_function_call_event(
+      self, function_call_id: Optional[str]
+  ) -> Optional[Event]:
+    """Returns the latest event with the function call."""
+    index = self.get_function_call_event_index(function_call_id)
+    return self._events[index] if index is not None else None
+
+  def find_function_call_event_index(
+      self, function_call_ids: Iterable[Optional[str]], before: int
+  ) -> Optional[int]:
+    """Finds the latest event before a position with any of the function calls.
+
+    Args:
+      function_call_ids: The IDs of the function calls to look for.
+      before: The position to search before.
+
+    Returns:
+      The position of the event, or None if there is none.
+    """
+    result = None
+    for function_call_id in function_call_ids:
+      indices = self._call_event_indices.get(function_call_id)
+      if not indices:
+        continue
+      i = bisect.bisect_left(indices, before)
+      if i and (result is None or indices[i - 1] > result):
+        result = indices[i - 1]
+    return result
+
+  def get_function_response_event_index(
+      self, function_call_id: Optional[str]
+  ) -> Optional[int]:
+    """Returns the position of the latest response to the function call."""
+    indices = self._response_event_indices.get(function_call_id)
+    return indices[-1] if indices else None
+
+  def is_pending(self, function_call_id: str) -> bool:
+    """Whether the function call has no response yet."""
+    return function_call_id in self._pending_call_ids
+
+  def get_pending_function_call_ids(
+      self, *, long_running_only: bool = False
+  ) -> list[str]:
+    """Returns the IDs of the function calls without a response.
+
+    Args:
+      long_running_only: Whether to only return the calls of long running
+        tools, i.e. the calls a paused invocation is waiting for.
+
+    Returns:
+      The IDs of the pending function calls, in the order they were made.
+    """
+    pending_call_ids = []
+    for function_call_id in self._pending_call_ids:
+      if long_running_only:
+        event = self.get_function_call_event(function_call_id)
+        if function_call_id not in (event.long_running_tool_ids or ()):
+          continue
+      pending_call_ids.append(function_call_id)
+    return pending_call_ids
+
+  def _reset(self) -> None:
+    self._events = []
+    self._indexed_count = 0
+    self._last_event = None
+    self._call_event_indices.clear()
+    self._response_event_indices.clear()
+    self._pending_call_ids.clear()
+
+  def _index_event(self, index: int, event: Event) -> None:
+    for function_call in event.get_function_calls():
+      _append_index(self._call_event_indices, function_call.id, index)
+      if (
+          function_call.id
+          and function_call.id not in self._response_event_indices
+      ):
+        self._pending_call_ids[function_call.id] = None
+    for function_response in event.get_function_responses():
+      _append_index(self._response_event_indices, function_response.id, index)
+      if function_response.id:
+        self._pending_call_ids.pop(function_response.id, None)
+
+
+def _append_index(
+    indices: dict[Optional[str], list[int]],
+    function_call_id: Optional[str],
+    index: int,
+) -> None:
+  event_indices = indices.setdefault(function_call_id, [])
+  # An event with several calls of the same ID is indexed once.
+  if not event_indices or event_indices[-1] != index:
+    event_indices.append(index)
@@ -22,10 +22,13 @@ import uuid
 
 from typing_extensions import override
 
+from . import _session_util
 from ..events.event import Event
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
+from .base_session_service import SessionProjection
 from .session import Session
 from .state import State
 
@@ -158,7 +161,14 @@ class InMemorySessionService(BaseSessionService):
       return None
 
     session = self.sessions[app_name][user_id].get(session_id)
-    copied_session = copy.deepcopy(session)
+    projection = config.projection if config else SessionProjection.FULL
+    if projection == SessionProjection.FULL:
+      copied_session = copy.deepcopy(session)
+    else:
+      copied_session = _copy_session_without_events(session)
+      if projection == SessionProjection.EVENT_IDS:
+        # The events are filtered before they're projected.
+        copied_session.events = list(session.events)
 
     if config:
       if config.num_recent_events:
@@ -173,6 +183,11 @@ class InMemorySessionService(BaseSessionService):
           i -= 1
         if i >= 0:
           copied_session.events = copied_session.events[i + 1 :]
+    if projection == SessionProjection.EVENT_IDS:
+      copied_session.events = [
+          _session_util.project_event_ids(event)
+          for event in copied_session.events
+      ]
 
     return self._merge_state(app_name, user_id, copied_session)
 
@@ -201,18 +216,34 @@ class InMemorySessionService(BaseSessionService):
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
-    return self._list_sessions_impl(app_name=app_name, user_id=user_id)
+    return self._list_sessions_impl(
+        app_name=app_name, user_id=user_id, config=config
+    )
 
   def list_sessions_sync(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     logger.warning('Deprecated. Please migrate to the async method.')
-    return self._list_sessions_impl(app_name=app_name, user_id=user_id)
+    return self._list_sessions_impl(
+        app_name=app_name, user_id=user_id, config=config
+    )
 
   def _list_sessions_impl(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     empty_response = ListSessionsResponse()
     if app_name not in self.sessions:
@@ -220,23 +251,36 @@ class InMemorySessionService(BaseSessionService):
     if user_id is not None and user_id not in self.sessions[app_name]:
       return empty_response
 
-    sessions_without_events = []
-
     if user_id is None:
-      for user_id in self.sessions[app_name]:
-        for session_id in self.sessions[app_name][user_id]:
-          session = self.sessions[app_name][user_id][session_id]
-          copied_session = copy.deepcopy(session)
-          copied_session.events = []
-          copied_session = self._merge_state(app_name, user_id, copied_session)
-          sessions_without_events.append(copied_session)
+      user_sessions = self.sessions[app_name].values()
     else:
-      for session in self.sessions[app_name][user_id].values():
-        copied_session = copy.deepcopy(session)
-        copied_session.events = []
-        copied_session = self._merge_state(app_name, user_id, copied_session)
-        sessions_without_events.append(copied_session)
-    return ListSessionsResponse(sessions=sessions_without_events)
+      user_sessions = [self.sessions[app_name][user_id]]
+    sessions = [
+        session
+        for sessions_by_id in user_sessions
+        for session in sessions_by_id.values()
+    ]
+    sessions.sort(key=_get_list_position, reverse=True)
+
+    next_page_token = None
+    if config and config.page_token:
+      position = _decode_list_position(config.page_token)
+      sessions = [s for s in sessions if _get_list_position(s) < position]
+    if config and config.page_size and len(sessions) > config.page_size:
+      sessions = sessions[: config.page_size]
+      next_page_token = _session_util.encode_page_token(
+          list(_get_list_position(sessions[-1]))
+      )
+
+    sessions_without_events = [
+        self._merge_state(
+            app_name, session.user_id, _copy_session_without_events(session)
+        )
+        for session in sessions
+    ]
+    return ListSessionsResponse(
+        sessions=sessions_without_events, next_page_token=next_page_token
+    )
 
   @override
   async def delete_session(
@@ -311,3 +355,26 @@ class InMemorySessionService(BaseSessionService):
     storage_session.last_update_time = event.timestamp
 
     return event
+
+
+def _copy_session_without_events(session: Session) -> Session:
+  return Session(
+      app_name=session.app_name,
+      user_id=session.user_id,
+      id=session.id,
+      state=copy.deepcopy(session.state),
+      last_update_time=session.last_update_time,
+  )
+
+
+def _get_list_position(session: Session) -> tuple[float, str, str]:
+  return (session.last_update_time, session.user_id, session.id)
+
+
+def _decode_list_position(page_token: str) -> tuple[float, str, str]:
+  last_update_time, user_id, session_id = _session_util.decode_page_token(
+      page_token, 3
+  )
+  if not isinstance(last_update_time, (int, float)):
+    raise ValueError(f'Invalid page token: {page_token}')
+  return (last_update_time, str(user_id), str(session_id))
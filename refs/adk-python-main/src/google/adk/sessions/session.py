@@ -20,8 +20,10 @@ from pydantic import alias_generators
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from ..events.event import Event
+from .function_call_index import FunctionCallIndex
 
 
 class Session(BaseModel):
@@ -48,3 +50,16 @@ class Session(BaseModel):
   call/response, etc."""
   last_update_time: float = 0.0
   """The last update time of the session."""
+
+  _function_call_index: FunctionCallIndex = PrivateAttr(
+      default_factory=FunctionCallIndex
+  )
+
+  def get_function_call_index(self) -> FunctionCallIndex:
+    """Returns the index of the function calls in the events of the session.
+
+    Session services update the index as events are appended. Since sessions
+    can also be loaded or modified directly, update it with the session events
+    before lookups, which only indexes the events it hasn't seen yet.
+    """
+    return self._function_call_index
@@ -36,7 +36,9 @@ from ..events.event import Event
 from ..events.event_actions import EventActions
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
+from .base_session_service import SessionProjection
 from .session import Session
 
 logger = logging.getLogger('google_adk.' + __name__)
@@ -171,6 +173,10 @@ class VertexAiSessionService(BaseSessionService):
         last_update_time=update_timestamp,
     )
 
+    projection = config.projection if config else SessionProjection.FULL
+    if projection == SessionProjection.METADATA:
+      return session
+
     list_events_kwargs = {}
     if config and not config.num_recent_events and config.after_timestamp:
       list_events_kwargs['config'] = {
@@ -195,26 +201,47 @@ class VertexAiSessionService(BaseSessionService):
     if config:
       if config.num_recent_events:
         session.events = session.events[-config.num_recent_events :]
+    if projection == SessionProjection.EVENT_IDS:
+      session.events = [
+          _session_util.project_event_ids(event) for event in session.events
+      ]
 
     return session
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     reasoning_engine_id = self._get_reasoning_engine_id(app_name)
     api_client = self._get_api_client()
 
     sessions = []
-    config = {}
+    list_config = {}
     if user_id is not None:
-      config['filter'] = f'user_id="{user_id}"'
+      list_config['filter'] = f'user_id="{user_id}"'
+    # The page tokens of the API are passed through, and sessions are listed
+    # in the order of the API.
+    if config and config.page_size:
+      list_config['page_size'] = config.page_size
+    if config and config.page_token:
+      list_config['page_token'] = config.page_token
     sessions_iterator = api_client.agent_engines.sessions.list(
         name=f'reasoningEngines/{reasoning_engine_id}',
-        config=config,
+        config=list_config,
     )
 
-    for api_session in sessions_iterator:
+    next_page_token = None
+    if config and config.page_size:
+      # Iterating the pager would fetch the next pages too.
+      api_sessions = sessions_iterator.page
+      next_page_token = sessions_iterator.config.get('page_token') or None
+    else:
+      api_sessions = sessions_iterator
+    for api_session in api_sessions:
       sessions.append(
           Session(
               app_name=app_name,
@@ -225,7 +252,9 @@ class VertexAiSessionService(BaseSessionService):
           )
       )
 
-    return ListSessionsResponse(sessions=sessions)
+    return ListSessionsResponse(
+        sessions=sessions, next_page_token=next_page_token
+    )
 
   async def delete_session(
       self, *, app_name: str, user_id: str, session_id: str
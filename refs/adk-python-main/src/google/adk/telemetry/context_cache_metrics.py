@@ -0,0 +1,124 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""OpenTelemetry metrics of the context caching system.
+
+The metrics are recorded while requests are prepared and responses are
+received, so cache efficiency can be monitored without analyzing the event
+history of sessions.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from google.genai import types
+from opentelemetry import metrics
+
+from .. import version
+from .tracing import SCHEMA_URL
+
+GEN_AI_REQUEST_MODEL = 'gen_ai.request.model'
+CONTEXT_CACHE_SHARED = 'adk.context_cache.shared'
+CONTEXT_CACHE_INVALIDATION_REASON = 'adk.context_cache.invalidation_reason'
+
+
+class ContextCacheMetrics:
+  """The instruments that record context cache metrics."""
+
+  def __init__(self, meter: metrics.Meter):
+    self._hits = meter.create_counter(
+        'adk.context_cache.hits',
+        unit='{request}',
+        description='Number of LLM requests that were served from a cache.',
+    )
+    self._misses = meter.create_counter(
+        'adk.context_cache.misses',
+        unit='{request}',
+        description='Number of LLM requests that were sent without a cache.',
+    )
+    self._creations = meter.create_counter(
+        'adk.context_cache.creations',
+        unit='{cache}',
+        description='Number of context caches that were created.',
+    )
+    self._invalidations = meter.create_counter(
+        'adk.context_cache.invalidations',
+        unit='{cache}',
+        description='Number of context caches that were found to be invalid.',
+    )
+    self._cached_tokens = meter.create_histogram(
+        'adk.context_cache.cached_tokens',
+        unit='{token}',
+        description='Number of prompt tokens per request read from a cache.',
+    )
+    self._uncached_tokens = meter.create_histogram(
+        'adk.context_cache.uncached_tokens',
+        unit='{token}',
+        description='Number of prompt tokens per request not read from a cache.',
+    )
+    self._fingerprint_duration = meter.create_histogram(
+        'adk.context_cache.fingerprint.duration',
+        unit='s',
+        description='Time spent computing cache fingerprints.',
+    )
+
+  def record_hit(self, model: Optional[str], shared: bool = False):
+    self._hits.add(
+        1, {GEN_AI_REQUEST_MODEL: model or '', CONTEXT_CACHE_SHARED: shared}
+    )
+
+  def record_miss(self, model: Optional[str]):
+    self._misses.add(1, {GEN_AI_REQUEST_MODEL: model or ''})
+
+  def record_creation(self, model: Optional[str], shared: bool = False):
+    self._creations.add(
+        1, {GEN_AI_REQUEST_MODEL: model or '', CONTEXT_CACHE_SHARED: shared}
+    )
+
+  def record_invalidation(self, model: Optional[str], reason: str):
+    self._invalidations.add(
+        1,
+        {
+            GEN_AI_REQUEST_MODEL: model or '',
+            CONTEXT_CACHE_INVALIDATION_REASON: reason,
+        },
+    )
+
+  def record_usage(
+      self,
+      model: Optional[str],
+      usage_metadata: Optional[types.GenerateContentResponseUsageMetadata],
+  ):
+    """Records the cached and uncached prompt tokens of a response."""
+    if not usage_metadata or usage_metadata.prompt_token_count is None:
+      return
+    cached_tokens = usage_metadata.cached_content_token_count or 0
+    attributes = {GEN_AI_REQUEST_MODEL: model or ''}
+    self._cached_tokens.record(cached_tokens, attributes)
+    self._uncached_tokens.record(
+        max(0, usage_metadata.prompt_token_count - cached_tokens), attributes
+    )
+
+  def record_fingerprint_duration(self, seconds: float):
+    self._fingerprint_duration.record(seconds)
+
+
+context_cache_metrics = ContextCacheMetrics(
+    metrics.get_meter(
+        name='gcp.vertex.agent',
+        version=version.__version__,
+        schema_url=SCHEMA_URL,
+    )
+)
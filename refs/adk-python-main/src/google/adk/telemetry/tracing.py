@@ -51,11 +51,13 @@ if TYPE_CHECKING:
   from ..models.llm_response import LlmResponse
   from ..tools.base_tool import BaseTool
 
+# TODO: Replace with constant from opentelemetry.semconv when it reaches version 1.37 in g3.
+SCHEMA_URL = 'https://opentelemetry.io/schemas/1.37.0'
+
 tracer = trace.get_tracer(
     instrumenting_module_name='gcp.vertex.agent',
     instrumenting_library_version=version.__version__,
-    # TODO: Replace with constant from opentelemetry.semconv when it reaches version 1.37 in g3.
-    schema_url='https://opentelemetry.io/schemas/1.37.0',
+    schema_url=SCHEMA_URL,
 )
 
 
@@ -111,6 +113,32 @@ def trace_agent_invocation(
   span.set_attribute(GEN_AI_CONVERSATION_ID, ctx.session.id)
 
 
+def trace_parallel_branch(
+    span: trace.Span,
+    sub_agent: BaseAgent,
+    ctx: InvocationContext,
+    outcome: str,
+    latency_seconds: float,
+) -> None:
+  """Traces the run of a sub-agent in a branch of a parallel agent.
+
+  Args:
+    span: Span on which attributes are set.
+    sub_agent: The sub-agent that ran in the branch.
+    ctx: InvocationContext of the branch.
+    outcome: How the branch ended: 'completed', 'failed' or 'cancelled'.
+    latency_seconds: How long the branch ran, until it ended or was cancelled.
+  """
+  span.set_attribute(GEN_AI_AGENT_NAME, sub_agent.name)
+  span.set_attribute(GEN_AI_CONVERSATION_ID, ctx.session.id)
+  span.set_attribute('gcp.vertex.agent.invocation_id', ctx.invocation_id)
+  span.set_attribute('gcp.vertex.agent.branch', ctx.branch or '')
+  span.set_attribute('gcp.vertex.agent.branch_outcome', outcome)
+  span.set_attribute(
+      'gcp.vertex.agent.branch_latency_ms', latency_seconds * 1000
+  )
+
+
 def trace_tool_call(
     tool: BaseTool,
     args: dict[str, Any],
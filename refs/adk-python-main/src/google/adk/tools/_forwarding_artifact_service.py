@@ -80,14 +80,7 @@ class ForwardingArtifactService(BaseArtifactService):
       session_id: Optional[str] = None,
   ) -> None:
     del app_name, user_id, session_id
-    if self._invocation_context.artifact_service is None:
-      raise ValueError("Artifact service is not initialized.")
-    await self._invocation_context.artifact_service.delete_artifact(
-        app_name=self._invocation_context.app_name,
-        user_id=self._invocation_context.user_id,
-        session_id=self._invocation_context.session.id,
-        filename=filename,
-    )
+    await self._invocation_context.delete_artifact(filename)
 
   @override
   async def list_versions(
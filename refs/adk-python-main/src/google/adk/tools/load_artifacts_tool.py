@@ -85,7 +85,13 @@ class LoadArtifactsTool(BaseTool):
   async def _append_artifacts_to_llm_request(
       self, *, tool_context: ToolContext, llm_request: LlmRequest
   ):
-    artifact_names = await tool_context.list_artifacts()
+    # The artifacts are listed once per invocation, saves and deletes made by
+    # the invocation keep the manifest up to date afterwards.
+    artifact_manifest = tool_context.artifact_manifest
+    artifact_names = artifact_manifest.get_artifact_keys()
+    if artifact_names is None:
+      artifact_names = await tool_context.list_artifacts()
+      artifact_manifest.set_artifact_keys(artifact_names)
     if not artifact_names:
       return
 
@@ -108,13 +114,13 @@ class LoadArtifactsTool(BaseTool):
         artifact_names = function_response.response['artifact_names']
         for artifact_name in artifact_names:
           # Try session-scoped first (default behavior)
-          artifact = await tool_context.load_artifact(artifact_name)
+          artifact = await self._load_artifact(tool_context, artifact_name)
 
           # If not found and name doesn't already have user: prefix,
           # try cross-session artifacts with user: prefix
           if artifact is None and not artifact_name.startswith('user:'):
             prefixed_name = f'user:{artifact_name}'
-            artifact = await tool_context.load_artifact(prefixed_name)
+            artifact = await self._load_artifact(tool_context, prefixed_name)
 
           if artifact is None:
             logger.warning('Artifact "%s" not found, skipping', artifact_name)
@@ -131,5 +137,16 @@ class LoadArtifactsTool(BaseTool):
               )
           )
 
+  async def _load_artifact(
+      self, tool_context: ToolContext, artifact_name: str
+  ) -> types.Part | None:
+    artifact_manifest = tool_context.artifact_manifest
+    artifact = artifact_manifest.get_artifact(artifact_name)
+    if artifact is None:
+      artifact = await tool_context.load_artifact(artifact_name)
+      if artifact is not None:
+        artifact_manifest.put_artifact(artifact_name, artifact)
+    return artifact
+
 
 load_artifacts_tool = LoadArtifactsTool()
@@ -25,6 +25,7 @@ from ..auth.auth_tool import AuthConfig
 from .tool_confirmation import ToolConfirmation
 
 if TYPE_CHECKING:
+  from ..agents.invocation_context import _InvocationArtifactManifest
   from ..agents.invocation_context import InvocationContext
   from ..events.event_actions import EventActions
   from ..memory.base_memory_service import SearchMemoryResponse
@@ -64,6 +65,15 @@ class ToolContext(CallbackContext):
   def actions(self) -> EventActions:
     return self._event_actions
 
+  @property
+  def artifact_manifest(self) -> _InvocationArtifactManifest:
+    """The artifacts of the current session as seen by this invocation.
+
+    Tools can keep the artifact keys and contents they fetched in the manifest,
+    so later steps of the invocation don't fetch them again.
+    """
+    return self._invocation_context.artifact_manifest
+
   def request_credential(self, auth_config: AuthConfig) -> None:
     if not self.function_call_id:
       raise ValueError('function_call_id is not set.')
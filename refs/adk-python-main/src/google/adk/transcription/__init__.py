@@ -0,0 +1,37 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from .base_transcription_backend import BaseTranscriptionBackend
+from .google_cloud_speech_transcription_backend import GoogleCloudSpeechTranscriptionBackend
+
+__all__ = [
+    'BaseTranscriptionBackend',
+    'GoogleCloudSpeechTranscriptionBackend',
+    'VoskTranscriptionBackend',
+]
+
+
+def __getattr__(name: str):
+  if name == 'VoskTranscriptionBackend':
+    try:
+      from .vosk_transcription_backend import VoskTranscriptionBackend
+
+      return VoskTranscriptionBackend
+    except ImportError as e:
+      raise ImportError(
+          'VoskTranscriptionBackend requires additional dependencies. '
+          'Please install with: pip install "google-adk[extensions]"'
+      ) from e
+  raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
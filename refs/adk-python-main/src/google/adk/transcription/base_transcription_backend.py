@@ -0,0 +1,64 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import abc
+from typing import AsyncGenerator
+from typing import AsyncIterator
+
+from google.genai import types
+from pydantic import BaseModel
+
+_DEFAULT_SAMPLE_RATE_HERTZ = 16000
+
+
+class BaseTranscriptionBackend(BaseModel):
+  """Abstract base class for speech transcription backends.
+
+  Backends transcribe a stream of audio while it arrives, without blocking the
+  event loop, so live agents can transcribe user audio when the live model's
+  own input transcription is disabled.
+
+  Attributes:
+    language_code: The BCP-47 language code of the audio. Default to "en-US".
+  """
+
+  language_code: str = 'en-US'
+  """The BCP-47 language code of the audio. Default to "en-US"."""
+
+  @abc.abstractmethod
+  def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    """Transcribes audio incrementally while it arrives.
+
+    Args:
+      audio: The chunks of the audio, until the audio ends.
+      mime_type: The MIME type of the audio, e.g. "audio/pcm;rate=16000".
+
+    Yields:
+      Transcriptions of the utterance being spoken, with `finished` unset,
+      and the transcription of each complete utterance, with `finished` set.
+    """
+    pass
+
+  def _get_sample_rate_hertz(self, mime_type: str) -> int:
+    """Returns the sample rate in the "rate" parameter of a MIME type."""
+    for parameter in mime_type.split(';')[1:]:
+      key, _, value = parameter.partition('=')
+      if key.strip() == 'rate' and value.strip().isdigit():
+        return int(value)
+    return _DEFAULT_SAMPLE_RATE_HERTZ
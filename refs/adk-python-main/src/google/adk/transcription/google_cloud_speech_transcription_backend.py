@@ -0,0 +1,67 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from typing import Optional
+
+from google.cloud import speech
+from google.genai import types
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from .base_transcription_backend import BaseTranscriptionBackend
+
+
+class GoogleCloudSpeechTranscriptionBackend(BaseTranscriptionBackend):
+  """Transcribes audio with the streaming API of Google Cloud Speech-to-Text.
+
+  The audio is streamed to the API while it arrives, and interim results are
+  yielded as unfinished transcriptions. Only 16-bit linear PCM audio is
+  supported.
+  """
+
+  _client: Optional[speech.SpeechAsyncClient] = PrivateAttr(default=None)
+
+  @override
+  async def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    if self._client is None:
+      self._client = speech.SpeechAsyncClient()
+    streaming_config = speech.StreamingRecognitionConfig(
+        config=speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=self._get_sample_rate_hertz(mime_type),
+            language_code=self.language_code,
+        ),
+        interim_results=True,
+    )
+
+    async def requests() -> AsyncIterator[speech.StreamingRecognizeRequest]:
+      yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
+      async for data in audio:
+        yield speech.StreamingRecognizeRequest(audio_content=data)
+
+    responses = await self._client.streaming_recognize(requests=requests())
+    async for response in responses:
+      for result in response.results:
+        if result.alternatives:
+          yield types.Transcription(
+              text=result.alternatives[0].transcript,
+              finished=result.is_final,
+          )
@@ -0,0 +1,72 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from typing import Optional
+
+from google.genai import types
+from pydantic import PrivateAttr
+from typing_extensions import override
+import vosk
+
+from .base_transcription_backend import BaseTranscriptionBackend
+
+
+class VoskTranscriptionBackend(BaseTranscriptionBackend):
+  """Transcribes audio on the local CPU with a Vosk model.
+
+  Small Vosk models run in real time on a CPU without network access, e.g. for
+  offline tests. The recognition runs in a worker thread, so it doesn't block
+  the event loop. Only 16-bit mono PCM audio is supported, and the language
+  is the one of the model.
+
+  Attributes:
+    model_path: The directory of the Vosk model.
+  """
+
+  model_path: str
+  """The directory of the Vosk model."""
+
+  _model: Optional[vosk.Model] = PrivateAttr(default=None)
+
+  @override
+  async def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    if self._model is None:
+      self._model = await asyncio.to_thread(vosk.Model, self.model_path)
+    recognizer = vosk.KaldiRecognizer(
+        self._model, self._get_sample_rate_hertz(mime_type)
+    )
+    last_partial = ''
+    async for data in audio:
+      if await asyncio.to_thread(recognizer.AcceptWaveform, data):
+        last_partial = ''
+        text = json.loads(recognizer.Result())['text']
+        if text:
+          yield types.Transcription(text=text, finished=True)
+        continue
+      partial = json.loads(recognizer.PartialResult())['partial']
+      if partial and partial != last_partial:
+        last_partial = partial
+        yield types.Transcription(text=partial, finished=False)
+    text = json.loads(recognizer.FinalResult())['text']
+    if text:
+      yield types.Transcription(text=text, finished=True)
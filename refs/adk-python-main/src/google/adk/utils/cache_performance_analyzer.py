@@ -16,6 +16,10 @@
 
 This module provides tools to analyze cache performance metrics from event
 history, including hit ratios, cost savings, and cache refresh patterns.
+
+To monitor cache efficiency across sessions, use the OpenTelemetry metrics in
+`google.adk.telemetry.context_cache_metrics` instead, which are recorded as
+requests are served and don't require loading sessions.
 """
 
 from __future__ import annotations
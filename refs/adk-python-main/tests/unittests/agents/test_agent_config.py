@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from pathlib import Path
 from typing import Literal
 from typing import Type
+from unittest import mock
 
 from google.adk.agents import config_agent_utils
 from google.adk.agents.agent_config import AgentConfig
@@ -131,6 +133,28 @@ sub_agents: []
   assert config.root.agent_class == agent_class_value
 
 
+def test_parallel_agent_config_completion_options(tmp_path: Path):
+  yaml_content = """\
+agent_class: ParallelAgent
+name: SpecialistsAgent
+sub_agents: []
+event_buffer_size: 8
+completion_config:
+  min_completed_sub_agents: 2
+  timeout_seconds: 30
+"""
+  config_file = tmp_path / "test_config.yaml"
+  config_file.write_text(yaml_content)
+
+  agent = config_agent_utils.from_config(str(config_file))
+
+  assert isinstance(agent, ParallelAgent)
+  assert agent.event_buffer_size == 8
+  assert agent.completion_config.min_completed_sub_agents == 2
+  assert agent.completion_config.timeout_seconds == 30
+  assert agent.completion_config.cancel_on_error
+
+
 @pytest.mark.parametrize(
     "agent_class_value",
     [
@@ -280,3 +304,52 @@ other_field: other value
       config.root.model_dump()
   )
   assert my_custom_config.other_field == "other value"
+
+
+def test_from_config_only_parses_changed_files(tmp_path: Path):
+  sub_agent_file = tmp_path / "sub_agent.yaml"
+  sub_agent_file.write_text("""\
+name: sub_agent
+model: gemini-2.0-flash
+instruction: sub agent instruction
+""")
+  config_file = tmp_path / "root_agent.yaml"
+  config_file.write_text("""\
+name: root_agent
+model: gemini-2.0-flash
+instruction: root agent instruction
+sub_agents:
+  - config_path: sub_agent.yaml
+""")
+
+  with mock.patch.object(
+      AgentConfig, "model_validate", wraps=AgentConfig.model_validate
+  ) as model_validate:
+    agent = config_agent_utils.from_config(str(config_file))
+    assert model_validate.call_count == 2
+
+    reloaded_agent = config_agent_utils.from_config(str(config_file))
+    assert model_validate.call_count == 2
+
+    # Touching a file without changing its content doesn't parse it again.
+    stat = sub_agent_file.stat()
+    os.utime(sub_agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    config_agent_utils.from_config(str(config_file))
+    assert model_validate.call_count == 2
+
+    sub_agent_file.write_text("""\
+name: sub_agent
+model: gemini-2.0-flash
+instruction: changed sub agent instruction
+""")
+    changed_agent = config_agent_utils.from_config(str(config_file))
+    assert model_validate.call_count == 3
+
+  assert reloaded_agent is not agent
+  assert reloaded_agent.sub_agents[0] is not agent.sub_agents[0]
+  assert reloaded_agent.sub_agents[0].parent_agent is reloaded_agent
+  assert agent.sub_agents[0].instruction == "sub agent instruction"
+  assert (
+      changed_agent.sub_agents[0].instruction
+      == "changed sub agent instruction"
+  )
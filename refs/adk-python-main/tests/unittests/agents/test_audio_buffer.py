@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.audio_buffer import ARTIFACT_READER
+from google.adk.agents.audio_buffer import AudioBuffer
+from google.adk.agents.audio_buffer import TRANSCRIPTION_READER
+
+
+def test_read_concatenates_chunks():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm')
+  buffer.append(b'abc', 1.0)
+  buffer.append(b'de', 2.0)
+
+  segment = buffer.read(ARTIFACT_READER)
+
+  assert segment.data == b'abcde'
+  assert segment.timestamp == 1.0
+  assert segment.chunk_count == 2
+  assert len(buffer) == 2
+  assert buffer.size == 5
+
+
+def test_consume_releases_chunks():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm')
+  buffer.append(b'abc', 1.0)
+  segment = buffer.read(ARTIFACT_READER)
+  buffer.append(b'de', 2.0)
+
+  buffer.consume(ARTIFACT_READER, segment.end)
+
+  assert len(buffer) == 1
+  assert buffer.size == 2
+  segment = buffer.read(ARTIFACT_READER)
+  assert segment.data == b'de'
+  assert segment.timestamp == 2.0
+  buffer.consume(ARTIFACT_READER, segment.end)
+  assert buffer.read(ARTIFACT_READER) is None
+  assert len(buffer) == 0
+
+
+def test_ring_wraps_around_without_growing():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm', capacity=8)
+  for i in range(10):
+    chunk = bytes([i]) * 3
+    buffer.append(chunk, float(i))
+
+    segment = buffer.read(ARTIFACT_READER)
+
+    assert segment.data == chunk
+    buffer.consume(ARTIFACT_READER, segment.end)
+  assert len(buffer._ring) == 8
+
+
+def test_ring_grows_when_full():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm', capacity=4)
+  buffer.append(b'abc', 1.0)
+  buffer.consume(ARTIFACT_READER, buffer.read(ARTIFACT_READER).end)
+  buffer.append(b'def', 2.0)  # Wraps around.
+
+  buffer.append(b'ghijk', 3.0)
+
+  assert len(buffer._ring) == 8
+  assert buffer.read(ARTIFACT_READER).data == b'defghijk'
+
+
+def test_chunks_are_kept_until_every_reader_consumed_them():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm')
+  buffer.add_reader(TRANSCRIPTION_READER)
+  buffer.append(b'abc', 1.0)
+  buffer.append(b'de', 2.0)
+
+  buffer.consume(ARTIFACT_READER, buffer.read(ARTIFACT_READER).end)
+
+  assert buffer.read(ARTIFACT_READER) is None
+  assert buffer.get_pending_size(ARTIFACT_READER) == 0
+  assert buffer.get_pending_size(TRANSCRIPTION_READER) == 5
+  assert len(buffer) == 2
+
+  buffer.consume(TRANSCRIPTION_READER, buffer.read(TRANSCRIPTION_READER).end)
+
+  assert len(buffer) == 0
+  assert buffer.size == 0
+
+
+def test_add_reader_starts_at_first_buffered_chunk():
+  buffer = AudioBuffer(role='user', mime_type='audio/pcm')
+  buffer.append(b'abc', 1.0)
+  buffer.consume(ARTIFACT_READER, buffer.read(ARTIFACT_READER).end)
+  buffer.append(b'de', 2.0)
+
+  buffer.add_reader(TRANSCRIPTION_READER)
+  buffer.add_reader(TRANSCRIPTION_READER)
+
+  assert buffer.read(TRANSCRIPTION_READER).data == b'de'
@@ -812,6 +812,40 @@ def test_find_sub_agent(request: pytest.FixtureRequest):
   assert parent.find_sub_agent('not_exist') is None
 
 
+def test_find_sub_agent_after_tree_changes(request: pytest.FixtureRequest):
+  sub_agent_1 = _TestingAgent(name=f'{request.function.__name__}_sub_agent_1')
+  parent = _TestingAgent(
+      name=f'{request.function.__name__}_parent',
+      sub_agents=[sub_agent_1],
+  )
+  assert parent.find_sub_agent(sub_agent_1.name) is sub_agent_1
+
+  # Sub-agents attached after the index was built are still found.
+  sub_agent_2 = _TestingAgent(name=f'{request.function.__name__}_sub_agent_2')
+  sub_agent_2.parent_agent = parent
+  parent.sub_agents.append(sub_agent_2)
+  assert parent.find_sub_agent(sub_agent_2.name) is sub_agent_2
+
+  # Detached sub-agents are no longer found.
+  parent.sub_agents.remove(sub_agent_1)
+  assert parent.find_sub_agent(sub_agent_1.name) is None
+
+
+def test_find_sub_agent_in_clone(request: pytest.FixtureRequest):
+  sub_agent = _TestingAgent(name=f'{request.function.__name__}_sub_agent')
+  parent = _TestingAgent(
+      name=f'{request.function.__name__}_parent',
+      sub_agents=[sub_agent],
+  )
+
+  cloned_parent = parent.clone()
+
+  cloned_sub_agent = cloned_parent.find_sub_agent(sub_agent.name)
+  assert cloned_sub_agent is cloned_parent.sub_agents[0]
+  assert cloned_sub_agent is not sub_agent
+  assert parent.find_sub_agent(sub_agent.name) is sub_agent
+
+
 def test_root_agent(request: pytest.FixtureRequest):
   grand_sub_agent_1 = _TestingAgent(
       name=f'{request.function.__name__}__grand_sub_agent_1'
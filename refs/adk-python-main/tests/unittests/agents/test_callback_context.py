@@ -280,24 +280,18 @@ class TestCallbackContext:
   @pytest.mark.asyncio
   async def test_save_artifact_integration(self, mock_invocation_context):
     """Test save_artifact to ensure credential methods follow same pattern."""
-    # Mock artifact service
-    artifact_service = AsyncMock()
-    artifact_service.save_artifact.return_value = 1
-    mock_invocation_context.artifact_service = artifact_service
+    mock_invocation_context.save_artifact = AsyncMock(return_value=1)
 
     context = CallbackContext(mock_invocation_context)
     test_artifact = Part.from_text(text="test content")
 
     version = await context.save_artifact("test_file.txt", test_artifact)
 
-    artifact_service.save_artifact.assert_called_once_with(
-        app_name="test-app",
-        user_id="test-user",
-        session_id="test-session-id",
-        filename="test_file.txt",
-        artifact=test_artifact,
+    mock_invocation_context.save_artifact.assert_called_once_with(
+        "test_file.txt", test_artifact
     )
     assert version == 1
+    assert context._event_actions.artifact_delta == {"test_file.txt": 1}
 
   @pytest.mark.asyncio
   async def test_load_artifact_integration(self, mock_invocation_context):
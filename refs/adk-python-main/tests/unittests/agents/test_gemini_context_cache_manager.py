@@ -14,6 +14,7 @@
 
 """Tests for GeminiContextCacheManager."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -21,9 +22,13 @@ from unittest.mock import patch
 
 from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.models.cache_metadata import CacheMetadata
+from google.adk.models.context_cache_registry import InMemoryContextCacheRegistry
+from google.adk.models.gemini_context_cache_manager import _extend_chain
+from google.adk.models.gemini_context_cache_manager import _get_content_key
 from google.adk.models.gemini_context_cache_manager import GeminiContextCacheManager
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.function_tool import FunctionTool
 from google.genai import Client
 from google.genai import types
 import pytest
@@ -416,6 +421,156 @@ class TestGeminiContextCacheManager:
 
     assert fingerprint_auto != fingerprint_none
 
+  def test_generate_cache_fingerprint_identifies_contents_by_event_id(self):
+    """Test that contents built from events are fingerprinted by event ID."""
+
+    def create_request_from_events(event_ids):
+      llm_request = self.create_llm_request(contents_count=len(event_ids))
+      for content, event_id in zip(llm_request.contents, event_ids):
+        llm_request.set_content_event_id(content, event_id)
+      return llm_request
+
+    llm_request = create_request_from_events(["e1", "e2", "e3"])
+    fingerprint = self.manager._generate_cache_fingerprint(llm_request, 2)
+
+    # The same events are fingerprinted without serializing their contents.
+    same_events_request = create_request_from_events(["e1", "e2", "e4"])
+    with patch.object(
+        types.Content,
+        "model_dump_json",
+        side_effect=AssertionError("content was serialized"),
+    ):
+      assert (
+          self.manager._generate_cache_fingerprint(same_events_request, 2)
+          == fingerprint
+      )
+
+    other_events_request = create_request_from_events(["e1", "e5", "e3"])
+    assert (
+        self.manager._generate_cache_fingerprint(other_events_request, 2)
+        != fingerprint
+    )
+    # Contents that are not built from events are fingerprinted by value.
+    assert (
+        self.manager._generate_cache_fingerprint(self.create_llm_request(), 2)
+        != fingerprint
+    )
+
+  def test_generate_cache_fingerprint_digests_each_content_once(self):
+    """Test that fingerprints of a request extend the same hash chain."""
+    llm_request = self.create_llm_request(contents_count=4)
+    expected_fingerprints = [
+        GeminiContextCacheManager(
+            genai_client=self.manager.genai_client
+        )._generate_cache_fingerprint(llm_request, count)
+        for count in range(5)
+    ]
+
+    with patch(
+        "google.adk.models.gemini_context_cache_manager._get_content_key",
+        wraps=_get_content_key,
+    ) as mock_get_content_key:
+      fingerprints = [
+          self.manager._generate_cache_fingerprint(llm_request, count)
+          for count in [2, 4, 0, 3, 1, 4]
+      ]
+
+    assert fingerprints == [
+        expected_fingerprints[count] for count in [2, 4, 0, 3, 1, 4]
+    ]
+    assert mock_get_content_key.call_count == 4
+
+    # Contents appended to the request extend the chain.
+    llm_request.contents.append(
+        types.Content(role="user", parts=[types.Part(text="More")])
+    )
+    assert (
+        self.manager._generate_cache_fingerprint(llm_request, 4)
+        == expected_fingerprints[4]
+    )
+    assert self.manager._generate_cache_fingerprint(
+        llm_request, 5
+    ) != self.manager._generate_cache_fingerprint(llm_request, 4)
+
+  async def test_handle_context_caching_extends_previous_step_chain(self):
+    """Test that a step only hashes the contents added since the last step."""
+
+    def create_request_from_events(event_ids, cache_metadata=None):
+      llm_request = self.create_llm_request(
+          cache_metadata=cache_metadata, contents_count=len(event_ids)
+      )
+      for content, event_id in zip(llm_request.contents, event_ids):
+        llm_request.set_content_event_id(content, event_id)
+      return llm_request
+
+    first_step_request = create_request_from_events(["s1", "s2", "s3"])
+    cache_metadata = await GeminiContextCacheManager(
+        self.manager.genai_client
+    ).handle_context_caching(first_step_request)
+
+    next_step_request = create_request_from_events(
+        ["s1", "s2", "s3", "s4", "s5"], cache_metadata=cache_metadata
+    )
+    with patch(
+        "google.adk.models.gemini_context_cache_manager._extend_chain",
+        wraps=_extend_chain,
+    ) as mock_extend_chain:
+      next_cache_metadata = await GeminiContextCacheManager(
+          self.manager.genai_client
+      ).handle_context_caching(next_step_request)
+
+    assert mock_extend_chain.call_count == 2
+    assert next_cache_metadata.fingerprint == GeminiContextCacheManager(
+        self.manager.genai_client
+    )._generate_cache_fingerprint(
+        create_request_from_events(["s1", "s2", "s3", "s4", "s5"]), 5
+    )
+
+    # A step whose history changed doesn't take over the changed contents.
+    changed_step_request = create_request_from_events(
+        ["s1", "s9", "s3", "s4"], cache_metadata=cache_metadata
+    )
+    assert (
+        await GeminiContextCacheManager(
+            self.manager.genai_client
+        ).handle_context_caching(changed_step_request)
+    ).fingerprint == GeminiContextCacheManager(
+        self.manager.genai_client
+    )._generate_cache_fingerprint(
+        create_request_from_events(["s1", "s9", "s3", "s4"]), 4
+    )
+
+  def test_generate_cache_fingerprint_memoizes_declarations_per_tool(self):
+    """Test that the declarations of a tool are only serialized once."""
+
+    def get_weather(city: str) -> str:
+      """Returns the weather in a city."""
+      return city
+
+    tool = FunctionTool(get_weather)
+
+    def create_request_with_tool():
+      llm_request = self.create_llm_request()
+      llm_request.config.tools = None
+      llm_request.append_tools([tool])
+      return llm_request
+
+    fingerprint = GeminiContextCacheManager(
+        self.manager.genai_client
+    )._generate_cache_fingerprint(create_request_with_tool(), 2)
+
+    with patch.object(
+        types.FunctionDeclaration,
+        "model_dump_json",
+        side_effect=AssertionError("declaration was serialized"),
+    ):
+      assert (
+          GeminiContextCacheManager(
+              self.manager.genai_client
+          )._generate_cache_fingerprint(create_request_with_tool(), 2)
+          == fingerprint
+      )
+
   async def test_populate_cache_metadata_in_response_no_invocations_increment(
       self,
   ):
@@ -627,3 +782,43 @@ class TestGeminiContextCacheManager:
     assert result.cache_name is None
     assert result.fingerprint == "test_fp"
     self.manager.genai_client.aio.caches.create.assert_not_called()
+
+  async def test_shared_prefix_cache_is_shared_across_sessions(self):
+    """Test that sessions without a cache share one cache of the prefix."""
+    registry = InMemoryContextCacheRegistry()
+    self.manager.genai_client.aio.caches.create = AsyncMock(
+        return_value=types.CachedContent(name="cachedContents/shared")
+    )
+    cache_config = ContextCacheConfig(share_static_prefix=True)
+    managers = [
+        GeminiContextCacheManager(
+            self.manager.genai_client, cache_registry=registry
+        )
+        for _ in range(3)
+    ]
+    llm_requests = []
+    for _ in managers:
+      llm_request = self.create_llm_request()
+      llm_request.cache_config = cache_config
+      llm_requests.append(llm_request)
+
+    results = await asyncio.gather(*[
+        manager.handle_context_caching(llm_request)
+        for manager, llm_request in zip(managers, llm_requests)
+    ])
+
+    self.manager.genai_client.aio.caches.create.assert_called_once()
+    for result, llm_request in zip(results, llm_requests):
+      # The session itself still has no cache of its own.
+      assert result.cache_name is None
+      assert result.contents_count == 3
+      assert llm_request.config.cached_content == "cachedContents/shared"
+      assert llm_request.config.system_instruction is None
+      assert llm_request.config.tools is None
+      assert len(llm_request.contents) == 3
+
+    key = next(iter(registry._entries))
+    assert registry.get_refcount(key) == 3
+    for manager in managers:
+      await manager.release_shared_cache()
+    assert registry.get_refcount(key) == 0
@@ -229,6 +229,34 @@ class TestInvocationContextWithAppResumablity:
     invocation_context = self._create_test_invocation_context(None)
     assert not invocation_context.is_resumable
 
+  def test_create_view_matches_model_copy(self):
+    """Tests that a view is a shallow copy with the given fields replaced."""
+    invocation_context = self._create_test_invocation_context(
+        ResumabilityConfig(is_resumable=True)
+    )
+    sub_agent = Mock(spec=BaseAgent)
+
+    view = invocation_context._create_view(agent=sub_agent, branch='a.b')
+
+    assert view == invocation_context.model_copy(
+        update={'agent': sub_agent, 'branch': 'a.b'}
+    )
+    assert view.model_fields_set == invocation_context.model_fields_set | {
+        'agent',
+        'branch',
+    }
+    assert invocation_context.agent is not sub_agent
+    assert invocation_context.branch is None
+    # Per-invocation trackers are shared, per-agent flags are not.
+    assert view.session is invocation_context.session
+    assert view.agent_states is invocation_context.agent_states
+    assert (
+        view._invocation_cost_manager
+        is invocation_context._invocation_cost_manager
+    )
+    view.end_invocation = True
+    assert not invocation_context.end_invocation
+
   def test_populate_invocation_agent_states_not_resumable(self):
     """Tests that populate_invocation_agent_states does nothing if not resumable."""
     invocation_context = self._create_test_invocation_context(
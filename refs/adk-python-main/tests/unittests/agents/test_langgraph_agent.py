@@ -236,7 +236,7 @@ async def test_langgraph_agent(
   mock_parent_context.end_invocation = False
   mock_session.events = events_list
   mock_parent_context.invocation_id = "test_invocation_id"
-  mock_parent_context.model_copy.return_value = mock_parent_context
+  mock_parent_context._create_view.return_value = mock_parent_context
   mock_parent_context.plugin_manager = PluginManager(plugins=[])
 
   weather_agent = LangGraphAgent(
@@ -15,12 +15,16 @@
 """Tests for the ParallelAgent."""
 
 import asyncio
+import sys
 from typing import AsyncGenerator
+from unittest import mock
 
+from google.adk.agents import parallel_agent as parallel_agent_module
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.base_agent import BaseAgentState
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.parallel_completion_config import ParallelCompletionConfig
 from google.adk.agents.sequential_agent import SequentialAgent
 from google.adk.agents.sequential_agent import SequentialAgentState
 from google.adk.apps.app import ResumabilityConfig
@@ -307,6 +311,59 @@ async def test_generating_one_event_per_agent_at_once(
     # Asserts on event are done in _TestingAgentWithMultipleEvents.
 
 
+class _TestingAgentWithStreamedEvents(_TestingAgent):
+  """Mock agent that records how many events it generated."""
+
+  generated_count: int = 0
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    for _ in range(5):
+      self.generated_count += 1
+      yield self.event(ctx)
+
+
+@pytest.mark.asyncio
+async def test_buffered_merge_lets_agents_run_ahead(
+    request: pytest.FixtureRequest,
+):
+  agent1 = _TestingAgentWithStreamedEvents(
+      name=f'{request.function.__name__}_test_agent_1'
+  )
+  agent2 = _TestingAgentWithStreamedEvents(
+      name=f'{request.function.__name__}_test_agent_2'
+  )
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=[agent1, agent2],
+      event_buffer_size=3,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  events = []
+  async for event in parallel_agent.run_async(parent_ctx):
+    if not events:
+      # Let the agents generate as many events as the buffer allows.
+      await asyncio.sleep(0.1)
+      # Besides the event being processed, each agent queued two more and
+      # generated a fourth one that waits for a free slot.
+      assert agent1.generated_count == 4
+      assert agent2.generated_count == 4
+    events.append(event)
+
+  assert len(events) == 10
+  for agent in [agent1, agent2]:
+    agent_events = [e for e in events if e.author == agent.name]
+    assert len(agent_events) == 5
+    assert all(
+        e.branch == f'{parallel_agent.name}.{agent.name}' for e in agent_events
+    )
+
+
 @pytest.mark.asyncio
 async def test_run_async_skip_if_no_sub_agent(request: pytest.FixtureRequest):
   parallel_agent = ParallelAgent(
@@ -373,3 +430,167 @@ async def test_stop_agent_if_sub_agent_fails(
     async for _ in agen:
       # The infinite agent could iterate a few times depending on scheduling.
       pass
+
+
+class _TestingAgentWithCleanup(_TestingAgent):
+  """Mock agent that records whether its run was cleaned up."""
+
+  cleaned_up: bool = False
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    try:
+      await asyncio.sleep(self.delay)
+      yield self.event(ctx)
+    finally:
+      self.cleaned_up = True
+
+
+_MERGE_FUNCS = [parallel_agent_module._merge_agent_run_pre_3_11]
+if sys.version_info >= (3, 11):
+  _MERGE_FUNCS.append(parallel_agent_module._merge_agent_run)
+
+
+@pytest.fixture(params=_MERGE_FUNCS, ids=lambda func: func.__name__)
+def merge_func(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+  """Makes the ParallelAgent merge with each supported merge function."""
+  monkeypatch.setattr(parallel_agent_module, '_merge_agent_run', request.param)
+  monkeypatch.setattr(
+      parallel_agent_module, '_merge_agent_run_pre_3_11', request.param
+  )
+  return request.param
+
+
+def _create_agents_with_delays(
+    test_name: str, delays: list[float]
+) -> list[_TestingAgentWithCleanup]:
+  return [
+      _TestingAgentWithCleanup(name=f'{test_name}_test_agent_{i}', delay=delay)
+      for i, delay in enumerate(delays)
+  ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('merge_func')
+@pytest.mark.parametrize(
+    'completion_config',
+    [
+        ParallelCompletionConfig(min_completed_sub_agents=2),
+        ParallelCompletionConfig(quorum=0.5),
+    ],
+)
+async def test_completion_config_cancels_laggards(
+    request: pytest.FixtureRequest,
+    completion_config: ParallelCompletionConfig,
+):
+  sub_agents = _create_agents_with_delays(
+      request.function.__name__, [0, 10, 0.1, 10]
+  )
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=sub_agents,
+      completion_config=completion_config,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  with mock.patch(
+      'google.adk.telemetry.tracing.trace_parallel_branch'
+  ) as mock_trace_parallel_branch:
+    events = await asyncio.wait_for(
+        _collect_events(parallel_agent.run_async(parent_ctx)), timeout=5
+    )
+
+  assert [e.author for e in events] == [sub_agents[0].name, sub_agents[2].name]
+  assert all(sub_agent.cleaned_up for sub_agent in sub_agents)
+  outcomes = {
+      call.args[1].name: call.args[3]
+      for call in mock_trace_parallel_branch.call_args_list
+  }
+  assert outcomes == {
+      sub_agents[0].name: 'completed',
+      sub_agents[1].name: 'cancelled',
+      sub_agents[2].name: 'completed',
+      sub_agents[3].name: 'cancelled',
+  }
+  assert all(
+      call.args[4] >= 0 for call in mock_trace_parallel_branch.call_args_list
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('merge_func')
+async def test_completion_config_deadline_keeps_partial_results(
+    request: pytest.FixtureRequest,
+):
+  sub_agents = _create_agents_with_delays(request.function.__name__, [0, 10])
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=sub_agents,
+      completion_config=ParallelCompletionConfig(timeout_seconds=0.2),
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent, is_resumable=True
+  )
+
+  events = await asyncio.wait_for(
+      _collect_events(parallel_agent.run_async(parent_ctx)), timeout=5
+  )
+
+  assert [e.author for e in events] == [
+      parallel_agent.name,
+      sub_agents[0].name,
+      parallel_agent.name,
+  ]
+  assert events[-1].actions.end_of_agent
+  assert sub_agents[1].cleaned_up
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('merge_func')
+async def test_completion_config_without_cancel_on_error(
+    request: pytest.FixtureRequest,
+):
+  failing_agent = _TestingAgentWithException(
+      name=f'{request.function.__name__}_test_agent_1'
+  )
+  agent2 = _TestingAgent(
+      name=f'{request.function.__name__}_test_agent_2', delay=0.1
+  )
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=[failing_agent, agent2],
+      completion_config=ParallelCompletionConfig(cancel_on_error=False),
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  events = await _collect_events(parallel_agent.run_async(parent_ctx))
+
+  assert [e.author for e in events] == [failing_agent.name, agent2.name]
+
+
+def test_completion_config_rejects_count_and_quorum():
+  with pytest.raises(ValueError):
+    ParallelCompletionConfig(min_completed_sub_agents=1, quorum=0.5)
+
+
+def test_completion_config_required_completions():
+  assert ParallelCompletionConfig().get_required_completions(5) == 5
+  assert (
+      ParallelCompletionConfig(
+          min_completed_sub_agents=7
+      ).get_required_completions(5)
+      == 5
+  )
+  assert ParallelCompletionConfig(quorum=0.5).get_required_completions(5) == 3
+
+
+async def _collect_events(
+    agen: AsyncGenerator[Event, None],
+) -> list[Event]:
+  return [e async for e in agen]
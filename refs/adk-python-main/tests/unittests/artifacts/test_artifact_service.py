@@ -15,21 +15,27 @@
 """Tests for the artifact service."""
 
 import enum
+import itertools
 from typing import Optional
 from typing import Union
 from unittest import mock
 
+from google.adk.artifacts.file_artifact_service import FileArtifactService
 from google.adk.artifacts.gcs_artifact_service import GcsArtifactService
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.api_core import exceptions as gcs_exceptions
 from google.genai import types
 import pytest
 
 Enum = enum.Enum
 
+_generations = itertools.count(1)
+
 
 class ArtifactServiceType(Enum):
   IN_MEMORY = "IN_MEMORY"
   GCS = "GCS"
+  FILE = "FILE"
 
 
 class MockBlob:
@@ -49,16 +55,32 @@ class MockBlob:
     self.name = name
     self.content: Optional[bytes] = None
     self.content_type: Optional[str] = None
+    self.generation = 0
+    self.chunk_size: Optional[int] = None
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: Only upload if the blob has this generation. 0
+          means that the blob must not exist.
+
+    Raises:
+        PreconditionFailed: If if_generation_match doesn't match.
     """
+    if (
+        if_generation_match is not None
+        and if_generation_match != self.generation
+    ):
+      raise gcs_exceptions.PreconditionFailed("Generation mismatch.")
+    self.generation = next(_generations)
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
@@ -76,16 +98,17 @@ class MockBlob:
         bytes: The content of the blob as bytes.
 
     Raises:
-        Exception: If the blob doesn't exist (hasn't been uploaded to).
+        NotFound: If the blob doesn't exist (hasn't been uploaded to).
     """
     if self.content is None:
-      return b""
+      raise gcs_exceptions.NotFound("Blob not found.")
     return self.content
 
   def delete(self) -> None:
     """Mocks deleting a blob."""
     self.content = None
     self.content_type = None
+    self.generation = 0
 
 
 class MockBucket:
@@ -113,6 +136,20 @@ class MockBucket:
       self.blobs[blob_name] = MockBlob(blob_name)
     return self.blobs[blob_name]
 
+  def get_blob(self, blob_name: str) -> Optional[MockBlob]:
+    """Mocks getting an existing Blob object.
+
+    Args:
+        blob_name: The name of the blob.
+
+    Returns:
+        The MockBlob if it exists, otherwise None.
+    """
+    blob = self.blobs.get(blob_name)
+    if blob is None or blob.content is None:
+      return None
+    return blob
+
 
 class MockClient:
   """Mocks the GCS Client."""
@@ -128,12 +165,13 @@ class MockClient:
     return self.buckets[bucket_name]
 
   def list_blobs(self, bucket: MockBucket, prefix: Optional[str] = None):
-    """Mocks listing blobs in a bucket, optionally with a prefix."""
-    if prefix:
-      return [
-          blob for name, blob in bucket.blobs.items() if name.startswith(prefix)
-      ]
-    return list(bucket.blobs.values())
+    """Mocks listing the existing blobs in a bucket, optionally with a prefix."""
+    return [
+        blob
+        for name, blob in bucket.blobs.items()
+        if blob.content is not None
+        and (not prefix or name.startswith(prefix))
+    ]
 
 
 def mock_gcs_artifact_service():
@@ -143,20 +181,28 @@ def mock_gcs_artifact_service():
 
 def get_artifact_service(
     service_type: ArtifactServiceType = ArtifactServiceType.IN_MEMORY,
+    root_dir: Optional[str] = None,
 ):
   """Creates an artifact service for testing."""
   if service_type == ArtifactServiceType.GCS:
     return mock_gcs_artifact_service()
+  if service_type == ArtifactServiceType.FILE:
+    return FileArtifactService(root_dir=root_dir)
   return InMemoryArtifactService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
-async def test_load_empty(service_type):
+async def test_load_empty(service_type, tmp_path):
   """Tests loading an artifact when none exists."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, str(tmp_path))
   assert not await artifact_service.load_artifact(
       app_name="test_app",
       user_id="test_user",
@@ -167,11 +213,16 @@ async def test_load_empty(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
-async def test_save_load_delete(service_type):
+async def test_save_load_delete(service_type, tmp_path):
   """Tests saving, loading, and deleting an artifact."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, str(tmp_path))
   artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
   app_name = "app0"
   user_id = "user0"
@@ -211,11 +262,16 @@ async def test_save_load_delete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
-async def test_list_keys(service_type):
+async def test_list_keys(service_type, tmp_path):
   """Tests listing keys in the artifact service."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, str(tmp_path))
   artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
   app_name = "app0"
   user_id = "user0"
@@ -242,11 +298,16 @@ async def test_list_keys(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
-async def test_list_versions(service_type):
+async def test_list_versions(service_type, tmp_path):
   """Tests listing versions of an artifact."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, str(tmp_path))
 
   app_name = "app0"
   user_id = "user0"
@@ -322,3 +383,263 @@ async def test_list_keys_preserves_user_prefix():
   # Should contain prefixed names and session file
   expected_keys = ["user:document.pdf", "user:image.png", "session_file.txt"]
   assert sorted(artifact_keys) == sorted(expected_keys)
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_and_load_latest_use_version_pointer():
+  """Tests that the latest version is found without listing all versions."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=artifact,
+  )
+
+  with mock.patch.object(
+      artifact_service.storage_client,
+      "list_blobs",
+      side_effect=AssertionError("list_blobs should not be called."),
+  ):
+    version = await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        artifact=types.Part.from_text(text="hello"),
+    )
+    loaded_artifact = await artifact_service.load_artifact(
+        app_name="app0", user_id="user0", session_id="123", filename="file"
+    )
+
+  assert version == 1
+  assert loaded_artifact.inline_data.data == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_skips_versions_taken_by_concurrent_writers():
+  """Tests that a version created by another writer is never overwritten."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=artifact,
+  )
+  # Another writer created version 1 but didn't advance the pointer yet.
+  artifact_service.bucket.blob("app0/user0/123/file/1").upload_from_string(
+      b"other_data", if_generation_match=0
+  )
+
+  version = await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=artifact,
+  )
+
+  assert version == 2
+  assert (
+      artifact_service.bucket.blob("app0/user0/123/file/1").content
+      == b"other_data"
+  )
+  assert (
+      await artifact_service.list_versions(
+          app_name="app0", user_id="user0", session_id="123", filename="file"
+      )
+      == [0, 1, 2]
+  )
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_gives_up_advancing_contended_version_pointer():
+  """Tests that a version pointer that keeps changing doesn't block saves."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=artifact,
+  )
+
+  # Every read sees a pointer generation that is stale by the time it is
+  # written, as if other writers kept updating it.
+  with mock.patch.object(
+      artifact_service, "_read_version_pointer", return_value=(None, -1)
+  ) as mock_read_version_pointer:
+    version = await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        artifact=artifact,
+    )
+
+  assert version == 1
+  assert mock_read_version_pointer.call_count == 11
+  assert (
+      artifact_service.bucket.blob("app0/user0/123/file/1").content
+      == b"test_data"
+  )
+
+
+@pytest.mark.asyncio
+async def test_gcs_list_artifact_keys_is_cached():
+  """Tests that listings are cached until an artifact is saved."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file0",
+      artifact=artifact,
+  )
+
+  with mock.patch.object(
+      artifact_service.storage_client,
+      "list_blobs",
+      wraps=artifact_service.storage_client.list_blobs,
+  ) as mock_list_blobs:
+    for _ in range(3):
+      assert await artifact_service.list_artifact_keys(
+          app_name="app0", user_id="user0", session_id="123"
+      ) == ["file0"]
+    assert mock_list_blobs.call_count == 2
+
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file1",
+        artifact=artifact,
+    )
+    assert await artifact_service.list_artifact_keys(
+        app_name="app0", user_id="user0", session_id="123"
+    ) == ["file0", "file1"]
+
+
+def _count_blobs(root_dir) -> int:
+  return sum(1 for path in (root_dir / "blobs").rglob("*") if path.is_file())
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_deduplicates_contents(tmp_path):
+  """Tests that identical contents are stored once and freed when unused."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+
+  for user_id in ["user0", "user1"]:
+    for _ in range(2):
+      await artifact_service.save_artifact(
+          app_name="app0",
+          user_id=user_id,
+          session_id="123",
+          filename="file",
+          artifact=artifact,
+      )
+  assert _count_blobs(tmp_path) == 1
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  assert _count_blobs(tmp_path) == 1
+  assert (
+      await artifact_service.load_artifact(
+          app_name="app0", user_id="user1", session_id="123", filename="file"
+      )
+      == artifact
+  )
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user1", session_id="123", filename="file"
+  )
+  assert _count_blobs(tmp_path) == 0
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_versions_and_metadata(tmp_path):
+  """Tests that versions, their metadata and contents survive a restart."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      filename="user:notes",
+      artifact=types.Part.from_text(text="first"),
+      custom_metadata={"source": "test"},
+  )
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      filename="user:notes",
+      artifact=types.Part(
+          file_data=types.FileData(
+              file_uri="gs://bucket/notes.txt", mime_type="text/plain"
+          )
+      ),
+  )
+
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  artifact_versions = await artifact_service.list_artifact_versions(
+      app_name="app0", user_id="user0", filename="user:notes"
+  )
+
+  assert [v.version for v in artifact_versions] == [0, 1]
+  assert artifact_versions[0].custom_metadata == {"source": "test"}
+  assert artifact_versions[1].canonical_uri == "gs://bucket/notes.txt"
+  assert await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", filename="user:notes", version=0
+  ) == types.Part.from_text(text="first")
+  latest_version = await artifact_service.get_artifact_version(
+      app_name="app0", user_id="user0", filename="user:notes"
+  )
+  assert latest_version.version == 1
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_streaming(tmp_path):
+  """Tests saving and loading an artifact as a stream of chunks."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  chunks = [b"a" * 10, b"b" * 10, b"c" * 5]
+
+  async def generate_chunks():
+    for chunk in chunks:
+      yield chunk
+
+  version = await artifact_service.save_artifact_stream(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="large_file",
+      chunks=generate_chunks(),
+      mime_type="application/octet-stream",
+  )
+
+  assert version == 0
+  loaded_chunks = [
+      chunk
+      async for chunk in artifact_service.load_artifact_stream(
+          app_name="app0",
+          user_id="user0",
+          session_id="123",
+          filename="large_file",
+          chunk_size=8,
+      )
+  ]
+  assert b"".join(loaded_chunks) == b"".join(chunks)
+  assert max(len(chunk) for chunk in loaded_chunks) == 8
+  buffer = await artifact_service.load_artifact_buffer(
+      app_name="app0", user_id="user0", session_id="123", filename="large_file"
+  )
+  assert buffer.tobytes() == b"".join(chunks)
+  artifact = await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="large_file"
+  )
+  assert artifact.inline_data.mime_type == "application/octet-stream"
@@ -19,6 +19,7 @@ import os
 from pathlib import Path
 import sys
 import tempfile
+import threading
 import time
 from typing import Any
 from typing import Optional
@@ -26,20 +27,30 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import click
 from fastapi.testclient import TestClient
 from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.apps.app import App
 from google.adk.cli.fast_api import get_fast_api_app
+from google.adk.cli.utils.base_agent_loader import BaseAgentLoader
+from google.adk.evaluation.database_eval_set_results_manager import DatabaseEvalSetResultsManager
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_metrics import EvalMetricResult
+from google.adk.evaluation.eval_result import EvalCaseResult
 from google.adk.evaluation.eval_result import EvalSetResult
 from google.adk.evaluation.eval_set import EvalSet
+from google.adk.evaluation.evaluator import EvalStatus
 from google.adk.evaluation.in_memory_eval_sets_manager import InMemoryEvalSetsManager
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
 from google.adk.runners import Runner
 from google.adk.sessions.base_session_service import ListSessionsResponse
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
 from google.genai import types
 from pydantic import BaseModel
@@ -178,7 +189,7 @@ def test_session_info():
 @pytest.fixture
 def mock_agent_loader():
 
-  class MockAgentLoader:
+  class MockAgentLoader(BaseAgentLoader):
 
     def __init__(self, agents_dir: str):
       pass
@@ -315,6 +326,15 @@ def mock_artifact_service():
       # Get the latest version
       return sorted(artifacts[key], key=lambda x: x["version"])[-1]["artifact"]
 
+    async def save_artifact(
+        self, app_name, user_id, filename, artifact, session_id=None
+    ):
+      """Save a new version of an artifact."""
+      key = f"{app_name}:{user_id}:{session_id}:{filename}"
+      versions = artifacts.setdefault(key, [])
+      versions.append({"version": len(versions), "artifact": artifact})
+      return len(versions) - 1
+
     async def list_artifact_keys(self, app_name, user_id, session_id):
       """List artifact names for a session."""
       prefix = f"{app_name}:{user_id}:{session_id}:"
@@ -683,6 +703,27 @@ def test_get_session(test_app, create_test_session):
   logger.info(f"Retrieved session: {data['id']}")
 
 
+def test_get_session_not_modified(test_app, create_test_session):
+  """Test that an unchanged session isn't sent again."""
+  info = create_test_session
+  url = f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/{info['session_id']}"
+  response = test_app.get(url)
+  etag = response.headers["etag"]
+
+  not_modified = test_app.get(url, headers={"If-None-Match": etag})
+  weak_not_modified = test_app.get(
+      url, headers={"If-None-Match": f'"other", W/{etag}'}
+  )
+  modified = test_app.get(url, headers={"If-None-Match": '"other"'})
+
+  assert not_modified.status_code == 304
+  assert not_modified.headers["etag"] == etag
+  assert not not_modified.content
+  assert weak_not_modified.status_code == 304
+  assert modified.status_code == 200
+  assert modified.json() == response.json()
+
+
 def test_list_sessions(test_app, create_test_session):
   """Test listing all sessions for a user."""
   info = create_test_session
@@ -846,6 +887,48 @@ def test_agent_run_passes_state_delta(test_app, create_test_session):
   assert data[3]["actions"]["stateDelta"] == payload["state_delta"]
 
 
+def test_agent_run_sse_with_text_deltas(
+    test_app, create_test_session, monkeypatch
+):
+  """Test that /run_sse sends streamed text as text deltas when requested."""
+
+  async def streaming_run_async(self, **kwargs):
+    for text in ("Hello", " wor", "ld"):
+      yield Event(
+          author="dummy agent",
+          invocation_id="invocation_id",
+          content=types.Content(role="model", parts=[types.Part(text=text)]),
+          partial=True,
+      )
+    yield _event_1()
+
+  monkeypatch.setattr(Runner, "run_async", streaming_run_async)
+  info = create_test_session
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+      "streaming": True,
+      "sseTextDeltas": True,
+  }
+
+  response = test_app.post("/run_sse", json=payload)
+
+  assert response.status_code == 200
+  frames = response.text.removesuffix("\n\n").split("\n\n")
+  assert [frame.split(":")[0] for frame in frames] == [
+      "data",
+      "event",
+      "event",
+      "data",
+  ]
+  assert frames[1].startswith("event: text_delta\ndata: ")
+  delta = json.loads(frames[1].split("\ndata: ")[1])
+  assert delta["text"] == " wor"
+  assert json.loads(frames[3].removeprefix("data: "))["author"] == "dummy agent"
+
+
 def test_list_artifact_names(test_app, create_test_session):
   """Test listing artifact names for a session."""
   info = create_test_session
@@ -859,6 +942,35 @@ def test_list_artifact_names(test_app, create_test_session):
   logger.info(f"Listed {len(data)} artifacts")
 
 
+@pytest.mark.asyncio
+async def test_load_artifact_not_modified(
+    test_app, create_test_session, mock_artifact_service
+):
+  """Test that an unchanged artifact isn't sent again."""
+  info = create_test_session
+  for text in ("v0", "v1"):
+    await mock_artifact_service.save_artifact(
+        app_name=info["app_name"],
+        user_id=info["user_id"],
+        session_id=info["session_id"],
+        filename="report.txt",
+        artifact=types.Part(text=text),
+    )
+  url = f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/{info['session_id']}/artifacts/report.txt"
+  response = test_app.get(url)
+  etag = response.headers["etag"]
+
+  not_modified = test_app.get(url, headers={"If-None-Match": etag})
+  version_0 = test_app.get(
+      f"{url}/versions/0", headers={"If-None-Match": etag}
+  )
+
+  assert response.json() == {"text": "v1"}
+  assert not_modified.status_code == 304
+  assert version_0.status_code == 200
+  assert version_0.json() == {"text": "v0"}
+
+
 def test_create_eval_set(test_app, test_session_info):
   """Test creating an eval set."""
   url = f"/apps/{test_session_info['app_name']}/eval_sets/test_eval_set_id"
@@ -967,6 +1079,126 @@ def test_list_metrics_info(test_app):
     assert "metricValueInfo" in metric
 
 
+def test_list_eval_metric_summaries_requires_database(test_app):
+  """Test that metric summaries are only served from a database store."""
+  response = test_app.get("/apps/test_app/eval-metric-summaries")
+
+  assert response.status_code == 400
+
+
+def test_list_eval_metric_summaries(
+    tmp_path,
+    mock_session_service,
+    mock_artifact_service,
+    mock_memory_service,
+    mock_agent_loader,
+    mock_eval_sets_manager,
+):
+  """Test listing metric summaries from a database eval results store."""
+  db_url = f"sqlite:///{tmp_path / 'eval_results.db'}"
+  with (
+      patch("signal.signal", return_value=None),
+      patch(
+          "google.adk.cli.fast_api.InMemorySessionService",
+          return_value=mock_session_service,
+      ),
+      patch(
+          "google.adk.cli.fast_api.InMemoryArtifactService",
+          return_value=mock_artifact_service,
+      ),
+      patch(
+          "google.adk.cli.fast_api.InMemoryMemoryService",
+          return_value=mock_memory_service,
+      ),
+      patch(
+          "google.adk.cli.fast_api.AgentLoader",
+          return_value=mock_agent_loader,
+      ),
+      patch(
+          "google.adk.cli.fast_api.LocalEvalSetsManager",
+          return_value=mock_eval_sets_manager,
+      ),
+  ):
+    client = TestClient(
+        get_fast_api_app(
+            agents_dir=".",
+            web=True,
+            session_service_uri="",
+            artifact_service_uri="",
+            memory_service_uri="",
+            eval_results_db_url=db_url,
+        )
+    )
+  DatabaseEvalSetResultsManager(db_url).save_eval_set_result(
+      "test_app",
+      "test_eval_set_id",
+      [
+          EvalCaseResult(
+              eval_set_id="test_eval_set_id",
+              eval_id="test_eval_case_id",
+              final_eval_status=EvalStatus.PASSED,
+              overall_eval_metric_results=[
+                  EvalMetricResult(
+                      metric_name="tool_trajectory_avg_score",
+                      threshold=0.5,
+                      score=1.0,
+                      eval_status=EvalStatus.PASSED,
+                  )
+              ],
+              eval_metric_result_per_invocation=[],
+              session_id="test_session_id",
+          )
+      ],
+  )
+
+  response = client.get(
+      "/apps/test_app/eval-metric-summaries",
+      params={"metric_name": "tool_trajectory_avg_score"},
+  )
+
+  assert response.status_code == 200
+  summaries = response.json()["evalMetricSummaries"]
+  assert len(summaries) == 1
+  assert summaries[0]["evalSetId"] == "test_eval_set_id"
+  assert summaries[0]["numPassed"] == 1
+  assert summaries[0]["passRate"] == 1.0
+
+
+def test_run_live_with_binary_frames(
+    test_app, create_test_session, monkeypatch
+):
+  """Test that live audio is exchanged as binary frames when requested."""
+
+  async def echo_run_live(self, session, live_request_queue):
+    live_request = await live_request_queue.get()
+    yield Event(
+        author="dummy agent",
+        invocation_id="invocation_id",
+        content=types.Content(
+            role="model", parts=[types.Part(inline_data=live_request.blob)]
+        ),
+    )
+    yield _event_1()
+
+  monkeypatch.setattr(Runner, "run_live", echo_run_live)
+  info = create_test_session
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}"
+  )
+  frame = b"\x14audio/pcm;rate=16000\x00\x01\x02\x03"
+
+  with test_app.websocket_connect(
+      url, subprotocols=["adk.live.binary.v1"]
+  ) as websocket:
+    assert websocket.accepted_subprotocol == "adk.live.binary.v1"
+    websocket.send_bytes(frame)
+
+    assert websocket.receive_bytes() == frame
+    event = json.loads(websocket.receive_text())
+    assert event["content"]["parts"][0]["text"] == "LLM reply"
+
+
 def test_debug_trace(test_app):
   """Test the debug trace endpoint."""
   # This test will likely return 404 since we haven't set up trace data,
@@ -1029,6 +1261,235 @@ def test_get_event_graph_returns_dot_src_for_app_agent():
   assert "dotSrc" in response.json()
 
 
+def test_list_sessions_and_get_session_projection():
+  """Test paginating sessions and getting sessions without their events."""
+  from google.adk.cli.adk_web_server import AdkWebServer
+
+  session_service = InMemorySessionService()
+  for i in range(3):
+    session = asyncio.run(
+        session_service.create_session(
+            app_name="test_app", user_id="user", session_id=f"session{i}"
+        )
+    )
+    asyncio.run(
+        session_service.append_event(
+            session, Event(author="user", timestamp=time.time() + i)
+        )
+    )
+  adk_web_server = AdkWebServer(
+      agent_loader=MagicMock(),
+      session_service=session_service,
+      memory_service=MagicMock(),
+      artifact_service=MagicMock(),
+      credential_service=MagicMock(),
+      eval_sets_manager=MagicMock(),
+      eval_set_results_manager=MagicMock(),
+      agents_dir=".",
+  )
+  client = TestClient(
+      adk_web_server.get_fast_api_app(
+          setup_observer=lambda _observer, _server: None,
+          tear_down_observer=lambda _observer, _server: None,
+      )
+  )
+  url = "/apps/test_app/users/user/sessions"
+
+  first_page = client.get(url, params={"page_size": 2})
+  second_page = client.get(
+      url,
+      params={
+          "page_size": 2,
+          "page_token": first_page.headers["x-next-page-token"],
+      },
+  )
+  invalid_page = client.get(url, params={"page_token": "invalid"})
+  metadata = client.get(f"{url}/session0", params={"projection": "metadata"})
+  event_ids = client.get(f"{url}/session0", params={"projection": "event_ids"})
+
+  assert [s["id"] for s in first_page.json()] == ["session2", "session1"]
+  assert [s["id"] for s in second_page.json()] == ["session0"]
+  assert "x-next-page-token" not in second_page.headers
+  assert invalid_page.status_code == 400
+  assert metadata.json()["events"] == []
+  assert [set(e) for e in event_ids.json()["events"]] == [
+      {"id", "invocationId", "author", "timestamp", "actions"}
+  ]
+
+
+def test_warm_up_builds_runners_and_llms():
+  """Test that warming up the server prepares the runners and LLMs of apps."""
+  from google.adk.cli.adk_web_server import AdkWebServer
+
+  class WarmUpLlm(BaseLlm):
+    warmed_up: bool = False
+
+    async def generate_content_async(self, llm_request, stream=False):
+      yield LlmResponse()
+
+    async def warm_up(self):
+      self.warmed_up = True
+
+  root_llm = WarmUpLlm(model="root")
+  sub_llm = WarmUpLlm(model="sub")
+  app_agent = LlmAgent(
+      name="root",
+      model=root_llm,
+      sub_agents=[LlmAgent(name="sub", model=sub_llm)],
+  )
+
+  class Loader(BaseAgentLoader):
+
+    def load_agent(self, app_name):
+      if app_name == "broken_app":
+        raise ValueError("Broken agent")
+      return app_agent
+
+    def list_agents(self):
+      return ["broken_app", "test_app"]
+
+  adk_web_server = AdkWebServer(
+      agent_loader=Loader(),
+      session_service=InMemorySessionService(),
+      memory_service=MagicMock(),
+      artifact_service=MagicMock(),
+      credential_service=MagicMock(),
+      eval_sets_manager=MagicMock(),
+      eval_set_results_manager=MagicMock(),
+      agents_dir=".",
+  )
+  app = adk_web_server.get_fast_api_app(
+      setup_observer=lambda _observer, _server: None,
+      tear_down_observer=lambda _observer, _server: None,
+      warm_up=True,
+  )
+
+  with TestClient(app) as client:
+    readiness = client.get("/ready")
+    assert list(adk_web_server.runner_dict) == ["test_app"]
+    assert root_llm.warmed_up
+    assert sub_llm.warmed_up
+
+  assert readiness.status_code == 200
+  assert readiness.json() == {
+      "ready": True,
+      "failedApps": {"broken_app": "Broken agent"},
+  }
+
+
+def test_warm_up_in_background():
+  """Test that the app reports when it's warmed up in the background."""
+  from google.adk.cli.adk_web_server import AdkWebServer
+
+  loading = threading.Event()
+
+  class Loader(BaseAgentLoader):
+
+    def load_agent(self, app_name):
+      loading.wait(timeout=10)
+      return root_agent
+
+    def list_agents(self):
+      return ["test_app"]
+
+  adk_web_server = AdkWebServer(
+      agent_loader=Loader(),
+      session_service=InMemorySessionService(),
+      memory_service=MagicMock(),
+      artifact_service=MagicMock(),
+      credential_service=MagicMock(),
+      eval_sets_manager=MagicMock(),
+      eval_set_results_manager=MagicMock(),
+      agents_dir=".",
+  )
+  app = adk_web_server.get_fast_api_app(
+      setup_observer=lambda _observer, _server: None,
+      tear_down_observer=lambda _observer, _server: None,
+      warm_up=True,
+      wait_for_warm_up=False,
+  )
+
+  with TestClient(app) as client:
+    warming_up = client.get("/ready")
+    loading.set()
+    deadline = time.monotonic() + 10
+    while (ready := client.get("/ready")).status_code != 200:
+      assert time.monotonic() < deadline
+      time.sleep(0.01)
+
+  assert warming_up.status_code == 503
+  assert warming_up.json()["ready"] is False
+  assert ready.json() == {"ready": True, "failedApps": {}}
+
+
+def test_multi_worker_app(
+    tmp_path, mock_artifact_service, mock_memory_service, mock_agent_loader
+):
+  """Test that the workers of an app share their state through storage."""
+  (tmp_path / "test_app").mkdir()
+
+  def get_worker_app():
+    with (
+        patch("signal.signal", return_value=None),
+        patch(
+            "google.adk.cli.fast_api.InMemoryArtifactService",
+            return_value=mock_artifact_service,
+        ),
+        patch(
+            "google.adk.cli.fast_api.InMemoryMemoryService",
+            return_value=mock_memory_service,
+        ),
+        patch(
+            "google.adk.cli.fast_api.AgentLoader",
+            return_value=mock_agent_loader,
+        ),
+    ):
+      return get_fast_api_app(
+          agents_dir=str(tmp_path),
+          web=False,
+          session_service_uri=f"sqlite:///{tmp_path / 'sessions.db'}",
+          workers=2,
+      )
+
+  with (
+      TestClient(get_worker_app()) as worker,
+      TestClient(get_worker_app()) as other_worker,
+  ):
+    created = worker.post("/apps/test_app/users/user/sessions")
+    session_id = created.json()["id"]
+    fetched = other_worker.get(
+        f"/apps/test_app/users/user/sessions/{session_id}"
+    )
+    worker.post("/apps/test_app/eval_sets/test_eval_set_id")
+    eval_sets = other_worker.get("/apps/test_app/eval-sets")
+    event_trace = worker.get("/debug/trace/event_id")
+    session_trace = worker.get(f"/debug/trace/session/{session_id}")
+
+  assert fetched.status_code == 200
+  assert (
+      created.headers["x-session-affinity"]
+      == fetched.headers["x-session-affinity"]
+  )
+  assert eval_sets.json()["evalSetIds"] == ["test_eval_set_id"]
+  assert event_trace.status_code == 404
+  assert "multiple workers" in event_trace.json()["detail"]
+  assert session_trace.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"session_service_uri": "sqlite://", "reload_agents": True},
+        {"session_service_uri": "sqlite://", "a2a": True},
+    ],
+)
+def test_multi_worker_app_rejects_in_memory_state(kwargs):
+  """Test that multiple workers can't be used with state kept in memory."""
+  with pytest.raises(click.ClickException):
+    get_fast_api_app(agents_dir=".", web=False, workers=2, **kwargs)
+
+
 @pytest.mark.skipif(
     sys.version_info < (3, 10), reason="A2A requires Python 3.10+"
 )
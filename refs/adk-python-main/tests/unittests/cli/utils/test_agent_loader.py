@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import os
 from pathlib import Path
 import sys
 import tempfile
 from textwrap import dedent
+from unittest import mock
 
+from google.adk.cli.utils.agent_change_handler import AgentChangeEventHandler
 from google.adk.cli.utils.agent_loader import AgentLoader
+from google.adk.cli.utils.shared_value import SharedValue
 from pydantic import ValidationError
 import pytest
 
@@ -887,3 +891,137 @@ class TestAgentLoader:
       # Verify they are different agents
       assert default_agent.name != custom_agent.name
       assert explicit_agent.name == default_agent.name
+
+  def test_preload_agents_reports_errors(self):
+    """Test that preloading loads all agents and reports the broken ones."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+      temp_path = Path(temp_dir)
+      self.create_agent_structure(
+          temp_path, "preloaded_agent", "package_with_root"
+      )
+      self.create_agent_structure(
+          temp_path, "preloaded_agent_module", "package_with_agent_module"
+      )
+      (temp_path / "preloaded_broken_agent").mkdir()
+      (temp_path / "preloaded_broken_agent" / "__init__.py").write_text(
+          "raise RuntimeError('Broken agent')"
+      )
+
+      loader = AgentLoader(str(temp_path))
+      errors = loader.preload_agents(max_workers=3)
+
+      assert list(errors) == [
+          "preloaded_agent",
+          "preloaded_agent_module",
+          "preloaded_broken_agent",
+      ]
+      assert errors["preloaded_agent"] is None
+      assert errors["preloaded_agent_module"] is None
+      assert "Broken agent" in str(errors["preloaded_broken_agent"])
+      assert loader._agent_cache["preloaded_agent"].name == "preloaded_agent"
+
+  def test_preload_agents_applies_each_agents_dotenv(self):
+    """Test that an agent isn't imported while another agent's .env applies."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+      temp_path = Path(temp_dir)
+      for agent_name in ["dotenv_agent_a", "dotenv_agent_b"]:
+        agent_dir = temp_path / agent_name
+        agent_dir.mkdir()
+        (agent_dir / ".env").write_text(f"ADK_TEST_DOTENV_AGENT={agent_name}")
+        (agent_dir / "__init__.py").write_text(dedent("""
+            import os
+            import time
+
+            from google.adk.agents.base_agent import BaseAgent
+
+            agent_name = os.environ["ADK_TEST_DOTENV_AGENT"]
+            # Give the other agent the time to apply its .env file.
+            time.sleep(0.2)
+            assert os.environ["ADK_TEST_DOTENV_AGENT"] == agent_name
+            root_agent = BaseAgent(name=agent_name)
+            """))
+
+      loader = AgentLoader(str(temp_path))
+      try:
+        errors = loader.preload_agents(max_workers=2)
+      finally:
+        os.environ.pop("ADK_TEST_DOTENV_AGENT", None)
+
+      assert errors == {"dotenv_agent_a": None, "dotenv_agent_b": None}
+      assert loader.load_agent("dotenv_agent_a").name == "dotenv_agent_a"
+      assert loader.load_agent("dotenv_agent_b").name == "dotenv_agent_b"
+
+  def test_concurrent_loads_load_agent_once(self):
+    """Test that an agent loaded from several threads is loaded once."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+      temp_path = Path(temp_dir)
+      self.create_agent_structure(
+          temp_path, "concurrent_agent", "package_with_agent_module"
+      )
+
+      loader = AgentLoader(str(temp_path))
+      with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        agents = list(executor.map(loader.load_agent, ["concurrent_agent"] * 8))
+
+      assert all(agent is agents[0] for agent in agents)
+
+  def test_reload_agent_swaps_in_new_agent(self):
+    """Test that reloading an agent replaces it once the new one is loaded."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+      temp_path = Path(temp_dir)
+      self.create_agent_structure(
+          temp_path, "reloaded_agent", "package_with_agent_module"
+      )
+      agent_file = temp_path / "reloaded_agent" / "agent.py"
+
+      loader = AgentLoader(str(temp_path))
+      agent = loader.load_agent("reloaded_agent")
+      agent_file.write_text(
+          agent_file.read_text().replace(
+              'name="reloaded_agent"', 'name="reloaded_agent_v2"'
+          )
+      )
+      reloaded_agent = loader.reload_agent("reloaded_agent")
+
+      assert reloaded_agent is not agent
+      assert reloaded_agent.name == "reloaded_agent_v2"
+      assert loader.load_agent("reloaded_agent") is reloaded_agent
+
+  def test_reload_agent_keeps_previous_agent_on_error(self):
+    """Test that a failed reload keeps the previous agent and its modules."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+      temp_path = Path(temp_dir)
+      self.create_agent_structure(
+          temp_path, "failed_reload_agent", "package_with_agent_module"
+      )
+      agent_file = temp_path / "failed_reload_agent" / "agent.py"
+
+      loader = AgentLoader(str(temp_path))
+      agent = loader.load_agent("failed_reload_agent")
+      agent_module = sys.modules["failed_reload_agent.agent"]
+      agent_file.write_text("raise RuntimeError('Broken agent')")
+
+      with pytest.raises(RuntimeError, match="Broken agent"):
+        loader.reload_agent("failed_reload_agent")
+
+      assert loader.load_agent("failed_reload_agent") is agent
+      assert sys.modules["failed_reload_agent.agent"] is agent_module
+
+  def test_agent_change_handler_reloads_current_app(self):
+    """Test that file changes reload the app and mark its runner for cleanup."""
+    loader = mock.create_autospec(AgentLoader, instance=True)
+    runners_to_clean = set()
+    handler = AgentChangeEventHandler(
+        agent_loader=loader,
+        runners_to_clean=runners_to_clean,
+        current_app_name_ref=SharedValue(value="test_app"),
+    )
+
+    loader.reload_agent.side_effect = RuntimeError("Broken agent")
+    handler.on_modified(mock.Mock(src_path="test_app/agent.py"))
+    assert not runners_to_clean
+
+    loader.reload_agent.side_effect = None
+    handler.on_modified(mock.Mock(src_path="test_app/agent.py"))
+    loader.reload_agent.assert_called_with("test_app")
+    assert runners_to_clean == {"test_app"}
@@ -488,6 +488,34 @@ def test_cli_api_server_invokes_uvicorn(
   assert _patch_uvicorn.calls, "uvicorn.Server.run must be called"
 
 
+def test_cli_api_server_with_workers(
+    tmp_path: Path, _patch_uvicorn: _Recorder, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """`adk api_server --workers` should serve the app from forked workers."""
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  mock_get_app = _Recorder()
+  mock_serve = _Recorder()
+  monkeypatch.setattr(cli_tools_click, "get_fast_api_app", mock_get_app)
+  monkeypatch.setattr(cli_tools_click, "serve_with_workers", mock_serve)
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      [
+          "api_server",
+          str(agents_dir),
+          "--session_service_uri",
+          "sqlite:///test.db",
+          "--workers",
+          "4",
+      ],
+  )
+  assert result.exit_code == 0
+  assert mock_get_app.calls[0][1]["workers"] == 4
+  assert mock_serve.calls[0][0][1] == 4
+  assert not _patch_uvicorn.calls
+
+
 def test_cli_web_passes_service_uris(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _patch_uvicorn: _Recorder
 ) -> None:
@@ -643,6 +671,40 @@ def test_cli_create_eval_set(tmp_path: Path):
   assert eval_set_data["eval_cases"] == []
 
 
+def test_cli_create_and_convert_jsonl_eval_set(tmp_path: Path):
+  app_name = "test_app"
+  eval_set_id = "test_eval_set"
+  agent_path = tmp_path / app_name
+  agent_path.mkdir()
+  (agent_path / "__init__.py").touch()
+
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      [
+          "eval_set",
+          "create",
+          str(agent_path),
+          eval_set_id,
+          "--eval_set_format",
+          "jsonl",
+      ],
+  )
+
+  assert result.exit_code == 0
+  assert (agent_path / f"{eval_set_id}.evalset.jsonl").exists()
+
+  result = runner.invoke(
+      cli_tools_click.main,
+      ["eval_set", "convert", str(agent_path), eval_set_id, "--to", "json"],
+  )
+
+  assert result.exit_code == 0
+  assert not (agent_path / f"{eval_set_id}.evalset.jsonl").exists()
+  with open(agent_path / f"{eval_set_id}.evalset.json", "r") as f:
+    assert json.load(f)["eval_set_id"] == eval_set_id
+
+
 def test_cli_add_eval_case_no_session(tmp_path: Path):
   app_name = "test_app_add_1"
   eval_set_id = "test_eval_set_add_1"
@@ -0,0 +1,217 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the compression of the API server responses."""
+
+import gzip
+import zlib
+
+from google.adk.cli.utils import compression
+import pytest
+
+_JSON_BODY = b'{"text": "' + b"a" * 4096 + b'"}'
+
+
+def _make_app(messages):
+  async def app(scope, receive, send):
+    for message in messages:
+      await send(dict(message))
+
+  return app
+
+
+def _start_message(content_type, headers=()):
+  return {
+      "type": "http.response.start",
+      "status": 200,
+      "headers": [(b"content-type", content_type.encode()), *headers],
+  }
+
+
+async def _call(messages, accept_encoding="gzip", minimum_size=1024):
+  sent = []
+
+  async def send(message):
+    sent.append(message)
+
+  async def receive():
+    return {"type": "http.request"}
+
+  middleware = compression.CompressionMiddleware(
+      _make_app(messages), minimum_size=minimum_size
+  )
+  scope = {
+      "type": "http",
+      "headers": [(b"accept-encoding", accept_encoding.encode())],
+  }
+  await middleware(scope, receive, send)
+  return sent
+
+
+def _headers(message):
+  return {
+      name.decode().lower(): value.decode()
+      for name, value in message["headers"]
+  }
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("GZIP;q=0.5", "gzip"),
+        ("br;q=0.5, zstd;q=0.5, gzip", "gzip"),
+        ("*", compression.SUPPORTED_ENCODINGS[0]),
+        (
+            "*, gzip;q=0",
+            next(
+                (e for e in compression.SUPPORTED_ENCODINGS if e != "gzip"),
+                None,
+            ),
+        ),
+        ("gzip;q=0", None),
+        ("gzip;q=invalid", None),
+        ("identity", None),
+        ("deflate, unknown", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+  assert compression.negotiate_encoding(accept_encoding) == expected
+
+
+@pytest.mark.asyncio
+async def test_compresses_complete_response():
+  sent = await _call([
+      _start_message("application/json", [(b"content-length", b"4107")]),
+      {"type": "http.response.body", "body": _JSON_BODY},
+  ])
+
+  start, body = sent
+  headers = _headers(start)
+  assert headers["content-encoding"] == "gzip"
+  assert headers["vary"] == "Accept-Encoding"
+  assert headers["content-length"] == str(len(body["body"]))
+  assert gzip.decompress(body["body"]) == _JSON_BODY
+
+
+@pytest.mark.asyncio
+async def test_keeps_small_responses_uncompressed():
+  sent = await _call([
+      _start_message("application/json"),
+      {"type": "http.response.body", "body": b"{}"},
+  ])
+
+  start, body = sent
+  assert "content-encoding" not in _headers(start)
+  assert _headers(start)["vary"] == "Accept-Encoding"
+  assert body["body"] == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_keeps_responses_uncompressed_if_not_accepted():
+  sent = await _call(
+      [
+          _start_message("application/json"),
+          {"type": "http.response.body", "body": _JSON_BODY},
+      ],
+      accept_encoding="identity",
+  )
+
+  assert "content-encoding" not in _headers(sent[0])
+  assert sent[1]["body"] == _JSON_BODY
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type, headers",
+    [
+        ("image/png", []),
+        ("application/json", [(b"content-encoding", b"br")]),
+    ],
+)
+async def test_keeps_incompressible_responses_as_is(content_type, headers):
+  sent = await _call([
+      _start_message(content_type, headers),
+      {"type": "http.response.body", "body": _JSON_BODY},
+  ])
+
+  assert "vary" not in _headers(sent[0])
+  assert sent[1]["body"] == _JSON_BODY
+
+
+@pytest.mark.asyncio
+async def test_weakens_etag_of_compressed_responses():
+  sent = await _call([
+      _start_message("application/json", [(b"etag", b'"abc"')]),
+      {"type": "http.response.body", "body": _JSON_BODY},
+  ])
+
+  assert _headers(sent[0])["etag"] == 'W/"abc"'
+
+
+@pytest.mark.asyncio
+async def test_keeps_not_modified_responses_as_is():
+  sent = await _call([
+      {
+          "type": "http.response.start",
+          "status": 304,
+          "headers": [(b"etag", b'"abc"')],
+      },
+      {"type": "http.response.body", "body": b""},
+  ])
+
+  assert _headers(sent[0]) == {"etag": '"abc"'}
+
+
+@pytest.mark.asyncio
+async def test_flushes_each_server_sent_event():
+  events = [f"data: {i}\n\n".encode() for i in range(3)]
+  sent = await _call([
+      _start_message("text/event-stream; charset=utf-8"),
+      *(
+          {"type": "http.response.body", "body": event, "more_body": True}
+          for event in events
+      ),
+      {"type": "http.response.body", "body": b""},
+  ])
+
+  assert _headers(sent[0])["content-encoding"] == "gzip"
+  assert "content-length" not in _headers(sent[0])
+  decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+  # Every event can be decoded as soon as its chunk is received.
+  for event, message in zip(events, sent[1:]):
+    assert decompressor.decompress(message["body"]) == event
+  decompressor.decompress(sent[-1]["body"])
+  assert decompressor.eof
+
+
+@pytest.mark.asyncio
+async def test_buffers_streamed_chunks_until_compressed():
+  chunks = [b"a" * 100] * 10
+  sent = await _call([
+      _start_message("application/json"),
+      *(
+          {"type": "http.response.body", "body": chunk, "more_body": True}
+          for chunk in chunks
+      ),
+      {"type": "http.response.body", "body": b""},
+  ])
+
+  # The start message is sent with the first chunk, even if it's all
+  # buffered by the compressor.
+  assert sent[0]["type"] == "http.response.start"
+  assert len(sent) < len(chunks) + 2
+  body = b"".join(message["body"] for message in sent[1:])
+  assert gzip.decompress(body) == b"".join(chunks)
@@ -0,0 +1,91 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the binary audio frames of live sessions."""
+
+from google.adk.cli.utils import live_frames
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.genai import types
+import pytest
+
+
+def _audio_event(**kwargs) -> Event:
+  return Event(
+      author="agent",
+      invocation_id="invocation_id",
+      content=types.Content(
+          role="model",
+          parts=[
+              types.Part(
+                  inline_data=types.Blob(
+                      mime_type="audio/pcm;rate=24000", data=b"\x00\x01\x02"
+                  )
+              )
+          ],
+      ),
+      **kwargs,
+  )
+
+
+def test_audio_frame_round_trip():
+  blob = types.Blob(mime_type="audio/pcm;rate=16000", data=b"\x00\xff" * 320)
+
+  frame = live_frames.encode_audio_frame(blob)
+
+  assert frame[0] == len("audio/pcm;rate=16000")
+  assert live_frames.decode_audio_frame(frame) == blob
+
+
+@pytest.mark.parametrize(
+    "frame", [b"", b"\x00audio", b"\x06audio", b"\x02\xff\xfe"]
+)
+def test_decode_malformed_audio_frame(frame: bytes):
+  with pytest.raises(ValueError):
+    live_frames.decode_audio_frame(frame)
+
+
+def test_encode_audio_frame_requires_mime_type():
+  with pytest.raises(ValueError):
+    live_frames.encode_audio_frame(types.Blob(data=b"\x00"))
+
+
+def test_get_audio_blobs_of_audio_only_event():
+  event = _audio_event(partial=True)
+
+  assert live_frames.get_audio_blobs(event) == [
+      event.content.parts[0].inline_data
+  ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"turn_complete": True},
+        {"interrupted": True},
+        {"actions": EventActions(state_delta={"key": "value"})},
+        {"output_transcription": types.Transcription(text="hi")},
+    ],
+)
+def test_get_audio_blobs_of_event_with_more_than_audio(kwargs):
+  assert live_frames.get_audio_blobs(_audio_event(**kwargs)) is None
+
+
+def test_get_audio_blobs_of_text_event():
+  event = Event(
+      author="agent",
+      content=types.Content(role="model", parts=[types.Part(text="Hello")]),
+  )
+
+  assert live_frames.get_audio_blobs(event) is None
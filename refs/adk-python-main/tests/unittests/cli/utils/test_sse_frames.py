@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the server-sent events of agent runs."""
+
+import json
+
+from google.adk.cli.utils import sse_frames
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.genai import types
+import pytest
+
+
+def _text_event(text: str, **kwargs) -> Event:
+  return Event.model_validate({
+      "author": "agent",
+      "invocation_id": "invocation_id",
+      "content": {"role": "model", "parts": [{"text": text}]},
+      "partial": True,
+      **kwargs,
+  })
+
+
+def _parse(frame: str) -> tuple[str, dict]:
+  lines = frame.removesuffix("\n\n").split("\n")
+  event_type = "message"
+  if lines[0].startswith("event: "):
+    event_type = lines.pop(0).removeprefix("event: ")
+  return event_type, json.loads(lines[0].removeprefix("data: "))
+
+
+def test_encodes_full_events_by_default():
+  encoder = sse_frames.SseEventEncoder()
+  event = _text_event("Hello")
+
+  frames = [encoder.encode(event), encoder.encode(_text_event(" world"))]
+
+  assert frames[0] == (
+      f"data: {event.model_dump_json(exclude_none=True, by_alias=True)}\n\n"
+  )
+  assert [_parse(frame)[0] for frame in frames] == ["message", "message"]
+
+
+def test_encodes_partial_text_as_deltas():
+  encoder = sse_frames.SseEventEncoder(text_deltas=True)
+  events = [
+      _text_event("Hello"),
+      _text_event(" wor"),
+      _text_event("ld"),
+      Event(
+          author="agent",
+          invocation_id="invocation_id",
+          content=types.Content(
+              role="model", parts=[types.Part(text="Hello world")]
+          ),
+      ),
+  ]
+
+  frames = [_parse(encoder.encode(event)) for event in events]
+
+  assert frames[0] == (
+      "message",
+      json.loads(events[0].model_dump_json(exclude_none=True, by_alias=True)),
+  )
+  assert frames[1] == (
+      "text_delta",
+      {"id": events[1].id, "timestamp": events[1].timestamp, "text": " wor"},
+  )
+  assert frames[2][1]["text"] == "ld"
+  assert frames[3][0] == "message"
+  assert frames[3][1]["content"]["parts"][0]["text"] == "Hello world"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"author": "other_agent"},
+        {"branch": "branch"},
+        {"actions": EventActions(state_delta={"key": "value"})},
+        {"content": {"role": "model", "parts": [{"text": "a"}, {"text": "b"}]}},
+        {
+            "content": {
+                "role": "model",
+                "parts": [{"text": "thinking", "thought": True}],
+            }
+        },
+    ],
+)
+def test_sends_changed_envelopes_in_full(kwargs):
+  encoder = sse_frames.SseEventEncoder(text_deltas=True)
+  encoder.encode(_text_event("Hello"))
+
+  event_type, _ = _parse(encoder.encode(_text_event(" world", **kwargs)))
+
+  assert event_type == "message"
+
+
+def test_text_delta_carries_changed_usage_metadata():
+  encoder = sse_frames.SseEventEncoder(text_deltas=True)
+  usage_metadata = {"promptTokenCount": 10, "totalTokenCount": 10}
+  encoder.encode(_text_event("Hello", usage_metadata=usage_metadata))
+
+  same_usage = _parse(
+      encoder.encode(_text_event(" wor", usage_metadata=usage_metadata))
+  )
+  new_usage = _parse(
+      encoder.encode(
+          _text_event(
+              "ld",
+              usage_metadata={"promptTokenCount": 10, "totalTokenCount": 12},
+          )
+      )
+  )
+
+  assert same_usage[0] == "text_delta"
+  assert "usageMetadata" not in same_usage[1]
+  assert new_usage[0] == "text_delta"
+  assert new_usage[1]["usageMetadata"] == {
+      "promptTokenCount": 10,
+      "totalTokenCount": 12,
+  }
@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for serving the API server from pre-forked workers."""
+
+import json
+import os
+import signal
+import socket
+import time
+import urllib.request
+
+from google.adk.cli.utils.workers import serve_with_workers
+import pytest
+import uvicorn
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Workers require os.fork"
+)
+
+
+def _make_app(fail_startup: bool):
+  """Returns an app that responds with the pids of its processes."""
+  loaded_in = os.getpid()
+
+  async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+      await receive()
+      if fail_startup:
+        await send({"type": "lifespan.startup.failed", "message": "failed"})
+        return
+      await send({"type": "lifespan.startup.complete"})
+      await receive()
+      await send({"type": "lifespan.shutdown.complete"})
+      return
+    body = json.dumps({"pid": os.getpid(), "loaded_in": loaded_in})
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"connection", b"close")],
+    })
+    await send({"type": "http.response.body", "body": body.encode()})
+
+  return app
+
+
+def _listen() -> socket.socket:
+  """Returns a listening socket on a free port.
+
+  Connections are queued on the socket until a worker accepts them, so
+  requests don't have to wait for the server to start.
+  """
+  sock = socket.socket()
+  sock.bind(("127.0.0.1", 0))
+  sock.listen()
+  return sock
+
+
+def _start_server(sock: socket.socket, fail_startup: bool = False) -> int:
+  """Forks a process that serves the app from two workers on the socket."""
+  pid = os.fork()
+  if pid == 0:
+    exit_code = 0
+    try:
+      config = uvicorn.Config(
+          _make_app(fail_startup), fd=sock.fileno(), log_level="critical"
+      )
+      serve_with_workers(config, 2)
+    except BaseException:  # pylint: disable=broad-exception-caught
+      exit_code = 1
+    finally:
+      os._exit(exit_code)
+  return pid
+
+
+def _wait(pid: int, timeout: float = 10.0) -> int:
+  deadline = time.monotonic() + timeout
+  while time.monotonic() < deadline:
+    waited_pid, status = os.waitpid(pid, os.WNOHANG)
+    if waited_pid:
+      return os.waitstatus_to_exitcode(status)
+    time.sleep(0.05)
+  os.kill(pid, signal.SIGKILL)
+  raise TimeoutError(f"Process {pid} didn't exit.")
+
+
+def _get(sock: socket.socket) -> dict:
+  port = sock.getsockname()[1]
+  with urllib.request.urlopen(
+      f"http://127.0.0.1:{port}/", timeout=10
+  ) as response:
+    return json.loads(response.read())
+
+
+def test_serves_from_forked_workers():
+  with _listen() as sock:
+    server_pid = _start_server(sock)
+    try:
+      responses = [_get(sock) for _ in range(20)]
+      # The app is loaded once, before the workers are forked from the server.
+      assert {r["loaded_in"] for r in responses} == {server_pid}
+      worker_pids = {r["pid"] for r in responses}
+      assert server_pid not in worker_pids
+
+      # Workers that die are replaced.
+      for pid in worker_pids:
+        os.kill(pid, signal.SIGKILL)
+      assert _get(sock)["pid"] not in worker_pids
+    finally:
+      os.kill(server_pid, signal.SIGTERM)
+      exit_code = _wait(server_pid)
+
+  assert exit_code == 0
+
+
+def test_exits_if_the_app_fails_to_start():
+  with _listen() as sock:
+    server_pid = _start_server(sock, fail_startup=True)
+
+    assert _wait(server_pid) == 1
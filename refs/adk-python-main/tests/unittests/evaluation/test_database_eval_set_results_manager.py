@@ -0,0 +1,202 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from google.adk.errors.not_found_error import NotFoundError
+from google.adk.evaluation.database_eval_set_results_manager import DatabaseEvalSetResultsManager
+from google.adk.evaluation.eval_metrics import EvalMetricResult
+from google.adk.evaluation.eval_result import EvalCaseResult
+from google.adk.evaluation.evaluator import EvalStatus
+import pytest
+
+
+def _create_eval_case_result(
+    eval_id: str, scores: dict[str, float], threshold: float = 0.5
+) -> EvalCaseResult:
+  overall_eval_metric_results = [
+      EvalMetricResult(
+          metric_name=metric_name,
+          threshold=threshold,
+          score=score,
+          eval_status=(
+              EvalStatus.PASSED if score >= threshold else EvalStatus.FAILED
+          ),
+      )
+      for metric_name, score in scores.items()
+  ]
+  final_eval_status = (
+      EvalStatus.PASSED
+      if all(
+          metric_result.eval_status == EvalStatus.PASSED
+          for metric_result in overall_eval_metric_results
+      )
+      else EvalStatus.FAILED
+  )
+  return EvalCaseResult(
+      eval_set_id="test_eval_set",
+      eval_id=eval_id,
+      final_eval_status=final_eval_status,
+      overall_eval_metric_results=overall_eval_metric_results,
+      eval_metric_result_per_invocation=[],
+      session_id=f"session_{eval_id}",
+  )
+
+
+class TestDatabaseEvalSetResultsManager:
+
+  @pytest.fixture
+  def manager(self, tmp_path):
+    return DatabaseEvalSetResultsManager(
+        db_url=f"sqlite:///{tmp_path / 'eval_results.db'}"
+    )
+
+  @patch("time.time")
+  def test_save_and_get_eval_set_result(self, mock_time, manager):
+    mock_time.return_value = 1000.0
+    eval_case_results = [
+        _create_eval_case_result("case1", {"metric_a": 0.9}),
+        _create_eval_case_result("case2", {"metric_a": 0.1}),
+    ]
+
+    manager.save_eval_set_result("test_app", "test_eval_set", eval_case_results)
+
+    eval_set_result_ids = manager.list_eval_set_results("test_app")
+    assert eval_set_result_ids == ["test_app_test_eval_set_1000.0"]
+    eval_set_result = manager.get_eval_set_result(
+        "test_app", eval_set_result_ids[0]
+    )
+    assert eval_set_result.eval_set_id == "test_eval_set"
+    assert eval_set_result.creation_timestamp == 1000.0
+    assert eval_set_result.eval_case_results == eval_case_results
+
+  def test_get_eval_set_result_not_found(self, manager):
+    with pytest.raises(NotFoundError):
+      manager.get_eval_set_result("test_app", "non_existent_id")
+
+  @patch("time.time")
+  def test_list_eval_set_results_is_scoped_and_ordered(
+      self, mock_time, manager
+  ):
+    for timestamp, app_name in [
+        (3.0, "test_app"),
+        (1.0, "test_app"),
+        (2.0, "another_app"),
+    ]:
+      mock_time.return_value = timestamp
+      manager.save_eval_set_result(
+          app_name,
+          "test_eval_set",
+          [_create_eval_case_result("case1", {"metric_a": 1.0})],
+      )
+
+    assert manager.list_eval_set_results("test_app") == [
+        "test_app_test_eval_set_1.0",
+        "test_app_test_eval_set_3.0",
+    ]
+    assert manager.list_eval_set_results("unknown_app") == []
+
+  @patch("time.time")
+  def test_list_eval_metric_summaries(self, mock_time, manager):
+    mock_time.return_value = 1.0
+    manager.save_eval_set_result(
+        "test_app",
+        "test_eval_set",
+        [
+            _create_eval_case_result(
+                f"case{i}", {"metric_a": i / 10, "metric_b": 1.0}
+            )
+            for i in range(11)
+        ],
+    )
+    mock_time.return_value = 2.0
+    manager.save_eval_set_result(
+        "test_app",
+        "test_eval_set",
+        [_create_eval_case_result("case1", {"metric_a": 0.2})],
+    )
+
+    summaries = manager.list_eval_metric_summaries(
+        "test_app", metric_name="metric_a"
+    )
+
+    assert [summary.creation_timestamp for summary in summaries] == [1.0, 2.0]
+    first_run = summaries[0]
+    assert first_run.num_passed == 6
+    assert first_run.num_failed == 5
+    assert first_run.pass_rate == pytest.approx(6 / 11)
+    assert first_run.mean_score == pytest.approx(0.5)
+    assert first_run.min_score == pytest.approx(0.0)
+    assert first_run.max_score == pytest.approx(1.0)
+    assert first_run.p50_score == pytest.approx(0.5)
+    assert first_run.p90_score == pytest.approx(0.9)
+    assert summaries[1].pass_rate == 0.0
+
+  @patch("time.time")
+  def test_list_eval_metric_summaries_filters(self, mock_time, manager):
+    for timestamp in [1.0, 2.0, 3.0]:
+      mock_time.return_value = timestamp
+      manager.save_eval_set_result(
+          "test_app",
+          "test_eval_set",
+          [_create_eval_case_result("case1", {"metric_a": 1.0})],
+      )
+
+    assert [
+        summary.creation_timestamp
+        for summary in manager.list_eval_metric_summaries(
+            "test_app", start_timestamp=2.0
+        )
+    ] == [2.0, 3.0]
+    assert [
+        summary.creation_timestamp
+        for summary in manager.list_eval_metric_summaries("test_app", limit=2)
+    ] == [2.0, 3.0]
+    assert not manager.list_eval_metric_summaries(
+        "test_app", eval_set_id="another_eval_set"
+    )
+
+  @patch("time.time")
+  def test_list_eval_metric_summaries_orders_metrics_within_run(
+      self, mock_time, manager
+  ):
+    for timestamp in [1.0, 2.0]:
+      mock_time.return_value = timestamp
+      manager.save_eval_set_result(
+          "test_app",
+          "test_eval_set",
+          [
+              _create_eval_case_result(
+                  "case1", {"metric_b": 1.0, "metric_c": 1.0, "metric_a": 1.0}
+              )
+          ],
+      )
+
+    assert [
+        (summary.creation_timestamp, summary.metric_name)
+        for summary in manager.list_eval_metric_summaries("test_app")
+    ] == [
+        (1.0, "metric_a"),
+        (1.0, "metric_b"),
+        (1.0, "metric_c"),
+        (2.0, "metric_a"),
+        (2.0, "metric_b"),
+        (2.0, "metric_c"),
+    ]
+
+  def test_invalid_db_url(self):
+    with pytest.raises(ValueError):
+      DatabaseEvalSetResultsManager(db_url="invalid url")
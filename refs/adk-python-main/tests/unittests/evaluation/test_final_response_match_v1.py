@@ -19,6 +19,7 @@ from google.adk.evaluation.eval_metrics import EvalMetric
 from google.adk.evaluation.eval_metrics import PrebuiltMetrics
 from google.adk.evaluation.evaluator import EvalStatus
 from google.adk.evaluation.final_response_match_v1 import _calculate_rouge_1_scores
+from google.adk.evaluation.final_response_match_v1 import Rouge1BatchScorer
 from google.adk.evaluation.final_response_match_v1 import RougeEvaluator
 from google.genai import types as genai_types
 import pytest
@@ -141,6 +142,38 @@ def test_rouge_evaluator_multiple_invocations(
   assert evaluation_result.overall_eval_status == expected_status
 
 
+def test_rouge_1_batch_scorer_matches_rouge_scorer():
+  candidates = [
+      "The quick brown fox jumps.",
+      "",
+      "running runners ran",
+      "hello hello world",
+      "No matching words here.",
+  ]
+  references = [
+      "The quick brown fox jumps over the lazy dog.",
+      "empty candidate",
+      "the runner is running",
+      "hello world world",
+      "",
+  ]
+  batch_scorer = Rouge1BatchScorer()
+
+  # Scoring twice also exercises the cached token ids.
+  for _ in range(2):
+    precisions, recalls, fmeasures = batch_scorer.score(candidates, references)
+    for i, (candidate, reference) in enumerate(zip(candidates, references)):
+      expected = _calculate_rouge_1_scores(candidate, reference)
+      assert precisions[i] == pytest.approx(expected.precision)
+      assert recalls[i] == pytest.approx(expected.recall)
+      assert fmeasures[i] == pytest.approx(expected.fmeasure)
+
+
+def test_rouge_1_batch_scorer_mismatched_lengths():
+  with pytest.raises(ValueError):
+    Rouge1BatchScorer().score(["candidate"], [])
+
+
 def test_get_metric_info():
   """Test get_metric_info function for response match metric."""
   metric_info = RougeEvaluator.get_metric_info()
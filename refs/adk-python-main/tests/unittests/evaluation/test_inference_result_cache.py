@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.evaluation.eval_case import EvalCase
+from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_case import SessionInput
+from google.adk.evaluation.inference_result_cache import CachedInference
+from google.adk.evaluation.inference_result_cache import get_agent_definition_hash
+from google.adk.evaluation.inference_result_cache import get_eval_case_hash
+from google.adk.evaluation.inference_result_cache import InferenceResultCache
+from google.genai import types as genai_types
+import pytest
+
+
+def _tool_a(x: int) -> int:
+  """Returns x."""
+  return x
+
+
+def _tool_b(x: int) -> int:
+  """Returns x + 1."""
+  return x + 1
+
+
+def _create_agent(
+    instruction: str = "Be helpful.", tools=None, temperature: float = 0.0
+) -> LlmAgent:
+  return LlmAgent(
+      name="root_agent",
+      model="gemini-2.0-flash",
+      instruction=instruction,
+      tools=tools or [],
+      generate_content_config=genai_types.GenerateContentConfig(
+          temperature=temperature
+      ),
+      sub_agents=[LlmAgent(name="sub_agent", model="gemini-2.0-flash")],
+  )
+
+
+def _create_eval_case(
+    query: str = "hello", expected_response: str = "hi"
+) -> EvalCase:
+  return EvalCase(
+      eval_id="case1",
+      conversation=[
+          Invocation(
+              user_content=genai_types.Content(
+                  parts=[genai_types.Part(text=query)], role="user"
+              ),
+              final_response=genai_types.Content(
+                  parts=[genai_types.Part(text=expected_response)],
+                  role="model",
+              ),
+          )
+      ],
+      session_input=SessionInput(app_name="app", user_id="user"),
+  )
+
+
+def test_agent_definition_hash_is_stable():
+  assert get_agent_definition_hash(
+      _create_agent(tools=[_tool_a])
+  ) == get_agent_definition_hash(_create_agent(tools=[_tool_a]))
+
+
+@pytest.mark.parametrize(
+    "changed_agent",
+    [
+        _create_agent(instruction="Be terse."),
+        _create_agent(tools=[_tool_b]),
+        _create_agent(temperature=0.5),
+    ],
+)
+def test_agent_definition_hash_changes_with_agent(changed_agent):
+  assert get_agent_definition_hash(
+      _create_agent(tools=[_tool_a])
+  ) != get_agent_definition_hash(changed_agent)
+
+
+def test_agent_definition_hash_changes_with_sub_agents():
+  agent = _create_agent()
+  changed_agent = _create_agent()
+  changed_agent.sub_agents[0].instruction = "Be terse."
+
+  assert get_agent_definition_hash(agent) != get_agent_definition_hash(
+      changed_agent
+  )
+
+
+def test_eval_case_hash_ignores_expected_responses():
+  assert get_eval_case_hash(
+      _create_eval_case(expected_response="hi")
+  ) == get_eval_case_hash(_create_eval_case(expected_response="hello there"))
+  assert get_eval_case_hash(
+      _create_eval_case(query="hello")
+  ) != get_eval_case_hash(_create_eval_case(query="bye"))
+
+
+def test_get_and_put(tmp_path):
+  cache = InferenceResultCache(cache_dir=str(tmp_path))
+  agent = _create_agent()
+  cache_key = cache.get_cache_key(agent, _create_eval_case())
+  cached_inference = CachedInference(
+      inferences=_create_eval_case().conversation
+  )
+
+  assert cache.get(cache_key) is None
+  cache.put(cache_key, cached_inference)
+
+  assert (
+      InferenceResultCache(cache_dir=str(tmp_path)).get(cache_key)
+      == cached_inference
+  )
+  assert cache.stats.hits == 0
+  assert cache.stats.misses == 1
+  assert cache.stats.writes == 1
+
+
+def test_cache_salt_changes_key(tmp_path):
+  agent = _create_agent()
+  eval_case = _create_eval_case()
+
+  assert InferenceResultCache(
+      cache_dir=str(tmp_path), cache_salt="v1"
+  ).get_cache_key(agent, eval_case) != InferenceResultCache(
+      cache_dir=str(tmp_path), cache_salt="v2"
+  ).get_cache_key(agent, eval_case)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+  cache = InferenceResultCache(cache_dir=str(tmp_path))
+  cache_key = cache.get_cache_key(_create_agent(), _create_eval_case())
+  cache.put(cache_key, CachedInference(inferences=[]))
+  with open(cache._get_entry_path(cache_key), "w", encoding="utf-8") as f:
+    f.write("not json")
+
+  assert cache.get(cache_key) is None
+  assert cache.stats.misses == 1
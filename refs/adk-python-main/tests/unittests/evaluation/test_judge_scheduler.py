@@ -0,0 +1,169 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from google.adk.evaluation.judge_scheduler import JudgeScheduler
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types as genai_types
+import pytest
+
+
+class _FakeJudgeModel:
+  """A judge model that records the calls that reach it."""
+
+  def __init__(self, delay: float = 0.0, error: Optional[Exception] = None):
+    self.delay = delay
+    self.error = error
+    self.calls = 0
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  async def generate_content_async(self, llm_request: LlmRequest):
+    self.calls += 1
+    self.in_flight += 1
+    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(self.delay)
+      if self.error:
+        raise self.error
+      yield LlmResponse(
+          content=genai_types.Content(
+              parts=[genai_types.Part(text=f"response {self.calls}")],
+          )
+      )
+    finally:
+      self.in_flight -= 1
+
+
+def _create_llm_request(
+    prompt: str = "prompt", temperature: Optional[float] = None
+) -> LlmRequest:
+  return LlmRequest(
+      model="gemini-2.5-flash",
+      contents=[
+          genai_types.Content(
+              parts=[genai_types.Part(text=prompt)],
+              role="user",
+          )
+      ],
+      config=genai_types.GenerateContentConfig(temperature=temperature),
+  )
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_requests_per_model():
+  scheduler = JudgeScheduler(max_concurrent_requests_per_model=2)
+  judge_model = _FakeJudgeModel(delay=0.01)
+
+  responses = await asyncio.gather(*[
+      scheduler.generate_content(judge_model, _create_llm_request(f"p{i}"))
+      for i in range(6)
+  ])
+
+  assert len(responses) == 6
+  assert judge_model.calls == 6
+  assert judge_model.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_deduplicates_identical_requests():
+  scheduler = JudgeScheduler()
+  judge_model = _FakeJudgeModel(delay=0.01)
+
+  # Two concurrent requests share the call that is in flight, the third one
+  # is served from the responses of the completed call.
+  first, second = await asyncio.gather(
+      scheduler.generate_content(judge_model, _create_llm_request()),
+      scheduler.generate_content(judge_model, _create_llm_request()),
+  )
+  third = await scheduler.generate_content(judge_model, _create_llm_request())
+
+  assert first == second == third
+  assert judge_model.calls == 1
+  assert scheduler.stats.requests == 3
+  assert scheduler.stats.model_calls == 1
+  assert scheduler.stats.deduplicated == 2
+
+
+@pytest.mark.asyncio
+async def test_samples_are_only_shared_for_deterministic_requests():
+  scheduler = JudgeScheduler()
+  judge_model = _FakeJudgeModel()
+
+  for sample_index in range(3):
+    await scheduler.generate_content(
+        judge_model, _create_llm_request(), sample_index=sample_index
+    )
+  assert judge_model.calls == 3
+
+  for sample_index in range(3):
+    await scheduler.generate_content(
+        judge_model,
+        _create_llm_request(temperature=0),
+        sample_index=sample_index,
+    )
+  assert judge_model.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_cached():
+  scheduler = JudgeScheduler()
+  judge_model = _FakeJudgeModel(error=ValueError("judge failed"))
+
+  with pytest.raises(ValueError):
+    await scheduler.generate_content(judge_model, _create_llm_request())
+
+  judge_model.error = None
+  responses = await scheduler.generate_content(
+      judge_model, _create_llm_request()
+  )
+
+  assert len(responses) == 1
+  assert judge_model.calls == 2
+
+
+def test_invalid_max_concurrent_requests_per_model():
+  with pytest.raises(ValueError):
+    JudgeScheduler(max_concurrent_requests_per_model=0)
+
+
+@pytest.mark.asyncio
+async def test_limits_requests_per_minute_per_model(monkeypatch):
+  # Lets 2 requests start per 0.2 seconds, i.e. one every 0.1 seconds once
+  # the first 2 started.
+  monkeypatch.setattr(
+      "google.adk.evaluation.judge_scheduler._RATE_LIMIT_INTERVAL_SECONDS", 0.2
+  )
+  scheduler = JudgeScheduler(max_requests_per_minute_per_model=2)
+  judge_model = _FakeJudgeModel()
+  loop = asyncio.get_running_loop()
+
+  start = loop.time()
+  await asyncio.gather(*[
+      scheduler.generate_content(judge_model, _create_llm_request(f"p{i}"))
+      for i in range(5)
+  ])
+
+  assert judge_model.calls == 5
+  assert loop.time() - start >= 0.25
+
+
+def test_invalid_max_requests_per_minute_per_model():
+  with pytest.raises(ValueError):
+    JudgeScheduler(max_requests_per_minute_per_model=0)
@@ -24,6 +24,7 @@ from google.adk.evaluation.eval_metrics import LlmAsAJudgeCriterion
 from google.adk.evaluation.evaluator import EvalStatus
 from google.adk.evaluation.evaluator import EvaluationResult
 from google.adk.evaluation.evaluator import PerInvocationResult
+from google.adk.evaluation.judge_scheduler import JudgeScheduler
 from google.adk.evaluation.llm_as_judge import AutoRaterScore
 from google.adk.evaluation.llm_as_judge import LlmAsJudge
 from google.adk.evaluation.llm_as_judge_utils import get_eval_status
@@ -232,3 +233,48 @@ async def test_evaluate_invocations_with_mock(
   assert mock_llm_as_judge.format_auto_rater_prompt.call_count == 2
   assert mock_llm_as_judge.convert_auto_rater_response_to_score.call_count == 6
   assert mock_llm_as_judge.aggregate_invocation_results.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_evaluate_invocations_shares_judge_scheduler(mock_judge_model):
+  mock_judge_model.generate_content_async = MagicMock(
+      wraps=mock_judge_model.generate_content_async
+  )
+  judge_scheduler = JudgeScheduler()
+  invocation = Invocation(
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="user content")],
+          role="user",
+      ),
+  )
+
+  for _ in range(2):
+    llm_as_judge = MockLlmAsJudge(
+        eval_metric=EvalMetric(
+            metric_name="test_metric",
+            threshold=0.5,
+            criterion=LlmAsAJudgeCriterion(
+                threshold=0.5,
+                judge_model_options=JudgeModelOptions(
+                    judge_model="gemini-2.5-flash",
+                    judge_model_config=genai_types.GenerateContentConfig(
+                        temperature=0
+                    ),
+                    num_samples=3,
+                ),
+            ),
+        ),
+        criterion_type=LlmAsAJudgeCriterion,
+    )
+    llm_as_judge._judge_model = mock_judge_model
+    llm_as_judge.judge_scheduler = judge_scheduler
+
+    result = await llm_as_judge.evaluate_invocations(
+        [invocation, invocation], [invocation, invocation]
+    )
+    assert result.overall_score == 1.0
+
+  # Every sample of every invocation of both runs is the same deterministic
+  # request, so the judge model is only called once.
+  assert mock_judge_model.generate_content_async.call_count == 1
+  assert judge_scheduler.stats.requests == 12
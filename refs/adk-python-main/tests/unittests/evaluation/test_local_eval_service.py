@@ -25,25 +25,32 @@ from google.adk.evaluation.base_eval_service import InferenceRequest
 from google.adk.evaluation.base_eval_service import InferenceResult
 from google.adk.evaluation.base_eval_service import InferenceStatus
 from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_case import SessionInput
 from google.adk.evaluation.eval_metrics import EvalMetric
 from google.adk.evaluation.eval_metrics import EvalMetricResult
 from google.adk.evaluation.eval_metrics import Interval
 from google.adk.evaluation.eval_metrics import MetricInfo
 from google.adk.evaluation.eval_metrics import MetricValueInfo
+from google.adk.evaluation.eval_metrics import PrebuiltMetrics
 from google.adk.evaluation.eval_result import EvalCaseResult
 from google.adk.evaluation.eval_set import EvalCase
 from google.adk.evaluation.eval_set import EvalSet
 from google.adk.evaluation.eval_set_results_manager import EvalSetResultsManager
 from google.adk.evaluation.eval_sets_manager import EvalSetsManager
+from google.adk.evaluation.evaluation_generator import EvaluationGenerator
 from google.adk.evaluation.evaluator import EvalStatus
 from google.adk.evaluation.evaluator import EvaluationResult
 from google.adk.evaluation.evaluator import Evaluator
 from google.adk.evaluation.evaluator import PerInvocationResult
+from google.adk.evaluation.inference_result_cache import InferenceResultCache
 from google.adk.evaluation.local_eval_service import LocalEvalService
 from google.adk.evaluation.metric_evaluator_registry import DEFAULT_METRIC_EVALUATOR_REGISTRY
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.models.registry import LLMRegistry
 from google.genai import types as genai_types
 import pytest
+from rouge_score import tokenize
 
 
 @pytest.fixture
@@ -126,7 +133,9 @@ async def test_perform_inference_success(
           EvalCase(eval_id="case2", conversation=[], session_input=None),
       ],
   )
-  mock_eval_sets_manager.get_eval_set.return_value = eval_set
+  mock_eval_sets_manager.iter_eval_cases.return_value = iter(
+      eval_set.eval_cases
+  )
 
   mock_inference_result = mock.MagicMock()
   eval_service._perform_inference_sigle_eval_item = mock.AsyncMock(
@@ -146,7 +155,7 @@ async def test_perform_inference_success(
   assert len(results) == 2
   assert results[0] == mock_inference_result
   assert results[1] == mock_inference_result
-  mock_eval_sets_manager.get_eval_set.assert_called_once_with(
+  mock_eval_sets_manager.iter_eval_cases.assert_called_once_with(
       app_name="test_app", eval_set_id="test_eval_set"
   )
   assert eval_service._perform_inference_sigle_eval_item.call_count == 2
@@ -166,7 +175,9 @@ async def test_perform_inference_with_case_ids(
           EvalCase(eval_id="case3", conversation=[], session_input=None),
       ],
   )
-  mock_eval_sets_manager.get_eval_set.return_value = eval_set
+  mock_eval_sets_manager.iter_eval_cases.return_value = iter(
+      eval_set.eval_cases
+  )
 
   mock_inference_result = mock.MagicMock()
   eval_service._perform_inference_sigle_eval_item = mock.AsyncMock(
@@ -204,7 +215,7 @@ async def test_perform_inference_eval_set_not_found(
     eval_service,
     mock_eval_sets_manager,
 ):
-  mock_eval_sets_manager.get_eval_set.return_value = None
+  mock_eval_sets_manager.iter_eval_cases.return_value = None
 
   inference_request = InferenceRequest(
       app_name="test_app",
@@ -259,6 +270,56 @@ async def test_evaluate_success(
   assert mock_eval_set_results_manager.save_eval_set_result.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_evaluate_shares_rouge_scorer_across_runs(
+    eval_service, mock_eval_sets_manager
+):
+  def create_invocation(text: str) -> Invocation:
+    return Invocation(
+        user_content=genai_types.Content(
+            parts=[genai_types.Part(text="question")]
+        ),
+        final_response=genai_types.Content(parts=[genai_types.Part(text=text)]),
+    )
+
+  # The same eval case, inferenced for two runs.
+  inference_results = [
+      InferenceResult(
+          app_name="test_app",
+          eval_set_id="test_eval_set",
+          eval_case_id="case1",
+          inferences=[create_invocation(text)],
+          session_id=f"session{i}",
+      )
+      for i, text in enumerate(["hello there", "hello world"])
+  ]
+  eval_metric = EvalMetric(
+      metric_name=PrebuiltMetrics.RESPONSE_MATCH_SCORE.value, threshold=0.5
+  )
+  evaluate_request = EvaluateRequest(
+      inference_results=inference_results,
+      evaluate_config=EvaluateConfig(eval_metrics=[eval_metric], parallelism=2),
+  )
+  mock_eval_case = mock.MagicMock(spec=EvalCase)
+  mock_eval_case.conversation = [create_invocation("hello world")]
+  mock_eval_case.session_input = None
+  mock_eval_sets_manager.get_eval_case.return_value = mock_eval_case
+
+  with mock.patch.object(
+      tokenize, "tokenize", wraps=tokenize.tokenize
+  ) as mock_tokenize:
+    results = [
+        result async for result in eval_service.evaluate(evaluate_request)
+    ]
+
+  scores = sorted(
+      result.overall_eval_metric_results[0].score for result in results
+  )
+  assert scores == [pytest.approx(0.5), 1.0]
+  # The reference, and the response that matches it, are tokenized once.
+  assert mock_tokenize.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_evaluate_eval_case_not_found(
     eval_service,
@@ -351,6 +412,101 @@ async def test_evaluate_single_inference_result(
     assert metric_result.eval_status == EvalStatus.PASSED
 
 
+@pytest.mark.asyncio
+async def test_perform_inference_uses_inference_result_cache(
+    dummy_agent, mock_eval_sets_manager, tmp_path
+):
+  eval_case = EvalCase(
+      eval_id="case1",
+      conversation=[
+          Invocation(
+              user_content=genai_types.Content(
+                  parts=[genai_types.Part(text="hello")], role="user"
+              ),
+          )
+      ],
+      session_input=SessionInput(
+          app_name="test_app", user_id="test_user", state={"turns": 0}
+      ),
+  )
+  inferences = [
+      Invocation(
+          user_content=genai_types.Content(
+              parts=[genai_types.Part(text="hello")], role="user"
+          ),
+          final_response=genai_types.Content(
+              parts=[genai_types.Part(text="hi")], role="model"
+          ),
+      )
+  ]
+  inference_result_cache = InferenceResultCache(cache_dir=str(tmp_path))
+  eval_service = LocalEvalService(
+      root_agent=dummy_agent,
+      eval_sets_manager=mock_eval_sets_manager,
+      inference_result_cache=inference_result_cache,
+  )
+  inference_request = InferenceRequest(
+      app_name="test_app",
+      eval_set_id="test_eval_set",
+      inference_config=InferenceConfig(parallelism=1),
+  )
+
+  async def fake_generate_inferences(**kwargs):
+    session_service = kwargs["session_service"]
+    session = await session_service.create_session(
+        app_name="test_app",
+        user_id="test_user",
+        state=kwargs["initial_session"].state,
+        session_id=kwargs["session_id"],
+    )
+    await session_service.append_event(
+        session,
+        Event(
+            author="user",
+            actions=EventActions(
+                state_delta={"turns": 1, "app:visits": ["case1"]}
+            ),
+        ),
+    )
+    return inferences
+
+  with mock.patch.object(
+      EvaluationGenerator,
+      "_generate_inferences_from_root_agent",
+      side_effect=fake_generate_inferences,
+  ) as mock_generate_inferences:
+    results = []
+    for _ in range(2):
+      mock_eval_sets_manager.iter_eval_cases.return_value = iter([eval_case])
+      with mock.patch.object(
+          eval_service._session_service,
+          "create_session",
+          wraps=eval_service._session_service.create_session,
+      ) as create_session:
+        async for result in eval_service.perform_inference(inference_request):
+          results.append(result)
+
+  assert mock_generate_inferences.call_count == 1
+  assert [result.inferences for result in results] == [inferences, inferences]
+  assert all(result.status == InferenceStatus.SUCCESS for result in results)
+  assert inference_result_cache.stats.hits == 1
+  assert inference_result_cache.stats.misses == 1
+  # The session of the cached inference is restored under the new session id.
+  sessions = [
+      await eval_service._session_service.get_session(
+          app_name="test_app",
+          user_id="test_user",
+          session_id=result.session_id,
+      )
+      for result in results
+  ]
+  # It starts from the initial state, and the events replay the deltas.
+  assert create_session.call_args.kwargs["state"] == {"turns": 0}
+  assert sessions[1].state == sessions[0].state
+  assert sessions[1].state == {"turns": 1, "app:visits": ["case1"]}
+  assert len(sessions[1].events) == len(sessions[0].events)
+
+
 def test_generate_final_eval_status_doesn_t_throw_on(eval_service):
   # How to fix if this test case fails?
   # This test case has failed mainly because a new EvalStatus got added. You
@@ -437,7 +593,9 @@ async def test_mcp_stdio_agent_no_runtime_error():
         eval_set_id="test_set",
         eval_cases=[test_eval_case],
     )
-    mock_eval_sets_manager.get_eval_set.return_value = eval_set
+    mock_eval_sets_manager.iter_eval_cases.return_value = iter(
+        eval_set.eval_cases
+    )
 
     # Create LocalEvalService with MCP agent
     eval_service = LocalEvalService(
@@ -19,11 +19,13 @@ import os
 import uuid
 
 from google.adk.errors.not_found_error import NotFoundError
+from google.adk.evaluation._jsonl_eval_set_file import JsonlEvalSetFile
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import IntermediateData
 from google.adk.evaluation.eval_case import Invocation
 from google.adk.evaluation.eval_set import EvalSet
 from google.adk.evaluation.local_eval_sets_manager import _EVAL_SET_FILE_EXTENSION
+from google.adk.evaluation.local_eval_sets_manager import _EVAL_SET_JSONL_FILE_EXTENSION
 from google.adk.evaluation.local_eval_sets_manager import convert_eval_set_to_pydanctic_schema
 from google.adk.evaluation.local_eval_sets_manager import load_eval_set_from_file
 from google.adk.evaluation.local_eval_sets_manager import LocalEvalSetsManager
@@ -749,3 +751,296 @@ class TestLocalEvalSetsManager:
       local_eval_sets_manager.delete_eval_case(
           app_name, eval_set_id, eval_case_id
       )
+
+
+class TestLocalEvalSetsManagerJsonlFormat:
+  """Tests for LocalEvalSetsManager with eval sets in the JSONL format."""
+
+  @pytest.fixture
+  def local_eval_sets_manager(self, tmp_path):
+    os.makedirs(tmp_path / "test_app")
+    return LocalEvalSetsManager(agents_dir=str(tmp_path), use_jsonl_format=True)
+
+  def _create_eval_case(self, eval_case_id: str, text: str = "hello"):
+    return EvalCase(
+        eval_id=eval_case_id,
+        conversation=[
+            Invocation(
+                invocation_id="invocation_id",
+                user_content=genai_types.Content(
+                    parts=[genai_types.Part(text=text)], role="user"
+                ),
+            )
+        ],
+    )
+
+  def test_create_eval_set_writes_jsonl_file(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+
+    eval_set_file_path = os.path.join(
+        local_eval_sets_manager._agents_dir,
+        "test_app",
+        "test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION,
+    )
+    assert os.path.exists(eval_set_file_path)
+    assert local_eval_sets_manager.list_eval_sets("test_app") == [
+        "test_eval_set"
+    ]
+    with pytest.raises(ValueError, match="already exists"):
+      local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+
+  def test_add_update_and_delete_eval_cases(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    eval_case_1 = self._create_eval_case("case_1")
+    eval_case_2 = self._create_eval_case("case_2")
+    updated_eval_case_1 = self._create_eval_case("case_1", text="updated")
+
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", eval_case_1
+    )
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", eval_case_2
+    )
+    local_eval_sets_manager.update_eval_case(
+        "test_app", "test_eval_set", updated_eval_case_1
+    )
+
+    eval_set = local_eval_sets_manager.get_eval_set("test_app", "test_eval_set")
+    assert eval_set.eval_set_id == "test_eval_set"
+    assert eval_set.eval_cases == [eval_case_2, updated_eval_case_1]
+    assert (
+        local_eval_sets_manager.get_eval_case(
+            "test_app", "test_eval_set", "case_1"
+        )
+        == updated_eval_case_1
+    )
+
+    local_eval_sets_manager.delete_eval_case(
+        "test_app", "test_eval_set", "case_2"
+    )
+
+    assert (
+        local_eval_sets_manager.get_eval_case(
+            "test_app", "test_eval_set", "case_2"
+        )
+        is None
+    )
+    assert list(
+        local_eval_sets_manager.iter_eval_cases("test_app", "test_eval_set")
+    ) == [updated_eval_case_1]
+
+  def test_add_eval_case_only_appends(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_1")
+    )
+    eval_set_file_path = os.path.join(
+        local_eval_sets_manager._agents_dir,
+        "test_app",
+        "test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION,
+    )
+    with open(eval_set_file_path, "rb") as f:
+      content_before = f.read()
+
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_2")
+    )
+
+    with open(eval_set_file_path, "rb") as f:
+      content_after = f.read()
+    assert content_after.startswith(content_before)
+    assert content_after.count(b"\n") == content_before.count(b"\n") + 1
+
+  def test_add_eval_case_eval_case_id_exists(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    eval_case = self._create_eval_case("case_1")
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", eval_case
+    )
+
+    with pytest.raises(
+        ValueError,
+        match="Eval id `case_1` already exists in `test_eval_set` eval set.",
+    ):
+      local_eval_sets_manager.add_eval_case(
+          "test_app", "test_eval_set", eval_case
+      )
+
+  def test_update_and_delete_eval_case_not_found(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+
+    with pytest.raises(NotFoundError):
+      local_eval_sets_manager.update_eval_case(
+          "test_app", "test_eval_set", self._create_eval_case("case_1")
+      )
+    with pytest.raises(NotFoundError):
+      local_eval_sets_manager.delete_eval_case(
+          "test_app", "test_eval_set", "case_1"
+      )
+
+  def test_changes_from_another_manager_are_picked_up(
+      self, local_eval_sets_manager
+  ):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_1")
+    )
+    other_manager = LocalEvalSetsManager(
+        agents_dir=local_eval_sets_manager._agents_dir
+    )
+
+    other_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_2")
+    )
+
+    assert [
+        eval_case.eval_id
+        for eval_case in local_eval_sets_manager.iter_eval_cases(
+            "test_app", "test_eval_set"
+        )
+    ] == ["case_1", "case_2"]
+
+  def test_compaction_keeps_live_eval_cases(
+      self, local_eval_sets_manager, mocker
+  ):
+    mocker.patch(
+        "google.adk.evaluation._jsonl_eval_set_file._MIN_DEAD_RECORDS_FOR_COMPACTION",
+        2,
+    )
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_1")
+    )
+    for i in range(5):
+      local_eval_sets_manager.update_eval_case(
+          "test_app",
+          "test_eval_set",
+          self._create_eval_case("case_1", text=f"update {i}"),
+      )
+    eval_set_file_path = os.path.join(
+        local_eval_sets_manager._agents_dir,
+        "test_app",
+        "test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION,
+    )
+
+    with open(eval_set_file_path, "rb") as f:
+      assert f.read().count(b"\n") < 7
+    assert local_eval_sets_manager.get_eval_case(
+        "test_app", "test_eval_set", "case_1"
+    ) == self._create_eval_case("case_1", text="update 4")
+
+  def test_json_eval_sets_keep_json_format(self, local_eval_sets_manager):
+    eval_set = EvalSet(
+        eval_set_id="json_eval_set",
+        eval_cases=[self._create_eval_case("case_1")],
+    )
+    eval_set_file_path = os.path.join(
+        local_eval_sets_manager._agents_dir,
+        "test_app",
+        "json_eval_set" + _EVAL_SET_FILE_EXTENSION,
+    )
+    with open(eval_set_file_path, "w", encoding="utf-8") as f:
+      f.write(eval_set.model_dump_json())
+
+    local_eval_sets_manager.add_eval_case(
+        "test_app", "json_eval_set", self._create_eval_case("case_2")
+    )
+
+    loaded_eval_set = load_eval_set_from_file(
+        eval_set_file_path, "json_eval_set"
+    )
+    assert [eval_case.eval_id for eval_case in loaded_eval_set.eval_cases] == [
+        "case_1",
+        "case_2",
+    ]
+
+  def test_load_eval_set_from_jsonl_file(self, tmp_path):
+    eval_set = EvalSet(
+        eval_set_id="test_eval_set",
+        name="test_eval_set",
+        eval_cases=[
+            self._create_eval_case("case_1"),
+            self._create_eval_case("case_2"),
+        ],
+        creation_timestamp=123.0,
+    )
+    eval_set_file_path = str(
+        tmp_path / ("test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION)
+    )
+    JsonlEvalSetFile.create(eval_set_file_path, eval_set)
+
+    assert (
+        load_eval_set_from_file(eval_set_file_path, "test_eval_set") == eval_set
+    )
+
+  def test_convert_eval_set_round_trip(self, tmp_path):
+    os.makedirs(tmp_path / "test_app", exist_ok=True)
+    json_manager = LocalEvalSetsManager(agents_dir=str(tmp_path))
+    json_manager.create_eval_set("test_app", "test_eval_set")
+    json_manager.add_eval_case(
+        "test_app", "test_eval_set", self._create_eval_case("case_1")
+    )
+    json_path = tmp_path / "test_app" / "test_eval_set.evalset.json"
+    jsonl_path = (
+        tmp_path
+        / "test_app"
+        / ("test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION)
+    )
+    original_eval_set = json_manager.get_eval_set("test_app", "test_eval_set")
+
+    json_manager.convert_eval_set(
+        "test_app", "test_eval_set", use_jsonl_format=True
+    )
+
+    assert not json_path.exists()
+    assert jsonl_path.exists()
+    assert (
+        json_manager.get_eval_set("test_app", "test_eval_set")
+        == original_eval_set
+    )
+
+    json_manager.convert_eval_set(
+        "test_app", "test_eval_set", use_jsonl_format=False
+    )
+
+    assert json_path.exists()
+    assert not jsonl_path.exists()
+    assert (
+        json_manager.get_eval_set("test_app", "test_eval_set")
+        == original_eval_set
+    )
+
+  def test_convert_missing_eval_set_raises(self, local_eval_sets_manager):
+    with pytest.raises(NotFoundError):
+      local_eval_sets_manager.convert_eval_set(
+          "test_app", "missing", use_jsonl_format=True
+      )
+
+  def test_empty_jsonl_file_raises(self, tmp_path):
+    eval_set_file_path = tmp_path / (
+        "test_eval_set" + _EVAL_SET_JSONL_FILE_EXTENSION
+    )
+    eval_set_file_path.touch()
+    jsonl_eval_set_file = JsonlEvalSetFile(str(eval_set_file_path))
+
+    with pytest.raises(ValueError, match="has no eval set header"):
+      jsonl_eval_set_file.get_eval_set()
+    with pytest.raises(ValueError, match="has no eval set header"):
+      jsonl_eval_set_file.add_eval_case(self._create_eval_case("case_1"))
+    assert eval_set_file_path.read_bytes() == b""
+
+  def test_list_eval_sets_in_both_formats_once(self, local_eval_sets_manager):
+    local_eval_sets_manager.create_eval_set("test_app", "test_eval_set")
+    eval_set_file_path = os.path.join(
+        local_eval_sets_manager._agents_dir,
+        "test_app",
+        "test_eval_set" + _EVAL_SET_FILE_EXTENSION,
+    )
+    with open(eval_set_file_path, "w", encoding="utf-8") as f:
+      f.write(
+          EvalSet(eval_set_id="test_eval_set", eval_cases=[]).model_dump_json()
+      )
+
+    assert local_eval_sets_manager.list_eval_sets("test_app") == [
+        "test_eval_set"
+    ]
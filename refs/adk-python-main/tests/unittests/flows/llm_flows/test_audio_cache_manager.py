@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
+from google.adk.agents.audio_buffer import ARTIFACT_READER
+from google.adk.agents.audio_buffer import AudioBuffer
 from google.adk.flows.llm_flows.audio_cache_manager import AudioCacheConfig
 from google.adk.flows.llm_flows.audio_cache_manager import AudioCacheManager
 from google.genai import types
@@ -73,10 +76,12 @@ class TestAudioCacheManager:
     assert invocation_context.input_realtime_cache is not None
     assert len(invocation_context.input_realtime_cache) == 1
 
-    entry = invocation_context.input_realtime_cache[0]
-    assert entry.role == 'user'
-    assert entry.data == audio_blob
-    assert isinstance(entry.timestamp, float)
+    cache = invocation_context.input_realtime_cache
+    assert cache.role == 'user'
+    assert cache.mime_type == 'audio/pcm'
+    segment = cache.read(ARTIFACT_READER)
+    assert segment.data == b'test_audio_data'
+    assert isinstance(segment.timestamp, float)
 
   @pytest.mark.asyncio
   async def test_cache_output_audio(self):
@@ -97,10 +102,12 @@ class TestAudioCacheManager:
     assert invocation_context.output_realtime_cache is not None
     assert len(invocation_context.output_realtime_cache) == 1
 
-    entry = invocation_context.output_realtime_cache[0]
-    assert entry.role == 'model'
-    assert entry.data == audio_blob
-    assert isinstance(entry.timestamp, float)
+    cache = invocation_context.output_realtime_cache
+    assert cache.role == 'model'
+    assert cache.mime_type == 'audio/wav'
+    segment = cache.read(ARTIFACT_READER)
+    assert segment.data == b'test_model_audio'
+    assert isinstance(segment.timestamp, float)
 
   @pytest.mark.asyncio
   async def test_multiple_audio_caching(self):
@@ -147,8 +154,8 @@ class TestAudioCacheManager:
     await self.manager.flush_caches(invocation_context)
 
     # Verify caches are cleared
-    assert invocation_context.input_realtime_cache == []
-    assert invocation_context.output_realtime_cache == []
+    assert len(invocation_context.input_realtime_cache) == 0
+    assert len(invocation_context.output_realtime_cache) == 0
 
     # Verify artifact service was called twice (once for each cache)
     assert mock_artifact_service.save_artifact.call_count == 2
@@ -177,7 +184,7 @@ class TestAudioCacheManager:
     )
 
     # Verify only input cache is cleared
-    assert invocation_context.input_realtime_cache == []
+    assert len(invocation_context.input_realtime_cache) == 0
     assert len(invocation_context.output_realtime_cache) == 1
 
     # Verify artifact service was called once
@@ -253,6 +260,116 @@ class TestAudioCacheManager:
     # Verify session event was created
     mock_session_service.append_event.assert_not_called()
 
+  @pytest.mark.asyncio
+  async def test_flush_keeps_audio_cached_while_saving(self):
+    """Test that audio cached while the artifact is saved isn't dropped."""
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    self.manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'first', mime_type='audio/pcm'),
+        'input',
+    )
+
+    async def save_artifact(**kwargs):
+      self.manager.cache_audio(
+          invocation_context,
+          types.Blob(data=b'second', mime_type='audio/pcm'),
+          'input',
+      )
+      return 1
+
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = save_artifact
+    invocation_context.artifact_service = mock_artifact_service
+
+    await self.manager.flush_caches(invocation_context)
+
+    saved_artifact = mock_artifact_service.save_artifact.call_args.kwargs[
+        'artifact'
+    ]
+    assert saved_artifact.inline_data.data == b'first'
+    segment = invocation_context.input_realtime_cache.read(ARTIFACT_READER)
+    assert segment.data == b'second'
+
+  @pytest.mark.asyncio
+  async def test_flush_full_caches(self):
+    """Test that only caches that reached the maximum size are flushed."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=8))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.return_value = 1
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'1234', mime_type='audio/pcm'),
+        'input',
+    )
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'12345678', mime_type='audio/pcm'),
+        'output',
+    )
+    manager.flush_full_caches(invocation_context)
+    # The full cache is only consumed once its artifact is saved.
+    assert len(invocation_context.output_realtime_cache) == 1
+    await asyncio.sleep(0)
+
+    mock_artifact_service.save_artifact.assert_called_once()
+    assert len(invocation_context.input_realtime_cache) == 1
+    assert len(invocation_context.output_realtime_cache) == 0
+
+  @pytest.mark.asyncio
+  async def test_flush_caches_waits_for_pending_flush(self):
+    """Test that audio saved by a background flush isn't saved again."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    save_started = asyncio.Event()
+    release_save = asyncio.Event()
+
+    async def save_artifact(**kwargs):
+      save_started.set()
+      await release_save.wait()
+      return 1
+
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = save_artifact
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'first', mime_type='audio/pcm'),
+        'input',
+    )
+    manager.flush_full_caches(invocation_context)
+    await save_started.wait()
+    # The cache is still full, but its flush is already saving.
+    manager.flush_full_caches(invocation_context)
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'second', mime_type='audio/pcm'),
+        'input',
+    )
+    flush = asyncio.create_task(
+        manager.flush_caches(invocation_context, flush_model_audio=False)
+    )
+    await asyncio.sleep(0)
+    release_save.set()
+    await flush
+
+    saved = [
+        call.kwargs['artifact'].inline_data.data
+        for call in mock_artifact_service.save_artifact.call_args_list
+    ]
+    assert saved == [b'first', b'second']
+    assert len(invocation_context.input_realtime_cache) == 0
+
   def test_get_cache_stats_empty(self):
     """Test getting statistics for empty caches."""
     invocation_context = Mock()
@@ -345,23 +462,15 @@ class TestAudioCacheManager:
     second_timestamp = 1234567891.456  # Second chunk timestamp (later)
 
     # Manually create audio cache entries with specific timestamps
-    invocation_context.input_realtime_cache = []
-
-    from google.adk.agents.invocation_context import RealtimeCacheEntry
-
-    first_entry = RealtimeCacheEntry(
-        role='user',
-        data=types.Blob(data=b'first_chunk', mime_type='audio/pcm'),
-        timestamp=first_timestamp,
+    invocation_context.input_realtime_cache = AudioBuffer(
+        role='user', mime_type='audio/pcm'
     )
-
-    second_entry = RealtimeCacheEntry(
-        role='user',
-        data=types.Blob(data=b'second_chunk', mime_type='audio/pcm'),
-        timestamp=second_timestamp,
+    invocation_context.input_realtime_cache.append(
+        b'first_chunk', first_timestamp
+    )
+    invocation_context.input_realtime_cache.append(
+        b'second_chunk', second_timestamp
     )
-
-    invocation_context.input_realtime_cache.extend([first_entry, second_entry])
 
     # Sleep briefly to ensure current time is different from first timestamp
     time.sleep(0.01)
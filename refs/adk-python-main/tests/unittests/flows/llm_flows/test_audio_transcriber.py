@@ -0,0 +1,231 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from unittest import mock
+
+from google.adk.agents.audio_buffer import ARTIFACT_READER
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.events.event import Event
+from google.adk.flows.llm_flows.base_llm_flow import BaseLlmFlow
+from google.adk.transcription import BaseTranscriptionBackend
+from google.genai import types
+import pytest
+from websockets.exceptions import ConnectionClosedOK
+
+from ... import testing_utils
+
+
+class _EchoTranscriptionBackend(BaseTranscriptionBackend):
+  """Transcribes each chunk of audio into its bytes as text."""
+
+  async def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    async for data in audio:
+      yield types.Transcription(text=data.decode(), finished=False)
+    yield types.Transcription(text=mime_type, finished=True)
+
+
+class _FailingTranscriptionBackend(BaseTranscriptionBackend):
+
+  async def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    raise RuntimeError('Transcription failed')
+    yield
+
+
+class _TestBaseLlmFlow(BaseLlmFlow):
+  pass
+
+
+class _SilentLlmConnection(testing_utils.MockLlmConnection):
+  """Doesn't respond until it's closed."""
+
+  def __init__(self):
+    super().__init__([])
+    self._closed = asyncio.Event()
+
+  async def receive(self):
+    await self._closed.wait()
+    raise ConnectionClosedOK(None, None)
+    yield
+
+  async def close(self):
+    self._closed.set()
+
+
+class _SilentModel(testing_utils.MockModel):
+
+  @contextlib.asynccontextmanager
+  async def connect(self, llm_request):
+    yield _SilentLlmConnection()
+
+
+def _drain(live_events: asyncio.Queue) -> list[Event]:
+  events = []
+  while not live_events.empty():
+    event, _ = live_events.get_nowait()
+    events.append(event)
+  return events
+
+
+async def _create_invocation_context(
+    backend: BaseTranscriptionBackend, agent: LlmAgent | None = None
+):
+  invocation_context = await testing_utils.create_invocation_context(
+      agent or testing_utils.create_test_agent(),
+      run_config=RunConfig(
+          input_audio_transcription=None, input_transcription_backend=backend
+      ),
+  )
+  invocation_context.live_request_queue = LiveRequestQueue()
+  return invocation_context
+
+
+@pytest.mark.asyncio
+async def test_transcribes_audio_while_it_arrives():
+  invocation_context = await _create_invocation_context(
+      _EchoTranscriptionBackend()
+  )
+  flow = _TestBaseLlmFlow()
+  audio_transcriber = flow._create_audio_transcriber(invocation_context)
+  live_events = asyncio.Queue()
+  transcription_task = asyncio.create_task(
+      flow._transcribe_input(invocation_context, audio_transcriber, live_events)
+  )
+  send_task = asyncio.create_task(
+      flow._send_to_model(
+          mock.AsyncMock(), invocation_context, audio_transcriber
+      )
+  )
+  queue = invocation_context.live_request_queue
+
+  queue.send_realtime(types.Blob(data=b'hello', mime_type='audio/pcm'))
+  await asyncio.sleep(0.01)
+
+  # Transcribed before the audio stream ends.
+  transcription_events = _drain(live_events)
+  assert [e.input_transcription.text for e in transcription_events] == ['hello']
+
+  queue.send_realtime(types.Blob(data=b'world', mime_type='audio/pcm'))
+  queue.close()
+  await send_task
+  audio_transcriber.close()
+  await transcription_task
+  transcription_events += _drain(live_events)
+
+  assert [
+      (e.author, e.input_transcription.text, e.input_transcription.finished)
+      for e in transcription_events
+  ] == [
+      ('user', 'hello', False),
+      ('user', 'world', False),
+      ('user', 'audio/pcm', True),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_transcription_shares_the_input_audio_cache():
+  invocation_context = await _create_invocation_context(
+      _EchoTranscriptionBackend()
+  )
+  flow = _TestBaseLlmFlow()
+  audio_transcriber = flow._create_audio_transcriber(invocation_context)
+  flow.audio_cache_manager.cache_audio(
+      invocation_context,
+      types.Blob(data=b'hello', mime_type='audio/pcm'),
+      'input',
+  )
+  audio_transcriber.on_audio_cached()
+  audio_transcriber.close()
+
+  transcriptions = [t.text async for t in audio_transcriber.transcribe()]
+
+  assert transcriptions == ['hello', 'audio/pcm']
+  input_cache = invocation_context.input_realtime_cache
+  # The audio stays cached until it's flushed to the artifact service.
+  assert input_cache.read(ARTIFACT_READER).data == b'hello'
+
+
+@pytest.mark.asyncio
+async def test_transcription_errors_are_logged():
+  invocation_context = await _create_invocation_context(
+      _FailingTranscriptionBackend()
+  )
+  flow = _TestBaseLlmFlow()
+  audio_transcriber = flow._create_audio_transcriber(invocation_context)
+  flow.audio_cache_manager.cache_audio(
+      invocation_context,
+      types.Blob(data=b'hello', mime_type='audio/pcm'),
+      'input',
+  )
+  audio_transcriber.on_audio_cached()
+  live_events = asyncio.Queue()
+
+  await flow._transcribe_input(
+      invocation_context, audio_transcriber, live_events
+  )
+
+  assert live_events.empty()
+
+
+@pytest.mark.asyncio
+async def test_live_flow_yields_transcriptions_as_they_are_made():
+  invocation_context = await _create_invocation_context(
+      _EchoTranscriptionBackend(),
+      agent=LlmAgent(name='test_agent', model=_SilentModel(responses=[])),
+  )
+  queue = invocation_context.live_request_queue
+  flow = _TestBaseLlmFlow()
+
+  async with contextlib.aclosing(flow.run_live(invocation_context)) as agen:
+    queue.send_realtime(types.Blob(data=b'hello', mime_type='audio/pcm'))
+    # The model hasn't responded, the transcription is yielded anyway.
+    event = await asyncio.wait_for(agen.__anext__(), timeout=5)
+    assert event.input_transcription.text == 'hello'
+
+    queue.send_realtime(types.Blob(data=b'world', mime_type='audio/pcm'))
+    queue.close()
+    # The audio stream is transcribed to its end once the connection closes.
+    tail = [
+        (
+            await asyncio.wait_for(agen.__anext__(), timeout=5)
+        ).input_transcription
+        for _ in range(2)
+    ]
+
+  assert [(t.text, t.finished) for t in tail] == [
+      ('world', False),
+      ('audio/pcm', True),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_no_transcriber_when_model_transcribes_input():
+  invocation_context = await testing_utils.create_invocation_context(
+      testing_utils.create_test_agent(),
+      run_config=RunConfig(
+          input_transcription_backend=_EchoTranscriptionBackend()
+      ),
+  )
+  flow = _TestBaseLlmFlow()
+
+  assert flow._create_audio_transcriber(invocation_context) is None
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest import mock
 
 from google.adk.agents.live_request_queue import LiveRequest
@@ -199,3 +200,91 @@ async def test_send_to_model_with_text_content(mock_llm_connection):
   # Verify send_content was called instead of send_realtime
   mock_llm_connection.send_content.assert_called_once_with(content)
   mock_llm_connection.send_realtime.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_to_model_batches_queued_audio(mock_llm_connection):
+  """Test _send_to_model merges audio blobs that are already queued."""
+  agent = Agent(name='test_agent', model='mock')
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content=''
+  )
+  invocation_context.live_request_queue = LiveRequestQueue()
+  flow = TestBaseLlmFlow()
+
+  queue = invocation_context.live_request_queue
+  queue.send_realtime(types.Blob(data=b'\x01\x02', mime_type='audio/pcm'))
+  queue.send_realtime(types.Blob(data=b'\x03\x04', mime_type='audio/pcm'))
+  queue.send_realtime(types.Blob(data=b'\xff', mime_type='image/jpeg'))
+  queue.send_realtime(types.Blob(data=b'\x05\x06', mime_type='audio/pcm'))
+  queue.close()
+
+  await flow._send_to_model(mock_llm_connection, invocation_context)
+
+  assert mock_llm_connection.send_realtime.call_args_list == [
+      mock.call(types.Blob(data=b'\x01\x02\x03\x04', mime_type='audio/pcm')),
+      mock.call(types.Blob(data=b'\xff', mime_type='image/jpeg')),
+      mock.call(types.Blob(data=b'\x05\x06', mime_type='audio/pcm')),
+  ]
+  mock_llm_connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_to_model_waits_without_polling(
+    test_blob, mock_llm_connection
+):
+  """Test _send_to_model doesn't wake up until a live request arrives."""
+  agent = Agent(name='test_agent', model='mock')
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content=''
+  )
+  invocation_context.live_request_queue = LiveRequestQueue()
+  flow = TestBaseLlmFlow()
+
+  with mock.patch('asyncio.wait_for') as mock_wait_for:
+    send_task = asyncio.create_task(
+        flow._send_to_model(mock_llm_connection, invocation_context)
+    )
+    await asyncio.sleep(0.01)
+    invocation_context.live_request_queue.send_realtime(test_blob)
+    invocation_context.live_request_queue.close()
+    await send_task
+
+  mock_wait_for.assert_not_called()
+  mock_llm_connection.send_realtime.assert_called_once_with(test_blob)
+
+
+@pytest.mark.asyncio
+async def test_send_to_model_polls_when_configured(
+    test_blob, mock_llm_connection
+):
+  """Test _send_to_model polls the queue when a poll interval is set."""
+  agent = Agent(name='test_agent', model='mock')
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent,
+      user_content='',
+      run_config=RunConfig(live_request_poll_interval=0.001),
+  )
+  invocation_context.live_request_queue = LiveRequestQueue()
+  flow = TestBaseLlmFlow()
+
+  wait_for = asyncio.wait_for
+  polled_three_times = asyncio.Event()
+
+  async def count_polls(*args, **kwargs):
+    if mock_wait_for.call_count >= 3:
+      polled_three_times.set()
+    return await wait_for(*args, **kwargs)
+
+  with mock.patch('asyncio.wait_for', side_effect=count_polls) as mock_wait_for:
+    send_task = asyncio.create_task(
+        flow._send_to_model(mock_llm_connection, invocation_context)
+    )
+    # The queue stays empty until it was polled several times.
+    await wait_for(polled_three_times.wait(), timeout=10)
+    invocation_context.live_request_queue.send_realtime(test_blob)
+    invocation_context.live_request_queue.close()
+    await send_task
+
+  assert mock_wait_for.call_count >= 3
+  mock_llm_connection.send_realtime.assert_called_once_with(test_blob)
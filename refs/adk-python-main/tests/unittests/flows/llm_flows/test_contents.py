@@ -370,3 +370,43 @@ async def test_events_with_empty_content_are_skipped():
       types.UserContent("Hello"),
       types.UserContent("How are you?"),
   ]
+
+
+@pytest.mark.asyncio
+async def test_contents_record_their_event_ids():
+  """Test that contents copied from events are recorded with the event ID."""
+  agent = Agent(model="gemini-2.5-flash", name="test_agent")
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent
+  )
+
+  events = [
+      Event(
+          invocation_id="inv1",
+          author="user",
+          content=types.UserContent("Hello"),
+      ),
+      # Replies of other agents are rewritten as user context.
+      Event(
+          invocation_id="inv2",
+          author="other_agent",
+          content=types.ModelContent("Hi from the other agent"),
+      ),
+      Event(
+          invocation_id="inv3",
+          author="user",
+          content=types.UserContent("How are you?"),
+      ),
+  ]
+  invocation_context.session.events = events
+
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  assert [
+      llm_request.get_content_event_id(content)
+      for content in llm_request.contents
+  ] == [events[0].id, None, events[2].id]
@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for InMemoryContextCacheRegistry."""
+
+import asyncio
+import time
+
+from google.adk.models.context_cache_registry import InMemoryContextCacheRegistry
+from google.adk.models.context_cache_registry import SharedContextCache
+import pytest
+
+
+class _FakeCaches:
+  """Creates and refreshes fake shared caches."""
+
+  def __init__(self, ttl_seconds: float = 1800, error: Exception = None):
+    self.ttl_seconds = ttl_seconds
+    self.error = error
+    self.created = 0
+    self.refreshed = 0
+
+  async def create(self) -> SharedContextCache:
+    self.created += 1
+    await asyncio.sleep(0.01)
+    if self.error:
+      raise self.error
+    now = time.time()
+    return SharedContextCache(
+        cache_name=f"cachedContents/{self.created}",
+        expire_time=now + self.ttl_seconds,
+        created_at=now,
+    )
+
+  async def refresh(self, cache: SharedContextCache) -> SharedContextCache:
+    self.refreshed += 1
+    return cache.model_copy(update={"expire_time": time.time() + 1800})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_create_one_cache():
+  registry = InMemoryContextCacheRegistry()
+  caches = _FakeCaches()
+
+  acquired = await asyncio.gather(*[
+      registry.acquire("key", create=caches.create, refresh=caches.refresh)
+      for _ in range(10)
+  ])
+
+  assert caches.created == 1
+  assert {cache.cache_name for cache in acquired} == {"cachedContents/1"}
+  assert registry.get_refcount("key") == 10
+
+  for cache in acquired:
+    await registry.release("key", cache)
+  assert registry.get_refcount("key") == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_close_to_expiry_is_refreshed():
+  registry = InMemoryContextCacheRegistry(refresh_window_seconds=600)
+  caches = _FakeCaches(ttl_seconds=400)
+
+  first = await registry.acquire(
+      "key", create=caches.create, refresh=caches.refresh
+  )
+  second = await registry.acquire(
+      "key", create=caches.create, refresh=caches.refresh
+  )
+
+  assert caches.created == 1
+  assert caches.refreshed == 1
+  assert second.cache_name == first.cache_name
+  assert second.expire_time > first.expire_time
+  assert registry.get_refcount("key") == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_is_recreated():
+  registry = InMemoryContextCacheRegistry()
+  # Caches that expire within the expiry buffer are not handed out.
+  caches = _FakeCaches(ttl_seconds=60)
+
+  first = await registry.acquire(
+      "key", create=caches.create, refresh=caches.refresh
+  )
+  second = await registry.acquire(
+      "key", create=caches.create, refresh=caches.refresh
+  )
+
+  assert caches.created == 2
+  assert first.cache_name != second.cache_name
+
+
+@pytest.mark.asyncio
+async def test_failed_creation_backs_off():
+  registry = InMemoryContextCacheRegistry(failure_backoff_seconds=60)
+  caches = _FakeCaches(error=ValueError("too few tokens"))
+
+  for _ in range(3):
+    assert (
+        await registry.acquire(
+            "key", create=caches.create, refresh=caches.refresh
+        )
+        is None
+    )
+
+  assert caches.created == 1
+
+
+@pytest.mark.asyncio
+async def test_caches_in_use_are_not_evicted():
+  registry = InMemoryContextCacheRegistry(max_entries=1)
+  caches = _FakeCaches()
+
+  in_use = await registry.acquire(
+      "in_use", create=caches.create, refresh=caches.refresh
+  )
+  idle = await registry.acquire(
+      "idle", create=caches.create, refresh=caches.refresh
+  )
+  await registry.release("idle", idle)
+  await registry.acquire("new", create=caches.create, refresh=caches.refresh)
+
+  assert registry.get_refcount("in_use") == 1
+  # The idle key was dropped, so acquiring it creates a new cache.
+  await registry.acquire("idle", create=caches.create, refresh=caches.refresh)
+  assert caches.created == 4
+  await registry.release("in_use", in_use)
@@ -549,6 +549,18 @@ async def test_generate_content_async_patches_tracking_headers(
     assert len(responses) == 2 if stream else 1
 
 
+@pytest.mark.asyncio
+async def test_warm_up_creates_api_client(gemini_llm):
+  """Test that warming up creates the client and resolves the backend."""
+  with mock.patch("google.adk.models.google_llm.Client") as mock_client:
+    mock_client.return_value.vertexai = False
+    await gemini_llm.warm_up()
+
+  mock_client.assert_called_once()
+  assert gemini_llm.__dict__["api_client"] is mock_client.return_value
+  assert gemini_llm.__dict__["_api_backend"] == GoogleLLMVariant.GEMINI_API
+
+
 def test_live_api_version_vertex_ai(gemini_llm):
   """Test that _live_api_version returns 'v1beta1' for Vertex AI backend."""
   with mock.patch.object(
@@ -1684,6 +1696,7 @@ async def test_generate_content_async_with_cache_metadata_integration(
       mock_cache_manager.handle_context_caching = AsyncMock(
           return_value=cache_metadata
       )
+      mock_cache_manager.release_shared_cache = AsyncMock()
 
       responses = [
           resp
@@ -1691,6 +1704,7 @@ async def test_generate_content_async_with_cache_metadata_integration(
               llm_request_with_cache, stream=False
           )
       ]
+      mock_cache_manager.release_shared_cache.assert_awaited_once()
 
       # Verify the response was processed
       assert len(responses) == 1
@@ -1729,6 +1743,55 @@ async def test_generate_content_async_with_cache_metadata_integration(
       assert second_arg.invocations_used == cache_metadata.invocations_used
 
 
+@pytest.mark.asyncio
+async def test_generate_content_async_stream_releases_cache_after_first_chunk(
+    gemini_llm, llm_request_with_cache, cache_metadata
+):
+  """Test that the shared cache is held until the stream starts responding."""
+  with mock.patch.object(gemini_llm, "api_client") as mock_client:
+    with mock.patch(
+        "google.adk.models.gemini_context_cache_manager.GeminiContextCacheManager"
+    ) as MockCacheManagerClass:
+      mock_cache_manager = MockCacheManagerClass.return_value
+      mock_cache_manager.handle_context_caching = AsyncMock(
+          return_value=cache_metadata
+      )
+      mock_cache_manager.release_shared_cache = AsyncMock()
+      released_before_request = []
+
+      async def mock_stream():
+        # The request is only sent once the stream is iterated.
+        released_before_request.append(
+            mock_cache_manager.release_shared_cache.await_count > 0
+        )
+        for text in ["Hello", " world"]:
+          yield types.GenerateContentResponse(
+              candidates=[
+                  types.Candidate(
+                      content=Content(
+                          role="model", parts=[Part.from_text(text=text)]
+                      )
+                  )
+              ]
+          )
+
+      async def mock_coro():
+        return mock_stream()
+
+      mock_client.aio.models.generate_content_stream.return_value = mock_coro()
+
+      responses = [
+          resp
+          async for resp in gemini_llm.generate_content_async(
+              llm_request_with_cache, stream=True
+          )
+      ]
+
+      assert responses
+      assert released_before_request == [False]
+      mock_cache_manager.release_shared_cache.assert_awaited()
+
+
 def test_build_request_log_with_config_multiple_tool_types():
   """Test that _build_request_log includes config with multiple tool types."""
   func_decl = types.FunctionDeclaration(
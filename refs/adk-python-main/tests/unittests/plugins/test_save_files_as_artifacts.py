@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
@@ -38,6 +39,11 @@ class TestSaveFilesAsArtifactsPlugin:
     self.mock_context.invocation_id = "test_invocation_123"
     self.mock_context.session = Mock()
     self.mock_context.session.id = "test_session"
+    self.mock_context._artifact_manifest = Mock()
+    # Saves go through the artifact service of the context.
+    self.mock_context.save_artifact.side_effect = functools.partial(
+        InvocationContext.save_artifact, self.mock_context
+    )
 
   @pytest.mark.asyncio
   async def test_save_files_with_display_name(self):
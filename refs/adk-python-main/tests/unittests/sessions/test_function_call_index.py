@@ -0,0 +1,144 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+from google.adk.events.event import Event
+from google.adk.sessions.function_call_index import FunctionCallIndex
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+import pytest
+
+
+def _call_event(
+    function_call_id: Optional[str], long_running: bool = False
+) -> Event:
+  return Event(
+      author='agent',
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part(
+                  function_call=types.FunctionCall(
+                      id=function_call_id, name='tool', args={}
+                  )
+              )
+          ],
+      ),
+      long_running_tool_ids={function_call_id} if long_running else None,
+  )
+
+
+def _response_event(function_call_id: Optional[str]) -> Event:
+  return Event(
+      author='user',
+      content=types.Content(
+          role='user',
+          parts=[
+              types.Part(
+                  function_response=types.FunctionResponse(
+                      id=function_call_id, name='tool', response={}
+                  )
+              )
+          ],
+      ),
+  )
+
+
+def test_pairs_calls_and_responses():
+  events = [_call_event('a'), _call_event('b'), _response_event('a')]
+
+  index = FunctionCallIndex(events)
+
+  assert index.get_function_call_event_index('a') == 0
+  assert index.get_function_call_event('b') is events[1]
+  assert index.get_function_response_event_index('a') == 2
+  assert index.get_function_response_event_index('b') is None
+  assert not index.is_pending('a')
+  assert index.is_pending('b')
+  assert index.get_pending_function_call_ids() == ['b']
+
+
+def test_update_indexes_appended_events():
+  events = [_call_event('a')]
+  index = FunctionCallIndex(events)
+
+  events.append(_response_event('a'))
+  events.append(_call_event('b'))
+  index.update(events)
+
+  assert index.get_function_response_event_index('a') == 1
+  assert index.get_function_call_event_index('b') == 2
+  assert index.get_pending_function_call_ids() == ['b']
+
+
+def test_update_accepts_new_list_extending_indexed_events():
+  events = [_call_event('a')]
+  index = FunctionCallIndex(events)
+
+  index.update(events + [_response_event('a')])
+
+  assert index.get_function_response_event_index('a') == 1
+  assert not index.is_pending('a')
+
+
+def test_update_rebuilds_after_rewind():
+  call_a = _call_event('a')
+  index = FunctionCallIndex([call_a, _response_event('a'), _call_event('b')])
+
+  index.update([call_a, _call_event('c')])
+
+  assert index.get_function_response_event_index('a') is None
+  assert index.get_function_call_event_index('b') is None
+  assert index.get_function_call_event_index('c') == 1
+  assert index.get_pending_function_call_ids() == ['a', 'c']
+
+
+def test_pending_long_running_call_ids():
+  events = [
+      _call_event('a', long_running=True),
+      _call_event('b'),
+      _call_event('c', long_running=True),
+      _response_event('c'),
+  ]
+
+  index = FunctionCallIndex(events)
+
+  assert index.get_pending_function_call_ids(long_running_only=True) == ['a']
+
+
+def test_calls_without_id_are_indexed_under_none():
+  events = [_call_event(None), _call_event('a'), _call_event(None)]
+
+  index = FunctionCallIndex(events)
+
+  assert index.find_function_call_event_index([None], before=2) == 0
+  assert index.find_function_call_event_index([None, 'a'], before=2) == 1
+  assert index.find_function_call_event_index(['b'], before=3) is None
+  assert index.get_pending_function_call_ids() == ['a']
+
+
+@pytest.mark.asyncio
+async def test_session_service_maintains_index():
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='app', user_id='user'
+  )
+
+  await session_service.append_event(session, _call_event('a'))
+  await session_service.append_event(session, _response_event('a'))
+
+  index = session.get_function_call_index()
+  assert index.get_function_call_event_index('a') == 0
+  assert index.get_function_response_event_index('a') == 1
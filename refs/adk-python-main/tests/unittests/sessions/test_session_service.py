@@ -19,10 +19,13 @@ import enum
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
 from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.base_session_service import ListSessionsConfig
+from google.adk.sessions.base_session_service import SessionProjection
 from google.adk.sessions.database_session_service import DatabaseSessionService
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 import pytest
+from sqlalchemy import event
 
 
 class SessionServiceType(enum.Enum):
@@ -182,6 +185,97 @@ async def test_list_sessions_all_users(service_type):
   assert {s.id for s in sessions_all} == {'session1a', 'session1b', 'session2a'}
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+@pytest.mark.parametrize('user_id', ['user1', None])
+async def test_list_sessions_with_pagination(service_type, user_id):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  for i in range(5):
+    await session_service.create_session(
+        app_name=app_name,
+        user_id='user1' if i % 2 else 'user2',
+        session_id=f'session{i}',
+        state={'key': i},
+    )
+  await session_service.create_session(
+      app_name=app_name, user_id='user1', session_id='session5'
+  )
+  all_sessions = (
+      await session_service.list_sessions(app_name=app_name, user_id=user_id)
+  ).sessions
+
+  pages = []
+  page_token = None
+  for _ in range(len(all_sessions)):
+    response = await session_service.list_sessions(
+        app_name=app_name,
+        user_id=user_id,
+        config=ListSessionsConfig(page_size=2, page_token=page_token),
+    )
+    pages.append([session.id for session in response.sessions])
+    page_token = response.next_page_token
+    if not page_token:
+      break
+
+  # The most recently updated sessions are listed first.
+  last_update_times = [session.last_update_time for session in all_sessions]
+  assert last_update_times == sorted(last_update_times, reverse=True)
+  assert not page_token
+  assert [len(page) for page in pages[:-1]] == [2] * (len(pages) - 1)
+  assert sum(pages, []) == [session.id for session in all_sessions]
+  assert len(all_sessions) == (6 if user_id is None else 3)
+  assert all(
+      session.state == {'key': int(session.id[-1])}
+      for session in all_sessions
+      if session.id != 'session5'
+  )
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_uses_update_time_index_on_sqlite():
+  session_service = get_session_service(SessionServiceType.DATABASE)
+  statements = []
+
+  def capture_select(conn, cursor, statement, parameters, context, many):
+    if statement.startswith('SELECT') and 'FROM sessions' in statement:
+      statements.append((statement, parameters))
+
+  event.listen(
+      session_service.db_engine, 'before_cursor_execute', capture_select
+  )
+  await session_service.list_sessions(
+      app_name='my_app',
+      user_id='user',
+      config=ListSessionsConfig(page_size=2),
+  )
+
+  statement, parameters = statements[0]
+  with session_service.db_engine.connect() as connection:
+    plan = connection.exec_driver_sql(
+        'EXPLAIN QUERY PLAN ' + statement, parameters
+    ).fetchall()
+  assert 'ix_sessions_app_name_user_id_julianday_update_time' in str(plan)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+async def test_list_sessions_with_invalid_page_token(service_type):
+  session_service = get_session_service(service_type)
+  await session_service.create_session(app_name='my_app', user_id='user')
+
+  with pytest.raises(ValueError, match='Invalid page token'):
+    await session_service.list_sessions(
+        app_name='my_app',
+        user_id='user',
+        config=ListSessionsConfig(page_token='invalid'),
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
@@ -538,3 +632,49 @@ async def test_append_event_should_trim_temp_delta_state(service_type):
   last_event = updated_session.events[-1]
   assert 'temp:key' not in last_event.actions.state_delta
   assert last_event.actions.state_delta['app:key'] == 'app_value'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+async def test_get_session_with_projection(service_type):
+  session_service = get_session_service(service_type)
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user', state={'key': 'value'}
+  )
+  events = [
+      Event(
+          invocation_id='invocation',
+          author='user',
+          timestamp=i,
+          content=types.Content(role='user', parts=[types.Part(text='text')]),
+      )
+      for i in range(1, 4)
+  ]
+  for event in events:
+    await session_service.append_event(session, event)
+
+  metadata = await session_service.get_session(
+      app_name='my_app',
+      user_id='user',
+      session_id=session.id,
+      config=GetSessionConfig(projection=SessionProjection.METADATA),
+  )
+  event_ids = await session_service.get_session(
+      app_name='my_app',
+      user_id='user',
+      session_id=session.id,
+      config=GetSessionConfig(
+          projection=SessionProjection.EVENT_IDS, num_recent_events=2
+      ),
+  )
+
+  assert metadata.state == {'key': 'value'}
+  assert not metadata.events
+  assert event_ids.state == {'key': 'value'}
+  assert [(e.id, e.timestamp) for e in event_ids.events] == [
+      (e.id, e.timestamp) for e in events[1:]
+  ]
+  assert all(e.invocation_id == 'invocation' for e in event_ids.events)
+  assert all(e.content is None for e in event_ids.events)
@@ -28,6 +28,8 @@ from google.adk.auth.auth_tool import AuthConfig
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
 from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.base_session_service import ListSessionsConfig
+from google.adk.sessions.base_session_service import SessionProjection
 from google.adk.sessions.session import Session
 from google.adk.sessions.vertex_ai_session_service import VertexAiSessionService
 from google.api_core import exceptions as api_core_exceptions
@@ -250,6 +252,16 @@ class MockApiClient:
     raise api_core_exceptions.NotFound(f'Session not found: {session_id}')
 
   def _list_sessions(self, name: str, config: dict[str, Any]):
+    if 'page_size' in config:
+      sessions = self._list_sessions(
+          name, {'filter': config.get('filter', '')}
+      )
+      start = int(config.get('page_token') or 0)
+      end = start + config['page_size']
+      return mock.Mock(
+          page=sessions[start:end],
+          config={'page_token': str(end) if end < len(sessions) else None},
+      )
     filter_val = config.get('filter', '')
     user_id_match = re.search(r'user_id="([^"]+)"', filter_val)
     if user_id_match:
@@ -478,6 +490,55 @@ async def test_list_sessions_with_pagination():
   assert sessions.sessions[1].id == 'page2'
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_get_api_client')
+async def test_list_sessions_with_page_size():
+  session_service = mock_vertex_ai_session_service()
+  first_page = await session_service.list_sessions(
+      app_name='123', config=ListSessionsConfig(page_size=3)
+  )
+  second_page = await session_service.list_sessions(
+      app_name='123',
+      config=ListSessionsConfig(
+          page_size=3, page_token=first_page.next_page_token
+      ),
+  )
+
+  assert [s.id for s in first_page.sessions] == ['1', '2', '3']
+  assert first_page.next_page_token == '3'
+  assert [s.id for s in second_page.sessions] == ['page1', 'page2']
+  assert second_page.next_page_token is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_get_api_client')
+async def test_get_session_with_projection():
+  session_service = mock_vertex_ai_session_service()
+  metadata = await session_service.get_session(
+      app_name='123',
+      user_id='user',
+      session_id='1',
+      config=GetSessionConfig(projection=SessionProjection.METADATA),
+  )
+  event_ids = await session_service.get_session(
+      app_name='123',
+      user_id='user',
+      session_id='1',
+      config=GetSessionConfig(projection=SessionProjection.EVENT_IDS),
+  )
+
+  assert metadata.state == MOCK_SESSION.state
+  assert not metadata.events
+  assert event_ids.events == [
+      Event(
+          id='123',
+          invocation_id='123',
+          author='user',
+          timestamp=MOCK_SESSION.events[0].timestamp,
+      )
+  ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures('mock_get_api_client')
 async def test_list_sessions_all_users():
@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest import mock
+
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.models.cache_metadata import CacheMetadata
+from google.adk.models.gemini_context_cache_manager import GeminiContextCacheManager
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.telemetry.context_cache_metrics import ContextCacheMetrics
+from google.genai import types
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+import pytest
+
+
+@pytest.fixture
+def metric_reader():
+  reader = InMemoryMetricReader()
+  meter = MeterProvider(metric_readers=[reader]).get_meter('test')
+  with mock.patch(
+      'google.adk.models.gemini_context_cache_manager.context_cache_metrics',
+      ContextCacheMetrics(meter),
+  ):
+    yield reader
+
+
+def _get_data_points(reader: InMemoryMetricReader) -> dict[str, list]:
+  data_points = {}
+  metrics_data = reader.get_metrics_data()
+  for resource_metrics in metrics_data.resource_metrics:
+    for scope_metrics in resource_metrics.scope_metrics:
+      for metric in scope_metrics.metrics:
+        data_points[metric.name] = list(metric.data.data_points)
+  return data_points
+
+
+def _create_llm_request(cache_metadata=None) -> LlmRequest:
+  return LlmRequest(
+      model='gemini-2.0-flash',
+      contents=[
+          types.Content(role='user', parts=[types.Part(text=f'Message {i}')])
+          for i in range(3)
+      ],
+      config=types.GenerateContentConfig(system_instruction='Instruction'),
+      cache_config=ContextCacheConfig(),
+      cache_metadata=cache_metadata,
+  )
+
+
+@pytest.mark.asyncio
+async def test_records_misses_and_fingerprint_duration(metric_reader):
+  manager = GeminiContextCacheManager(mock.AsyncMock())
+
+  await manager.handle_context_caching(_create_llm_request())
+
+  data_points = _get_data_points(metric_reader)
+  assert data_points['adk.context_cache.misses'][0].value == 1
+  assert data_points['adk.context_cache.misses'][0].attributes == {
+      'gen_ai.request.model': 'gemini-2.0-flash'
+  }
+  assert data_points['adk.context_cache.fingerprint.duration'][0].count == 1
+  assert 'adk.context_cache.hits' not in data_points
+
+
+@pytest.mark.asyncio
+async def test_records_hits_and_token_usage(metric_reader):
+  manager = GeminiContextCacheManager(mock.AsyncMock())
+  llm_request = _create_llm_request()
+  fingerprint = manager._generate_cache_fingerprint(llm_request, 2)
+  llm_request.cache_metadata = CacheMetadata(
+      cache_name='cachedContents/123',
+      expire_time=time.time() + 1800,
+      fingerprint=fingerprint,
+      invocations_used=1,
+      contents_count=2,
+      created_at=time.time(),
+  )
+
+  cache_metadata = await manager.handle_context_caching(llm_request)
+  llm_response = LlmResponse(
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          prompt_token_count=1000, cached_content_token_count=800
+      )
+  )
+  manager.populate_cache_metadata_in_response(llm_response, cache_metadata)
+
+  data_points = _get_data_points(metric_reader)
+  assert data_points['adk.context_cache.hits'][0].value == 1
+  assert data_points['adk.context_cache.cached_tokens'][0].sum == 800
+  assert data_points['adk.context_cache.uncached_tokens'][0].sum == 200
+
+
+@pytest.mark.asyncio
+async def test_records_invalidations_with_reason(metric_reader):
+  manager = GeminiContextCacheManager(mock.AsyncMock())
+  llm_request = _create_llm_request(
+      cache_metadata=CacheMetadata(
+          cache_name='cachedContents/123',
+          expire_time=time.time() - 10,
+          fingerprint='fingerprint',
+          invocations_used=1,
+          contents_count=2,
+          created_at=time.time() - 1800,
+      )
+  )
+
+  await manager.handle_context_caching(llm_request)
+
+  data_points = _get_data_points(metric_reader)
+  invalidations = data_points['adk.context_cache.invalidations']
+  assert invalidations[0].value == 1
+  assert (
+      invalidations[0].attributes['adk.context_cache.invalidation_reason']
+      == 'expired'
+  )
@@ -345,6 +345,71 @@ class TestRunnerFindAgentToRun:
     result = self.runner._find_agent_to_run(session, self.root_agent)
     assert result == self.sub_agent2
 
+  def test_find_agent_to_run_resumes_from_last_active_agent(self):
+    """Test that events before the last lookup are not scanned again."""
+    first_event = Event(
+        invocation_id="inv1",
+        author="sub_agent1",
+        content=types.Content(
+            role="model", parts=[types.Part(text="Sub agent response")]
+        ),
+    )
+    session = Session(
+        id="test_session",
+        user_id="test_user",
+        app_name="test_app",
+        events=[first_event],
+    )
+    assert (
+        self.runner._find_agent_to_run(session, self.root_agent)
+        is self.sub_agent1
+    )
+
+    session.events.append(
+        Event(
+            invocation_id="inv2",
+            author="user",
+            content=types.Content(
+                role="user", parts=[types.Part(text="User message")]
+            ),
+        )
+    )
+    # The marked event is not inspected again, so changing it has no effect.
+    first_event.author = "sub_agent2"
+    result = self.runner._find_agent_to_run(session, self.root_agent)
+
+    assert result is self.sub_agent1
+
+  def test_find_agent_to_run_rescans_when_marker_event_is_gone(self):
+    """Test that a session rewound past the marked event is scanned again."""
+    session = Session(
+        id="test_session",
+        user_id="test_user",
+        app_name="test_app",
+        events=[
+            Event(
+                invocation_id="inv1",
+                author="sub_agent1",
+                content=types.Content(
+                    role="model", parts=[types.Part(text="Sub agent 1")]
+                ),
+            )
+        ],
+    )
+    self.runner._find_agent_to_run(session, self.root_agent)
+
+    session.events = [
+        Event(
+            invocation_id="inv2",
+            author="sub_agent2",
+            content=types.Content(
+                role="model", parts=[types.Part(text="Sub agent 2")]
+            ),
+        )
+    ]
+    result = self.runner._find_agent_to_run(session, self.root_agent)
+    assert result is self.sub_agent2
+
   def test_is_transferable_across_agent_tree_with_llm_agent(self):
     """Test _is_transferable_across_agent_tree with LLM agent."""
     result = self.runner._is_transferable_across_agent_tree(self.sub_agent1)
@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.adk.models.llm_request import LlmRequest
+from google.adk.tools._forwarding_artifact_service import ForwardingArtifactService
+from google.adk.tools.load_artifacts_tool import load_artifacts_tool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+async def _create_tool_context() -> ToolContext:
+  agent = Agent(name='test_agent', tools=[load_artifacts_tool])
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent
+  )
+  return ToolContext(invocation_context)
+
+
+def _create_llm_request(*artifact_names: str) -> LlmRequest:
+  contents = []
+  if artifact_names:
+    contents.append(
+        types.Content(
+            role='user',
+            parts=[
+                types.Part.from_function_response(
+                    name='load_artifacts',
+                    response={'artifact_names': list(artifact_names)},
+                )
+            ],
+        )
+    )
+  return LlmRequest(contents=contents)
+
+
+@pytest.mark.asyncio
+async def test_artifacts_are_listed_once_per_invocation():
+  tool_context = await _create_tool_context()
+  await tool_context.save_artifact('a.txt', types.Part.from_text(text='a'))
+  with mock.patch.object(
+      InMemoryArtifactService,
+      'list_artifact_keys',
+      autospec=True,
+      side_effect=InMemoryArtifactService.list_artifact_keys,
+  ) as list_artifact_keys:
+    for _ in range(2):
+      llm_request = _create_llm_request()
+      await load_artifacts_tool.process_llm_request(
+          tool_context=tool_context, llm_request=llm_request
+      )
+      assert 'a.txt' in llm_request.config.system_instruction
+
+  assert list_artifact_keys.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_saved_and_deleted_artifacts_update_the_listing():
+  tool_context = await _create_tool_context()
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=_create_llm_request()
+  )
+
+  await tool_context.save_artifact('a.txt', types.Part.from_text(text='a'))
+  llm_request = _create_llm_request()
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=llm_request
+  )
+  assert 'a.txt' in llm_request.config.system_instruction
+
+  invocation_context = tool_context._invocation_context
+  await ForwardingArtifactService(tool_context).delete_artifact(
+      app_name=invocation_context.app_name,
+      user_id=invocation_context.user_id,
+      session_id=invocation_context.session.id,
+      filename='a.txt',
+  )
+  llm_request = _create_llm_request()
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=llm_request
+  )
+  assert not llm_request.config.system_instruction
+
+
+@pytest.mark.asyncio
+async def test_loaded_artifacts_are_cached_until_saved_again():
+  tool_context = await _create_tool_context()
+  await tool_context.save_artifact('a.txt', types.Part.from_text(text='v0'))
+  with mock.patch.object(
+      InMemoryArtifactService,
+      'load_artifact',
+      autospec=True,
+      side_effect=InMemoryArtifactService.load_artifact,
+  ) as load_artifact:
+    for _ in range(2):
+      llm_request = _create_llm_request('a.txt')
+      await load_artifacts_tool.process_llm_request(
+          tool_context=tool_context, llm_request=llm_request
+      )
+      assert llm_request.contents[-1].parts[1].text == 'v0'
+    assert load_artifact.call_count == 1
+
+    await tool_context.save_artifact('a.txt', types.Part.from_text(text='v1'))
+    llm_request = _create_llm_request('a.txt')
+    await load_artifacts_tool.process_llm_request(
+        tool_context=tool_context, llm_request=llm_request
+    )
+    assert llm_request.contents[-1].parts[1].text == 'v1'
+    assert load_artifact.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_artifacts_saved_by_the_invocation_update_the_listing():
+  tool_context = await _create_tool_context()
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=_create_llm_request()
+  )
+
+  # E.g. the audio flushes and the plugins save through the invocation.
+  await tool_context._invocation_context.save_artifact(
+      'a.txt', types.Part.from_text(text='a')
+  )
+  llm_request = _create_llm_request()
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=llm_request
+  )
+  assert 'a.txt' in llm_request.config.system_instruction
+  assert tool_context.artifact_manifest.get_artifact_keys() == ['a.txt']
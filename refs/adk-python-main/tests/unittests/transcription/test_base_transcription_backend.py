@@ -0,0 +1,55 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import AsyncGenerator
+from typing import AsyncIterator
+
+from google.adk.agents.run_config import RunConfig
+from google.adk.transcription import BaseTranscriptionBackend
+from google.genai import types
+import pytest
+
+
+class _EchoTranscriptionBackend(BaseTranscriptionBackend):
+
+  async def transcribe(
+      self, audio: AsyncIterator[bytes], mime_type: str
+  ) -> AsyncGenerator[types.Transcription, None]:
+    async for data in audio:
+      yield types.Transcription(text=data.decode(), finished=True)
+
+
+@pytest.mark.parametrize(
+    'mime_type, sample_rate_hertz',
+    [
+        ('audio/pcm', 16000),
+        ('audio/pcm;rate=24000', 24000),
+        ('audio/pcm; rate=8000', 8000),
+        ('audio/pcm;rate=invalid', 16000),
+    ],
+)
+def test_get_sample_rate_hertz(mime_type: str, sample_rate_hertz: int):
+  backend = _EchoTranscriptionBackend()
+
+  assert backend._get_sample_rate_hertz(mime_type) == sample_rate_hertz
+
+
+def test_run_config_accepts_backend():
+  backend = _EchoTranscriptionBackend(language_code='de-DE')
+
+  run_config = RunConfig(
+      input_audio_transcription=None, input_transcription_backend=backend
+  )
+
+  assert run_config.input_transcription_backend is backend